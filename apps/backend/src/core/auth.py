@@ -10,6 +10,7 @@ import structlog
 
 from .config import get_settings
 from ..models.user import User
+from ..services.principal_cache import get_principal_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -17,6 +18,17 @@ security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
 
+async def _load_user(user_id: str) -> Optional[User]:
+    """Get a user, served from the principal cache when fresh."""
+    principal_cache = get_principal_cache()
+    user = principal_cache.get_user(user_id)
+    if user is None:
+        user = await User.get(user_id)
+        if user is not None:
+            principal_cache.put_user(user)
+    return user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> User:
@@ -30,12 +42,17 @@ async def get_current_user(
     settings = get_settings()
 
     try:
-        # Decode JWT token
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm]
-        )
+        # Decode JWT token (reuses the claims AuthMiddleware cached for it)
+        principal_cache = get_principal_cache()
+        token_key = principal_cache.token_key(token)
+        payload = principal_cache.get_claims(token_key)
+        if payload is None:
+            payload = jwt.decode(
+                token,
+                settings.jwt_secret_key,
+                algorithms=[settings.jwt_algorithm]
+            )
+            principal_cache.put_claims(token_key, payload)
 
         user_id: Optional[str] = payload.get("sub")
         if user_id is None:
@@ -44,8 +61,8 @@ async def get_current_user(
                 detail="Token inválido"
             )
 
-        # Get user from database
-        user = await User.get(user_id)
+        # Get user from the snapshot cache, then the database
+        user = await _load_user(user_id)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -105,12 +122,17 @@ async def get_current_user_sse(
     settings = get_settings()
 
     try:
-        # Decode JWT token
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm]
-        )
+        # Decode JWT token (reuses the claims AuthMiddleware cached for it)
+        principal_cache = get_principal_cache()
+        token_key = principal_cache.token_key(token)
+        payload = principal_cache.get_claims(token_key)
+        if payload is None:
+            payload = jwt.decode(
+                token,
+                settings.jwt_secret_key,
+                algorithms=[settings.jwt_algorithm]
+            )
+            principal_cache.put_claims(token_key, payload)
 
         user_id: Optional[str] = payload.get("sub")
         if user_id is None:
@@ -119,8 +141,8 @@ async def get_current_user_sse(
                 detail="Token inválido"
             )
 
-        # Get user from database
-        user = await User.get(user_id)
+        # Get user from the snapshot cache, then the database
+        user = await _load_user(user_id)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -109,6 +109,38 @@ class Settings(BaseSettings):
     jwt_access_token_expire_minutes: int = Field(default=60, description="Access token expiry")
     jwt_refresh_token_expire_days: int = Field(default=7, description="Refresh token expiry")
 
+    # Password hashing pool (keeps argon2 off the event loop)
+    password_hash_workers: int = Field(
+        default=2,
+        description="Threads hashing/verifying passwords (argon2 uses ~64MB each)"
+    )
+    password_hash_max_queue: int = Field(
+        default=32,
+        description="Hashing jobs allowed to wait for a worker before logins get 503"
+    )
+
+    # Authenticated-principal cache (per process, synced via Redis pub/sub)
+    auth_principal_cache_enabled: bool = Field(
+        default=True,
+        description="Cache decoded JWT claims and user snapshots in process"
+    )
+    auth_principal_cache_ttl_seconds: int = Field(
+        default=30,
+        description="TTL in seconds for cached JWT claims (never past the token exp)"
+    )
+    auth_user_cache_ttl_seconds: int = Field(
+        default=60,
+        description="TTL in seconds for cached user snapshots"
+    )
+    auth_principal_cache_max_entries: int = Field(
+        default=10000,
+        description="Max cached tokens and users per process"
+    )
+    auth_revocation_bloom_capacity: int = Field(
+        default=100000,
+        description="Expected revoked tokens sized into the revocation Bloom filter"
+    )
+
     # Email (SMTP for password reset)
     smtp_host: str = Field(default="smtp.gmail.com", description="SMTP server host", alias="MAIL_SERVER")
     smtp_port: int = Field(default=587, description="SMTP server port", alias="MAIL_PORT")
@@ -214,6 +246,26 @@ class Settings(BaseSettings):
     saptiva_base_url: str = Field(default="https://api.saptiva.com", description="SAPTIVA API base URL")
     saptiva_timeout: int = Field(default=30, description="SAPTIVA request timeout")
     saptiva_max_retries: int = Field(default=3, description="SAPTIVA max retries")
+    saptiva_max_connections: int = Field(
+        default=50,
+        description="SAPTIVA connection pool size shared by all bulkheads"
+    )
+    saptiva_interactive_reserve: int = Field(
+        default=15,
+        description="SAPTIVA connections only interactive (chat) requests may use"
+    )
+    saptiva_hedging_enabled: bool = Field(
+        default=True,
+        description="Hedge idempotent non-streaming SAPTIVA calls after the observed p95 latency"
+    )
+    saptiva_retry_budget_ratio: float = Field(
+        default=0.2,
+        description="Retries + hedges allowed as a fraction of SAPTIVA requests (10s window)"
+    )
+    saptiva_retry_budget_min_per_second: float = Field(
+        default=5.0,
+        description="Retries + hedges always allowed per second regardless of traffic"
+    )
 
     @computed_field
     @property
@@ -288,7 +340,66 @@ class Settings(BaseSettings):
     rate_limit_enabled: bool = Field(default=True, description="Enable rate limiting")
     rate_limit_calls: int = Field(default=100, description="Rate limit calls per period")
     rate_limit_period: int = Field(default=60, description="Rate limit period in seconds")
-    
+    rate_limit_global_enabled: bool = Field(
+        default=False,
+        description="Also enforce RATE_LIMIT_CALLS per RATE_LIMIT_PERIOD per client IP on every request (per-route limits apply regardless)"
+    )
+    rate_limit_trusted_proxy_hops: int = Field(
+        default=1,
+        description="Proxies in front of the API that append to X-Forwarded-For (0 ignores the header)"
+    )
+
+    # MCP long-running tasks (POST /api/mcp/tasks)
+    mcp_task_backend: str = Field(
+        default="memory",
+        description="Task store and queue: 'memory' (single process) or 'redis' (shared by replicas)"
+    )
+    mcp_task_workers: int = Field(
+        default=4,
+        description="Tasks run concurrently per process; 0 only queues them for standalone workers"
+    )
+    mcp_task_ttl_hours: int = Field(default=24, description="Hours finished tasks are kept")
+    mcp_task_cancel_grace_seconds: float = Field(
+        default=5.0,
+        description="Time a cancelled task has to stop at a checkpoint before it is cancelled outright"
+    )
+
+    # MCP request body limit (checked from Content-Length before the body is read)
+    mcp_max_request_body_bytes: int = Field(
+        default=1310720,
+        description="Max request body for /api/mcp routes in bytes (payloads themselves are capped at 1024KB; 0 disables)"
+    )
+
+    # MCP batch invocation (POST /api/mcp/invoke/batch)
+    mcp_batch_max_items: int = Field(default=20, description="Max invocations per batch")
+    mcp_batch_max_concurrency: int = Field(default=4, description="Max invocations of one batch running at once")
+    mcp_batch_item_timeout_ms: int = Field(default=30000, description="Max time per batch invocation")
+
+    # MCP latency tracking (rolling in-process percentiles and SLO)
+    mcp_latency_window_seconds: float = Field(default=300.0, description="Rolling window for in-process latency percentiles")
+    mcp_latency_window_max_samples: int = Field(default=2048, description="Max samples kept per tool/version/phase window")
+    mcp_latency_slo_p95_ms: float = Field(default=5000.0, description="Default p95 latency SLO for MCP tool invocations")
+    mcp_latency_slo_overrides: str = Field(
+        default="",
+        description="Per-tool p95 SLOs in ms, comma-separated (e.g. 'audit_file=30000,get_relevant_segments=800')"
+    )
+    mcp_latency_slo_min_samples: int = Field(default=20, description="Samples in the window before a tool can breach its SLO")
+
+    # MCP lazy tool registry preloading
+    mcp_tool_preload_top_n: int = Field(default=3, description="Most-used tools loaded in the background after startup (0 disables)")
+    mcp_tool_preload_delay_seconds: float = Field(default=10.0, description="Delay after startup before preloading tools")
+    mcp_tool_stats_flush_seconds: float = Field(default=60.0, description="Interval for persisting tool usage stats to Redis")
+
+    # MCP tool result cache
+    mcp_tool_cache_stale_seconds: int = Field(default=3600, description="How long an expired tool result may still be served while it is refreshed")
+    mcp_tool_cache_compress_min_bytes: int = Field(default=1024, description="Tool results at least this large are stored zlib-compressed")
+    mcp_warmup_tools: str = Field(
+        default="excel_analyzer",
+        description="Comma-separated tools warmed in the background when a document finishes ingesting (empty disables); only tools with a cache reader (see WARMUP_SPECS) apply"
+    )
+    mcp_warmup_concurrency: int = Field(default=2, description="Documents warmed at once")
+    mcp_warmup_queue_size: int = Field(default=200, description="Documents waiting for warmup before new ones are dropped")
+
     # CORS - Parse from environment variable or use defaults
     cors_origins: List[str] = Field(
         default=["http://localhost:3000"],
@@ -380,6 +491,70 @@ class Settings(BaseSettings):
         description="Recent messages to include in LLM context"
     )
 
+    # Memoized deterministic LLM sub-tasks (titles, executive summaries)
+    llm_memo_enabled: bool = Field(
+        default=True,
+        description="Cache low-temperature LLM sub-task responses in Redis"
+    )
+    llm_memo_ttl_seconds: int = Field(
+        default=86400,
+        description="TTL in seconds for memoized LLM responses"
+    )
+    llm_memo_max_temperature: float = Field(
+        default=0.3,
+        description="Only memoize LLM calls at or below this temperature"
+    )
+
+    # Semantic response cache (repeated questions over the same documents)
+    semantic_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse answers to near-identical questions over unchanged documents"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Min cosine similarity between questions to serve a cached answer"
+    )
+    semantic_cache_ttl_seconds: int = Field(
+        default=86400,
+        description="TTL in seconds for cached answers"
+    )
+    semantic_cache_max_entries: int = Field(
+        default=100,
+        description="Max cached answers kept per document/model/prompt scope"
+    )
+
+    # Recent-message window cache (Redis write-through, MongoDB fallback)
+    recent_messages_cache_size: int = Field(
+        default=40,
+        description="Max messages kept per chat in the Redis recent-message window"
+    )
+    recent_messages_cache_ttl: int = Field(
+        default=3600,
+        description="TTL in seconds for the Redis recent-message window"
+    )
+
+    # Rolling conversation summaries (bounds prompt size on long chats)
+    context_summary_enabled: bool = Field(
+        default=True,
+        description="Fold older messages into a rolling summary instead of sending them verbatim"
+    )
+    context_summary_recent_messages: int = Field(
+        default=6,
+        description="Recent messages (last K) sent verbatim alongside the summary"
+    )
+    context_summary_trigger_messages: int = Field(
+        default=8,
+        description="Unsummarized messages outside the recent window that trigger a background summary update"
+    )
+    context_summary_model: str = Field(
+        default="Saptiva Turbo",
+        description="Model used to produce conversation summaries"
+    )
+    context_summary_max_tokens: int = Field(
+        default=400,
+        description="Max tokens for a generated summary"
+    )
+
     def log_config_safely(self) -> dict:
         """Return configuration for logging with secrets masked."""
         config = {}
@@ -138,12 +138,14 @@ class APIError(Exception):
         detail: str,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
         code: str = "API_ERROR",
-        title: str | None = None
+        title: str | None = None,
+        headers: dict[str, str] | None = None
     ):
         self.detail = detail
         self.status_code = status_code
         self.code = code  # P0-AUTH-ERRMAP: Semantic error code
         self.title = title or detail
+        self.headers = headers or {}
         super().__init__(detail)
 
 
@@ -189,6 +191,23 @@ class ConflictError(APIError):
         super().__init__(detail, status.HTTP_409_CONFLICT, code)
 
 
+class ServiceUnavailableError(APIError):
+    """Temporary overload; the client should retry after ``retry_after`` seconds."""
+
+    def __init__(
+        self,
+        detail: str = "Service temporarily unavailable",
+        code: str = "SERVICE_UNAVAILABLE",
+        retry_after: int = 1
+    ):
+        super().__init__(
+            detail,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            code,
+            headers={"Retry-After": str(retry_after)}
+        )
+
+
 async def api_exception_handler(request: Request, exc: APIError) -> JSONResponse:
     """Handle custom API exceptions with Problem Details format (RFC 7807)."""
     logger.warning(
@@ -213,7 +232,7 @@ async def api_exception_handler(request: Request, exc: APIError) -> JSONResponse
     }
 
     # P0-AUTH-NOSTORE: Add no-cache headers for auth endpoints
-    headers = {}
+    headers = dict(getattr(exc, 'headers', None) or {})
     if request.url.path.startswith("/api/auth"):
         headers["Cache-Control"] = "no-store, no-cache, must-revalidate, private"
         headers["Pragma"] = "no-cache"
@@ -5,8 +5,12 @@ Permite configurar prompts base, addendums y parámetros específicos por modelo
 
 import hashlib
 import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import structlog
 import yaml
@@ -48,6 +52,32 @@ class PromptEntry(BaseModel):
     params: ModelParams = Field(default_factory=ModelParams, description="Parámetros de generación")
 
 
+@dataclass(frozen=True)
+class ResolvedPrompt:
+    """
+    Bundle resuelto (system prompt + parámetros) para un (modelo, tools, canal).
+
+    Inmutable: se comparte entre turnos y ``unpack`` entrega copias que el
+    llamador puede modificar libremente.
+    """
+
+    system_text: str
+    params: Mapping[str, Any]
+    metadata: Mapping[str, Any]
+
+    def unpack(self) -> Tuple[str, Dict]:
+        """Retornar (system_text, params) con params y _metadata como dicts nuevos."""
+        params = {
+            key: list(value) if isinstance(value, (list, tuple)) else value
+            for key, value in self.params.items()
+        }
+        params["_metadata"] = dict(self.metadata)
+        return self.system_text, params
+
+
+BundleKey = Tuple[str, Optional[str], str]
+
+
 class PromptRegistry:
     """
     Registro centralizado de system prompts y parámetros por modelo.
@@ -69,6 +99,9 @@ class PromptRegistry:
         "code": 2048,
     }
 
+    # Tope de bundles en cache (tools_markdown puede variar por request)
+    MAX_BUNDLES = 256
+
     def __init__(self, registry_path: Optional[str] = None):
         """
         Inicializar registro de prompts.
@@ -82,6 +115,12 @@ class PromptRegistry:
         self.org_name: str = "Saptiva"
         self.models: Dict[str, PromptEntry] = {}
 
+        # Cache LRU de bundles resueltos (los bundles son inmutables).
+        # {CURRENT_DATE} queda fijo en el texto, así que la cache se
+        # descarta al cambiar el día.
+        self._bundles: "OrderedDict[BundleKey, ResolvedPrompt]" = OrderedDict()
+        self._bundles_date: Optional[str] = None
+
         if registry_path:
             self.load(registry_path)
 
@@ -157,6 +196,10 @@ class PromptRegistry:
             if not self.models:
                 raise ValueError("No valid models loaded from registry")
 
+            # Recarga: descartar bundles del registro anterior y precompilar
+            self.invalidate()
+            self.precompile()
+
             logger.info(
                 "Prompt registry loaded successfully",
                 path=path,
@@ -173,6 +216,30 @@ class PromptRegistry:
             logger.error("Failed to load prompt registry", error=str(e), path=path)
             raise
 
+    def invalidate(self) -> None:
+        """Descartar todos los bundles resueltos (llamar tras modificar ``models``)."""
+        self._bundles = OrderedDict()
+        self._bundles_date = None
+
+    def precompile(self, tools_states: Tuple[Optional[str], ...] = (None,)) -> int:
+        """
+        Resolver de antemano los bundles de cada modelo y canal.
+
+        Los bundles con otros ``tools_markdown`` se compilan en el primer
+        ``resolve`` que los pide y quedan en cache desde ese momento.
+
+        Args:
+            tools_states: Variantes de tools_markdown a precompilar
+
+        Returns:
+            Número de bundles en cache
+        """
+        for model in self.models:
+            for channel in self.CHANNEL_MAX_TOKENS:
+                for tools_markdown in tools_states:
+                    self._get_bundle(model, tools_markdown, channel)
+        return len(self._bundles)
+
     def resolve(
         self,
         model: str,
@@ -182,6 +249,9 @@ class PromptRegistry:
         """
         Resolver system prompt y parámetros para un modelo y canal.
 
+        El bundle se compila una vez por (modelo, tools_markdown, canal) y se
+        reutiliza; cada llamada recibe copias propias de los parámetros.
+
         Args:
             model: Nombre del modelo (e.g., "Saptiva Turbo", "Saptiva Cortex")
             tools_markdown: Descripción de herramientas en markdown (opcional)
@@ -192,6 +262,38 @@ class PromptRegistry:
             - system_text: System prompt completamente resuelto
             - params_dict: Diccionario con parámetros de generación
         """
+        return self._get_bundle(model, tools_markdown, channel).unpack()
+
+    def _get_bundle(self, model: str, tools_markdown: Optional[str], channel: str) -> ResolvedPrompt:
+        """Obtener bundle de la cache o compilarlo (LRU de ``MAX_BUNDLES``)."""
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        if current_date != self._bundles_date:
+            self._bundles = OrderedDict()
+            self._bundles_date = current_date
+
+        key = (model, tools_markdown, channel)
+        bundles = self._bundles
+        bundle = bundles.get(key)
+        if bundle is not None:
+            bundles.move_to_end(key)
+            return bundle
+
+        bundle = self._compile(model, tools_markdown, channel, current_date)
+        bundles[key] = bundle
+        # Descartar solo los menos usados; los bundles precompilados que se
+        # siguen pidiendo no se pierden por un pico de tools_markdown distintos
+        while len(bundles) > self.MAX_BUNDLES:
+            bundles.popitem(last=False)
+        return bundle
+
+    def _compile(
+        self,
+        model: str,
+        tools_markdown: Optional[str],
+        channel: str,
+        current_date: str
+    ) -> ResolvedPrompt:
+        """Resolver un bundle desde el registro (sin cache)."""
         # Resolver modelo (fallback a default si no existe)
         entry = self.models.get(model)
         if not entry:
@@ -210,10 +312,8 @@ class PromptRegistry:
         system_text = entry.system_base
         system_text = system_text.replace("{CopilotOS}", self.copilot_name)
         system_text = system_text.replace("{Saptiva}", self.org_name)
-        
+
         # Inyectar fecha actual para grounding temporal
-        from datetime import datetime
-        current_date = datetime.now().strftime("%Y-%m-%d")
         system_text = system_text.replace("{CURRENT_DATE}", current_date)
 
         # Paso 2: Inyectar herramientas si están disponibles
@@ -245,7 +345,7 @@ class PromptRegistry:
         # else: el modelo ya definió max_tokens en sus params, lo respetamos
 
         # Agregar metadata
-        params["_metadata"] = {
+        metadata = {
             "model": model,
             "channel": channel,
             "version": self.version,  # For test compatibility
@@ -256,15 +356,22 @@ class PromptRegistry:
         }
 
         logger.debug(
-            "Resolved prompt for model",
+            "Compiled prompt bundle for model",
             model=model,
             channel=channel,
-            system_hash=params["_metadata"]["system_hash"],
+            system_hash=metadata["system_hash"],
             prompt_length=len(system_text),
             max_tokens=params["max_tokens"]
         )
 
-        return system_text, params
+        return ResolvedPrompt(
+            system_text=system_text,
+            params=MappingProxyType({
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in params.items()
+            }),
+            metadata=MappingProxyType(metadata),
+        )
 
     @staticmethod
     def _hash_system_prompt(system_text: str) -> str:
@@ -0,0 +1,262 @@
+"""
+Distributed sliding-window rate limiting.
+
+One engine serves the HTTP middleware, per-route limits, upload throttling
+and MCP tool invocations, so limits hold across workers and replicas.
+
+Each check is a single Redis round-trip: a Lua script trims, counts, adds
+and sets the TTL of every window (minute, hour, ...) atomically, using the
+Redis clock so replicas with skewed clocks agree.
+
+Before going to Redis, an in-process token bucket per key and window
+(capacity = limit, refilled at limit/window) rejects keys this worker alone
+has already pushed past the limit. A bucket can only be empty if this
+worker made ~limit allowed requests within the window, which the global
+window would reject anyway, so the pre-check never denies a request Redis
+would accept; it just keeps abusive clients off Redis.
+
+If Redis is unavailable the engine falls back to an in-memory sliding window
+(per worker) and retries the connection after a short backoff.
+"""
+
+import math
+import time
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence
+from uuid import uuid4
+
+import structlog
+
+from .redis_cache import get_redis_cache
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "ratelimit"
+REDIS_RETRY_SECONDS = 30.0
+MAX_LOCAL_BUCKETS = 10000
+
+
+@dataclass(frozen=True)
+class RateWindow:
+    """At most ``limit`` requests per ``seconds``."""
+
+    limit: int
+    seconds: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.seconds}s"
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of one check."""
+
+    allowed: bool
+    limit: int          # Limit of the tightest window
+    remaining: int      # Requests left in the tightest window
+    retry_after: float  # Seconds until a request may succeed (0 when allowed)
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Retry-After header value (whole seconds, at least 1 when denied)."""
+        return max(1, math.ceil(self.retry_after)) if not self.allowed else 0
+
+
+class _TokenBucket:
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+
+    def __init__(self, capacity: int, rate: float, now: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimitEngine:
+    """Sliding-window limiter: local token-bucket pre-check + one Redis script."""
+
+    # KEYS: one sorted set per window | ARGV: member, (limit, window_ms) per window, [cost]
+    # Returns {allowed, retry_after_ms, count per window...} (counts before this request)
+    _SLIDING_WINDOW_SCRIPT = """
+    local time = redis.call('TIME')
+    local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+    local cost = tonumber(ARGV[#KEYS * 2 + 2] or '1')
+    local result = {1, 0}
+    for i, key in ipairs(KEYS) do
+        local limit = tonumber(ARGV[i * 2])
+        local window = tonumber(ARGV[i * 2 + 1])
+        redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+        local count = redis.call('ZCARD', key)
+        if count + cost > limit then
+            result[1] = 0
+            -- Wait until enough of the oldest entries leave the window
+            local retry = window
+            if cost <= limit then
+                local oldest = redis.call('ZRANGE', key, count + cost - limit - 1, count + cost - limit - 1, 'WITHSCORES')
+                if oldest[2] then retry = tonumber(oldest[2]) + window - now end
+            end
+            if retry > result[2] then result[2] = retry end
+        end
+        result[i + 2] = count
+    end
+    if result[1] == 1 then
+        for i, key in ipairs(KEYS) do
+            for n = 1, cost do
+                redis.call('ZADD', key, now, ARGV[1] .. ':' .. n)
+            end
+            redis.call('PEXPIRE', key, ARGV[i * 2 + 1])
+        end
+    end
+    return result
+    """
+
+    def __init__(self, redis_client=None, *, use_redis: bool = True, prefix: str = KEY_PREFIX):
+        self.use_redis = use_redis
+        self.prefix = prefix
+        self._redis = redis_client
+        self._script = None
+        self._redis_retry_at = 0.0
+        self._buckets: "OrderedDict[tuple, List[_TokenBucket]]" = OrderedDict()
+        # In-memory fallback: timestamps of allowed requests per key
+        self.local_log: Dict[str, Deque[float]] = defaultdict(deque)
+
+    async def _get_script(self):
+        """Registered Lua script (EVALSHA), or None while Redis is unavailable."""
+        if not self.use_redis:
+            return None
+        if self._script is not None:
+            return self._script
+        if time.monotonic() < self._redis_retry_at:
+            return None
+
+        try:
+            if self._redis is None:
+                redis_cache = await get_redis_cache()
+                if redis_cache.client is None:
+                    await redis_cache.connect()
+                self._redis = redis_cache.client
+            if self._redis is not None:
+                self._script = self._redis.register_script(self._SLIDING_WINDOW_SCRIPT)
+        except Exception as exc:
+            logger.warning("Rate limiter Redis init failed, using in-memory fallback", error=str(exc))
+
+        if self._script is None:
+            self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        return self._script
+
+    def _local_buckets(self, key: str, windows: Sequence[RateWindow], now: float) -> List[_TokenBucket]:
+        bucket_key = (key, tuple(windows))
+        buckets = self._buckets.get(bucket_key)
+        if buckets is None:
+            buckets = [_TokenBucket(w.limit, w.limit / w.seconds, now) for w in windows]
+            self._buckets[bucket_key] = buckets
+            # Evicting a bucket only forgets local history; Redis stays authoritative
+            while len(self._buckets) > MAX_LOCAL_BUCKETS:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(bucket_key)
+        for bucket in buckets:
+            bucket.refill(now)
+        return buckets
+
+    async def hit(self, key: str, windows: Sequence[RateWindow], cost: int = 1) -> RateLimitResult:
+        """
+        Count ``cost`` requests for ``key`` against every window, if all allow them.
+
+        A batch of N calls is one check with ``cost=N``: all-or-nothing, one round-trip.
+        """
+        now = time.monotonic()
+        tightest = min(windows, key=lambda w: w.limit)
+        buckets = self._local_buckets(key, windows, now)
+
+        empty = [b for b in buckets if b.tokens < cost]
+        if empty:
+            retry_after = max((cost - b.tokens) / b.rate for b in empty)
+            return RateLimitResult(False, tightest.limit, 0, retry_after)
+
+        script = await self._get_script()
+        if script is not None:
+            try:
+                result = await self._run_script(script, key, windows, cost)
+            except Exception as exc:
+                logger.warning("Rate limiter Redis error, using in-memory fallback", key=key, error=str(exc))
+                self._script = None
+                self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+                result = self._hit_local(key, windows, time.time(), cost)
+        else:
+            result = self._hit_local(key, windows, time.time(), cost)
+
+        if result.allowed:
+            for bucket in buckets:
+                bucket.tokens -= cost
+        return result
+
+    async def _run_script(self, script, key: str, windows: Sequence[RateWindow], cost: int = 1) -> RateLimitResult:
+        # Hash tag keeps every window of a key in one cluster slot (scripts need that)
+        keys = [f"{self.prefix}:{{{key}}}:{w.name}" for w in windows]
+        args: List = [uuid4().hex]
+        for window in windows:
+            args.extend((window.limit, window.seconds * 1000))
+        if cost != 1:
+            args.append(cost)
+
+        allowed, retry_after_ms, *counts = await script(keys=keys, args=args)
+        tightest = min(range(len(windows)), key=lambda i: windows[i].limit)
+        limit = windows[tightest].limit
+        if not allowed:
+            return RateLimitResult(False, limit, 0, int(retry_after_ms) / 1000)
+        return RateLimitResult(True, limit, max(0, limit - int(counts[tightest]) - cost), 0.0)
+
+    def trim_local(self, key: str, now: float, window_seconds: float) -> Deque[float]:
+        """Drop fallback timestamps older than ``window_seconds``."""
+        log = self.local_log[key]
+        cutoff = now - window_seconds
+        while log and log[0] <= cutoff:
+            log.popleft()
+        return log
+
+    def _hit_local(self, key: str, windows: Sequence[RateWindow], now: float, cost: int = 1) -> RateLimitResult:
+        log = self.trim_local(key, now, max(w.seconds for w in windows))
+        allowed = True
+        retry_after = 0.0
+        tightest_remaining: Optional[int] = None
+        tightest = min(windows, key=lambda w: w.limit)
+
+        for window in windows:
+            start = bisect_left(log, now - window.seconds)
+            count = len(log) - start
+            if count + cost > window.limit:
+                allowed = False
+                excess = count + cost - window.limit
+                wait = log[start + excess - 1] + window.seconds - now if cost <= window.limit else window.seconds
+                retry_after = max(retry_after, wait)
+            if window is tightest:
+                tightest_remaining = window.limit - count - cost
+
+        if not allowed:
+            return RateLimitResult(False, tightest.limit, 0, retry_after)
+        log.extend([now] * cost)
+        return RateLimitResult(True, tightest.limit, max(0, tightest_remaining or 0), 0.0)
+
+
+_engine_instance: Optional[RateLimitEngine] = None
+
+
+def get_rate_limit_engine() -> RateLimitEngine:
+    """
+    Get singleton RateLimitEngine instance.
+
+    Returns:
+        RateLimitEngine singleton instance
+    """
+    global _engine_instance
+    if _engine_instance is None:
+        _engine_instance = RateLimitEngine()
+    return _engine_instance
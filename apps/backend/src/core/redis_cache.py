@@ -1,5 +1,5 @@
 """
-Redis cache for chat history and research tasks.
+Redis cache for chat history, research tasks and recent-message windows.
 """
 
 import json
@@ -271,6 +271,18 @@ class RedisCache:
         except Exception as e:
             logger.warning("Error setting cache", key=key, error=str(e))
 
+    async def ttl(self, key: str) -> Optional[int]:
+        """Remaining time to live of a key in seconds (None if missing or without expiry)"""
+        if not self.client:
+            return None
+
+        try:
+            remaining = await self.client.ttl(key)
+            return remaining if remaining > 0 else None
+        except Exception as e:
+            logger.warning("Error getting cache TTL", key=key, error=str(e))
+            return None
+
     async def delete_pattern(self, pattern: str):
         """Delete all keys matching a pattern"""
         if not self.client:
@@ -306,6 +318,173 @@ class RedisCache:
         await self.invalidate_chat_history(chat_id)
         await self.invalidate_research_tasks(chat_id)
 
+    # ======================================
+    # RECENT MESSAGE WINDOW (write-through)
+    # ======================================
+    # Per-chat capped list of serialized messages, newest first. The list is
+    # only (re)built from MongoDB, and writers only append to an existing list
+    # (LPUSHX), so a present list is always a contiguous prefix of history.
+    # A generation counter bumped by every writer prevents a slow reader from
+    # repopulating the window with a snapshot that misses a newer message.
+
+    _POPULATE_RECENT_SCRIPT = """
+    local gen = redis.call('GET', KEYS[2]) or '0'
+    if gen ~= ARGV[1] then
+        return 0
+    end
+    redis.call('DEL', KEYS[1])
+    if #ARGV > 2 then
+        redis.call('RPUSH', KEYS[1], unpack(ARGV, 3))
+        redis.call('EXPIRE', KEYS[1], ARGV[2])
+    end
+    return 1
+    """
+
+    @staticmethod
+    def _recent_messages_keys(chat_id: str) -> tuple:
+        return f"recent_messages:{chat_id}", f"recent_messages:{chat_id}:gen"
+
+    async def get_recent_messages(
+        self,
+        chat_id: str,
+        limit: int
+    ) -> tuple:
+        """
+        Get the cached recent-message window.
+
+        Returns:
+            Tuple of (messages newest first or None on miss, generation)
+        """
+        if not self.client:
+            return None, None
+
+        list_key, gen_key = self._recent_messages_keys(chat_id)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.exists(list_key)
+            pipe.lrange(list_key, 0, limit - 1)
+            pipe.get(gen_key)
+            exists, items, gen = await pipe.execute()
+
+            if not exists:
+                return None, gen or "0"
+            return [json.loads(item) for item in items], gen or "0"
+
+        except Exception as e:
+            logger.warning("Error getting recent messages", chat_id=chat_id, error=str(e))
+            return None, None
+
+    async def populate_recent_messages(
+        self,
+        chat_id: str,
+        messages: list,
+        generation: str
+    ) -> bool:
+        """
+        Replace the recent-message window with a MongoDB snapshot.
+
+        Skipped if a writer appended a message since ``generation`` was read.
+        """
+        if not self.client or generation is None:
+            return False
+
+        list_key, gen_key = self._recent_messages_keys(chat_id)
+        try:
+            size = self.settings.recent_messages_cache_size
+            payload = [json.dumps(msg, default=str) for msg in messages[:size]]
+            result = await self.client.eval(
+                self._POPULATE_RECENT_SCRIPT,
+                2,
+                list_key,
+                gen_key,
+                generation,
+                self.settings.recent_messages_cache_ttl,
+                *payload
+            )
+            return bool(result)
+
+        except Exception as e:
+            logger.warning("Error populating recent messages", chat_id=chat_id, error=str(e))
+            return False
+
+    # Write-through + invalidation for a newly persisted message in ONE call.
+    # KEYS/ARGV layout: recent list, generation key | message, cap, ttl, patterns...
+    _COMMIT_MESSAGE_SCRIPT = """
+    redis.call('LPUSHX', KEYS[1], ARGV[1])
+    redis.call('LTRIM', KEYS[1], 0, tonumber(ARGV[2]) - 1)
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    redis.call('INCR', KEYS[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+    local deleted = 0
+    for i = 4, #ARGV do
+        local keys = redis.call('KEYS', ARGV[i])
+        for j = 1, #keys, 500 do
+            deleted = deleted + redis.call('DEL', unpack(keys, j, math.min(j + 499, #keys)))
+        end
+    end
+    return deleted
+    """
+
+    async def commit_chat_message(
+        self,
+        chat_id: str,
+        message: dict,
+        invalidate_research: bool = False
+    ) -> bool:
+        """
+        Apply every cache side effect of a new message in a single round-trip.
+
+        Pushes the message onto the recent-message window and drops the chat
+        history / timeline caches (plus research tasks if requested), the same
+        keys invalidate_chat_history() and invalidate_research_tasks() delete.
+
+        Returns:
+            True if the script ran
+        """
+        if not self.client:
+            return False
+
+        list_key, gen_key = self._recent_messages_keys(chat_id)
+        patterns = [
+            f"cache:chat_history:{chat_id}*",
+            f"chat_timeline:{chat_id}:*"
+        ]
+        if invalidate_research:
+            patterns.append(f"cache:research_tasks:{chat_id}*")
+
+        try:
+            deleted = await self.client.eval(
+                self._COMMIT_MESSAGE_SCRIPT,
+                2,
+                list_key,
+                gen_key,
+                json.dumps(message, default=str),
+                self.settings.recent_messages_cache_size,
+                self.settings.recent_messages_cache_ttl,
+                *patterns
+            )
+            logger.debug("Committed chat message to cache", chat_id=chat_id, keys_deleted=deleted)
+            return True
+
+        except Exception as e:
+            logger.warning("Error committing chat message to cache", chat_id=chat_id, error=str(e))
+            return False
+
+    async def invalidate_recent_messages(self, chat_id: str):
+        """Drop the recent-message window (message deletions/edits)."""
+        if not self.client:
+            return
+
+        list_key, gen_key = self._recent_messages_keys(chat_id)
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.delete(list_key)
+            pipe.incr(gen_key)
+            pipe.expire(gen_key, self.settings.recent_messages_cache_ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Error invalidating recent messages", chat_id=chat_id, error=str(e))
+
 
 # Singleton instance
 _redis_cache: Optional[RedisCache] = None
@@ -0,0 +1,64 @@
+"""
+Single-flight coalescing of concurrent identical async calls.
+
+While a call for a key is running, later calls for the same key wait for its
+result instead of starting their own, so a burst of identical requests does
+the expensive work (an LLM call, a classification) once.
+
+Usage:
+    _in_flight = SingleFlight()
+
+    result = await _in_flight.run(key, lambda: compute(key))
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Per-key registry of in-flight calls (one per process/event loop)."""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def clear(self) -> None:
+        self._in_flight.clear()
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return ``await factory()``, sharing one call among concurrent callers.
+
+        The leading caller's exception is raised to every waiting caller. If
+        the leader is cancelled, waiting callers run the call themselves.
+        """
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The leading call was cancelled: make our own below
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await factory()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved: there may be no followers waiting on it
+            future.exception()
+            raise
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
@@ -154,6 +154,88 @@ CHAT_LLM_TIMEOUT_TOTAL = Counter(
     registry=CUSTOM_REGISTRY
 )
 
+# SAPTIVA bulkheads (adaptive concurrency per purpose)
+LLM_QUEUE_WAIT_SECONDS = Histogram(
+    'copilotos_llm_queue_wait_seconds',
+    'Time SAPTIVA requests waited for a bulkhead slot',
+    ['purpose'],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0],
+    registry=CUSTOM_REGISTRY
+)
+
+LLM_CONCURRENCY_LIMIT = Gauge(
+    'copilotos_llm_concurrency_limit',
+    'Current adaptive concurrency limit per SAPTIVA bulkhead',
+    ['purpose'],
+    registry=CUSTOM_REGISTRY
+)
+
+LLM_IN_FLIGHT = Gauge(
+    'copilotos_llm_in_flight_requests',
+    'SAPTIVA requests in flight per bulkhead',
+    ['purpose'],
+    registry=CUSTOM_REGISTRY
+)
+
+LLM_BULKHEAD_REJECTIONS = Counter(
+    'copilotos_llm_bulkhead_rejections_total',
+    'SAPTIVA requests rejected by a bulkhead',
+    ['purpose', 'reason'],
+    registry=CUSTOM_REGISTRY
+)
+
+LLM_HEDGED_REQUESTS = Counter(
+    'copilotos_llm_hedged_requests_total',
+    'Hedged SAPTIVA requests (sent, won by the hedge)',
+    ['purpose', 'outcome'],
+    registry=CUSTOM_REGISTRY
+)
+
+LLM_RETRY_BUDGET_EXHAUSTED = Counter(
+    'copilotos_llm_retry_budget_exhausted_total',
+    'SAPTIVA retries or hedges skipped because the retry budget was spent',
+    ['purpose', 'kind'],
+    registry=CUSTOM_REGISTRY
+)
+
+# Password hashing pool (argon2/bcrypt off the event loop)
+PASSWORD_HASH_SECONDS = Histogram(
+    'copilotos_password_hash_seconds',
+    'Time spent hashing or verifying a password in the hashing pool',
+    ['operation'],
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+    registry=CUSTOM_REGISTRY
+)
+
+PASSWORD_HASH_QUEUE_WAIT_SECONDS = Histogram(
+    'copilotos_password_hash_queue_wait_seconds',
+    'Time password hashing jobs waited for a pool worker',
+    ['operation'],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+    registry=CUSTOM_REGISTRY
+)
+
+PASSWORD_HASH_REJECTIONS = Counter(
+    'copilotos_password_hash_rejections_total',
+    'Password hashing jobs rejected because the pool queue was full',
+    ['operation'],
+    registry=CUSTOM_REGISTRY
+)
+
+# MCP tool cache warmup after document ingestion
+TOOL_CACHE_WARMUP = Counter(
+    'copilotos_mcp_tool_cache_warmup_total',
+    'Tool cache warmups per document (warmed, skipped, failed, dropped)',
+    ['tool', 'outcome'],
+    registry=CUSTOM_REGISTRY
+)
+
+TOOL_CACHE_WARMUP_QUEUE = Gauge(
+    'copilotos_mcp_tool_cache_warmup_queue_depth',
+    'Documents waiting for tool cache warmup',
+    registry=CUSTOM_REGISTRY
+)
+
 TOOL_INVOCATIONS = Counter(
     'copilotos_tool_invocations_total',
     'Tool invocations grouped by key',
@@ -214,6 +296,80 @@ def record_chat_completion_latency(model: str, duration_seconds: float, has_docu
         logger.warning("Failed to record chat completion latency", error=str(exc), model=model)
 
 
+def record_llm_queue_wait(purpose: str, wait_seconds: float) -> None:
+    """Record how long a SAPTIVA request waited for a bulkhead slot."""
+    try:
+        LLM_QUEUE_WAIT_SECONDS.labels(purpose=purpose).observe(wait_seconds)
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record LLM queue wait", error=str(exc), purpose=purpose)
+
+
+def record_llm_concurrency(purpose: str, limit: int, in_flight: int) -> None:
+    """Record the adaptive limit and in-flight requests of a bulkhead."""
+    try:
+        LLM_CONCURRENCY_LIMIT.labels(purpose=purpose).set(limit)
+        LLM_IN_FLIGHT.labels(purpose=purpose).set(in_flight)
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record LLM concurrency", error=str(exc), purpose=purpose)
+
+
+def record_llm_bulkhead_rejection(purpose: str, reason: str) -> None:
+    """Increment bulkhead rejection counter."""
+    try:
+        LLM_BULKHEAD_REJECTIONS.labels(purpose=purpose, reason=reason).inc()
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record LLM bulkhead rejection", error=str(exc), purpose=purpose)
+
+
+def record_llm_hedge(purpose: str, outcome: str) -> None:
+    """Increment hedged request counter (outcome: sent, won)."""
+    try:
+        LLM_HEDGED_REQUESTS.labels(purpose=purpose, outcome=outcome).inc()
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record LLM hedge", error=str(exc), purpose=purpose)
+
+
+def record_llm_retry_budget_exhausted(purpose: str, kind: str) -> None:
+    """Increment counter of retries/hedges denied by the retry budget."""
+    try:
+        LLM_RETRY_BUDGET_EXHAUSTED.labels(purpose=purpose, kind=kind).inc()
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record retry budget exhaustion", error=str(exc), purpose=purpose)
+
+
+def record_password_hash(operation: str, wait_seconds: float, duration_seconds: float) -> None:
+    """Record queue wait and run time of a password hashing job."""
+    try:
+        PASSWORD_HASH_QUEUE_WAIT_SECONDS.labels(operation=operation).observe(wait_seconds)
+        PASSWORD_HASH_SECONDS.labels(operation=operation).observe(duration_seconds)
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record password hash", error=str(exc), operation=operation)
+
+
+def record_password_hash_rejection(operation: str) -> None:
+    """Increment password hashing rejection counter."""
+    try:
+        PASSWORD_HASH_REJECTIONS.labels(operation=operation).inc()
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record password hash rejection", error=str(exc), operation=operation)
+
+
+def record_tool_cache_warmup(tool: str, outcome: str) -> None:
+    """Increment tool cache warmup counter (outcome: warmed, skipped, failed, dropped)."""
+    try:
+        TOOL_CACHE_WARMUP.labels(tool=tool, outcome=outcome).inc()
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record tool cache warmup", error=str(exc), tool=tool)
+
+
+def record_tool_cache_warmup_queue(depth: int) -> None:
+    """Set the number of documents waiting for tool cache warmup."""
+    try:
+        TOOL_CACHE_WARMUP_QUEUE.set(depth)
+    except Exception as exc:  # pragma: no cover - best-effort metric
+        logger.warning("Failed to record tool cache warmup queue", error=str(exc))
+
+
 def increment_llm_timeout(model: str) -> None:
     """Increment LLM timeout counter."""
     try:
@@ -490,47 +646,61 @@ def setup_telemetry(settings) -> None:
     logger.info("Advanced telemetry setup complete")
 
 
-def instrument_fastapi(app) -> None:
-    """Enhanced FastAPI instrumentation with request tracking."""
-    from fastapi import Request, Response
-    import time
+class RequestInstrumentationMiddleware:
+    """
+    Pure ASGI middleware tracking request metrics and active connections.
+
+    Request duration is recorded when the response starts (as before); the
+    connection stays counted as active until the body, including a long-lived
+    SSE stream, has been fully sent.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Track an HTTP request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    @app.middleware("http")
-    async def telemetry_middleware(request: Request, call_next):
-        """Middleware to track all HTTP requests."""
         start_time = time.time()
+        method = scope["method"]
+        endpoint = scope["path"]
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # Track successful request
+                telemetry.track_request(
+                    method=method,
+                    endpoint=endpoint,
+                    status_code=message["status"],
+                    duration=time.time() - start_time
+                )
+            await send(message)
 
         # Increment active connections
         telemetry.increment_active_connections()
 
         try:
-            response = await call_next(request)
-            duration = time.time() - start_time
-
-            # Track successful request
-            telemetry.track_request(
-                method=request.method,
-                endpoint=str(request.url.path),
-                status_code=response.status_code,
-                duration=duration
-            )
-
-            return response
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
-            duration = time.time() - start_time
-
-            # Track failed request
-            telemetry.track_request(
-                method=request.method,
-                endpoint=str(request.url.path),
-                status_code=500,
-                duration=duration
-            )
+            if not response_started:
+                # Track failed request
+                telemetry.track_request(
+                    method=method,
+                    endpoint=endpoint,
+                    status_code=500,
+                    duration=time.time() - start_time
+                )
 
             ERROR_COUNT.labels(
                 error_type=type(e).__name__,
-                endpoint=str(request.url.path),
+                endpoint=endpoint,
                 severity='error'
             ).inc()
 
@@ -540,6 +710,11 @@ def instrument_fastapi(app) -> None:
             # Decrement active connections
             telemetry.decrement_active_connections()
 
+
+def instrument_fastapi(app) -> None:
+    """Enhanced FastAPI instrumentation with request tracking."""
+    app.add_middleware(RequestInstrumentationMiddleware)
+
     logger.info("FastAPI instrumentation with telemetry middleware enabled")
 
 
@@ -31,13 +31,15 @@ from .core.telemetry import (
     increment_tool_invocation,
 )
 from .middleware.auth import AuthMiddleware
-from .middleware.rate_limit import RateLimitMiddleware, limiter, _rate_limit_exceeded_handler
+from .middleware.rate_limit import RateLimitMiddleware
 from .middleware.telemetry import TelemetryMiddleware
 from .middleware.cache_control import CacheControlMiddleware
-from slowapi.errors import RateLimitExceeded
+from .middleware.body_limit import BodySizeLimitMiddleware
 from .routers import auth, chat, deep_research, health, history, reports, stream, metrics, conversations, intent, models, documents, review, features, files, mcp_admin, resources, artifacts
 from .routers import settings as settings_router
 from .services.storage import storage
+from .services.principal_cache import get_principal_cache
+from .services.password_hashing import shutdown_password_hashing_pool
 from .core.auth import get_current_user
 
 # MCP (Model Context Protocol) integration - Using FastMCP (official SDK)
@@ -46,6 +48,7 @@ try:
     from .mcp.fastapi_adapter import MCPFastAPIAdapter
     from .mcp.tasks import task_manager
     from .mcp.lazy_routes import create_lazy_mcp_router
+    from .mcp.lazy_registry import get_lazy_registry
     _mcp_enabled = True
 except ModuleNotFoundError as mcp_import_err:  # pragma: no cover - defensive guard for missing SDK deps
     # If fastmcp dependency chain is broken (e.g., mcp.types missing), downgrade gracefully
@@ -57,10 +60,12 @@ except ModuleNotFoundError as mcp_import_err:  # pragma: no cover - defensive gu
     MCPFastAPIAdapter = None  # type: ignore
     task_manager = None  # type: ignore
     create_lazy_mcp_router = None  # type: ignore
+    get_lazy_registry = None  # type: ignore
     _mcp_enabled = False
 
 # Resource lifecycle management
 from .workers.resource_cleanup_worker import get_cleanup_worker
+from .services.tool_cache_warmup import get_tool_cache_warmer
 
 
 @asynccontextmanager
@@ -77,10 +82,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await Database.connect_to_mongo()
     await storage.start_reaper()
 
+    # Keep the in-process auth caches in sync with revocations and user updates
+    principal_cache = get_principal_cache()
+    await principal_cache.start()
+
     # Start MCP task manager (only if MCP is enabled)
     if _mcp_enabled and task_manager:
         await task_manager.start()
 
+    # Pre-load the most-used MCP tools in the background (after a delay, cold start stays fast)
+    if _mcp_enabled and get_lazy_registry:
+        await get_lazy_registry().start()
+
+    # Warm MCP tool results for documents as they finish ingesting
+    if _mcp_enabled:
+        await get_tool_cache_warmer().start()
+
     # Start resource cleanup worker
     cleanup_worker = get_cleanup_worker()
     await cleanup_worker.start()
@@ -106,10 +123,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Stop resource cleanup worker
     await cleanup_worker.stop()
 
+    await principal_cache.stop()
+    shutdown_password_hashing_pool()
+
     # Stop MCP task manager
     if _mcp_enabled and task_manager:
         await task_manager.stop()
 
+    # Persist MCP tool usage stats for the next preload
+    if _mcp_enabled and get_lazy_registry:
+        await get_lazy_registry().stop()
+
+    if _mcp_enabled:
+        await get_tool_cache_warmer().stop()
+
     # Close database connection
     await Database.close_mongo_connection()
     await storage.stop_reaper()
@@ -149,12 +176,9 @@ def create_app() -> FastAPI:
     app.add_middleware(AuthMiddleware)
     app.add_middleware(RateLimitMiddleware)
     app.add_middleware(CacheControlMiddleware)  # ISSUE-023: Prevent caching of API responses
-    
-    # Rate limiter state
-    app.state.limiter = limiter
+    app.add_middleware(BodySizeLimitMiddleware)  # 413 from Content-Length before the body is read
 
     # Exception handlers
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     app.add_exception_handler(APIError, api_exception_handler)
     app.add_exception_handler(StarletteHTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
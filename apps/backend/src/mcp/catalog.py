@@ -0,0 +1,87 @@
+"""
+Compiled MCP tool catalog.
+
+Tool specs (metadata + JSON schemas) are derived from FastMCP tool objects
+through introspection. The frontend fetches the catalog on every page load,
+so the adapter compiles it once per registry state and reuses it until a
+tool is registered/removed or a tool version is registered/deprecated.
+
+Responses carry a strong ETag; clients revalidate with If-None-Match and
+get 304 Not Modified while the catalog is unchanged.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from fastapi import Request, Response
+
+# Fields /discover returns without schemas or version info
+SUMMARY_FIELDS = (
+    "name",
+    "display_name",
+    "description",
+    "category",
+    "capabilities",
+    "tags",
+    "author",
+    "requires_auth",
+)
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match already names ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 §13.1.2): ignore W/ prefixes
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def json_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """JSON response with ETag, or 304 if the client already has this body."""
+    etag = etag or make_etag(body)
+    headers = {"ETag": etag}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def dump_json(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class ToolCatalog:
+    """Immutable snapshot of every tool spec for one registry state."""
+
+    def __init__(self, key: Hashable, tools: Dict[str, Any], specs: Dict[str, dict]):
+        self.key = key
+        self.tools = tools
+        self.specs = specs
+        # GET /tools body, serialized once
+        self.tools_body = dump_json(list(specs.values()))
+        self.tools_etag = make_etag(self.tools_body)
+        # (tool, resolved version) -> GET /schema body
+        self.schemas: Dict[Tuple[str, str], bytes] = {}
+
+    def discover(self, include_schema: bool, include_versions: bool) -> List[dict]:
+        """Per-tool /discover entries (fresh dicts, specs are shared)."""
+        entries = []
+        for spec in self.specs.values():
+            entry = {field: spec[field] for field in SUMMARY_FIELDS}
+            if include_versions:
+                entry["version"] = spec["version"]
+                entry["available_versions"] = spec["available_versions"]
+            if include_schema:
+                entry["input_schema"] = spec["input_schema"]
+                entry["output_schema"] = spec["output_schema"]
+            entries.append(entry)
+        return entries
@@ -17,13 +17,18 @@ from typing import Callable, Optional, List
 import asyncio
 from datetime import datetime
 import inspect
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from types import SimpleNamespace
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from fastapi.encoders import jsonable_encoder
 from fastmcp import FastMCP, Client
+from pydantic import ValidationError
 import structlog
+from sse_starlette.sse import EventSourceResponse
 
+from ..core.config import get_settings
 from ..models.user import User
-from .tasks import task_manager, TaskPriority, TaskStatus, Task
+from .tasks import task_manager, TaskPriority, TaskStatus, Task, TERMINAL_STATUSES, get_task_context
+from .catalog import ToolCatalog, dump_json, json_response
 from .versioning import versioned_registry, parse_version_constraint
 from .security import (
     rate_limiter,
@@ -33,7 +38,7 @@ from .security import (
     PIIScrubber,
     get_user_scopes,
 )
-from .protocol import ErrorCode
+from .protocol import BatchInvokeRequest, ErrorCode
 from .metrics import metrics_collector
 
 logger = structlog.get_logger(__name__)
@@ -70,6 +75,8 @@ class MCPFastAPIAdapter:
         self.on_invoke = on_invoke
         self.client = Client(mcp_server)  # In-memory client for testing
         self.async_threshold_ms = async_threshold_ms
+        self._catalog: Optional[ToolCatalog] = None
+        task_manager.set_runner(self.run_task)
 
     def create_router(self, prefix: str = "/mcp", tags: List[str] = None) -> APIRouter:
         """
@@ -86,6 +93,7 @@ class MCPFastAPIAdapter:
 
         @router.get("/tools")
         async def list_tools(
+            request: Request,
             current_user: User = Depends(self.auth_dependency),
         ):
             """
@@ -96,44 +104,15 @@ class MCPFastAPIAdapter:
             - category, capabilities, tags
             - input_schema, output_schema (JSON Schema)
             - rate_limit, timeout_ms, max_payload_size_kb
+
+            The list is precompiled; responds 304 when If-None-Match matches the ETag.
             """
             logger.info("MCP tools listing requested", user_id=str(current_user.id))
 
-            # Use FastMCP introspection to list tools
-            tools = []
-            tool_map = await self._get_tool_map()
-            for tool_name, tool_obj in tool_map.items():
-                callable_ref = getattr(tool_obj, "fn", tool_obj)
-                # Check if tool has multiple versions in versioned registry
-                available_versions = versioned_registry.list_versions(tool_name)
-                latest_version = versioned_registry.get_latest(tool_name)
-
-                # If no versions registered, use default 1.0.0
-                if not available_versions:
-                    available_versions = ["1.0.0"]
-                    latest_version = "1.0.0"
-
-                # Extract metadata from FastMCP tool
-                tool_spec = {
-                    "name": tool_name,
-                    "version": latest_version,
-                    "available_versions": available_versions,  # NEW: List all versions
-                    "display_name": self._resolve_tool_display_name(tool_name),
-                    "description": self._resolve_tool_description(tool_obj, tool_name),
-                    "category": "general",  # Could be extracted from tool metadata
-                    "capabilities": ["async"],  # FastMCP tools are async by default
-                    "tags": [],
-                    "author": "OctaviOS",
-                    "requires_auth": True,
-                    "input_schema": self._get_tool_input_schema(tool_obj, callable_ref),
-                    "output_schema": self._get_tool_output_schema(tool_obj, callable_ref),
-                    "timeout_ms": 30000,
-                    "max_payload_size_kb": 1024,
-                }
-                tools.append(tool_spec)
+            catalog = await self._get_catalog()
 
-            logger.info("MCP tools listed", user_id=str(current_user.id), tool_count=len(tools))
-            return tools
+            logger.info("MCP tools listed", user_id=str(current_user.id), tool_count=len(catalog.specs))
+            return json_response(request, catalog.tools_body, catalog.tools_etag)
 
         @router.post("/invoke")
         async def invoke_tool(
@@ -192,12 +171,13 @@ class MCPFastAPIAdapter:
 
             invocation_id = str(uuid4())
             start_time = time.time()
+            checks_start = time.perf_counter()
 
+            # Checks raising unexpectedly get the same error responses as execution
             try:
-                # Security Layer 1: Validate payload size
+                # Security Layer 1: Validate payload size and structure (one pass)
                 try:
-                    PayloadValidator.validate_size(payload, max_size_kb=1024)
-                    PayloadValidator.validate_structure(payload)
+                    PayloadValidator.validate(payload, max_size_kb=1024)
                 except ValueError as e:
                     duration_ms = (time.time() - start_time) * 1000
 
@@ -321,213 +301,256 @@ class MCPFastAPIAdapter:
                         "duration_ms": (time.time() - start_time) * 1000,
                         "cached": False,
                     }
+            except Exception as e:
+                return self._invocation_exception(tool_name, invocation_id, start_time, current_user, e)
+
+            response = await self._run_invocation(
+                tool_name,
+                version_constraint,
+                payload,
+                idempotency_key,
+                current_user,
+                invocation_id,
+                start_time,
+                phases={"validation": time.perf_counter() - checks_start},
+            )
+            return self._serialize_invocation(response)
 
-                # Resolve version if versioned registry has this tool
-                resolved_version = None
-                tool_impl = None
-                tools_snapshot: Optional[dict] = None
+        @router.post("/invoke/batch")
+        async def invoke_tools_batch(
+            request: dict,
+            current_user: User = Depends(self.auth_dependency),
+        ):
+            """
+            Invoke several MCP tools in one request.
 
-                if versioned_registry.list_versions(tool_name):
-                    # Tool has versions - use versioned registry
-                    try:
-                        resolved_version, tool_impl = versioned_registry.resolve(
-                            tool_name,
-                            version_constraint
-                        )
-                        logger.debug(
-                            "Tool version resolved",
-                            tool=tool_name,
-                            constraint=version_constraint,
-                            resolved=resolved_version,
-                        )
-                    except ValueError as e:
-                        # Version resolution failed
-                        return {
-                            "success": False,
-                            "tool": tool_name,
-                            "version": version_constraint or "latest",
-                            "result": None,
-                            "error": {
-                                "code": "TOOL_NOT_FOUND",
-                                "message": str(e),
-                                "details": {
-                                    "available_versions": versioned_registry.list_versions(tool_name)
-                                },
-                            },
-                            "metadata": {},
-                            "invocation_id": invocation_id,
-                            "duration_ms": 0.0,
-                            "cached": False,
-                        }
-                else:
-                    # Tool not versioned - use FastMCP default registry
-                    tools_snapshot = await self._get_tool_map()
-                    tool_impl = tools_snapshot.get(tool_name)
-                    resolved_version = "1.0.0"
-
-                if not tool_impl:
-                    available_tools = (
-                        list(tools_snapshot.keys())
-                        if tools_snapshot is not None
-                        else list((await self._get_tool_map()).keys())
-                    )
-                    return {
-                        "success": False,
-                        "tool": tool_name,
-                        "version": resolved_version or "1.0.0",
-                        "result": None,
-                        "error": {
-                            "code": "TOOL_NOT_FOUND",
-                            "message": f"Tool '{tool_name}' not found",
-                            "details": {"available_tools": available_tools},
-                        },
-                        "metadata": {},
-                        "invocation_id": invocation_id,
-                        "duration_ms": 0.0,
-                        "cached": False,
-                    }
+            Auth, scopes and payload limits are checked once for the whole batch,
+            and the rate limit is charged once per tool (cost = its invocations).
+            Invocations run concurrently, at most ``max_concurrency`` at a time
+            (capped by MCP_BATCH_MAX_CONCURRENCY), each with its own timeout.
+            Results are streamed as Server-Sent Events in completion order.
 
-                if (
-                    tool_impl
-                    and not hasattr(tool_impl, "run")
-                    and self._callable_accepts_param(tool_impl, "user_id")
-                    and "user_id" not in payload
-                ):
-                    payload = {**payload, "user_id": str(current_user.id)}
-
-                # Execute tool
-                result = await self._execute_tool_impl(
-                    tool_name,
-                    tool_impl,
-                    payload,
-                    context={"user_id": str(current_user.id)},
-                )
+            Request format:
+            {
+                "invocations": [
+                    {"tool": "get_relevant_segments", "payload": {...}},
+                    {"tool": "excel_analyzer", "version": "^1.0.0", "payload": {...}, "timeout_ms": 10000}
+                ],
+                "max_concurrency": 4,  // optional
+                "timeout_ms": 30000  // optional, per-invocation default
+            }
 
-                duration_ms = (time.time() - start_time) * 1000
+            The body is validated as BatchInvokeRequest (concurrency and timeouts
+            must be positive and bounded); an invalid body gets 400.
 
-                # Record success metrics
-                metrics_collector.record_tool_invocation(
-                    tool=tool_name,
-                    version=resolved_version or "1.0.0",
-                    status="success",
-                    duration_seconds=duration_ms / 1000,
-                    outcome="success",
-                    user_type="user",
+            Events:
+            - result: {"index": 0, ...same body as POST /invoke...}
+            - done: {"total": 2, "succeeded": 2, "failed": 0, "duration_ms": 812.3}
+            """
+            import time
+            from uuid import uuid4
+
+            settings = get_settings()
+
+            try:
+                batch = BatchInvokeRequest.model_validate(request)
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid batch request: {field}: {error['msg']}",
                 )
 
-                response = {
-                    "success": True,
-                    "tool": tool_name,
-                    "version": resolved_version or "1.0.0",
-                    "result": result,
-                    "error": None,
-                    "metadata": {
-                        "user_id": str(current_user.id),
-                        "idempotency_key": idempotency_key,
-                        "version_constraint": version_constraint,  # NEW: Track requested constraint
-                    },
-                    "invocation_id": invocation_id,
-                    "duration_ms": duration_ms,
-                    "cached": False,
-                }
+            invocations = batch.invocations
+            if len(invocations) > settings.mcp_batch_max_items:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Too many invocations: {len(invocations)} (max: {settings.mcp_batch_max_items})",
+                )
 
-                logger.info(
-                    "MCP tool invocation succeeded",
-                    user_id=str(current_user.id),
-                    tool=tool_name,
-                    duration_ms=duration_ms,
+            # Security Layer 1 (once): total payload size
+            try:
+                PayloadValidator.validate_size(
+                    {"invocations": [item.payload for item in invocations]},
+                    max_size_kb=1024,
                 )
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-                # Callback for telemetry
-                if self.on_invoke:
-                    try:
-                        self.on_invoke(response)
-                    except Exception:  # pragma: no cover
-                        pass
+            batch_start = time.time()
+            user_scopes = get_user_scopes(current_user)
+            max_concurrency = min(
+                batch.max_concurrency or settings.mcp_batch_max_concurrency,
+                settings.mcp_batch_max_concurrency,
+            )
+            default_timeout_ms = min(
+                batch.timeout_ms or settings.mcp_batch_item_timeout_ms,
+                settings.mcp_batch_item_timeout_ms,
+            )
 
-                return response
+            logger.info(
+                "MCP batch invocation requested",
+                user_id=str(current_user.id),
+                tools=[item.tool for item in invocations],
+                max_concurrency=max_concurrency,
+            )
 
-            except ValueError as e:
-                # Input validation error
-                duration_ms = (time.time() - start_time) * 1000
+            rejected: dict = {}  # index -> error response
+            runnable: dict = {}  # tool -> [index, ...]
+            denied_tools: dict = {}  # tool -> PermissionError
+            for index, item in enumerate(invocations):
+                tool_name = item.tool
+                version = item.version or "latest"
+                start_time = time.time()
 
-                logger.warning(
-                    "MCP tool invocation failed: invalid input",
-                    user_id=str(current_user.id),
-                    tool=tool_name,
-                    error=str(e),
-                )
+                try:
+                    PayloadValidator.validate_structure(item.payload)
+                except ValueError as e:
+                    metrics_collector.record_validation_failure(
+                        tool=tool_name, version=version, error_code="VALIDATION_ERROR",
+                    )
+                    rejected[index] = self._invocation_error(
+                        tool_name, version, str(uuid4()), start_time, "validation_error",
+                        {
+                            "code": ErrorCode.VALIDATION_ERROR.value,
+                            "message": str(e),
+                            "user_message": "Request payload validation failed",
+                        },
+                    )
+                    continue
 
-                return {
-                    "success": False,
-                    "tool": tool_name,
-                    "version": "1.0.0",
-                    "result": None,
-                    "error": {
-                        "code": "INVALID_INPUT",
-                        "message": str(e),
-                        "details": {},
-                    },
-                    "metadata": {},
-                    "invocation_id": invocation_id,
-                    "duration_ms": duration_ms,
-                    "cached": False,
-                }
+                # Security Layer 2: scopes, checked once per tool
+                if tool_name not in denied_tools and tool_name not in runnable:
+                    try:
+                        ScopeValidator.validate_tool_access(user_scopes, tool_name)
+                    except PermissionError as e:
+                        denied_tools[tool_name] = e
+                if tool_name in denied_tools:
+                    required_scope = ScopeValidator.get_required_scope(tool_name)
+                    metrics_collector.record_permission_denied(
+                        tool=tool_name,
+                        required_scope=required_scope.value if required_scope else "unknown",
+                    )
+                    rejected[index] = self._invocation_error(
+                        tool_name, version, str(uuid4()), start_time, "permission_denied",
+                        {
+                            "code": ErrorCode.PERMISSION_DENIED.value,
+                            "message": str(denied_tools[tool_name]),
+                            "user_message": "You don't have permission to use this tool",
+                        },
+                    )
+                    continue
 
-            except PermissionError as e:
-                # Authorization error
-                duration_ms = (time.time() - start_time) * 1000
+                runnable.setdefault(tool_name, []).append(index)
 
-                logger.warning(
-                    "MCP tool invocation failed: permission denied",
-                    user_id=str(current_user.id),
-                    tool=tool_name,
-                    error=str(e),
+            # Security Layer 3: one rate-limit check per tool for all its invocations
+            rate_limit_config = RateLimitConfig(calls_per_minute=60, calls_per_hour=1000)
+            for tool_name, indexes in list(runnable.items()):
+                allowed, retry_after_ms = await rate_limiter.check_rate_limit(
+                    f"{current_user.id}:{tool_name}",
+                    rate_limit_config,
+                    cost=len(indexes),
                 )
+                if allowed:
+                    continue
 
-                return {
-                    "success": False,
-                    "tool": tool_name,
-                    "version": "1.0.0",
-                    "result": None,
-                    "error": {
-                        "code": "PERMISSION_DENIED",
-                        "message": str(e),
-                        "details": {},
-                    },
-                    "metadata": {},
-                    "invocation_id": invocation_id,
-                    "duration_ms": duration_ms,
-                    "cached": False,
-                }
+                del runnable[tool_name]
+                for index in indexes:
+                    metrics_collector.record_rate_limit_exceeded(tool=tool_name, user_type="user")
+                    rejected[index] = self._invocation_error(
+                        tool_name, invocations[index].version or "latest", str(uuid4()),
+                        time.time(), "rate_limit",
+                        {
+                            "code": ErrorCode.RATE_LIMIT.value,
+                            "message": f"Rate limit exceeded for tool '{tool_name}'",
+                            "user_message": "Too many requests. Please try again later.",
+                            "retry_after_ms": retry_after_ms,
+                        },
+                    )
 
-            except Exception as e:
-                # Execution error
-                duration_ms = (time.time() - start_time) * 1000
+            semaphore = asyncio.Semaphore(max_concurrency)
 
-                logger.error(
-                    "MCP tool invocation failed: execution error",
-                    user_id=str(current_user.id),
-                    tool=tool_name,
-                    error=str(e),
-                    exc_info=True,
-                )
+            async def run_one(index: int) -> tuple:
+                item = invocations[index]
+                tool_name = item.tool
+                version = item.version
+                timeout_ms = min(item.timeout_ms or default_timeout_ms, default_timeout_ms)
+                invocation_id = str(uuid4())
+                queued_at = time.perf_counter()
 
-                return {
-                    "success": False,
-                    "tool": tool_name,
-                    "version": "1.0.0",
-                    "result": None,
-                    "error": {
-                        "code": "EXECUTION_ERROR",
-                        "message": f"Tool execution failed: {str(e)}",
-                        "details": {"exc_type": type(e).__name__},
-                    },
-                    "metadata": {},
-                    "invocation_id": invocation_id,
-                    "duration_ms": duration_ms,
-                    "cached": False,
-                }
+                async with semaphore:
+                    start_time = time.time()
+                    try:
+                        response = await asyncio.wait_for(
+                            self._run_invocation(
+                                tool_name,
+                                version,
+                                item.payload,
+                                item.idempotency_key,
+                                current_user,
+                                invocation_id,
+                                start_time,
+                                phases={"queue_wait": time.perf_counter() - queued_at},
+                            ),
+                            timeout=timeout_ms / 1000,
+                        )
+                    except asyncio.TimeoutError:
+                        response = self._invocation_error(
+                            tool_name, version or "latest", invocation_id, start_time, "timeout",
+                            {
+                                "code": ErrorCode.TIMEOUT.value,
+                                "message": f"Tool '{tool_name}' exceeded timeout of {timeout_ms}ms",
+                                "user_message": "The tool took too long to respond",
+                            },
+                        )
+                return index, response
+
+            async def event_generator():
+                succeeded = 0
+                pending = [
+                    asyncio.create_task(run_one(index))
+                    for indexes in runnable.values()
+                    for index in indexes
+                ]
+                try:
+                    for index, response in sorted(rejected.items()):
+                        yield {"event": "result", "data": dump_json({"index": index, **response}).decode()}
+
+                    for next_done in asyncio.as_completed(pending):
+                        index, response = await next_done
+                        succeeded += bool(response.get("success"))
+                        serialize_start = time.perf_counter()
+                        data = dump_json({"index": index, **response}).decode()
+                        metrics_collector.record_tool_phase(
+                            response["tool"], response["version"], "serialization",
+                            time.perf_counter() - serialize_start,
+                        )
+                        yield {"event": "result", "data": data}
+
+                    duration_ms = (time.time() - batch_start) * 1000
+                    logger.info(
+                        "MCP batch invocation completed",
+                        user_id=str(current_user.id),
+                        total=len(invocations),
+                        succeeded=succeeded,
+                        duration_ms=duration_ms,
+                    )
+                    yield {
+                        "event": "done",
+                        "data": dump_json({
+                            "total": len(invocations),
+                            "succeeded": succeeded,
+                            "failed": len(invocations) - succeeded,
+                            "duration_ms": duration_ms,
+                        }).decode(),
+                    }
+                finally:
+                    # Client went away: stop invocations still running
+                    for task in pending:
+                        task.cancel()
+
+            return EventSourceResponse(event_generator())
 
         @router.get("/health")
         async def mcp_health_check(
@@ -551,7 +574,6 @@ class MCPFastAPIAdapter:
             - GET /health?include_tools=true - Health + tool list
             - GET /health?include_tools=true&include_metrics=true - Full status
             """
-            from .tasks import task_manager
             from .metrics import get_metrics_summary
 
             tool_map = await self._get_tool_map()
@@ -598,19 +620,20 @@ class MCPFastAPIAdapter:
 
             # Optional: Include task queue status
             if include_tasks:
-                pending_tasks = task_manager.list_tasks(status=__import__("src.mcp.tasks", fromlist=["TaskStatus"]).TaskStatus.PENDING)
-                running_tasks = task_manager.list_tasks(status=__import__("src.mcp.tasks", fromlist=["TaskStatus"]).TaskStatus.RUNNING)
+                pending_tasks = await task_manager.count(TaskStatus.PENDING)
+                running_tasks = await task_manager.count(TaskStatus.RUNNING)
 
                 response["tasks"] = {
-                    "pending": len(pending_tasks),
-                    "running": len(running_tasks),
-                    "queue_healthy": len(running_tasks) < 10,  # Threshold
+                    "pending": pending_tasks,
+                    "running": running_tasks,
+                    "queue_healthy": running_tasks < 10,  # Threshold
                 }
 
             return response
 
         @router.get("/discover")
         async def discover_tools(
+            request: Request,
             category: Optional[str] = Query(None, description="Filter by category"),
             capability: Optional[str] = Query(None, description="Filter by capability (async, streaming, etc.)"),
             tag: Optional[str] = Query(None, description="Filter by tag"),
@@ -654,44 +677,17 @@ class MCPFastAPIAdapter:
             )
 
             user_scopes = get_user_scopes(current_user)
-            tool_map = await self._get_tool_map()
+            catalog = await self._get_catalog()
             tools = []
 
-            for tool_name, tool_obj in tool_map.items():
-                callable_ref = getattr(tool_obj, "fn", tool_obj)
+            for tool_spec in catalog.discover(include_schema, include_versions):
                 # Check if user has access to this tool
                 try:
-                    ScopeValidator.validate_tool_access(user_scopes, tool_name)
+                    ScopeValidator.validate_tool_access(user_scopes, tool_spec["name"])
                 except PermissionError:
                     # Skip tools user doesn't have access to
                     continue
 
-                # Get version information
-                available_versions = versioned_registry.list_versions(tool_name)
-                latest_version = versioned_registry.get_latest(tool_name) if available_versions else "1.0.0"
-
-                # Extract tool metadata
-                tool_spec = {
-                    "name": tool_name,
-                    "display_name": self._resolve_tool_display_name(tool_name),
-                    "description": self._resolve_tool_description(tool_obj, tool_name),
-                    "category": "general",  # TODO: Extract from metadata
-                    "capabilities": ["async"],  # FastMCP tools are async by default
-                    "tags": [],  # TODO: Extract from metadata
-                    "author": "OctaviOS",
-                    "requires_auth": True,
-                }
-
-                # Add version information
-                if include_versions:
-                    tool_spec["version"] = latest_version
-                    tool_spec["available_versions"] = available_versions or ["1.0.0"]
-
-                # Add schemas if requested
-                if include_schema:
-                    tool_spec["input_schema"] = self._get_tool_input_schema(tool_obj, callable_ref)
-                    tool_spec["output_schema"] = self._get_tool_output_schema(tool_obj, callable_ref)
-
                 # Apply filters
                 if category and tool_spec["category"] != category:
                     continue
@@ -713,11 +709,11 @@ class MCPFastAPIAdapter:
             logger.info(
                 "MCP tool discovery completed",
                 user_id=str(current_user.id),
-                total_tools=len(tool_map),
+                total_tools=len(catalog.specs),
                 filtered_tools=len(tools),
             )
 
-            return {
+            return json_response(request, dump_json({
                 "total": len(tools),
                 "filtered": len(tools),
                 "tools": tools,
@@ -727,10 +723,11 @@ class MCPFastAPIAdapter:
                     "tag": tag,
                     "search": search,
                 },
-            }
+            }))
 
         @router.get("/schema/{tool_name}")
         async def get_tool_schema(
+            request: Request,
             tool_name: str,
             version: Optional[str] = Query(None, description="Version constraint (e.g., ^1.0.0)"),
             current_user: User = Depends(self.auth_dependency),
@@ -749,6 +746,8 @@ class MCPFastAPIAdapter:
             - Client SDK validation
             - API documentation
             - Testing and debugging
+
+            Responses are cached per resolved version and carry an ETag.
             """
             logger.info(
                 "Tool schema requested",
@@ -757,10 +756,11 @@ class MCPFastAPIAdapter:
                 version_constraint=version,
             )
 
+            catalog = await self._get_catalog()
+
             # Resolve version
             resolved_version = None
             tool_impl = None
-            tools_snapshot: Optional[dict] = None
 
             if versioned_registry.list_versions(tool_name):
                 # Tool has versions
@@ -773,8 +773,7 @@ class MCPFastAPIAdapter:
                     )
             else:
                 # Tool not versioned
-                tools_snapshot = await self._get_tool_map()
-                tool_impl = tools_snapshot.get(tool_name)
+                tool_impl = catalog.tools.get(tool_name)
                 resolved_version = "1.0.0"
 
             if not tool_impl:
@@ -783,23 +782,28 @@ class MCPFastAPIAdapter:
                     detail=f"Tool '{tool_name}' not found",
                 )
 
-            # Extract schemas
-            callable_ref = getattr(tool_impl, "fn", tool_impl)
-            input_schema = self._get_tool_input_schema(tool_impl, callable_ref)
-            output_schema = self._get_tool_output_schema(tool_impl, callable_ref)
+            body = catalog.schemas.get((tool_name, resolved_version))
+            if body is None:
+                # Extract schemas
+                callable_ref = getattr(tool_impl, "fn", tool_impl)
+                input_schema = self._get_tool_input_schema(tool_impl, callable_ref)
+                output_schema = self._get_tool_output_schema(tool_impl, callable_ref)
 
-            # Generate example payload
-            example_payload = self._generate_example_payload(input_schema)
+                # Generate example payload
+                example_payload = self._generate_example_payload(input_schema)
 
-            return {
-                "tool": tool_name,
-                "version": resolved_version,
-                "available_versions": versioned_registry.list_versions(tool_name) or ["1.0.0"],
-                "input_schema": input_schema,
-                "output_schema": output_schema,
-                "example_payload": example_payload,
-                "description": self._resolve_tool_description(tool_impl, tool_name),
-            }
+                body = dump_json({
+                    "tool": tool_name,
+                    "version": resolved_version,
+                    "available_versions": versioned_registry.list_versions(tool_name) or ["1.0.0"],
+                    "input_schema": input_schema,
+                    "output_schema": output_schema,
+                    "example_payload": example_payload,
+                    "description": self._resolve_tool_description(tool_impl, tool_name),
+                })
+                catalog.schemas[(tool_name, resolved_version)] = body
+
+            return json_response(request, body)
 
         # Task Management Routes (202 Accepted Pattern)
 
@@ -826,6 +830,7 @@ class MCPFastAPIAdapter:
                 "status": "pending",
                 "poll_url": "/api/mcp/tasks/{task_id}",
                 "cancel_url": "/api/mcp/tasks/{task_id}",
+                "events_url": "/api/mcp/tasks/{task_id}/events",
                 "estimated_duration_ms": 10000
             }
             """
@@ -875,15 +880,15 @@ class MCPFastAPIAdapter:
                 priority=priority.value,
             )
 
-            # Start task execution in background
-            import asyncio
-            asyncio.create_task(self._execute_task(task_id, tool_name, payload, current_user))
+            # Queue for the worker pool (highest priority first)
+            await task_manager.submit(task_id)
 
             return {
                 "task_id": task_id,
                 "status": "pending",
                 "poll_url": f"{prefix}/tasks/{task_id}",
                 "cancel_url": f"{prefix}/tasks/{task_id}",
+                "events_url": f"{prefix}/tasks/{task_id}/events",
                 "estimated_duration_ms": self._estimate_duration(tool_name, payload),
             }
 
@@ -909,7 +914,7 @@ class MCPFastAPIAdapter:
                 "error": {...},  // only when status=failed
             }
             """
-            task = task_manager.get_task(task_id)
+            task = await task_manager.fetch_task(task_id)
 
             if not task:
                 raise HTTPException(
@@ -924,18 +929,41 @@ class MCPFastAPIAdapter:
                     detail="Not authorized to access this task",
                 )
 
-            return {
-                "task_id": task.task_id,
-                "tool": task.tool,
-                "status": task.status.value,
-                "progress": task.progress,
-                "progress_message": task.progress_message,
-                "created_at": task.created_at.isoformat(),
-                "started_at": task.started_at.isoformat() if task.started_at else None,
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                "result": task.result,
-                "error": task.error,
-            }
+            return self._task_status_body(task)
+
+        @router.get("/tasks/{task_id}/events")
+        async def stream_task_events(
+            task_id: str,
+            current_user: User = Depends(self.auth_dependency),
+        ):
+            """
+            Stream task progress as Server-Sent Events instead of polling.
+
+            Events:
+            - progress: status/progress changed (same body as GET /tasks/{task_id})
+            - completed | failed | cancelled: final state, then the stream ends
+            """
+            task = await task_manager.fetch_task(task_id)
+
+            if not task:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Task '{task_id}' not found",
+                )
+
+            # Verify ownership
+            if task.user_id != str(current_user.id):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Not authorized to access this task",
+                )
+
+            async def event_generator():
+                async for snapshot in task_manager.watch(task_id):
+                    event = snapshot.status.value if snapshot.status in TERMINAL_STATUSES else "progress"
+                    yield {"event": event, "data": dump_json(self._task_status_body(snapshot)).decode()}
+
+            return EventSourceResponse(event_generator())
 
         @router.delete("/tasks/{task_id}", status_code=status.HTTP_202_ACCEPTED)
         async def cancel_task(
@@ -945,8 +973,9 @@ class MCPFastAPIAdapter:
             """
             Request task cancellation.
 
-            Returns 202 Accepted. The task will be marked for cancellation,
-            but actual cancellation depends on the tool checking cancellation_requested.
+            Returns 202 Accepted. The running tool stops at its next checkpoint
+            (report_progress / check_cancelled), or is cancelled after
+            MCP_TASK_CANCEL_GRACE_SECONDS if it never checks.
 
             Response:
             {
@@ -955,7 +984,7 @@ class MCPFastAPIAdapter:
                 "message": "Cancellation requested. Task will stop at next checkpoint."
             }
             """
-            task = task_manager.get_task(task_id)
+            task = await task_manager.fetch_task(task_id)
 
             if not task:
                 raise HTTPException(
@@ -971,7 +1000,7 @@ class MCPFastAPIAdapter:
                 )
 
             # Request cancellation
-            success = task_manager.request_cancellation(task_id)
+            success = await task_manager.cancel(task_id)
 
             if not success:
                 return {
@@ -1001,18 +1030,19 @@ class MCPFastAPIAdapter:
             current_user: User = Depends(self.auth_dependency),
             status_filter: Optional[str] = Query(None, alias="status"),
             tool_filter: Optional[str] = Query(None, alias="tool"),
+            limit: int = Query(default=50, ge=1, le=200, description="Number of tasks to retrieve"),
+            offset: int = Query(default=0, ge=0, description="Number of tasks to skip"),
         ):
             """
-            List user's tasks with optional filters.
+            List user's tasks with optional filters, newest first.
 
             Query params:
             - status: Filter by status (pending | running | completed | failed | cancelled)
             - tool: Filter by tool name
+            - limit / offset: Page of tasks to return
 
             Returns list of task summaries.
             """
-            from .tasks import TaskStatus
-
             # Parse status filter
             task_status = None
             if status_filter:
@@ -1024,10 +1054,12 @@ class MCPFastAPIAdapter:
                         detail=f"Invalid status: {status_filter}",
                     )
 
-            tasks = task_manager.list_tasks(
+            tasks = await task_manager.fetch_tasks(
                 user_id=str(current_user.id),
                 tool=tool_filter,
                 status=task_status,
+                offset=offset,
+                limit=limit,
             )
 
             return [
@@ -1079,6 +1111,58 @@ class MCPFastAPIAdapter:
             "required": required,
         }
 
+    async def _get_catalog(self) -> ToolCatalog:
+        """
+        Compiled tool catalog, rebuilt only when the registries change.
+
+        The key combines the versioned registry revision with the identity of
+        every FastMCP tool, so adding/removing tools or registering/deprecating
+        versions invalidates it.
+        """
+        tool_map = await self._get_tool_map()
+        key = (versioned_registry.revision, tuple((name, id(obj)) for name, obj in tool_map.items()))
+        catalog = self._catalog
+        if catalog is not None and catalog.key == key:
+            return catalog
+
+        specs = {
+            tool_name: self._build_tool_spec(tool_name, tool_obj)
+            for tool_name, tool_obj in tool_map.items()
+        }
+        self._catalog = ToolCatalog(key, dict(tool_map), specs)
+        logger.info("MCP tool catalog compiled", tool_count=len(specs), registry_revision=key[0])
+        return self._catalog
+
+    def _build_tool_spec(self, tool_name: str, tool_obj) -> dict:
+        """Full tool specification as listed by GET /tools."""
+        callable_ref = getattr(tool_obj, "fn", tool_obj)
+        # Check if tool has multiple versions in versioned registry
+        available_versions = versioned_registry.list_versions(tool_name)
+        latest_version = versioned_registry.get_latest(tool_name)
+
+        # If no versions registered, use default 1.0.0
+        if not available_versions:
+            available_versions = ["1.0.0"]
+            latest_version = "1.0.0"
+
+        # Extract metadata from FastMCP tool
+        return {
+            "name": tool_name,
+            "version": latest_version,
+            "available_versions": available_versions,
+            "display_name": self._resolve_tool_display_name(tool_name),
+            "description": self._resolve_tool_description(tool_obj, tool_name),
+            "category": "general",  # Could be extracted from tool metadata
+            "capabilities": ["async"],  # FastMCP tools are async by default
+            "tags": [],
+            "author": "OctaviOS",
+            "requires_auth": True,
+            "input_schema": self._get_tool_input_schema(tool_obj, callable_ref),
+            "output_schema": self._get_tool_output_schema(tool_obj, callable_ref),
+            "timeout_ms": 30000,
+            "max_payload_size_kb": 1024,
+        }
+
     async def _get_tool_map(self) -> dict:
         """
         Obtain the current FastMCP tool registry, compatible with FastMCP 2.x and legacy builds.
@@ -1132,6 +1216,260 @@ class MCPFastAPIAdapter:
             return schema
         return self._extract_output_schema(fallback_callable)
 
+    def _serialize_invocation(self, response: dict) -> Response:
+        """Encode an invocation response once, timed as its serialization phase."""
+        import time
+
+        serialize_start = time.perf_counter()
+        body = dump_json(jsonable_encoder(response))
+        metrics_collector.record_tool_phase(
+            response["tool"], response["version"], "serialization", time.perf_counter() - serialize_start,
+        )
+        return Response(content=body, media_type="application/json")
+
+    def _invocation_error(
+        self,
+        tool_name: str,
+        version: str,
+        invocation_id: str,
+        start_time: float,
+        outcome: str,
+        error: dict,
+    ) -> dict:
+        """Failed invocation response (same shape as POST /invoke), with metrics."""
+        import time
+
+        duration_ms = (time.time() - start_time) * 1000
+        metrics_collector.record_tool_invocation(
+            tool=tool_name,
+            version=version,
+            status="error",
+            duration_seconds=duration_ms / 1000,
+            outcome=outcome,
+            user_type="user",
+        )
+        return {
+            "success": False,
+            "tool": tool_name,
+            "version": version,
+            "result": None,
+            "error": error,
+            "metadata": {},
+            "invocation_id": invocation_id,
+            "duration_ms": duration_ms,
+            "cached": False,
+        }
+
+    def _invocation_exception(
+        self,
+        tool_name: str,
+        invocation_id: str,
+        start_time: float,
+        current_user: User,
+        e: Exception,
+    ) -> dict:
+        """Invocation response for an unexpected exception (input, permission or execution error)."""
+        import time
+
+        duration_ms = (time.time() - start_time) * 1000
+
+        if isinstance(e, ValueError):
+            # Input validation error
+            logger.warning(
+                "MCP tool invocation failed: invalid input",
+                user_id=str(current_user.id),
+                tool=tool_name,
+                error=str(e),
+            )
+            error = {"code": "INVALID_INPUT", "message": str(e), "details": {}}
+        elif isinstance(e, PermissionError):
+            # Authorization error
+            logger.warning(
+                "MCP tool invocation failed: permission denied",
+                user_id=str(current_user.id),
+                tool=tool_name,
+                error=str(e),
+            )
+            error = {"code": "PERMISSION_DENIED", "message": str(e), "details": {}}
+        else:
+            # Execution error
+            logger.error(
+                "MCP tool invocation failed: execution error",
+                user_id=str(current_user.id),
+                tool=tool_name,
+                error=str(e),
+                exc_info=True,
+            )
+            error = {
+                "code": "EXECUTION_ERROR",
+                "message": f"Tool execution failed: {str(e)}",
+                "details": {"exc_type": type(e).__name__},
+            }
+
+        return {
+            "success": False,
+            "tool": tool_name,
+            "version": "1.0.0",
+            "result": None,
+            "error": error,
+            "metadata": {},
+            "invocation_id": invocation_id,
+            "duration_ms": duration_ms,
+            "cached": False,
+        }
+
+    async def _run_invocation(
+        self,
+        tool_name: str,
+        version_constraint: Optional[str],
+        payload: dict,
+        idempotency_key: Optional[str],
+        current_user: User,
+        invocation_id: str,
+        start_time: float,
+        phases: Optional[dict] = None,
+    ) -> dict:
+        """
+        Resolve and execute one tool invocation that already passed validation,
+        scope and rate-limit checks. Always returns an invocation response.
+
+        ``phases`` holds the time already spent (validation, queue_wait); the
+        execution phase is added here and all of them are recorded together.
+        """
+        import time
+
+        try:
+            # Resolve version if versioned registry has this tool
+            resolved_version = None
+            tool_impl = None
+            tools_snapshot: Optional[dict] = None
+
+            if versioned_registry.list_versions(tool_name):
+                # Tool has versions - use versioned registry
+                try:
+                    resolved_version, tool_impl = versioned_registry.resolve(
+                        tool_name,
+                        version_constraint
+                    )
+                    logger.debug(
+                        "Tool version resolved",
+                        tool=tool_name,
+                        constraint=version_constraint,
+                        resolved=resolved_version,
+                    )
+                except ValueError as e:
+                    # Version resolution failed
+                    return {
+                        "success": False,
+                        "tool": tool_name,
+                        "version": version_constraint or "latest",
+                        "result": None,
+                        "error": {
+                            "code": "TOOL_NOT_FOUND",
+                            "message": str(e),
+                            "details": {
+                                "available_versions": versioned_registry.list_versions(tool_name)
+                            },
+                        },
+                        "metadata": {},
+                        "invocation_id": invocation_id,
+                        "duration_ms": 0.0,
+                        "cached": False,
+                    }
+            else:
+                # Tool not versioned - use FastMCP default registry
+                tools_snapshot = await self._get_tool_map()
+                tool_impl = tools_snapshot.get(tool_name)
+                resolved_version = "1.0.0"
+
+            if not tool_impl:
+                available_tools = (
+                    list(tools_snapshot.keys())
+                    if tools_snapshot is not None
+                    else list((await self._get_tool_map()).keys())
+                )
+                return {
+                    "success": False,
+                    "tool": tool_name,
+                    "version": resolved_version or "1.0.0",
+                    "result": None,
+                    "error": {
+                        "code": "TOOL_NOT_FOUND",
+                        "message": f"Tool '{tool_name}' not found",
+                        "details": {"available_tools": available_tools},
+                    },
+                    "metadata": {},
+                    "invocation_id": invocation_id,
+                    "duration_ms": 0.0,
+                    "cached": False,
+                }
+
+            if (
+                tool_impl
+                and not hasattr(tool_impl, "run")
+                and self._callable_accepts_param(tool_impl, "user_id")
+                and "user_id" not in payload
+            ):
+                payload = {**payload, "user_id": str(current_user.id)}
+
+            # Execute tool
+            execution_start = time.perf_counter()
+            result = await self._execute_tool_impl(
+                tool_name,
+                tool_impl,
+                payload,
+                context={"user_id": str(current_user.id)},
+            )
+            phases = {**(phases or {}), "execution": time.perf_counter() - execution_start}
+
+            duration_ms = (time.time() - start_time) * 1000
+
+            # Record success metrics
+            metrics_collector.record_tool_invocation(
+                tool=tool_name,
+                version=resolved_version or "1.0.0",
+                status="success",
+                duration_seconds=duration_ms / 1000,
+                outcome="success",
+                user_type="user",
+                phases=phases,
+            )
+
+            response = {
+                "success": True,
+                "tool": tool_name,
+                "version": resolved_version or "1.0.0",
+                "result": result,
+                "error": None,
+                "metadata": {
+                    "user_id": str(current_user.id),
+                    "idempotency_key": idempotency_key,
+                    "version_constraint": version_constraint,  # NEW: Track requested constraint
+                },
+                "invocation_id": invocation_id,
+                "duration_ms": duration_ms,
+                "cached": False,
+            }
+
+            logger.info(
+                "MCP tool invocation succeeded",
+                user_id=str(current_user.id),
+                tool=tool_name,
+                duration_ms=duration_ms,
+            )
+
+            # Callback for telemetry
+            if self.on_invoke:
+                try:
+                    self.on_invoke(response)
+                except Exception:  # pragma: no cover
+                    pass
+
+            return response
+
+        except Exception as e:
+            return self._invocation_exception(tool_name, invocation_id, start_time, current_user, e)
+
     async def _execute_tool_impl(self, tool_name: str, tool_impl, payload: dict, context: Optional[dict] = None):
         """
         Execute a tool regardless of whether FastMCP returns Tool objects or raw callables.
@@ -1157,6 +1495,9 @@ class MCPFastAPIAdapter:
 
             # Legacy callables (aceptan payload completo como único arg)
             if callable(tool_impl):
+                task_context = get_task_context()
+                if task_context is not None and self._callable_accepts_param(tool_impl, "ctx"):
+                    return await tool_impl(payload, ctx=task_context)
                 return await tool_impl(payload)
 
             raise ValueError(f"Tool {tool_name} is not executable")
@@ -1206,6 +1547,11 @@ class MCPFastAPIAdapter:
 
         return type_map.get(python_type, "string")
 
+    async def run_task(self, task: Task):
+        """Task manager runner: execute a dequeued task on behalf of its owner."""
+        owner = SimpleNamespace(id=task.user_id)
+        await self._execute_task(task.task_id, task.tool, task.payload, owner)
+
     async def _execute_task(self, task_id: str, tool_name: str, payload: dict, user: User):
         """
         Execute a task in the background.
@@ -1233,6 +1579,10 @@ class MCPFastAPIAdapter:
             )
 
         task_manager.mark_running(task_id)
+        task = task_manager.get_task(task_id)
+        metrics_collector.record_tool_phase(
+            tool_name, "latest", "queue_wait", (task.started_at - task.created_at).total_seconds(),
+        )
 
         try:
             # Get tool function or descriptor
@@ -1256,11 +1606,18 @@ class MCPFastAPIAdapter:
             ):
                 payload = {**payload, "user_id": str(getattr(user, "id", "system"))}
 
-            # Execute tool with cancellation checks
-            # Note: Tool implementation should check task_manager.is_cancellation_requested(task_id)
-            # at checkpoints and raise asyncio.CancelledError
-
-            result = await self._execute_tool_impl(tool_name, tool_impl, payload)
+            # The tool sees the task context through ctx / get_task_context():
+            # report_progress feeds GET /tasks/{id}/events and is a cancellation
+            # checkpoint. Tools that never check are cancelled after a grace period.
+            execution_start = time.perf_counter()
+            with task_manager.task_context(task_id) as context:
+                result = await context.run(
+                    self._execute_tool_impl(tool_name, tool_impl, payload),
+                    grace_seconds=get_settings().mcp_task_cancel_grace_seconds,
+                )
+            metrics_collector.record_tool_phase(
+                tool_name, "latest", "execution", time.perf_counter() - execution_start,
+            )
 
             # Check if cancelled during execution
             if task_manager.is_cancellation_requested(task_id):
@@ -1365,6 +1722,29 @@ class MCPFastAPIAdapter:
 
             logger.error("Task failed: execution error", task_id=task_id, tool=tool_name, error=str(e), exc_info=True)
 
+        finally:
+            # End-to-end latency (queue wait included) against the tool's SLO
+            task = task_manager.get_task(task_id)
+            if task and task.completed_at and task.status != TaskStatus.CANCELLED:
+                metrics_collector.record_task_latency(
+                    tool_name, (task.completed_at - task.created_at).total_seconds(),
+                )
+
+    @staticmethod
+    def _task_status_body(task: Task) -> dict:
+        return {
+            "task_id": task.task_id,
+            "tool": task.tool,
+            "status": task.status.value,
+            "progress": task.progress,
+            "progress_message": task.progress_message,
+            "created_at": task.created_at.isoformat(),
+            "started_at": task.started_at.isoformat() if task.started_at else None,
+            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            "result": task.result,
+            "error": task.error,
+        }
+
     def _estimate_duration(self, tool_name: str, payload: dict) -> int:
         """
         Estimate task duration in milliseconds.
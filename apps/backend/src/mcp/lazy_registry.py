@@ -21,19 +21,31 @@ Usage:
 
     # Invoke tool
     result = await tool.invoke(payload, context)
+
+Usage-driven preloading:
+    The registry records per-tool import time and call counts and persists
+    them in Redis. After startup (with a delay, so cold start stays fast) it
+    pre-loads the N most-called tools in the background, so heavy imports
+    (pandas, fitz) are not paid on a user's request.
 """
 
 from typing import Dict, List, Optional, Any
+import asyncio
 import importlib
 import inspect
+import time
+from collections import Counter
 from pathlib import Path
 import structlog
 
+from ..core.config import get_settings
 from .protocol import ToolSpec, ToolInvokeRequest, ToolInvokeResponse, ToolCategory
 from .tool import Tool
 
 logger = structlog.get_logger(__name__)
 
+STATS_KEY = "mcp:lazy_registry:stats"
+
 
 class ToolMetadata:
     """Minimal tool metadata for discovery (does not load full tool)."""
@@ -53,6 +65,10 @@ class ToolMetadata:
         self.description = description or f"Tool: {name}"
         self._loaded: bool = False
         self._instance: Optional[Tool] = None
+        # Usage stats (calls include those persisted by previous runs)
+        self.calls: int = 0
+        self.load_ms: Optional[float] = None
+        self.preloaded: bool = False
 
 
 class LazyToolRegistry:
@@ -84,6 +100,14 @@ class LazyToolRegistry:
         self.tools_directory = tools_directory
         self._metadata_cache: Dict[str, ToolMetadata] = {}
         self._loaded_tools: Dict[str, Tool] = {}
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+
+        # Calls not yet persisted; load times to persist
+        self._pending_calls: Counter = Counter()
+        self._pending_load_ms: Dict[str, float] = {}
+        self._redis = None
+        self._background: Optional[asyncio.Task] = None
+        self._preload_done = False
 
         # Scan directory on initialization (lightweight)
         self._scan_tools_directory()
@@ -238,6 +262,15 @@ class LazyToolRegistry:
             logger.warning("Tool not found in registry", tool=tool_name)
             return None
 
+        lock = self._load_locks.setdefault(tool_name, asyncio.Lock())
+        async with lock:
+            # Loaded by a concurrent caller (e.g. the background preload)
+            if tool_name in self._loaded_tools:
+                return self._loaded_tools[tool_name]
+            return await self._import_tool(metadata)
+
+    async def _import_tool(self, metadata: ToolMetadata) -> Optional[Tool]:
+        tool_name = metadata.name
         try:
             # Dynamic import (happens on-demand!)
             logger.debug(
@@ -246,21 +279,27 @@ class LazyToolRegistry:
                 module=metadata.module_path
             )
 
-            module = importlib.import_module(metadata.module_path)
+            started = time.perf_counter()
+            # Import off the event loop; instantiate on it (tools may create loop objects)
+            module = await asyncio.to_thread(importlib.import_module, metadata.module_path)
             tool_class = getattr(module, metadata.class_name)
 
             # Instantiate tool
             tool_instance = tool_class()
+            load_ms = (time.perf_counter() - started) * 1000
 
             # Cache for reuse
             self._loaded_tools[tool_name] = tool_instance
             metadata._loaded = True
             metadata._instance = tool_instance
+            metadata.load_ms = load_ms
+            self._pending_load_ms[tool_name] = load_ms
 
             logger.info(
                 "Tool loaded successfully",
                 tool=tool_name,
-                class_name=metadata.class_name
+                class_name=metadata.class_name,
+                load_ms=round(load_ms, 1),
             )
 
             return tool_instance
@@ -300,6 +339,8 @@ class LazyToolRegistry:
         Returns:
             Tool invocation response
         """
+        self.record_call(request.tool)
+
         # Load tool on-demand
         tool = await self.load_tool(request.tool)
 
@@ -329,6 +370,114 @@ class LazyToolRegistry:
         # Invoke tool
         return await tool.invoke(request.payload, request.context)
 
+    def record_call(self, tool_name: str) -> None:
+        """Count an invocation towards the tool's preload ranking."""
+        metadata = self._metadata_cache.get(tool_name)
+        if metadata:
+            metadata.calls += 1
+            self._pending_calls[tool_name] += 1
+
+    def preload_candidates(self, top_n: int) -> List[str]:
+        """Most-called tools first; among equals, the slowest to import."""
+        ranked = sorted(
+            (m for m in self._metadata_cache.values() if m.calls > 0),
+            key=lambda m: (m.calls, m.load_ms or 0.0),
+            reverse=True,
+        )
+        return [m.name for m in ranked[:top_n]]
+
+    async def _get_redis(self):
+        if self._redis is None:
+            from ..services.cache_service import get_redis_client
+            self._redis = await get_redis_client()
+        return self._redis
+
+    async def load_persisted_stats(self) -> None:
+        """Merge call counts and import times saved by previous runs (and replicas)."""
+        try:
+            client = await self._get_redis()
+            saved = await client.hgetall(STATS_KEY)
+        except Exception as e:
+            logger.warning("Could not read tool usage stats", error=str(e))
+            return
+
+        for field, value in saved.items():
+            kind, _, tool_name = field.partition(":")
+            metadata = self._metadata_cache.get(tool_name)
+            if not metadata:
+                continue
+            if kind == "calls":
+                metadata.calls += int(value)
+            elif kind == "load_ms" and metadata.load_ms is None:
+                metadata.load_ms = float(value)
+
+    async def persist_stats(self) -> None:
+        """Write call deltas and import times to Redis (shared by all replicas)."""
+        if not self._pending_calls and not self._pending_load_ms:
+            return
+
+        calls, self._pending_calls = self._pending_calls, Counter()
+        load_ms, self._pending_load_ms = self._pending_load_ms, {}
+        try:
+            client = await self._get_redis()
+            pipe = client.pipeline(transaction=False)
+            for tool_name, count in calls.items():
+                pipe.hincrby(STATS_KEY, f"calls:{tool_name}", count)
+            for tool_name, value in load_ms.items():
+                pipe.hset(STATS_KEY, f"load_ms:{tool_name}", round(value, 1))
+            await pipe.execute()
+        except Exception as e:
+            # Keep the deltas for the next attempt
+            self._pending_calls.update(calls)
+            self._pending_load_ms = {**load_ms, **self._pending_load_ms}
+            logger.warning("Could not persist tool usage stats", error=str(e))
+
+    async def preload(self, top_n: int) -> List[str]:
+        """Load the top-N tools by usage, one at a time."""
+        preloaded = []
+        for tool_name in self.preload_candidates(top_n):
+            if tool_name in self._loaded_tools:
+                continue
+            if await self.load_tool(tool_name) is not None:
+                self._metadata_cache[tool_name].preloaded = True
+                preloaded.append(tool_name)
+        return preloaded
+
+    async def _background_loop(self, top_n: int, delay_seconds: float, flush_seconds: float) -> None:
+        # Let startup and the first requests go first
+        await asyncio.sleep(delay_seconds)
+        await self.load_persisted_stats()
+        try:
+            preloaded = await self.preload(top_n)
+            logger.info("Tools preloaded", tools=preloaded, top_n=top_n)
+        except Exception as e:
+            logger.warning("Tool preload failed", error=str(e))
+        self._preload_done = True
+
+        while True:
+            await asyncio.sleep(flush_seconds)
+            await self.persist_stats()
+
+    async def start(self) -> None:
+        """Start background preloading and periodic stats persistence."""
+        if self._background is None:
+            settings = get_settings()
+            self._background = asyncio.create_task(self._background_loop(
+                settings.mcp_tool_preload_top_n,
+                settings.mcp_tool_preload_delay_seconds,
+                settings.mcp_tool_stats_flush_seconds,
+            ))
+
+    async def stop(self) -> None:
+        if self._background is not None:
+            self._background.cancel()
+            try:
+                await self._background
+            except asyncio.CancelledError:
+                pass
+            self._background = None
+        await self.persist_stats()
+
     def get_loaded_tools_count(self) -> int:
         """Get number of currently loaded tools."""
         return len(self._loaded_tools)
@@ -371,7 +520,20 @@ class LazyToolRegistry:
             "tools_loaded": len(self._loaded_tools),
             "tools_available": list(self._metadata_cache.keys()),
             "tools_loaded_list": list(self._loaded_tools.keys()),
-            "memory_efficiency": f"{(1 - len(self._loaded_tools) / max(len(self._metadata_cache), 1)) * 100:.1f}%"
+            "memory_efficiency": f"{(1 - len(self._loaded_tools) / max(len(self._metadata_cache), 1)) * 100:.1f}%",
+            "usage": {
+                name: {
+                    "calls": metadata.calls,
+                    "load_ms": round(metadata.load_ms, 1) if metadata.load_ms is not None else None,
+                    "loaded": metadata._loaded,
+                    "preloaded": metadata.preloaded,
+                }
+                for name, metadata in self._metadata_cache.items()
+            },
+            "preload": {
+                "completed": self._preload_done,
+                "tools": [name for name, m in self._metadata_cache.items() if m.preloaded],
+            },
         }
 
 
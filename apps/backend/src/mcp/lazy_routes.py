@@ -239,6 +239,7 @@ def create_lazy_mcp_router(
         """
         invocation_id = str(uuid4())
         start_time = time.time()
+        checks_start = time.perf_counter()
         requested_version = request.version or "latest"
         payload = request.payload or {}
         context = (request.context or {}).copy()
@@ -294,8 +295,7 @@ def create_lazy_mcp_router(
 
         # Security Layer 1: Payload validation
         try:
-            PayloadValidator.validate_size(payload, max_size_kb=1024)
-            PayloadValidator.validate_structure(payload)
+            PayloadValidator.validate(payload, max_size_kb=1024)
         except ValueError as exc:
             metrics_collector.record_validation_failure(
                 tool=request.tool,
@@ -360,7 +360,11 @@ def create_lazy_mcp_router(
             idempotency_key=request.idempotency_key,
         )
 
+        validation_seconds = time.perf_counter() - checks_start
+        execution_start = time.perf_counter()
         response = await lazy_registry.invoke(tool_request)
+        # Execution includes loading the tool on first use
+        phases = {"validation": validation_seconds, "execution": time.perf_counter() - execution_start}
 
         outcome_label = (
             "success"
@@ -374,6 +378,7 @@ def create_lazy_mcp_router(
             duration_seconds=response.duration_ms / 1000,
             outcome=outcome_label,
             user_type=user_type,
+            phases=phases,
         )
 
         logger.info(
@@ -412,7 +417,9 @@ def create_lazy_mcp_router(
               "tools_loaded": 2,
               "tools_available": ["audit_file", "excel_analyzer", ...],
               "tools_loaded_list": ["audit_file", "extract_document_text"],
-              "memory_efficiency": "60.0%"
+              "memory_efficiency": "60.0%",
+              "usage": {"audit_file": {"calls": 42, "load_ms": 180.3, "loaded": true, "preloaded": true}, ...},
+              "preload": {"completed": true, "tools": ["audit_file"]}
             }
         """
         _require_admin_scope(current_user, MCPScope.ADMIN_METRICS)
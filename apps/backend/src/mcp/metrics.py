@@ -7,10 +7,13 @@ Integrates with Prometheus for:
 - Tool timeout counters
 - Tool validation failure counters
 - Task lifecycle metrics
+- Per-phase latency (queue_wait, validation, cache_lookup, execution,
+  serialization), with rolling in-process percentiles and SLO checks per tool
 
 Metrics Design:
 - mcp_tool_invocations_total{tool, version, status, user_type}
 - mcp_tool_duration_seconds{tool, version, outcome}
+- mcp_tool_phase_duration_seconds{tool, version, phase}
 - mcp_tool_timeouts_total{tool, version}
 - mcp_tool_validation_failures_total{tool, version, error_code}
 - mcp_task_created_total{tool, priority}
@@ -18,12 +21,22 @@ Metrics Design:
 - mcp_task_duration_seconds{tool, status}
 """
 
-from typing import Optional
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 from prometheus_client import Counter, Histogram, Gauge
 import structlog
 
+from ..core.config import get_settings
+
 logger = structlog.get_logger(__name__)
 
+PHASES = ("queue_wait", "validation", "cache_lookup", "execution", "serialization")
+TOTAL_PHASE = "total"
+# Rejected before the tool ran: counted, but kept out of latency percentiles
+REJECTED_OUTCOMES = {"validation_error", "permission_denied", "rate_limit"}
+
 
 # Tool Invocation Metrics
 
@@ -53,6 +66,14 @@ tool_duration_seconds._buckets = (
     300.0,
 )
 
+tool_phase_duration_seconds = Histogram(
+    "mcp_tool_phase_duration_seconds",
+    "MCP tool invocation latency by phase in seconds",
+    # version is "latest" where none is resolved (tasks, cache lookups)
+    labelnames=["tool", "version", "phase"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0],
+)
+
 tool_timeouts_total = Counter(
     "mcp_tool_timeouts_total",
     "Total MCP tool timeouts",
@@ -145,6 +166,136 @@ tool_deprecated_version_usage_total = Counter(
 tool_deprecated_version_usage_total._name = "mcp_tool_deprecated_version_usage_total"
 
 
+class LatencyWindow:
+    """Samples of the last ``window_seconds`` (at most ``max_samples``)."""
+
+    def __init__(self, window_seconds: float, max_samples: int):
+        self.window_seconds = window_seconds
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
+
+    def add(self, seconds: float, now: float) -> None:
+        self._samples.append((now, seconds))
+
+    def percentiles(self, now: float) -> Optional[dict]:
+        """count, p50/p95/p99/max in ms over the window, or None if empty."""
+        cutoff = now - self.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        if not self._samples:
+            return None
+
+        values = sorted(seconds for _, seconds in self._samples)
+        last = len(values) - 1
+
+        def rank(q: float) -> float:
+            return round(values[min(last, int(q * len(values)))] * 1000, 2)
+
+        return {
+            "count": len(values),
+            "p50_ms": rank(0.50),
+            "p95_ms": rank(0.95),
+            "p99_ms": rank(0.99),
+            "max_ms": round(values[-1] * 1000, 2),
+        }
+
+
+class LatencyTracker:
+    """
+    Rolling per (tool, phase) latency windows, computed in-process.
+
+    Serves get_metrics_summary and the SLO report without a Prometheus
+    query. Windows are per tool, not per version: task and cache phases
+    have no resolved version, and every phase of a tool must meet its total
+    for the report to say where the time goes (Prometheus keeps versions).
+    The number of series is capped so unknown tool names cannot grow it
+    without bound.
+    """
+
+    MAX_SERIES = 512
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        slo_p95_ms: Optional[float] = None,
+        slo_overrides: Optional[Dict[str, float]] = None,
+        slo_min_samples: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.window_seconds = window_seconds or settings.mcp_latency_window_seconds
+        self.max_samples = max_samples or settings.mcp_latency_window_max_samples
+        self.slo_p95_ms = slo_p95_ms or settings.mcp_latency_slo_p95_ms
+        if slo_overrides is None:
+            slo_overrides = {}
+            for item in settings.mcp_latency_slo_overrides.split(","):
+                tool, _, target = item.partition("=")
+                if tool.strip() and target.strip():
+                    slo_overrides[tool.strip()] = float(target)
+        self.slo_overrides = slo_overrides
+        self.slo_min_samples = settings.mcp_latency_slo_min_samples if slo_min_samples is None else slo_min_samples
+        self._windows: Dict[Tuple[str, str], LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, tool: str, phase: str, seconds: float, now: Optional[float] = None) -> None:
+        key = (tool, phase)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                if len(self._windows) >= self.MAX_SERIES:
+                    return
+                window = self._windows[key] = LatencyWindow(self.window_seconds, self.max_samples)
+            window.add(seconds, time.monotonic() if now is None else now)
+
+    def summary(self, now: Optional[float] = None) -> Dict[str, Dict[str, dict]]:
+        """{tool: {phase: percentiles}} over the rolling window."""
+        now = time.monotonic() if now is None else now
+        result: Dict[str, Dict[str, dict]] = {}
+        with self._lock:
+            for (tool, phase), window in sorted(self._windows.items()):
+                stats = window.percentiles(now)
+                if stats:
+                    result.setdefault(tool, {})[phase] = stats
+        return result
+
+    def slo_target_ms(self, tool: str) -> float:
+        return self.slo_overrides.get(tool, self.slo_p95_ms)
+
+    def slo_report(self, now: Optional[float] = None) -> List[dict]:
+        """
+        p95 of total latency per tool against its SLO target.
+
+        A tool is only flagged once it has ``slo_min_samples`` samples in
+        the window, so a single slow call does not page anyone.
+        """
+        report = []
+        for tool, phases in self.summary(now).items():
+            total = phases.get(TOTAL_PHASE)
+            if not total:
+                continue
+            target = self.slo_target_ms(tool)
+            report.append({
+                "tool": tool,
+                "p95_ms": total["p95_ms"],
+                "target_p95_ms": target,
+                "samples": total["count"],
+                "breached": total["count"] >= self.slo_min_samples and total["p95_ms"] > target,
+                # Slowest phase, to say where the time goes
+                "slowest_phase": max(
+                    (p for p in phases if p != TOTAL_PHASE),
+                    key=lambda p: phases[p]["p95_ms"],
+                    default=None,
+                ),
+            })
+        return report
+
+    def reset(self) -> None:
+        with self._lock:
+            self._windows.clear()
+
+
+latency_tracker = LatencyTracker()
+
+
 class MCPMetricsCollector:
     """
     Centralized metrics collector for MCP operations.
@@ -164,6 +315,7 @@ class MCPMetricsCollector:
         duration_seconds: float,
         outcome: str,  # "success" | "validation_error" | "permission_denied" | "timeout" | "error"
         user_type: str = "user",  # "user" | "admin" | "service"
+        phases: Optional[Dict[str, float]] = None,
     ):
         """
         Record tool invocation metrics.
@@ -175,6 +327,7 @@ class MCPMetricsCollector:
             duration_seconds: Execution time in seconds
             outcome: Detailed outcome (success, validation_error, etc.)
             user_type: Type of user (for segmentation)
+            phases: Seconds spent per phase (see PHASES), if measured
         """
         # Increment invocation counter
         tool_invocations_total.labels(
@@ -191,6 +344,11 @@ class MCPMetricsCollector:
             outcome=outcome,
         ).observe(duration_seconds)
 
+        for phase, seconds in (phases or {}).items():
+            MCPMetricsCollector.record_tool_phase(tool, version, phase, seconds)
+        if outcome not in REJECTED_OUTCOMES:
+            latency_tracker.observe(tool, TOTAL_PHASE, duration_seconds)
+
         logger.debug(
             "Tool invocation metric recorded",
             tool=tool,
@@ -200,6 +358,16 @@ class MCPMetricsCollector:
             outcome=outcome,
         )
 
+    @staticmethod
+    def record_tool_phase(tool: str, version: str, phase: str, duration_seconds: float):
+        """Record time spent in one phase of an invocation (histogram + rolling window)."""
+        tool_phase_duration_seconds.labels(
+            tool=tool,
+            version=version,
+            phase=phase,
+        ).observe(duration_seconds)
+        latency_tracker.observe(tool, phase, duration_seconds)
+
     @staticmethod
     def record_tool_timeout(tool: str, version: str):
         """Record tool timeout event."""
@@ -300,6 +468,16 @@ class MCPMetricsCollector:
             duration_seconds=duration_seconds,
         )
 
+    @staticmethod
+    def record_task_latency(tool: str, total_seconds: float):
+        """
+        Record the end-to-end latency of a finished task (queue wait included).
+
+        Feeds the tool's total so async tasks are checked against its SLO
+        like invocations are; cancelled tasks are left out.
+        """
+        latency_tracker.observe(tool, TOTAL_PHASE, total_seconds)
+
     @staticmethod
     def record_task_cancelled(tool: str):
         """Record task cancellation."""
@@ -353,9 +531,12 @@ def get_metrics_summary() -> dict:
     Returns:
         Dictionary with metric summaries
     """
-    # This is a simplified version - in production, you'd query Prometheus
+    # Rolling percentiles are in-process (this replica); Prometheus has the rest
     return {
         "tool_invocations": "See Prometheus for details",
         "tasks_pending": "See task_queue_size gauge",
+        "latency": latency_tracker.summary(),
+        "latency_window_seconds": latency_tracker.window_seconds,
+        "slo_breaches": [entry for entry in latency_tracker.slo_report() if entry["breached"]],
         "message": "Use Prometheus /metrics endpoint for detailed metrics",
     }
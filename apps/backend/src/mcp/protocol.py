@@ -4,6 +4,7 @@ MCP Protocol - Type definitions and contracts.
 Defines standardized message types for tool invocation:
 - ToolSpec: Tool capability advertisement
 - ToolInvokeRequest/Response: Invocation messages
+- BatchInvokeRequest: Several invocations in one request
 - ToolError: Standardized error reporting
 - ToolMetrics: Observability metrics
 """
@@ -66,6 +67,33 @@ class ToolInvokeRequest(BaseModel):
     idempotency_key: Optional[str] = Field(None, description="Idempotency key for retry safety")
 
 
+# Hard bounds of batch options; MCP_BATCH_* settings may lower them further
+MAX_BATCH_TIMEOUT_MS = 600_000
+MAX_BATCH_CONCURRENCY = 64
+
+
+class BatchInvocation(BaseModel):
+    """One invocation of a batch."""
+    tool: str = Field(..., min_length=1, description="Tool name")
+    version: Optional[str] = Field(None, description="Version constraint (defaults to latest)")
+    payload: Dict[str, Any] = Field(default_factory=dict, description="Tool-specific input")
+    idempotency_key: Optional[str] = Field(None, description="Idempotency key for retry safety")
+    timeout_ms: Optional[int] = Field(
+        None, gt=0, le=MAX_BATCH_TIMEOUT_MS, description="Timeout of this invocation"
+    )
+
+
+class BatchInvokeRequest(BaseModel):
+    """Request to invoke several tools concurrently."""
+    invocations: List[BatchInvocation] = Field(..., min_length=1, description="Invocations to run")
+    max_concurrency: Optional[int] = Field(
+        None, gt=0, le=MAX_BATCH_CONCURRENCY, description="Max invocations running at once"
+    )
+    timeout_ms: Optional[int] = Field(
+        None, gt=0, le=MAX_BATCH_TIMEOUT_MS, description="Default timeout per invocation"
+    )
+
+
 class ToolInvokeResponse(BaseModel):
     """Response from tool invocation."""
     success: bool
@@ -4,7 +4,7 @@ from __future__ import annotations
 MCP Security - Rate limiting, payload size limits, AuthZ scopes, PII scrubbing.
 
 Features:
-- Per-tool rate limiting (Redis-backed sliding window)
+- Per-tool rate limiting (distributed sliding window, see core.rate_limiter)
 - Payload size validation
 - Authorization scopes (mcp:tools.audit, mcp:tools.viz, etc.)
 - PII scrubbing for logs (emails, phones, SSNs)
@@ -17,16 +17,18 @@ Security principles:
 - Audit everything
 """
 
+import hashlib
 import os
 import re
-import time
-from typing import Dict, List, Optional, Set
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Set
 from enum import Enum
 from dataclasses import dataclass
 import structlog
 
 from ..core.config import get_settings
-from ..core.redis_cache import get_redis_cache
+from ..core.rate_limiter import RateLimitEngine, RateWindow, get_rate_limit_engine
 
 logger = structlog.get_logger(__name__)
 
@@ -70,10 +72,10 @@ class RateLimitConfig:
 
 class RateLimiter:
     """
-    Redis-backed sliding window rate limiter.
+    Per-tool rate limiter (minute and hour sliding windows).
 
-    Uses sorted sets with timestamps for precise rate limiting.
-    Supports multiple time windows (minute, hour).
+    Backed by the shared RateLimitEngine: one atomic Redis script per check,
+    so limits hold across workers, with an in-memory fallback.
     """
 
     def __init__(self, redis_client=None, *, use_redis: bool = True):
@@ -83,32 +85,17 @@ class RateLimiter:
         Args:
             redis_client: Redis client instance (optional, uses in-memory fallback)
         """
-        self.redis = redis_client
-        self.use_redis = use_redis
-        self._memory_storage: Dict[str, List[float]] = {}  # Fallback in-memory
-
-    async def _get_redis_client(self):
-        """Lazily obtain Redis client (fallback to in-memory on failure)."""
-        if not self.use_redis:
-            return None
-
-        if self.redis:
-            return self.redis
-
-        try:
-            redis_cache = await get_redis_cache()
-            if redis_cache.client is None:
-                await redis_cache.connect()
-            self.redis = redis_cache.client
-        except Exception as exc:
-            logger.warning("RateLimiter redis init failed, using in-memory fallback", error=str(exc))
-            self.redis = None
-        return self.redis
+        if redis_client is None and use_redis:
+            # Share the process-wide engine (and its Redis script) with the HTTP limiter
+            self.engine = get_rate_limit_engine()
+        else:
+            self.engine = RateLimitEngine(redis_client, use_redis=use_redis)
 
     async def check_rate_limit(
         self,
         key: str,
         limit_config: RateLimitConfig,
+        cost: int = 1,
     ) -> tuple[bool, Optional[int]]:
         """
         Check if request is within rate limit.
@@ -116,117 +103,176 @@ class RateLimiter:
         Args:
             key: Rate limit key (e.g., "user_123:audit_file")
             limit_config: Rate limit configuration
+            cost: Calls to count at once (batch invocations); all or none are allowed
 
         Returns:
             (allowed: bool, retry_after_ms: Optional[int])
             - allowed: True if request allowed
             - retry_after_ms: Time to wait before retry (if not allowed)
         """
-        now = time.time()
-
-        # Check minute window
-        minute_key = f"ratelimit:minute:{key}"
-        minute_count = await self._get_count(minute_key, now - 60)
-
-        if minute_count >= limit_config.calls_per_minute:
-            # Calculate retry time
-            oldest_timestamp = await self._get_oldest(minute_key)
-            retry_after_ms = int((oldest_timestamp + 60 - now) * 1000)
-
-            logger.warning(
-                "Rate limit exceeded (minute)",
-                key=key,
-                count=minute_count,
-                limit=limit_config.calls_per_minute,
-                retry_after_ms=retry_after_ms,
-            )
-
-            return (False, retry_after_ms)
+        result = await self.engine.hit(
+            f"mcp:{key}",
+            (
+                RateWindow(limit_config.calls_per_minute, 60),
+                RateWindow(limit_config.calls_per_hour, 3600),
+            ),
+            cost,
+        )
+        if result.allowed:
+            return (True, None)
+
+        retry_after_ms = max(1, int(result.retry_after * 1000))
+        logger.warning(
+            "Rate limit exceeded",
+            key=key,
+            limit_per_minute=limit_config.calls_per_minute,
+            limit_per_hour=limit_config.calls_per_hour,
+            retry_after_ms=retry_after_ms,
+        )
+        return (False, retry_after_ms)
+
+
+_JSON_TYPES = frozenset({str, dict, list, tuple, int, float, bool, type(None)})
+# Subclasses (str enums, OrderedDict, ...) are measured as their JSON base type
+_JSON_BASES = (str, dict, list, tuple, int, float)
 
-        # Check hour window
-        hour_key = f"ratelimit:hour:{key}"
-        hour_count = await self._get_count(hour_key, now - 3600)
 
-        if hour_count >= limit_config.calls_per_hour:
-            oldest_timestamp = await self._get_oldest(hour_key)
-            retry_after_ms = int((oldest_timestamp + 3600 - now) * 1000)
+@dataclass
+class PayloadStats:
+    """What one validation pass measured (approximate JSON size in bytes)."""
 
-            logger.warning(
-                "Rate limit exceeded (hour)",
-                key=key,
-                count=hour_count,
-                limit=limit_config.calls_per_hour,
-                retry_after_ms=retry_after_ms,
-            )
+    size_bytes: int
+    depth: int
+    elements: int
 
-            return (False, retry_after_ms)
 
-        # Record request
-        await self._record_request(minute_key, now, ttl=120)  # 2 minutes TTL
-        await self._record_request(hour_key, now, ttl=7200)  # 2 hours TTL
+class PayloadValidator:
+    """
+    Validate and sanitize tool payloads.
 
-        return (True, None)
+    ``validate`` walks the payload once, iteratively, and measures the
+    estimated JSON-encoded size, nesting depth and element count together,
+    raising on the first limit exceeded. Nothing is serialized: strings
+    count as their UTF-8 length plus quotes, separators as json.dumps
+    would emit them.
+    """
 
-    async def _get_count(self, key: str, since: float) -> int:
-        """Get count of requests since timestamp."""
-        redis_client = await self._get_redis_client()
+    MAX_PAYLOAD_SIZE_KB = 1024  # 1MB default
+    MAX_STRING_LENGTH = 10000
+    MAX_ARRAY_LENGTH = 1000
+    MAX_NESTING_DEPTH = 10
+    MAX_KEY_LENGTH = 100
+    MAX_ELEMENTS = 100_000
 
-        if redis_client:
-            # Redis implementation
-            try:
-                return await redis_client.zcount(key, since, "+inf")
-            except Exception as e:
-                logger.error("Redis error in rate limiter", error=str(e))
-                return 0
-        else:
-            # In-memory fallback
-            timestamps = self._memory_storage.get(key, [])
-            return len([t for t in timestamps if t >= since])
-
-    async def _get_oldest(self, key: str) -> float:
-        """Get oldest timestamp in window."""
-        redis_client = await self._get_redis_client()
-
-        if redis_client:
-            try:
-                result = await redis_client.zrange(key, 0, 0, withscores=True)
-                return result[0][1] if result else time.time()
-            except Exception:
-                return time.time()
-        else:
-            timestamps = self._memory_storage.get(key, [])
-            return min(timestamps) if timestamps else time.time()
-
-    async def _record_request(self, key: str, timestamp: float, ttl: int):
-        """Record a request timestamp."""
-        redis_client = await self._get_redis_client()
-
-        if redis_client:
-            try:
-                await redis_client.zadd(key, {str(timestamp): timestamp})
-                await redis_client.expire(key, ttl)
-            except Exception as e:
-                logger.error("Redis error recording request", error=str(e))
-        else:
-            # In-memory fallback
-            if key not in self._memory_storage:
-                self._memory_storage[key] = []
-            self._memory_storage[key].append(timestamp)
+    @staticmethod
+    def _encoded_len(text: str) -> int:
+        if text.isascii():
+            return len(text) + 2
+        return len(text.encode("utf-8", "surrogatepass")) + 2
 
-            # Cleanup old entries
-            cutoff = timestamp - ttl
-            self._memory_storage[key] = [
-                t for t in self._memory_storage[key] if t > cutoff
-            ]
+    @classmethod
+    def validate(
+        cls,
+        payload: Any,
+        max_size_kb: Optional[float] = MAX_PAYLOAD_SIZE_KB,
+        check_structure: bool = True,
+        depth: int = 0,
+    ) -> PayloadStats:
+        """
+        Check size and structure in a single pass.
 
+        Args:
+            payload: Tool payload
+            max_size_kb: Max estimated JSON size in KB (None skips the size check)
+            check_structure: Enforce depth, key, string, array and element limits
+            depth: Nesting depth of ``payload`` itself
 
-class PayloadValidator:
-    """Validate and sanitize tool payloads."""
+        Returns:
+            PayloadStats for the payload
 
-    MAX_PAYLOAD_SIZE_KB = 1024  # 1MB default
-    MAX_STRING_LENGTH = 10000
-    MAX_ARRAY_LENGTH = 1000
-    MAX_NESTING_DEPTH = 10
+        Raises:
+            ValueError: On the first limit exceeded
+        """
+        if not isinstance(payload, (dict, list, tuple)):
+            raise ValueError(f"Invalid payload type: {type(payload)}")
+
+        max_bytes = max_size_kb * 1024 if max_size_kb is not None else None
+        max_string = cls.MAX_STRING_LENGTH if check_structure else None
+        size = 0
+        elements = 0
+        max_depth = depth
+
+        # Only containers go on the stack; scalars are measured in place. A
+        # list under a dict shares the dict's depth, as it always has, while
+        # any other nested container adds a level.
+        stack = [(payload, depth)]
+        while stack:
+            container, level = stack.pop()
+            if check_structure and level > cls.MAX_NESTING_DEPTH:
+                raise ValueError(f"Payload nesting too deep (max: {cls.MAX_NESTING_DEPTH})")
+            if level > max_depth:
+                max_depth = level
+            count = len(container)
+            elements += count
+
+            if isinstance(container, dict):
+                # braces, ": " per item and ", " between items
+                size += 4 * count if count else 2
+                for key in container:
+                    if type(key) is str:
+                        if check_structure and len(key) > cls.MAX_KEY_LENGTH:
+                            raise ValueError(
+                                f"Key too long: {len(key)} chars (max: {cls.MAX_KEY_LENGTH})"
+                            )
+                        size += len(key) + 2 if key.isascii() else cls._encoded_len(key)
+                    elif check_structure:
+                        raise ValueError(f"Invalid key type: {type(key)}")
+                    else:
+                        size += len(str(key)) + 2
+                items = container.values()
+                list_level, dict_level = level, level + 1
+            else:
+                if check_structure and count > cls.MAX_ARRAY_LENGTH:
+                    raise ValueError(
+                        f"Array too long: {count} items (max: {cls.MAX_ARRAY_LENGTH})"
+                    )
+                size += 2 * count if count else 2
+                items = container
+                list_level = dict_level = level + 1
+
+            for item in items:
+                kind = type(item)
+                if kind not in _JSON_TYPES:
+                    kind = next((base for base in _JSON_BASES if isinstance(item, base)), None)
+
+                if kind is str:
+                    if max_string is not None and len(item) > max_string:
+                        raise ValueError(
+                            f"String too long: {len(item)} chars (max: {max_string})"
+                        )
+                    size += len(item) + 2 if item.isascii() else cls._encoded_len(item)
+                elif kind is dict:
+                    stack.append((item, dict_level))
+                elif kind is list or kind is tuple:
+                    stack.append((item, list_level))
+                elif item is None or item is True:
+                    size += 4
+                elif item is False:
+                    size += 5
+                elif kind is int or kind is float:
+                    size += len(repr(item))
+                else:
+                    size += len(str(item)) + 2
+
+            if max_bytes is not None and size > max_bytes:
+                raise ValueError(
+                    f"Payload too large: exceeds limit of {max_size_kb}KB "
+                    f"(stopped at ~{size / 1024:.2f}KB)"
+                )
+            if check_structure and elements > cls.MAX_ELEMENTS:
+                raise ValueError(f"Payload has too many elements (max: {cls.MAX_ELEMENTS})")
+
+        return PayloadStats(size_bytes=size, depth=max_depth, elements=elements)
 
     @classmethod
     def validate_size(cls, payload: dict, max_size_kb: int = MAX_PAYLOAD_SIZE_KB) -> bool:
@@ -243,16 +289,7 @@ class PayloadValidator:
         Raises:
             ValueError: If payload too large
         """
-        import json
-
-        payload_bytes = json.dumps(payload).encode('utf-8')
-        size_kb = len(payload_bytes) / 1024
-
-        if size_kb > max_size_kb:
-            raise ValueError(
-                f"Payload too large: {size_kb:.2f}KB exceeds limit of {max_size_kb}KB"
-            )
-
+        cls.validate(payload, max_size_kb=max_size_kb, check_structure=False)
         return True
 
     @classmethod
@@ -262,45 +299,13 @@ class PayloadValidator:
 
         Checks:
         - Max nesting depth
-        - String length limits
-        - Array length limits
-        - No executable code
+        - Key, string and array length limits (inside arrays too)
+        - Total element count
 
         Raises:
             ValueError: If validation fails
         """
-        if depth > cls.MAX_NESTING_DEPTH:
-            raise ValueError(f"Payload nesting too deep (max: {cls.MAX_NESTING_DEPTH})")
-
-        for key, value in payload.items():
-            # Check key
-            if not isinstance(key, str):
-                raise ValueError(f"Invalid key type: {type(key)}")
-
-            if len(key) > 100:
-                raise ValueError(f"Key too long: {len(key)} chars (max: 100)")
-
-            # Check value
-            if isinstance(value, str):
-                if len(value) > cls.MAX_STRING_LENGTH:
-                    raise ValueError(
-                        f"String too long: {len(value)} chars (max: {cls.MAX_STRING_LENGTH})"
-                    )
-
-            elif isinstance(value, list):
-                if len(value) > cls.MAX_ARRAY_LENGTH:
-                    raise ValueError(
-                        f"Array too long: {len(value)} items (max: {cls.MAX_ARRAY_LENGTH})"
-                    )
-
-                # Check array items recursively
-                for item in value:
-                    if isinstance(item, dict):
-                        cls.validate_structure(item, depth + 1)
-
-            elif isinstance(value, dict):
-                cls.validate_structure(value, depth + 1)
-
+        cls.validate(payload, max_size_kb=None, depth=depth)
         return True
 
 
@@ -400,15 +405,106 @@ class PIIScrubber:
     - Credit card numbers
     - IP addresses
     - API keys/tokens (common patterns)
+
+    All patterns are compiled into one alternation, so each string is
+    scanned once instead of once per pattern. Large strings are memoized by
+    content hash (tool results are often scrubbed more than once), and
+    ``scrub_stream`` scrubs huge text fields piecewise.
     """
 
+    # Pattern bodies; every PII pattern starts at a word boundary.
+    # Atomic local part, (?=(X+))X as possessive X++ needs Python 3.11: an
+    # email needs an "@" right after it, so the run is never backtracked over.
+    _EMAIL = r'(?=(?P<local>[A-Za-z0-9._%+-]+))(?P=local)@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    _PHONE = r'(?:\d{3}[-.\s]?)?\d{3}[-.\s]?\d{4}\b'
+    _SSN = r'\d{3}-\d{2}-\d{4}\b'
+    _CREDIT_CARD = r'\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b'
+    _IP = r'(?:\d{1,3}\.){3}\d{1,3}\b'
+    _API_KEY = r'[A-Za-z0-9_-]{32,}\b'  # Long alphanumeric strings
+    _PREFIXED_KEY = r'(?:sk|pk|rk)[_-][A-Za-z0-9_-]{16,}\b'  # sk_live_..., pk_test_...
+
     # Regex patterns for PII
-    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-    PHONE_PATTERN = re.compile(r'\b(?:\d{3}[-.\s]?)?\d{3}[-.\s]?\d{4}\b')
-    SSN_PATTERN = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
-    CREDIT_CARD_PATTERN = re.compile(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b')
-    IP_PATTERN = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
-    API_KEY_PATTERN = re.compile(r'\b[A-Za-z0-9_-]{32,}\b')  # Long alphanumeric strings
+    EMAIL_PATTERN = re.compile(r'\b' + _EMAIL)
+    PHONE_PATTERN = re.compile(r'\b' + _PHONE)
+    SSN_PATTERN = re.compile(r'\b' + _SSN)
+    CREDIT_CARD_PATTERN = re.compile(r'\b' + _CREDIT_CARD)
+    IP_PATTERN = re.compile(r'\b' + _IP)
+    API_KEY_PATTERN = re.compile(r'\b' + _API_KEY)
+    PREFIXED_KEY_PATTERN = re.compile(r'\b' + _PREFIXED_KEY)
+
+    # Group name -> replacement
+    REPLACEMENTS = {
+        "email": "[EMAIL_REDACTED]",
+        "phone": "[PHONE_REDACTED]",
+        "ssn": "[SSN_REDACTED]",
+        "cc": "[CC_REDACTED]",
+        "ip": "[IP_REDACTED]",
+        "key": "[KEY_REDACTED]",
+    }
+
+    # Single pass over the text, alternatives in the original priority order
+    # (email, phone, SSN, card, IP, key). The word boundary is tested once
+    # per position and the numeric patterns only where a digit starts.
+    _EMAIL_BRANCH = f'(?P<email>{_EMAIL})|'
+    _NUMERIC_BRANCH = (
+        f'(?=\\d)(?:(?P<phone>{_PHONE})|(?P<ssn>{_SSN})|(?P<cc>{_CREDIT_CARD})|(?P<ip>{_IP}))'
+    )
+    _KEY_BRANCH = f'|(?P<key>{_PREFIXED_KEY}|{_API_KEY})'
+    # (text has "@", text mentions a key/token) -> combined pattern
+    COMBINED_PATTERNS = {
+        (True, False): re.compile(f'\\b(?:{_EMAIL_BRANCH}{_NUMERIC_BRANCH})'),
+        (False, False): re.compile(f'\\b(?:{_NUMERIC_BRANCH})'),
+        (True, True): re.compile(f'\\b(?:{_EMAIL_BRANCH}{_NUMERIC_BRANCH}{_KEY_BRANCH})'),
+        (False, True): re.compile(f'\\b(?:{_NUMERIC_BRANCH}{_KEY_BRANCH})'),
+    }
+    # API keys are only scrubbed when the text mentions a key/token (be conservative)
+    KEY_HINT_PATTERN = re.compile(r'key|token', re.IGNORECASE)
+
+    # A match never contains a character outside these classes, nor two
+    # whitespace characters in a row: text can be split there and each
+    # piece scrubbed on its own with the same result.
+    SAFE_SPLIT_PATTERN = re.compile(r'[^\w.%+\-@|\s]|\s(?=\s)')
+    STREAM_CHUNK_CHARS = 64 * 1024
+
+    # Content-hash memo for large strings
+    MEMO_MIN_CHARS = 8 * 1024
+    MEMO_MAX_CHARS = 16 * 1024 * 1024
+    _memo: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+    _memo_chars = 0
+    _memo_lock = threading.Lock()
+
+    @classmethod
+    def _replace(cls, match: re.Match) -> str:
+        return cls.REPLACEMENTS[match.lastgroup]
+
+    @classmethod
+    def _pattern_for(cls, text: str) -> re.Pattern:
+        return cls.COMBINED_PATTERNS["@" in text, cls.KEY_HINT_PATTERN.search(text) is not None]
+
+    @classmethod
+    def _scrub_once(cls, text: str) -> str:
+        scrubbed, count = cls._pattern_for(text).subn(cls._replace, text)
+        return scrubbed if count else text
+
+    @classmethod
+    def _memo_get(cls, digest: bytes):
+        with cls._memo_lock:
+            if digest not in cls._memo:
+                return False, None
+            cls._memo.move_to_end(digest)
+            return True, cls._memo[digest]
+
+    @classmethod
+    def _memo_put(cls, digest: bytes, scrubbed: Optional[str]) -> None:
+        size = len(scrubbed) if scrubbed is not None else 0
+        with cls._memo_lock:
+            if digest in cls._memo:
+                return
+            cls._memo[digest] = scrubbed
+            cls._memo_chars += size
+            while cls._memo_chars > cls.MEMO_MAX_CHARS and cls._memo:
+                _, evicted = cls._memo.popitem(last=False)
+                cls._memo_chars -= len(evicted) if evicted is not None else 0
 
     @classmethod
     def scrub(cls, text: str) -> str:
@@ -419,29 +515,50 @@ class PIIScrubber:
             text: Input text
 
         Returns:
-            Scrubbed text with PII replaced
+            Scrubbed text with PII replaced (the same object if nothing matched)
         """
-        # Scrub emails
-        text = cls.EMAIL_PATTERN.sub('[EMAIL_REDACTED]', text)
-
-        # Scrub phone numbers
-        text = cls.PHONE_PATTERN.sub('[PHONE_REDACTED]', text)
-
-        # Scrub SSNs
-        text = cls.SSN_PATTERN.sub('[SSN_REDACTED]', text)
+        if len(text) < cls.MEMO_MIN_CHARS:
+            return cls._scrub_once(text)
+
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        found, scrubbed = cls._memo_get(digest)
+        if not found:
+            scrubbed = cls._scrub_once(text)
+            # Clean text is remembered as None: costs no memory
+            scrubbed = None if scrubbed is text else scrubbed
+            cls._memo_put(digest, scrubbed)
+        return text if scrubbed is None else scrubbed
 
-        # Scrub credit cards
-        text = cls.CREDIT_CARD_PATTERN.sub('[CC_REDACTED]', text)
+    @classmethod
+    def scrub_stream(cls, text: str, chunk_chars: Optional[int] = None) -> Iterator[str]:
+        """
+        Scrub a large text piecewise, yielding scrubbed pieces in order.
 
-        # Scrub IPs
-        text = cls.IP_PATTERN.sub('[IP_REDACTED]', text)
+        Pieces end at safe split points, so ``"".join(scrub_stream(text))``
+        equals ``scrub(text)`` while callers can forward output as it is
+        produced instead of holding a second full copy.
+        """
+        chunk_chars = chunk_chars or cls.STREAM_CHUNK_CHARS
+        pattern = cls._pattern_for(text)
+        pos, length = 0, len(text)
+
+        while pos < length:
+            split = length
+            if pos + chunk_chars < length:
+                boundary = cls.SAFE_SPLIT_PATTERN.search(text, pos + chunk_chars)
+                if boundary:
+                    split = boundary.end()
+            yield pattern.sub(cls._replace, text[pos:split])
+            pos = split
 
-        # Scrub API keys (be conservative)
-        # Only scrub if looks like a key (not just any long string)
-        if 'key' in text.lower() or 'token' in text.lower():
-            text = cls.API_KEY_PATTERN.sub('[KEY_REDACTED]', text)
+    @classmethod
+    def scrub_value(cls, value: Any) -> Any:
+        """
+        Recursively scrub strings inside dicts, lists and tuples.
 
-        return text
+        Subtrees without PII are returned as-is rather than copied.
+        """
+        return cls._scrub_tree(value, share=True)
 
     @classmethod
     def scrub_dict(cls, data: dict) -> dict:
@@ -452,26 +569,32 @@ class PIIScrubber:
             data: Input dictionary
 
         Returns:
-            Scrubbed dictionary
+            Scrubbed copy of the dictionary (dicts and lists are always new,
+            so callers may modify it; use scrub_value to share clean subtrees)
         """
-        scrubbed = {}
-
-        for key, value in data.items():
-            if isinstance(value, str):
-                scrubbed[key] = cls.scrub(value)
-            elif isinstance(value, dict):
-                scrubbed[key] = cls.scrub_dict(value)
-            elif isinstance(value, list):
-                scrubbed[key] = [
-                    cls.scrub(item) if isinstance(item, str)
-                    else cls.scrub_dict(item) if isinstance(item, dict)
-                    else item
-                    for item in value
-                ]
-            else:
-                scrubbed[key] = value
+        return cls._scrub_tree(data, share=False)
 
-        return scrubbed
+    @classmethod
+    def _scrub_tree(cls, value: Any, share: bool) -> Any:
+        if isinstance(value, str):
+            return cls.scrub(value)
+        if isinstance(value, dict):
+            scrubbed = {key: cls._scrub_tree(item, share) for key, item in value.items()}
+            if share and all(scrubbed[key] is item for key, item in value.items()):
+                return value
+            return scrubbed
+        if isinstance(value, (list, tuple)):
+            items = [cls._scrub_tree(item, share) for item in value]
+            if isinstance(value, list):
+                if share and all(new is old for new, old in zip(items, value)):
+                    return value
+                return items
+            # Tuples are immutable: shared whenever nothing changed
+            if all(new is old for new, old in zip(items, value)):
+                return value
+            # namedtuples take fields positionally; other subclasses become tuples
+            return value._make(items) if hasattr(value, "_make") else tuple(items)
+        return value
 
 
 # Global rate limiter instance
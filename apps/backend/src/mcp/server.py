@@ -37,6 +37,8 @@ if _local_mcp_server:
 import structlog
 from pydantic import BaseModel, Field
 
+from .tasks import get_task_context
+
 try:
     from .tools.audit_file import AuditFileTool
 except ModuleNotFoundError:
@@ -136,6 +138,7 @@ async def excel_analyzer(
 
     operations = operations or ["stats", "preview"]
     aggregate_columns = aggregate_columns or []
+    ctx = ctx or get_task_context()  # set when running as an MCP task
     user_id = getattr(ctx, "user_id", None) if ctx else None
 
     if ctx:
@@ -281,6 +284,7 @@ async def viz_tool(
     """
     import pandas as pd
 
+    ctx = ctx or get_task_context()  # set when running as an MCP task
     user_id = getattr(ctx, "user_id", None) if ctx else None
 
     if ctx:
@@ -434,6 +438,7 @@ async def deep_research(
     from ..services.deep_research_service import create_research_task
 
     focus_areas = focus_areas or []
+    ctx = ctx or get_task_context()  # set when running as an MCP task
     user_id = getattr(ctx, "user_id", None) if ctx else None
 
     # Map depth to iterations if not explicitly provided
@@ -550,6 +555,7 @@ async def extract_document_text(
 
     start_time = time.time()
     page_numbers = page_numbers or []
+    ctx = ctx or get_task_context()  # set when running as an MCP task
     user_id = getattr(ctx, "user_id", None) if ctx else None
 
     if ctx:
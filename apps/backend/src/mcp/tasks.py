@@ -9,23 +9,48 @@ Handles:
 - Result persistence
 
 Architecture:
-- In-memory queue for MVP (can be replaced with Redis/RQ/Celery)
+- Pluggable backend: in-memory (single process) or Redis (shared by replicas)
+- Priority queues (HIGH → NORMAL → LOW) drained by a bounded worker pool,
+  in the API process or in standalone workers (src.workers.mcp_task_worker)
 - Task states: PENDING → RUNNING → COMPLETED | FAILED | CANCELLED
+- Cancellation requests are broadcast via Redis pub/sub
+- Running tools get a TaskContext: a cancellation token and a
+  report_progress channel; watch() streams task snapshots (SSE)
 - Automatic cleanup after TTL
+
+The synchronous methods (create_task, mark_*, update_progress, ...) work on
+the process-local copy of a task and never block; with the Redis backend the
+changes are written through in the background. Reads that may be served by
+another replica (fetch_task, fetch_tasks, cancel, count) are async.
 """
 
 import asyncio
-import time
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from uuid import uuid4
 import structlog
 
 from pydantic import BaseModel
 
+from ..core.config import get_settings
+
 logger = structlog.get_logger(__name__)
 
+QUEUE_POLL_SECONDS = 1
+RECONNECT_DELAY_SECONDS = 5.0
+# watch(): snapshots buffered per watcher, and re-read interval when idle
+WATCH_QUEUE_SIZE = 16
+WATCH_REFRESH_SECONDS = 15.0
+WATCH_SUBSCRIBE_TIMEOUT = 1.0
+# Page size of task listings
+DEFAULT_LIST_LIMIT = 50
+
 
 class TaskStatus(str, Enum):
     """Task execution status."""
@@ -43,6 +68,12 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
+TERMINAL_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+# Dispatch order: lower rank is dequeued first
+PRIORITY_RANK = {TaskPriority.HIGH: 0, TaskPriority.NORMAL: 1, TaskPriority.LOW: 2}
+
+
 class Task(BaseModel):
     """Task representation."""
     task_id: str
@@ -61,43 +92,576 @@ class Task(BaseModel):
     cancellation_requested: bool = False
 
 
+TaskRunner = Callable[[Task], Awaitable[None]]
+
+_current_task_context: ContextVar[Optional["TaskContext"]] = ContextVar("mcp_task_context", default=None)
+
+
+def get_task_context() -> Optional["TaskContext"]:
+    """Context of the MCP task running in the current coroutine, if any."""
+    return _current_task_context.get()
+
+
+class TaskContext:
+    """
+    Handed to a tool running as a task: cancellation token + progress channel.
+
+    Mirrors the parts of FastMCP's Context the tools use (report_progress,
+    info, ...), so tools can do ``ctx = ctx or get_task_context()``. Every
+    report_progress is also a cancellation checkpoint.
+    """
+
+    def __init__(self, manager: "TaskManager", task: Task):
+        self.manager = manager
+        self.task_id = task.task_id
+        self.tool = task.tool
+        self.user_id = task.user_id
+        self.cancel_event = asyncio.Event()
+        if task.cancellation_requested:
+            self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """Raise asyncio.CancelledError if cancellation was requested."""
+        if self.cancel_event.is_set():
+            raise asyncio.CancelledError(f"Task {self.task_id} cancelled")
+
+    async def report_progress(self, progress: float, total: Any = None, message: Optional[str] = None) -> None:
+        """
+        Publish progress (0.0 to 1.0, or ``progress`` out of ``total``).
+
+        Accepts both FastMCP's ``(progress, total, message)`` and the
+        ``(progress, message)`` form used by the tools in server.py.
+        """
+        if isinstance(total, str) and message is None:
+            total, message = None, total
+        if total:
+            progress = progress / total
+        self.manager.update_progress(self.task_id, progress, message)
+        self.check_cancelled()
+
+    async def debug(self, message: str) -> None:
+        logger.debug(message, task_id=self.task_id, tool=self.tool)
+
+    async def info(self, message: str) -> None:
+        logger.info(message, task_id=self.task_id, tool=self.tool)
+
+    async def warning(self, message: str) -> None:
+        logger.warning(message, task_id=self.task_id, tool=self.tool)
+
+    async def error(self, message: str) -> None:
+        logger.error(message, task_id=self.task_id, tool=self.tool)
+
+    async def run(self, awaitable: Awaitable[Any], grace_seconds: float) -> Any:
+        """
+        Await the tool, enforcing cancellation on tools that never check.
+
+        Once cancellation is requested the tool has ``grace_seconds`` to stop
+        at a checkpoint (or finish); after that it is cancelled outright.
+        """
+        work = asyncio.ensure_future(awaitable)
+        requested = asyncio.create_task(self.cancel_event.wait())
+        try:
+            await asyncio.wait({work, requested}, return_when=asyncio.FIRST_COMPLETED)
+            if not work.done():
+                await asyncio.wait({work}, timeout=grace_seconds)
+            if not work.done():
+                logger.info("Task ignored cancellation, cancelling it", task_id=self.task_id, tool=self.tool)
+                work.cancel()
+                await asyncio.wait({work})
+            return work.result()
+        finally:
+            requested.cancel()
+            if not work.done():
+                work.cancel()
+
+
+def _offer(queue: asyncio.Queue, task: Task) -> None:
+    """Queue a snapshot for a watcher, dropping the oldest one if it lags behind."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(task)
+
+
+class TaskBackend(ABC):
+    """
+    Task storage, indexes and dispatch queues.
+
+    ``distributed`` backends are shared between processes: TaskManager writes
+    local changes through to them and reads other replicas' tasks from them.
+    Every backend must queue tasks; the storage and pub/sub methods default
+    to no-ops for backends whose store is TaskManager.tasks itself.
+    """
+
+    distributed = False
+
+    async def save(self, task: Task) -> None:
+        """Persist a task and update its user/status indexes."""
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        """Load a task by ID."""
+        return None
+
+    async def list(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        tool: Optional[str] = None,
+        offset: int = 0,
+        limit: int = DEFAULT_LIST_LIMIT,
+    ) -> List[Task]:
+        """One page of the tasks matching the filters, newest first."""
+        return []
+
+    async def count(self, status: TaskStatus) -> int:
+        """Number of tasks in a status."""
+        return 0
+
+    @abstractmethod
+    async def enqueue(self, task: Task) -> None:
+        """Queue a task for the worker pool according to its priority."""
+
+    @abstractmethod
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        """Next task ID by priority, or None after ``timeout`` seconds."""
+
+    async def request_cancellation(self, task_id: str) -> Optional[Task]:
+        """
+        Flag a stored, unfinished task for cancellation and tell every process.
+
+        Only the flag is written, never the task itself, so a replica's stale
+        copy cannot overwrite the state of the one running it. Returns the
+        task, or None if it is unknown or already finished.
+        """
+        return None
+
+    async def listen_cancellations(self, callback: Callable[[str], None]) -> None:
+        """Call ``callback(task_id)`` for every cancellation; runs until cancelled."""
+
+    async def listen_updates(
+        self, task_id: str, callback: Callable[[Task], None], subscribed: asyncio.Event
+    ) -> None:
+        """Call ``callback(task)`` whenever the task is saved; runs until cancelled."""
+        subscribed.set()
+
+    async def cleanup(self, cutoff: datetime) -> None:
+        """Drop index entries of finished tasks created before ``cutoff``."""
+
+
+class InMemoryTaskBackend(TaskBackend):
+    """Single-process backend: TaskManager.tasks is the store, this is the queue."""
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wakeup_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _event(self) -> asyncio.Event:
+        # Events belong to one loop; recreate if the manager moved to another
+        loop = asyncio.get_running_loop()
+        if self._wakeup_loop is not loop:
+            self._wakeup = asyncio.Event()
+            self._wakeup_loop = loop
+        return self._wakeup
+
+    async def enqueue(self, task: Task) -> None:
+        heapq.heappush(self._heap, (PRIORITY_RANK[task.priority], next(self._seq), task.task_id))
+        self._event().set()
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        if not self._heap:
+            event = self._event()
+            event.clear()
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+            if not self._heap:
+                return None
+        return heapq.heappop(self._heap)[2]
+
+
+class RedisTaskBackend(TaskBackend):
+    """
+    Redis backend shared by API replicas and standalone workers.
+
+    Keys:
+    - {prefix}:task:{id}          JSON task, expires ``ttl`` after its last update
+    - {prefix}:cancel_requested:{id}  cancellation flag, kept apart from the task JSON
+    - {prefix}:user:{user_id}     sorted set of task IDs by creation time
+    - {prefix}:status:{status}    sorted set of task IDs by creation time
+    - {prefix}:queue:{priority}   list of task IDs waiting for a worker
+    - {prefix}:cancel             pub/sub channel of cancelled task IDs
+    - {prefix}:updates:{id}       pub/sub channel of task snapshots, one per save
+    """
+
+    distributed = True
+
+    def __init__(self, redis_client=None, *, prefix: str = "mcp:tasks", ttl: timedelta = timedelta(hours=24)):
+        self._redis = redis_client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.channel = f"{prefix}:cancel"
+
+    async def _client(self):
+        if self._redis is None:
+            from ..services.cache_service import get_redis_client
+            self._redis = await get_redis_client()
+        return self._redis
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.prefix}:task:{task_id}"
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{self.prefix}:user:{user_id}"
+
+    def _status_key(self, status: TaskStatus) -> str:
+        return f"{self.prefix}:status:{status.value}"
+
+    def _queue_key(self, priority: TaskPriority) -> str:
+        return f"{self.prefix}:queue:{priority.value}"
+
+    def _cancel_key(self, task_id: str) -> str:
+        return f"{self.prefix}:cancel_requested:{task_id}"
+
+    def _updates_channel(self, task_id: str) -> str:
+        return f"{self.prefix}:updates:{task_id}"
+
+    @staticmethod
+    def _load(raw: str, cancel_requested: Optional[str]) -> Task:
+        task = Task.model_validate_json(raw)
+        if cancel_requested:
+            task.cancellation_requested = True
+        return task
+
+    async def save(self, task: Task) -> None:
+        client = await self._client()
+        ttl_seconds = int(self.ttl.total_seconds())
+        entry = {task.task_id: task.created_at.timestamp()}
+
+        raw = task.model_dump_json()
+
+        pipe = client.pipeline(transaction=True)
+        pipe.set(self._task_key(task.task_id), raw, ex=ttl_seconds)
+        pipe.zadd(self._user_key(task.user_id), entry)
+        pipe.expire(self._user_key(task.user_id), ttl_seconds)
+        for status in TaskStatus:
+            if status == task.status:
+                pipe.zadd(self._status_key(status), entry)
+            else:
+                pipe.zrem(self._status_key(status), task.task_id)
+        pipe.publish(self._updates_channel(task.task_id), raw)
+        await pipe.execute()
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        client = await self._client()
+        raw, cancel_requested = await client.mget([self._task_key(task_id), self._cancel_key(task_id)])
+        return self._load(raw, cancel_requested) if raw else None
+
+    async def list(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        tool: Optional[str] = None,
+        offset: int = 0,
+        limit: int = DEFAULT_LIST_LIMIT,
+    ) -> List[Task]:
+        client = await self._client()
+
+        if not (user_id or status):
+            # Newest offset+limit of each status index, merged
+            scored = []
+            for each in TaskStatus:
+                scored.extend(await client.zrevrange(self._status_key(each), 0, offset + limit - 1, withscores=True))
+            scored.sort(key=lambda item: item[1], reverse=True)
+            tasks, _ = await self._load_many(client, [task_id for task_id, _ in scored])
+            return [t for t in tasks if tool is None or t.tool == tool][offset:offset + limit]
+
+        # Walk the index a page at a time until enough tasks match the filters
+        index = self._user_key(user_id) if user_id else self._status_key(status)
+        tasks: List[Task] = []
+        expired: List[str] = []
+        skipped = 0
+        start = 0
+        while len(tasks) < limit:
+            ids = await client.zrevrange(index, start, start + limit - 1)
+            if not ids:
+                break
+            start += len(ids)
+            page, page_expired = await self._load_many(client, ids)
+            expired.extend(page_expired)
+            for task in page:
+                if (status and task.status != status) or (tool and task.tool != tool):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                elif len(tasks) < limit:
+                    tasks.append(task)
+
+        # Task keys expire on their own; drop their index entries lazily
+        if expired:
+            await client.zrem(index, *expired)
+        return tasks
+
+    async def _load_many(self, client, ids: List[str]) -> Tuple[List[Task], List[str]]:
+        """Tasks stored under ``ids`` (in order), and the IDs whose task expired."""
+        if not ids:
+            return [], []
+
+        tasks = []
+        expired = []
+        values = await client.mget([self._task_key(i) for i in ids] + [self._cancel_key(i) for i in ids])
+        for task_id, raw, cancel_requested in zip(ids, values[:len(ids)], values[len(ids):]):
+            if raw is None:
+                expired.append(task_id)
+            else:
+                tasks.append(self._load(raw, cancel_requested))
+        return tasks, expired
+
+    async def count(self, status: TaskStatus) -> int:
+        client = await self._client()
+        return await client.zcard(self._status_key(status))
+
+    async def enqueue(self, task: Task) -> None:
+        client = await self._client()
+        await client.lpush(self._queue_key(task.priority), task.task_id)
+
+    async def dequeue(self, timeout: float) -> Optional[str]:
+        client = await self._client()
+        # BRPOP serves the first non-empty key, so key order is priority order
+        queues = [self._queue_key(p) for p in sorted(PRIORITY_RANK, key=PRIORITY_RANK.get)]
+        item = await client.brpop(queues, timeout=timeout)
+        return item[1] if item else None
+
+    async def request_cancellation(self, task_id: str) -> Optional[Task]:
+        task = await self.get(task_id)
+        if task is None or task.status in TERMINAL_STATUSES:
+            return None
+
+        client = await self._client()
+        pipe = client.pipeline(transaction=True)
+        pipe.set(self._cancel_key(task_id), 1, ex=int(self.ttl.total_seconds()))
+        pipe.publish(self.channel, task_id)
+        await pipe.execute()
+
+        task.cancellation_requested = True
+        return task
+
+    async def listen_cancellations(self, callback: Callable[[str], None]) -> None:
+        while True:
+            pubsub = None
+            try:
+                client = await self._client()
+                pubsub = client.pubsub()
+                await pubsub.subscribe(self.channel)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message["type"] == "message":
+                        callback(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Task cancellation listener disconnected", error=str(exc))
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def listen_updates(
+        self, task_id: str, callback: Callable[[Task], None], subscribed: asyncio.Event
+    ) -> None:
+        client = await self._client()
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(self._updates_channel(task_id))
+            subscribed.set()
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message["type"] == "message":
+                    callback(Task.model_validate_json(message["data"]))
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+
+    async def cleanup(self, cutoff: datetime) -> None:
+        client = await self._client()
+        for status in TERMINAL_STATUSES:
+            await client.zremrangebyscore(self._status_key(status), "-inf", cutoff.timestamp())
+
+
+def create_task_backend(ttl: timedelta) -> TaskBackend:
+    """Backend selected by MCP_TASK_BACKEND ("memory" or "redis")."""
+    if get_settings().mcp_task_backend == "redis":
+        return RedisTaskBackend(ttl=ttl)
+    return InMemoryTaskBackend()
+
+
 class TaskManager:
     """
     Manages long-running MCP tasks.
 
     Features:
-    - In-memory task queue (MVP - can upgrade to Redis/RQ)
-    - Cancellation support
-    - Progress tracking
+    - Pluggable backend (in-memory or Redis) with per-user and per-status indexes
+    - Priority dispatch to a bounded worker pool
+    - Cancellation support (pub/sub across replicas, TaskContext tokens)
+    - Progress tracking and streaming (watch)
     - Automatic cleanup after TTL
     """
 
-    def __init__(self, ttl_hours: int = 24):
+    def __init__(
+        self,
+        ttl_hours: int = 24,
+        backend: Optional[TaskBackend] = None,
+        workers: Optional[int] = None,
+    ):
         """
         Initialize task manager.
 
         Args:
             ttl_hours: Task TTL in hours (default: 24)
+            backend: Task backend (default: from MCP_TASK_BACKEND)
+            workers: Worker pool size; 0 only queues tasks (default: MCP_TASK_WORKERS)
         """
         self.tasks: Dict[str, Task] = {}
         self.ttl = timedelta(hours=ttl_hours)
+        self.backend = backend or create_task_backend(self.ttl)
+        self.workers = get_settings().mcp_task_workers if workers is None else max(0, workers)
+        self.runner: Optional[TaskRunner] = None
         self._cleanup_task: Optional[asyncio.Task] = None
 
-    async def start(self):
-        """Start background cleanup task."""
+        # Local indexes (insertion order = creation order for tasks created here)
+        self._by_user: Dict[str, Dict[str, None]] = {}
+        self._by_status: Dict[TaskStatus, Dict[str, None]] = {status: {} for status in TaskStatus}
+
+        self._worker_tasks: List[asyncio.Task] = []
+        self._listener: Optional[asyncio.Task] = None
+        # Tasks changed locally and not yet written to a distributed backend
+        self._dirty: Dict[str, None] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        # Contexts of tasks running here, and queues of local watchers
+        self._contexts: Dict[str, TaskContext] = {}
+        self._watchers: Dict[str, Set[asyncio.Queue]] = {}
+
+    async def start(self, runner: Optional[TaskRunner] = None):
+        """Start cleanup, the worker pool and the cancellation listener."""
+        if runner is not None:
+            self.runner = runner
         if self._cleanup_task is None:
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-            logger.info("Task manager started")
+            if self.backend.distributed:
+                self._listener = asyncio.create_task(
+                    self.backend.listen_cancellations(self._on_cancellation)
+                )
+            logger.info(
+                "Task manager started",
+                backend=type(self.backend).__name__,
+                workers=self.workers,
+            )
+        self._ensure_workers()
 
     async def stop(self):
-        """Stop background cleanup task."""
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-            logger.info("Task manager stopped")
+        """Stop workers and background tasks, flushing pending writes."""
+        background = [*self._worker_tasks, self._listener, self._cleanup_task]
+        for task in background:
+            if task:
+                task.cancel()
+        for task in background:
+            if task:
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._worker_tasks = []
+        self._listener = None
+        self._cleanup_task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning("Could not persist tasks on shutdown", error=str(e))
+        if self._flusher:
+            self._flusher.cancel()
+            self._flusher = None
+        logger.info("Task manager stopped")
+
+    def set_runner(self, runner: TaskRunner):
+        """Set the coroutine that executes a dequeued task."""
+        self.runner = runner
+
+    def _ensure_workers(self):
+        if self.runner is None or self.workers == 0:
+            return
+        if self._worker_tasks and not all(t.done() for t in self._worker_tasks):
+            return
+        self._worker_tasks = [
+            asyncio.create_task(self._worker_loop(), name=f"mcp-task-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    def _index(self, task: Task):
+        self._by_user.setdefault(task.user_id, {})[task.task_id] = None
+        self._by_status[task.status][task.task_id] = None
+
+    def _set_status(self, task: Task, status: TaskStatus):
+        self._by_status[task.status].pop(task.task_id, None)
+        task.status = status
+        self._by_status[status][task.task_id] = None
+
+    def _touch(self, task: Task):
+        """Notify local watchers and schedule a write-through to a distributed backend."""
+        watchers = self._watchers.get(task.task_id)
+        if watchers:
+            snapshot = task.model_copy()
+            for queue in watchers:
+                _offer(queue, snapshot)
+
+        if not self.backend.distributed:
+            return
+        self._dirty[task.task_id] = None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Flushed by the next flush() or start()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_soon())
+
+    async def _flush_soon(self):
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning("Task write-through failed, will retry", error=str(e))
+
+    async def flush(self):
+        """Write locally changed tasks to the backend."""
+        if not self.backend.distributed:
+            return
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        # Serialized so an older snapshot never overwrites a newer one
+        async with self._flush_lock:
+            while self._dirty:
+                # Clear the flag before saving: changes made during the save
+                # mark the task dirty again and are written on the next pass
+                task_id = next(iter(self._dirty))
+                del self._dirty[task_id]
+                task = self.tasks.get(task_id)
+                if task is None:
+                    continue
+                try:
+                    await self.backend.save(task.model_copy())
+                except BaseException:
+                    self._dirty[task_id] = None
+                    raise
 
     def create_task(
         self,
@@ -110,12 +674,6 @@ class TaskManager:
         """
         Create a new task.
 
-        Args:
-            tool: Tool name
-            payload: Tool input
-            user_id: User ID
-            priority: Task priority
-
         Args:
             tool: Tool name
             payload: Tool input
@@ -139,6 +697,8 @@ class TaskManager:
         )
 
         self.tasks[task_id] = task
+        self._index(task)
+        self._touch(task)
 
         logger.info(
             "Task created",
@@ -150,8 +710,39 @@ class TaskManager:
 
         return task_id
 
+    async def submit(self, task_id: str):
+        """
+        Queue a created task for the worker pool.
+
+        With the Redis backend the task is persisted first, so a worker in
+        any process can pick it up.
+        """
+        task = self.tasks[task_id]
+        try:
+            await self.flush()
+            await self.backend.enqueue(task)
+        except Exception as e:
+            logger.error("Task could not be queued", task_id=task_id, error=str(e))
+            self.mark_failed(
+                task_id,
+                {"code": "QUEUE_UNAVAILABLE", "message": "Task queue unavailable"},
+            )
+            return
+        self._ensure_workers()
+
     def get_task(self, task_id: str) -> Optional[Task]:
-        """Get task by ID."""
+        """Get task by ID (process-local copy)."""
+        return self.tasks.get(task_id)
+
+    async def fetch_task(self, task_id: str) -> Optional[Task]:
+        """Get task by ID, from the backend if it is shared by other replicas."""
+        if self.backend.distributed:
+            try:
+                task = await self.backend.get(task_id)
+                if task is not None:
+                    return task
+            except Exception as e:
+                logger.warning("Task backend read failed, using local copy", task_id=task_id, error=str(e))
         return self.tasks.get(task_id)
 
     def update_progress(
@@ -173,6 +764,7 @@ class TaskManager:
             task.progress = max(0.0, min(1.0, progress))
             if message:
                 task.progress_message = message
+            self._touch(task)
 
             logger.debug(
                 "Task progress updated",
@@ -185,8 +777,9 @@ class TaskManager:
         """Mark task as running."""
         task = self.tasks.get(task_id)
         if task:
-            task.status = TaskStatus.RUNNING
+            self._set_status(task, TaskStatus.RUNNING)
             task.started_at = datetime.utcnow()
+            self._touch(task)
 
             logger.info("Task started", task_id=task_id, tool=task.tool)
 
@@ -198,10 +791,11 @@ class TaskManager:
         """Mark task as completed with result."""
         task = self.tasks.get(task_id)
         if task:
-            task.status = TaskStatus.COMPLETED
+            self._set_status(task, TaskStatus.COMPLETED)
             task.completed_at = datetime.utcnow()
             task.progress = 1.0
             task.result = result
+            self._touch(task)
 
             duration_ms = (
                 (task.completed_at - task.started_at).total_seconds() * 1000
@@ -224,9 +818,10 @@ class TaskManager:
         """Mark task as failed with error."""
         task = self.tasks.get(task_id)
         if task:
-            task.status = TaskStatus.FAILED
+            self._set_status(task, TaskStatus.FAILED)
             task.completed_at = datetime.utcnow()
             task.error = error
+            self._touch(task)
 
             logger.error(
                 "Task failed",
@@ -246,7 +841,7 @@ class TaskManager:
         if not task:
             return False
 
-        if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
+        if task.status in TERMINAL_STATUSES:
             logger.warning(
                 "Cannot cancel task in terminal state",
                 task_id=task_id,
@@ -255,17 +850,67 @@ class TaskManager:
             return False
 
         task.cancellation_requested = True
+        self._signal_cancellation(task_id)
+        self._touch(task)
 
         logger.info("Task cancellation requested", task_id=task_id, tool=task.tool)
 
         return True
 
+    async def cancel(self, task_id: str) -> bool:
+        """
+        Request cancellation of a task running in any process.
+
+        Returns:
+            True if cancellation requested, False if task not found/already completed
+        """
+        if not self.backend.distributed:
+            return self.request_cancellation(task_id)
+
+        # The local copy may be stale (another replica claimed the task), so
+        # only the flag goes to the backend; the copy just takes the flag too
+        task = await self.backend.request_cancellation(task_id)
+        if task is None:
+            return False
+        self._on_cancellation(task_id)
+
+        logger.info("Task cancellation requested", task_id=task_id, tool=task.tool)
+        return True
+
+    def _on_cancellation(self, task_id: str):
+        task = self.tasks.get(task_id)
+        if task and task.status not in TERMINAL_STATUSES:
+            task.cancellation_requested = True
+            self._signal_cancellation(task_id)
+
+    def _signal_cancellation(self, task_id: str):
+        context = self._contexts.get(task_id)
+        if context is not None:
+            context.cancel_event.set()
+
+    @contextmanager
+    def task_context(self, task_id: str) -> Iterator[TaskContext]:
+        """
+        TaskContext for running a task here, current for the enclosed code.
+
+        Cancellation requests (local or from another replica) set its token.
+        """
+        context = TaskContext(self, self.tasks[task_id])
+        self._contexts[task_id] = context
+        token = _current_task_context.set(context)
+        try:
+            yield context
+        finally:
+            _current_task_context.reset(token)
+            self._contexts.pop(task_id, None)
+
     def mark_cancelled(self, task_id: str):
         """Mark task as cancelled."""
         task = self.tasks.get(task_id)
         if task:
-            task.status = TaskStatus.CANCELLED
+            self._set_status(task, TaskStatus.CANCELLED)
             task.completed_at = datetime.utcnow()
+            self._touch(task)
 
             logger.info("Task cancelled", task_id=task_id, tool=task.tool)
 
@@ -281,7 +926,7 @@ class TaskManager:
         status: Optional[TaskStatus] = None,
     ) -> list[Task]:
         """
-        List tasks with optional filters.
+        List process-local tasks with optional filters.
 
         Args:
             user_id: Filter by user
@@ -289,23 +934,133 @@ class TaskManager:
             status: Filter by status
 
         Returns:
-            List of tasks
+            List of tasks, newest first
         """
-        tasks = list(self.tasks.values())
-
         if user_id:
-            tasks = [t for t in tasks if t.user_id == user_id]
+            # Per-user index is in creation order: walk it backwards
+            candidates = (self.tasks[i] for i in reversed(self._by_user.get(user_id, {})))
+            tasks = [t for t in candidates if status is None or t.status == status]
+        else:
+            ids = self._by_status[status] if status else self.tasks
+            tasks = sorted((self.tasks[i] for i in ids), key=lambda t: t.created_at, reverse=True)
 
         if tool:
             tasks = [t for t in tasks if t.tool == tool]
 
-        if status:
-            tasks = [t for t in tasks if t.status == status]
+        return tasks
 
-        # Sort by created_at descending
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
+    async def fetch_tasks(
+        self,
+        user_id: Optional[str] = None,
+        tool: Optional[str] = None,
+        status: Optional[TaskStatus] = None,
+        offset: int = 0,
+        limit: int = DEFAULT_LIST_LIMIT,
+    ) -> list[Task]:
+        """Like list_tasks, one page at a time, across every replica when the backend is shared."""
+        if self.backend.distributed:
+            try:
+                return await self.backend.list(
+                    user_id=user_id, status=status, tool=tool, offset=offset, limit=limit
+                )
+            except Exception as e:
+                logger.warning("Task backend list failed, using local tasks", error=str(e))
 
-        return tasks
+        return self.list_tasks(user_id=user_id, tool=tool, status=status)[offset:offset + limit]
+
+    async def count(self, status: TaskStatus) -> int:
+        """Number of tasks in a status."""
+        if self.backend.distributed:
+            try:
+                return await self.backend.count(status)
+            except Exception as e:
+                logger.warning("Task backend count failed, using local tasks", error=str(e))
+        return len(self._by_status[status])
+
+    async def watch(self, task_id: str, refresh_seconds: float = WATCH_REFRESH_SECONDS) -> AsyncIterator[Task]:
+        """
+        Yield snapshots of a task as it changes, ending after a terminal status.
+
+        Changes made in this process arrive immediately; with a distributed
+        backend, changes made elsewhere arrive through its update channel.
+        The task is re-read after ``refresh_seconds`` without news, so a
+        missed message only delays an update. Yields nothing for unknown tasks.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=WATCH_QUEUE_SIZE)
+        watchers = self._watchers.setdefault(task_id, set())
+        watchers.add(queue)
+        listener = None
+        try:
+            if self.backend.distributed:
+                subscribed = asyncio.Event()
+                listener = asyncio.create_task(self._listen_updates(task_id, queue, subscribed))
+                try:
+                    await asyncio.wait_for(subscribed.wait(), WATCH_SUBSCRIBE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass
+
+            task = await self.fetch_task(task_id)
+            last = None
+            while task is not None:
+                state = (task.status, task.progress, task.progress_message)
+                if state != last:
+                    last = state
+                    yield task
+                if task.status in TERMINAL_STATUSES:
+                    return
+                try:
+                    task = await asyncio.wait_for(queue.get(), refresh_seconds)
+                except asyncio.TimeoutError:
+                    task = await self.fetch_task(task_id)
+        finally:
+            watchers.discard(queue)
+            if not watchers:
+                self._watchers.pop(task_id, None)
+            if listener is not None:
+                listener.cancel()
+                await asyncio.gather(listener, return_exceptions=True)
+
+    async def _listen_updates(self, task_id: str, queue: asyncio.Queue, subscribed: asyncio.Event):
+        try:
+            await self.backend.listen_updates(task_id, lambda task: _offer(queue, task), subscribed)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Task update listener failed, falling back to re-reads", task_id=task_id, error=str(e))
+        finally:
+            subscribed.set()
+
+    async def _claim(self, task_id: str) -> Optional[Task]:
+        """Local copy of a dequeued task, or None if it should not run."""
+        task = self.tasks.get(task_id)
+        if task is None and self.backend.distributed:
+            task = await self.backend.get(task_id)
+            if task is not None:
+                self.tasks[task_id] = task
+                self._index(task)
+
+        if task is None or task.status != TaskStatus.PENDING:
+            return None
+        if task.cancellation_requested:
+            self.mark_cancelled(task_id)
+            return None
+        return task
+
+    async def _worker_loop(self):
+        """Run queued tasks one at a time, highest priority first."""
+        while True:
+            try:
+                task_id = await self.backend.dequeue(QUEUE_POLL_SECONDS)
+                if task_id is None:
+                    continue
+                task = await self._claim(task_id)
+                if task is not None:
+                    await self.runner(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Task worker error", error=str(e), exc_info=True)
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
 
     async def _cleanup_loop(self):
         """Background task to cleanup old completed tasks."""
@@ -323,18 +1078,26 @@ class TaskManager:
         now = datetime.utcnow()
         to_remove = []
 
-        for task_id, task in self.tasks.items():
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
+        for status in TERMINAL_STATUSES:
+            for task_id in self._by_status[status]:
+                task = self.tasks[task_id]
                 age = now - (task.completed_at or task.created_at)
-                if age > self.ttl:
-                    to_remove.append(task_id)
+                if age > self.ttl and task_id not in self._dirty:
+                    to_remove.append(task)
+
+        for task in to_remove:
+            del self.tasks[task.task_id]
+            self._by_status[task.status].pop(task.task_id, None)
+            user_tasks = self._by_user.get(task.user_id, {})
+            user_tasks.pop(task.task_id, None)
+            if not user_tasks:
+                self._by_user.pop(task.user_id, None)
 
-        for task_id in to_remove:
-            del self.tasks[task_id]
+        await self.backend.cleanup(now - self.ttl)
 
         if to_remove:
             logger.info("Cleaned up old tasks", count=len(to_remove))
 
 
 # Global task manager instance
-task_manager = TaskManager()
+task_manager = TaskManager(ttl_hours=get_settings().mcp_task_ttl_hours)
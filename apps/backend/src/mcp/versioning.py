@@ -233,6 +233,9 @@ class VersionedToolRegistry:
         # tool_name -> {deprecated_version_str -> replacement_version}
         self._deprecated: Dict[str, Dict[str, str]] = {}
 
+        # Bumped on every change; caches derived from the registry key on it
+        self.revision = 0
+
     def register(
         self,
         tool_name: str,
@@ -256,6 +259,7 @@ class VersionedToolRegistry:
 
         metadata = metadata or {}
         self._tools[tool_name][version] = (parsed_version, tool_func, metadata)
+        self.revision += 1
 
         # Update latest version
         if tool_name not in self._latest:
@@ -289,6 +293,7 @@ class VersionedToolRegistry:
             self._deprecated[tool_name] = {}
 
         self._deprecated[tool_name][version] = replacement
+        self.revision += 1
 
         logger.warning(
             "Tool version deprecated",
@@ -297,6 +302,35 @@ class VersionedToolRegistry:
             replacement=replacement,
         )
 
+    def unregister(self, tool_name: str, version: Optional[str] = None):
+        """
+        Remove a tool version, or every version of the tool.
+
+        Args:
+            tool_name: Tool identifier
+            version: Version to remove (default: all versions)
+        """
+        versions = self._tools.get(tool_name)
+        if not versions:
+            return
+
+        if version is None:
+            versions.clear()
+        else:
+            versions.pop(version, None)
+            self._deprecated.get(tool_name, {}).pop(version, None)
+
+        if versions:
+            self._latest[tool_name] = max(versions.items(), key=lambda item: item[1][0])[0]
+        else:
+            self._tools.pop(tool_name, None)
+            self._latest.pop(tool_name, None)
+            self._deprecated.pop(tool_name, None)
+
+        self.revision += 1
+
+        logger.info("Tool version unregistered", tool=tool_name, version=version or "*")
+
     def resolve(self, tool_name: str, version_constraint: Optional[str] = None) -> Tuple[str, any]:
         """
         Resolve version constraint to specific version and return tool.
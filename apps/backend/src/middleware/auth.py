@@ -1,22 +1,26 @@
 """
 Authentication middleware for JWT token validation.
+
+Pure ASGI middleware: public paths and authenticated requests are handed to
+the app with the original ``receive``/``send``, so streamed responses are not
+re-buffered the way ``BaseHTTPMiddleware`` does.
 """
 
 from typing import Optional
 
 import structlog
-from fastapi import Request, Response, status
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..core.config import get_settings
 from ..services.cache_service import is_token_blacklisted
+from ..services.principal_cache import get_principal_cache
 
 logger = structlog.get_logger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """JWT authentication middleware."""
     
     # Public endpoints that don't require authentication
@@ -39,46 +43,60 @@ class AuthMiddleware(BaseHTTPMiddleware):
     }
     
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.settings = get_settings()
-    
-    async def dispatch(self, request: Request, call_next) -> Response:
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and validate JWT token if required."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip authentication for public endpoints and preflight requests
-        if request.method == "OPTIONS" or request.url.path in self.PUBLIC_PATHS:
-            return await call_next(request)
+        if scope["method"] == "OPTIONS" or scope["path"] in self.PUBLIC_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
         # Extract JWT token from request
         token = self._extract_token(request)
         if not token:
             logger.warning("Missing authentication token", path=request.url.path)
             self._token_error_code = "token_missing"
-            return self._unauthorized_response("token_missing")
-
-        # Validate JWT token
-        payload = self._validate_token(token)
-        if not payload:
-            logger.warning("Invalid JWT token", path=request.url.path)
-            # _token_error_code is set by _validate_token
-            return self._unauthorized_response()
-
-        # Check if token has been revoked (blacklisted)
-        is_blacklisted = await is_token_blacklisted(token)
-        if is_blacklisted:
+            await self._unauthorized_response("token_missing")(scope, receive, send)
+            return
+
+        # Validate JWT token (decoded claims are cached briefly per token)
+        principal_cache = get_principal_cache()
+        token_key = principal_cache.token_key(token)
+        payload = principal_cache.get_claims(token_key)
+        if payload is None:
+            payload = self._validate_token(token)
+            if not payload:
+                logger.warning("Invalid JWT token", path=request.url.path)
+                # _token_error_code is set by _validate_token
+                await self._unauthorized_response()(scope, receive, send)
+                return
+            principal_cache.put_claims(token_key, payload)
+
+        # Check if token has been revoked (blacklisted); the local revocation
+        # mirror only skips Redis for tokens known not to be revoked
+        if principal_cache.might_be_revoked(token_key) and await is_token_blacklisted(token):
             logger.warning("Token has been revoked", path=request.url.path)
             self._token_error_code = "token_revoked"
-            return self._unauthorized_response("token_revoked")
+            await self._unauthorized_response("token_revoked")(scope, receive, send)
+            return
 
-        # Add user context to request
+        # Add user context to request (request.state is backed by scope["state"])
         request.state.user_id = payload.get("sub") or payload.get("user_id")
         request.state.authenticated = True
         request.state.user_claims = payload
 
         logger.debug("Authenticated request", user_id=request.state.user_id, path=request.url.path)
 
-        return await call_next(request)
-    
+        await self.app(scope, receive, send)
+
     def _extract_token(self, request: Request) -> Optional[str]:
         """
         Extract JWT token from Authorization header or query string.
@@ -0,0 +1,102 @@
+"""
+Request body size limit.
+
+Rejects oversized requests with 413 before any of the body is read: the
+declared Content-Length is checked against the limit for the route prefix.
+Chunked bodies (no Content-Length) are counted as they are received and cut
+off once they pass the limit, so the JSON parser never sees more than that.
+"""
+
+from typing import Dict, Optional
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.config import get_settings
+
+BODY_METHODS = {"POST", "PUT", "PATCH"}
+
+
+def _content_length(scope: Scope) -> Optional[int]:
+    for name, value in scope.get("headers", ()):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _too_large(limit: int) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={
+            "error": "payload_too_large",
+            "detail": f"El cuerpo de la solicitud excede el límite de {limit} bytes.",
+            "limit_bytes": limit,
+        },
+    )
+
+
+class BodySizeLimitMiddleware:
+    """
+    Hard per-prefix request body limits (bytes), e.g. ``{"/api/mcp": 1310720}``.
+
+    The longest matching prefix wins; paths without one pass through.
+    Pure ASGI, like the rest of the stack.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Optional[Dict[str, int]] = None) -> None:
+        self.app = app
+        if limits is None:
+            limits = {"/api/mcp": get_settings().mcp_max_request_body_bytes}
+        # Longest prefix first
+        self.limits = sorted(
+            ((prefix, limit) for prefix, limit in limits.items() if limit > 0),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def limit_for(self, path: str) -> Optional[int]:
+        for prefix, limit in self.limits:
+            if path.startswith(prefix):
+                return limit
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limit_for(scope["path"])
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        declared = _content_length(scope)
+        if declared is not None:
+            if declared > limit:
+                await _too_large(limit)(scope, receive, send)
+                return
+            # The server enforces Content-Length, nothing left to count
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_wrapper() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the route, so the HTTP exception handler answers 413
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"El cuerpo de la solicitud excede el límite de {limit} bytes.",
+                    )
+            return message
+
+        await self.app(scope, receive_wrapper, send)
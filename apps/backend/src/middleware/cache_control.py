@@ -5,12 +5,15 @@ ISSUE-023: Adds no-cache headers to all API responses to prevent
 browsers from caching sensitive chat data.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class CacheControlMiddleware(BaseHTTPMiddleware):
+# Catalog endpoints whose ETag responses may be cached privately
+REVALIDATE_PATHS = ("/api/mcp/tools", "/api/mcp/discover", "/api/mcp/schema/")
+
+
+class CacheControlMiddleware:
     """
     Middleware to add Cache-Control headers to API responses.
 
@@ -18,17 +21,36 @@ class CacheControlMiddleware(BaseHTTPMiddleware):
     - Chat messages (sensitive, real-time data)
     - User authentication state
     - Document review results
+
+    The MCP tool catalog (``REVALIDATE_PATHS``) carries an ETag and may be
+    stored privately but must be revalidated, so If-None-Match can answer
+    304. Other ETag-bearing responses (e.g. ``FileResponse`` report
+    downloads) are never stored.
+
+    Pure ASGI: headers are rewritten on ``http.response.start`` and body
+    chunks are forwarded untouched.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Apply no-cache headers to all API routes
-        if request.url.path.startswith("/api/"):
-            response.headers["Cache-Control"] = (
-                "no-store, no-cache, must-revalidate, max-age=0"
-            )
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-
-        return response
+        if scope["type"] != "http" or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        revalidate = scope["path"].startswith(REVALIDATE_PATHS)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if revalidate and "etag" in headers:
+                    headers["Cache-Control"] = "private, no-cache"
+                else:
+                    headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+                headers["Pragma"] = "no-cache"
+                headers["Expires"] = "0"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,49 +1,196 @@
 """
-Rate limiting middleware using slowapi.
+Rate limiting middleware and per-route limits.
 
 Prevents abuse of API endpoints by limiting request rates per user/IP.
+Both the global middleware limit and ``@limiter.limit()`` route limits go
+through the shared RateLimitEngine, so they hold across workers and replicas
+instead of being counted per process.
 """
 
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+import functools
+import re
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.config import get_settings
+from ..core.rate_limiter import RateLimitEngine, RateLimitResult, RateWindow, get_rate_limit_engine
+
+# Probes and scrapes must never be throttled
+EXEMPT_PATHS = {
+    "/api/health",
+    "/api/health/live",
+    "/api/health/ready",
+    "/api/metrics",
+}
+# Streams, their reconnects and task polling are long-lived or frequent by design
+EXEMPT_PREFIXES = ("/api/stream/", "/api/review/events/", "/api/mcp/tasks/")
+
+
+def _client_ip(headers, client: Optional[Tuple[str, int]], trusted_hops: int = 1) -> str:
+    """
+    Client address as seen by the trusted proxies in front of the app.
+
+    Each trusted proxy appends its peer to X-Forwarded-For, so the client is
+    the ``trusted_hops``-th entry from the right; entries further left are
+    set by the client and ignored. Without the header, the peer address.
+    """
+    forwarded = headers.get("X-Forwarded-For") or headers.get("x-forwarded-for")
+    if forwarded and trusted_hops > 0:
+        hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+        if hops:
+            return hops[max(0, len(hops) - trusted_hops)]
+    return client[0] if client else "unknown"
+
 
 def get_user_id_or_ip(request: Request) -> str:
     """
-    Get user ID from JWT token, fallback to IP address.
+    Get user ID from the auth middleware, fallback to IP address.
 
     This ensures:
     - Authenticated users are rate-limited per user
     - Anonymous users are rate-limited per IP
     """
-    # Try to get user from request state (set by auth middleware)
-    user = getattr(request.state, "user", None)
-    if user and hasattr(user, "id"):
-        return f"user:{user.id}"
+    user_id = getattr(request.state, "user_id", None)
+    if user_id:
+        return f"user:{user_id}"
+
+    client = (request.client.host, request.client.port) if request.client else None
+    return f"ip:{_client_ip(request.headers, client, get_settings().rate_limit_trusted_proxy_hops)}"
+
+
+_LIMIT_SPEC = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)\s*$")
+_PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_limit(spec: str) -> RateWindow:
+    """Parse a limit such as ``"100/hour"``."""
+    match = _LIMIT_SPEC.match(spec)
+    if not match:
+        raise ValueError(f"Invalid rate limit: {spec!r}")
+    return RateWindow(int(match.group(1)), _PERIOD_SECONDS[match.group(2)])
+
+
+class RouteLimiter:
+    """``@limiter.limit("100/hour")`` decorator for individual endpoints."""
+
+    def __init__(self, key_func: Callable[[Request], str], engine: Optional[RateLimitEngine] = None):
+        self.key_func = key_func
+        self._engine = engine
+
+    @property
+    def engine(self) -> RateLimitEngine:
+        return self._engine or get_rate_limit_engine()
 
-    # Fallback to IP address
-    return f"ip:{get_remote_address(request)}"
+    def limit(self, spec: str):
+        """Limit the decorated endpoint; it must take a ``request: Request`` argument."""
+        window = parse_limit(spec)
 
+        def decorator(endpoint):
+            scope_name = f"route:{endpoint.__module__}.{endpoint.__name__}"
 
-# Initialize rate limiter
-limiter = Limiter(
-    key_func=get_user_id_or_ip,
-    default_limits=["1000/hour"],  # Global default: 1000 requests per hour
-    storage_uri="memory://",  # Use in-memory storage (upgrade to Redis for production)
-    strategy="fixed-window",  # Fixed window strategy
-)
+            @functools.wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                request = kwargs.get("request")
+                if request is None:
+                    request = next(arg for arg in args if isinstance(arg, Request))
 
+                result = await self.engine.hit(f"{scope_name}:{self.key_func(request)}", (window,))
+                if not result.allowed:
+                    raise HTTPException(
+                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                        detail=f"Rate limit exceeded: {spec}",
+                        headers=_limit_headers(result),
+                    )
+                return await endpoint(*args, **kwargs)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+            return wrapper
+
+        return decorator
+
+
+def _limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(result.retry_after_seconds)
+    return headers
+
+
+# Per-route limits (global limit is enforced by RateLimitMiddleware)
+limiter = RouteLimiter(key_func=get_user_id_or_ip)
+
+
+class RateLimitMiddleware:
     """
-    Placeholder middleware for rate limiting.
-    
-    Actual rate limiting is done via @limiter.limit() decorator on endpoints.
-    This middleware is just for compatibility with the main.py middleware chain.
+    Global per-client limit: RATE_LIMIT_CALLS requests per RATE_LIMIT_PERIOD.
+
+    Opt-in (RATE_LIMIT_GLOBAL_ENABLED); health/metrics, SSE streams and task
+    polling are never counted. Runs before authentication, so clients are
+    keyed by IP (see ``_client_ip`` for X-Forwarded-For handling). Adds
+    X-RateLimit-Limit / X-RateLimit-Remaining to responses and answers 429
+    with Retry-After when the limit is exceeded. Pure ASGI, so streamed
+    responses pass through untouched.
     """
-    async def dispatch(self, request: Request, call_next):
-        # Pass through - actual rate limiting handled by decorators
-        response = await call_next(request)
-        return response
+
+    def __init__(self, app: ASGIApp, engine: Optional[RateLimitEngine] = None) -> None:
+        self.app = app
+        self.settings = get_settings()
+        # Own engine unless one is given: its Redis keys are shared, local state is not
+        self.engine = engine or RateLimitEngine(prefix="ratelimit:http")
+
+    @property
+    def _requests(self) -> Dict[str, Deque[float]]:
+        """In-memory request log used while Redis is unavailable."""
+        return self.engine.local_log
+
+    def _cleanup_old_requests(self, client_ip: str, current_time: float) -> None:
+        """Drop in-memory entries outside the rate limit period."""
+        self.engine.trim_local(client_ip, current_time, self.settings.rate_limit_period)
+
+    def _get_client_ip(self, request: Request) -> str:
+        client = (request.client.host, 0) if request.client else None
+        return _client_ip(request.headers, client, self.settings.rate_limit_trusted_proxy_hops)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.settings.rate_limit_enabled
+            or not self.settings.rate_limit_global_enabled
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in EXEMPT_PATHS
+            or scope["path"].startswith(EXEMPT_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        window = RateWindow(self.settings.rate_limit_calls, self.settings.rate_limit_period)
+        result = await self.engine.hit(self._get_client_ip(request), (window,))
+        headers = _limit_headers(result)
+
+        if not result.allowed:
+            retry_after = result.retry_after_seconds
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "error": "rate_limit_exceeded",
+                    "detail": "Demasiadas solicitudes. Intenta de nuevo más tarde.",
+                    "retry_after": retry_after,
+                },
+                headers=headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -1,59 +1,75 @@
 """
 Telemetry middleware for request tracking and metrics.
+
+Implemented as a pure ASGI middleware: messages pass straight through to the
+server, so streamed (SSE) responses are not re-buffered through the extra
+task and memory stream that ``BaseHTTPMiddleware`` adds per request.
 """
 
 import time
-from typing import Callable
 
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ..core.telemetry import metrics_collector, trace_span
+from ..core.telemetry import metrics_collector
 
 logger = structlog.get_logger(__name__)
 
-class TelemetryMiddleware(BaseHTTPMiddleware):
+
+class TelemetryMiddleware:
     """Middleware for collecting telemetry data."""
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with telemetry tracking."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
-        method = request.method
-        path_template = request.url.path
+        method = scope["method"]
+        path_template = scope["path"]
+        response_started = False
 
-        try:
-            # Process request without telemetry span for now to avoid the compatibility issue
-            response = await call_next(request)
-            status_code = response.status_code
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
 
-            # Record metrics
-            duration = time.time() - start_time
-            metrics_collector.record_request(
-                method=method,
-                endpoint=path_template,
-                status_code=status_code,
-                duration=duration
-            )
+                # Record metrics once headers are ready (streamed bodies keep flowing)
+                duration = time.time() - start_time
+                metrics_collector.record_request(
+                    method=method,
+                    endpoint=path_template,
+                    status_code=status_code,
+                    duration=duration
+                )
 
-            # Log request
-            logger.info(
-                "Request completed",
-                method=method,
-                path=path_template,
-                status_code=status_code,
-                duration_ms=duration * 1000,
-                user_agent=request.headers.get("user-agent", ""),
-                remote_addr=request.client.host if request.client else "",
-            )
+                # Log request
+                headers = Headers(scope=scope)
+                client = scope.get("client")
+                logger.info(
+                    "Request completed",
+                    method=method,
+                    path=path_template,
+                    status_code=status_code,
+                    duration_ms=duration * 1000,
+                    user_agent=headers.get("user-agent", ""),
+                    remote_addr=client[0] if client else "",
+                )
 
-            return response
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
+            if response_started:
+                raise
+
             # Record error metrics
             duration = time.time() - start_time
             metrics_collector.record_request(
@@ -71,4 +87,4 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
                 duration_ms=duration * 1000,
             )
 
-            raise
\ No newline at end of file
+            raise
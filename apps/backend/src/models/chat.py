@@ -126,6 +126,27 @@ class CanvasState(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last canvas update")
 
 
+class ConversationSummary(BaseModel):
+    """Rolling summary subdocument for long conversations.
+
+    Older messages are folded into ``text`` incrementally; only messages newer
+    than ``covered_until`` are sent verbatim to the LLM.
+    """
+    text: str = Field(default="", description="Compact summary of the summarized messages")
+    version: int = Field(default=0, description="Monotonic summary version (optimistic concurrency)")
+    covered_message_count: int = Field(default=0, description="Number of messages folded into the summary")
+    covered_until: Optional[datetime] = Field(None, description="created_at of the newest summarized message")
+    model: Optional[str] = Field(None, description="Model used to produce the summary")
+    updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last summary update")
+
+
+class ChatMemoryView(BaseModel):
+    """Projection of the ChatSession fields used to build memory context"""
+    memory_facts: Dict[str, str] = Field(default_factory=dict)
+    memory_context: Dict[str, str] = Field(default_factory=dict)
+    conversation_summary: Optional[ConversationSummary] = None
+
+
 class ChatSession(Document):
     """Chat session document model"""
 
@@ -155,6 +176,12 @@ class ChatSession(Document):
         description="Current conversation context: bank, period, metric"
     )
 
+    # Rolling conversation summary (bounds prompt size on long chats)
+    conversation_summary: Optional[ConversationSummary] = Field(
+        None,
+        description="Incrementally updated summary of messages older than the recent window"
+    )
+
     # Canvas state persistence
     canvas_state: Optional[CanvasState] = Field(None, description="Canvas sidebar state for this conversation")
 
@@ -228,67 +255,25 @@ class ChatSession(Document):
         ).sort(-ChatMessage.created_at).skip(skip).limit(limit).to_list()
 
     async def add_message(self, role: MessageRole, content: str, **kwargs) -> ChatMessage:
-        """Add a new message to this chat session"""
+        """
+        Add a new message to this chat session.
+
+        Session stats, the DRAFT → ACTIVE transition, unified history and
+        cache invalidation are handled by MessagePersistence in one batch.
+        """
+        from ..services.message_persistence import MessagePersistence
+
         message = ChatMessage(
             chat_id=self.id,
             role=role,
             content=content,
             **kwargs
         )
-        await message.insert()
-
-        # Update session stats
-        self.message_count += 1
-        self.updated_at = datetime.utcnow()
-        now = datetime.utcnow()
-
-        # Progressive Commitment: Set timestamps
-        if self.message_count == 1:
-            # First message: set first_message_at
-            self.first_message_at = now
-        # Always update last_message_at
-        self.last_message_at = now
-
-        # P0-BE-UNIQ-EMPTY: Transition from DRAFT to ACTIVE on first message
-        if self.message_count == 1 and self.state == ConversationState.DRAFT:
-            await self.transition_state(
-                ConversationState.ACTIVE,
-                reason="first_message_received"
-            )
-        else:
-            await self.save()
-
-        # Invalidate cache for this chat
-        try:
-            from ..core.redis_cache import get_redis_cache
-            cache = await get_redis_cache()
-            await cache.invalidate_all_for_chat(self.id)
-        except Exception as e:
-            # Don't fail if cache invalidation fails
-            import structlog
-            logger = structlog.get_logger(__name__)
-            logger.warning("Failed to invalidate cache", error=str(e), chat_id=self.id)
-
-        # Record in unified history
-        try:
-            from ..services.history_service import HistoryService
-            await HistoryService.record_chat_message(
-                chat_id=self.id,
-                user_id=self.user_id,
-                message=message
-            )
-        except Exception as e:
-            # Don't fail message creation if history fails
-            import structlog
-            logger = structlog.get_logger(__name__)
-            logger.warning(
-                "Failed to record message in unified history",
-                error=str(e),
-                chat_id=self.id,
-                message_id=message.id
-            )
-
-        return message
+        return await MessagePersistence.persist(
+            self,
+            message,
+            invalidate_research=bool(kwargs.get("task_id"))
+        )
 
     async def transition_state(self, new_state: ConversationState, reason: str = None):
         """
@@ -65,6 +65,9 @@ class Document(BeanieDocument):
     minio_key: str = Field(..., description="MinIO object key")
     minio_bucket: str = Field(default="documents", description="MinIO bucket")
 
+    # Integrity
+    content_hash: Optional[str] = Field(None, description="SHA-256 of the uploaded file bytes")
+
     # Processing
     status: DocumentStatus = Field(default=DocumentStatus.UPLOADING, description="Processing status")
     error_message: Optional[str] = Field(None, description="Error message if failed")
@@ -94,4 +97,5 @@ class Document(BeanieDocument):
             "conversation_id",
             "created_at",
             [("user_id", 1), ("created_at", -1)],
+            [("user_id", 1), ("content_hash", 1)],
         ]
@@ -22,12 +22,14 @@ from ..schemas.user import User as UserSchema, UserCreate
 from ..services.auth_service import (
     authenticate_user,
     get_user_profile,
+    hash_password,
     logout_user,
     refresh_access_token,
     register_user,
 )
 # Import stateless security utils
 from ..core.security import create_password_reset_token, verify_password_reset_token
+from ..services.principal_cache import get_principal_cache
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
@@ -239,10 +241,10 @@ async def reset_password(
             detail="Usuario no encontrado"
         )
 
-    # Update password
-    from passlib.hash import argon2
-    user.password_hash = argon2.hash(payload.new_password)
+    # Update password (hashed off the event loop)
+    user.password_hash = await hash_password(payload.new_password)
     await user.save()
+    await get_principal_cache().invalidate_user(user.id)
 
     logger.info(
         "Password successfully reset",
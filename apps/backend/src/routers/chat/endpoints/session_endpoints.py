@@ -340,6 +340,7 @@ async def delete_chat_session(
 
         # Invalidate all caches for this chat
         await cache.invalidate_all_for_chat(chat_id)
+        await cache.invalidate_recent_messages(chat_id)
 
         logger.info(
             "Deleted chat session",
@@ -32,7 +32,10 @@ from ....services.chat_service import ChatService
 from ....services.chat_helpers import build_chat_context
 from ....services.session_context_manager import SessionContextManager
 from ....services.document_service import DocumentService
+from ....services.llm_concurrency import LLMPurpose
+from ....services.llm_memo import cached_chat_completion
 from ....services.saptiva_client import get_saptiva_client
+from ....services.semantic_response_cache import get_semantic_response_cache
 from ....services.audit_mcp_client import (
     audit_document_via_mcp,
     MCPAuditorUnavailableError,
@@ -408,11 +411,15 @@ Sé directo, profesional, sin emojis. Usa párrafos cortos.
 """
 
     try:
-        response = await saptiva_client.chat_completion(
+        # Memoized: a re-audit with the same findings reuses the summary
+        response = await cached_chat_completion(
+            saptiva_client,
             model="SAPTIVA_TURBO",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=500,
-            temperature=0.3
+            temperature=0.3,
+            purpose=LLMPurpose.BACKGROUND,
+            hedge=True
         )
 
         logger.info("LLM response received", has_response=bool(response), response_type=type(response).__name__)
@@ -827,7 +834,7 @@ class StreamingHandler:
             # The is_bank_query() function determines if the message is banking-related
             bank_chart_data = None
             from ....services.tool_execution_service import ToolExecutionService
-            from ....models.chat import ChatMessage as ChatMessageModel
+            from ....services.recent_messages import get_recent_messages
 
             logger.debug(
                 "Bank advisor global mode - checking for bank analytics query",
@@ -838,16 +845,14 @@ class StreamingHandler:
             # Get recent messages for clarification context detection
             recent_messages = []
             try:
-                recent_msgs = await ChatMessageModel.find(
-                    ChatMessageModel.chat_id == chat_session.id
-                ).sort(-ChatMessageModel.created_at).limit(5).to_list()
+                recent_msgs = await get_recent_messages(chat_session.id, 5)
 
                 # Convert to dict format with metadata for clarification detection
                 for msg in reversed(recent_msgs):
                     recent_messages.append({
                         "role": msg.role.value,
                         "content": msg.content,
-                        "metadata": msg.metadata if hasattr(msg, 'metadata') else {}
+                        "metadata": msg.metadata
                     })
             except Exception as e:
                 logger.warning(
@@ -1369,6 +1374,36 @@ class StreamingHandler:
         """
         # FIX-001: Wrap entire streaming logic in try-catch for proper error propagation
         try:
+            # FIX-001: Use centralized prompt registry instead of hardcoded string
+            # This ensures consistent Saptiva branding across all models
+            from ....core.prompt_registry import get_prompt_registry
+            prompt_registry = get_prompt_registry()
+
+            # Build tools markdown when documents are available so the LLM knows about RAG tool
+            has_docs_available = bool(context.document_ids)
+
+            # Resolve system prompt for this model
+            system_prompt, model_params = prompt_registry.resolve(
+                model=context.model,
+                tools_markdown=self._build_tools_markdown(has_documents=has_docs_available),
+                channel="chat"
+            )
+
+            # Semantic response cache: a repeated question over unchanged documents
+            # skips retrieval and the LLM call (answers with bank data are never cached)
+            semantic_cache = get_semantic_response_cache()
+            cache_lookup = None
+            cached_answer = None
+            if semantic_cache.enabled and context.document_ids and not bank_chart_data:
+                cache_lookup = await semantic_cache.lookup(
+                    question=context.message,
+                    document_ids=context.document_ids,
+                    user_id=context.user_id,
+                    model=context.model,
+                    system_hash=model_params.get("_metadata", {}).get("system_hash", ""),
+                )
+                cached_answer = cache_lookup.hit if cache_lookup else None
+
             # NEW: Prepare document context for RAG using GetRelevantSegmentsTool
             document_context = None
             doc_warnings = []
@@ -1381,7 +1416,7 @@ class StreamingHandler:
                 document_ids=context.document_ids
             )
 
-            if context.document_ids:
+            if context.document_ids and cached_answer is None:
                 logger.info(
                     "🚀 [RAG DEBUG] Starting GetRelevantSegmentsTool",
                     conversation_id=context.session_id,
@@ -1495,25 +1530,6 @@ class StreamingHandler:
             # Initialize Saptiva client (singleton managed async factory)
             saptiva_client = await get_saptiva_client()
 
-            # FIX-001: Use centralized prompt registry instead of hardcoded string
-            # This ensures consistent Saptiva branding across all models
-            from ....core.prompt_registry import get_prompt_registry
-            prompt_registry = get_prompt_registry()
-
-            # Build tools markdown when documents are available so the LLM knows about RAG tool
-            has_docs_available = bool(
-                document_context
-                or context.document_ids
-                or (locals().get("current_file_ids") and len(locals().get("current_file_ids")) > 0)
-            )
-
-            # Resolve system prompt for this model
-            system_prompt, model_params = prompt_registry.resolve(
-                model=context.model,
-                tools_markdown=self._build_tools_markdown(has_documents=has_docs_available),
-                channel="chat"
-            )
-
             # Add document context if available
             if document_context:
                 system_prompt += f"\n\n**Documentos adjuntos por el usuario:**\n{document_context}"
@@ -1654,6 +1670,7 @@ Escribe la respuesta de forma fluida y profesional, como un analista financiero.
             event_queue: Queue = Queue(maxsize=10)
             full_response = ""
             producer_error = None
+            llm_answered = False
 
             async def producer():
                 """
@@ -1662,7 +1679,7 @@ Escribe la respuesta de forma fluida y profesional, como un analista financiero.
                 If queue is full (slow consumer), put() will block, providing backpressure.
                 This prevents unbounded memory growth on the server.
                 """
-                nonlocal full_response, producer_error
+                nonlocal full_response, producer_error, llm_answered
 
                 try:
                     logger.info(
@@ -1760,6 +1777,23 @@ Escribe la respuesta de forma fluida y profesional, como un analista financiero.
                                 # Don't block stream on artifact persistence failure
                                 # User will still see the chart preview in chat
 
+                    if cached_answer is not None:
+                        # Semantic cache hit: replay the stored answer as a stream
+                        full_response = cached_answer.answer
+                        chunk_size = 50  # Characters per chunk, same as the RAG path
+                        for i in range(0, len(full_response), chunk_size):
+                            await event_queue.put({
+                                "event": "chunk",
+                                "data": json.dumps({"content": full_response[i:i + chunk_size]})
+                            })
+                        await event_queue.put(None)
+                        logger.info(
+                            "Producer served semantic cache hit",
+                            response_length=len(full_response),
+                            similarity=round(cached_answer.similarity, 4)
+                        )
+                        return
+
                     # FIX-001: Use resolved system_prompt (not hardcoded system_message)
                     # Use model_params for temperature/max_tokens (registry overrides context)
 
@@ -1887,6 +1921,8 @@ Escribe la respuesta de forma fluida y profesional, como un analista financiero.
                                 "Non-streaming response missing choices - using fallback content"
                             )
 
+                        llm_answered = bool(response_content.strip())
+
                         # ANTI-EMPTY-RESPONSE: Use centralized handler with contextual messages
                         response_content = ensure_non_empty_content(
                             response_content,
@@ -2075,6 +2111,12 @@ Escribe la respuesta de forma fluida y profesional, como un analista financiero.
                     "document_warnings": doc_warnings if doc_warnings else None
                 }
 
+                if cache_lookup is not None:
+                    assistant_metadata["semantic_cache"] = cache_lookup.to_metadata()
+                    # Only cache real answers grounded on the retrieved documents
+                    if cached_answer is None and llm_answered and document_context:
+                        semantic_cache.store_in_background(cache_lookup, context.message, full_response)
+
                 # BA-P0-004: Include bank_chart_data in metadata for persistence
                 if bank_chart_data:
                     chart_data_dict = bank_chart_data if isinstance(bank_chart_data, dict) else bank_chart_data.model_dump(mode='json')
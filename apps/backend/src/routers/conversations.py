@@ -531,8 +531,10 @@ async def generate_title(request: TitleGenerationRequest) -> TitleGenerationResp
     Fallback to heuristic if LLM fails.
     """
     try:
-        from ..services.saptiva_client import SaptivaClient
-        saptiva_client = SaptivaClient()
+        from ..services.llm_concurrency import LLMPurpose
+        from ..services.llm_memo import cached_chat_completion
+        from ..services.saptiva_client import get_saptiva_client
+        saptiva_client = await get_saptiva_client()
 
         # System prompt for title generation (optimized for sidebar UI)
         system_prompt = (
@@ -544,14 +546,18 @@ async def generate_title(request: TitleGenerationRequest) -> TitleGenerationResp
 
         # Try to generate with LLM (lightweight model, no tools)
         try:
-            response = await saptiva_client.chat_completion(
+            # Memoized: the same first message always yields the same title
+            response = await cached_chat_completion(
+                saptiva_client,
                 model="SAPTIVA_TURBO",  # Use fastest model
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": f"Mensaje: {request.text}"}
                 ],
                 temperature=0.3,  # Low temperature for consistency
-                max_tokens=20  # Short response
+                max_tokens=20,  # Short response
+                purpose=LLMPurpose.BACKGROUND,
+                hedge=True
             )
 
             title = response.choices[0]["message"].get("content", "").strip()
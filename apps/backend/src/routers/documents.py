@@ -29,6 +29,7 @@ from ..models.document import Document, DocumentStatus
 from ..schemas.document import IngestResponse, PageContentResponse, DocumentMetadata
 from ..services.file_ingest import file_ingest_service
 from ..services.thumbnail_service import thumbnail_service
+from ..services.semantic_response_cache import get_semantic_response_cache
 
 # V2 Future: MinIO persistent storage
 # from ..services.minio_service import minio_service
@@ -380,6 +381,9 @@ async def delete_document(
         await redis_client.delete(f"doc:text:{doc_id}")
         logger.info("Deleted from Redis cache", doc_id=doc_id)
 
+        # Cached answers built on this content must not outlive it
+        await get_semantic_response_cache().invalidate_document(doc.content_hash)
+
     except Exception as e:
         logger.error("Failed to delete temp files", error=str(e), doc_id=doc_id)
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
 from typing import AsyncGenerator, List, Optional
 from uuid import uuid4
 
@@ -13,7 +12,7 @@ from sse_starlette.sse import EventSourceResponse
 
 from ..core.auth import get_current_user, get_current_user_sse
 from ..core.config import get_settings
-from ..core.redis_cache import get_redis_cache
+from ..core.rate_limiter import RateWindow, get_rate_limit_engine
 from ..models.document import Document, DocumentStatus
 from ..models.user import User
 from ..schemas.files import FileError, FileEventPayload, FileEventPhase, FileIngestBulkResponse, FileIngestResponse, FileStatus
@@ -30,28 +29,20 @@ RATE_LIMIT_WINDOW_SECONDS = 60
 
 
 async def _check_rate_limit(user_id: str) -> None:
-    """Simple Redis-based rate limiter: 10 uploads/min per user."""
-    redis_cache = await get_redis_cache()
-    redis_client = redis_cache.client
-    key = f"rate_limit:upload:{user_id}"
-    now = int(datetime.utcnow().timestamp())
-    window_start = now - RATE_LIMIT_WINDOW_SECONDS
-
-    # Sliding window: remove old entries, count recent ones
-    await redis_client.zremrangebyscore(key, "-inf", window_start)
-    count = await redis_client.zcard(key)
-
-    if count >= RATE_LIMIT_UPLOADS_PER_MINUTE:
-        logger.warning("Rate limit exceeded", user_id=user_id, count=count)
+    """Sliding-window upload limit per user (one atomic Redis call)."""
+    result = await get_rate_limit_engine().hit(
+        f"upload:{user_id}",
+        (RateWindow(RATE_LIMIT_UPLOADS_PER_MINUTE, RATE_LIMIT_WINDOW_SECONDS),),
+    )
+
+    if not result.allowed:
+        logger.warning("Rate limit exceeded", user_id=user_id)
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=f"Rate limit exceeded: max {RATE_LIMIT_UPLOADS_PER_MINUTE} uploads per minute"
+            detail=f"Rate limit exceeded: max {RATE_LIMIT_UPLOADS_PER_MINUTE} uploads per minute",
+            headers={"Retry-After": str(result.retry_after_seconds)},
         )
 
-    # Add current request to window
-    await redis_client.zadd(key, {str(now): now})
-    await redis_client.expire(key, 300)  # TTL cleanup: 5 min for natural garbage collection
-
 
 @router.post("/upload", response_model=FileIngestBulkResponse, status_code=status.HTTP_201_CREATED)
 async def upload_files(
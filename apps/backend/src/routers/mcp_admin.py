@@ -4,7 +4,8 @@ MCP Admin Routes - Cache management and tool administration.
 Provides endpoints for:
 - Cache invalidation (by document, tool, or all)
 - Cache statistics
-- Cache warmup (pre-population)
+- Cache warmup (pre-population) and ingest warmup coverage
+- Tool latency percentiles and SLO breaches
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
@@ -20,6 +21,8 @@ from ..services.mcp_cache import (
     get_cache_stats,
     warmup_tool_cache
 )
+from ..services.tool_cache_warmup import get_tool_cache_warmer
+from ..mcp.metrics import latency_tracker
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -139,13 +142,15 @@ async def get_cache_statistics(
         doc_id: Optional document ID to filter stats
 
     Returns:
-        Cache statistics with counts by tool and document
+        Cache statistics with counts by tool and document, plus warm
+        coverage of documents warmed at ingest time
     """
     stats = await get_cache_stats(doc_id)
 
     return {
         "success": True,
-        "stats": stats
+        "stats": stats,
+        "warmup": get_tool_cache_warmer().get_stats()
     }
 
 
@@ -185,3 +190,31 @@ async def warmup_cache(
         "message": f"Warmed up cache for {results['cached']} documents",
         "results": results
     }
+
+
+@router.get("/latency/slo", tags=["mcp-admin"])
+async def get_latency_slo_report(
+    breached_only: bool = Query(False, description="Only return tools breaching their SLO"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Rolling p95 latency per tool against its configured SLO.
+
+    Percentiles come from this replica's in-process windows
+    (MCP_LATENCY_WINDOW_SECONDS); targets from MCP_LATENCY_SLO_P95_MS and
+    MCP_LATENCY_SLO_OVERRIDES. Each entry names its slowest phase.
+
+    Returns:
+        SLO entries, the tools breaching them, and per-phase percentiles
+    """
+    report = latency_tracker.slo_report()
+    breaches = [entry for entry in report if entry["breached"]]
+
+    return {
+        "success": True,
+        "window_seconds": latency_tracker.window_seconds,
+        "min_samples": latency_tracker.slo_min_samples,
+        "breaches": breaches,
+        "tools": breaches if breached_only else report,
+        "phases": latency_tracker.summary(),
+    }
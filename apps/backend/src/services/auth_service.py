@@ -29,6 +29,8 @@ from ..schemas.user import (
     UserPreferences as UserPreferencesSchema,
 )
 from .cache_service import add_token_to_blacklist, is_token_blacklisted
+from .password_hashing import get_password_hashing_pool
+from .principal_cache import get_principal_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -51,9 +53,23 @@ def _hash_password(password: str) -> str:
     return _pwd_context.hash(password)
 
 
-def _verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against the stored hash."""
-    return _pwd_context.verify(plain_password, hashed_password)
+async def hash_password(password: str) -> str:
+    """Hash a plain-text password on the hashing pool (off the event loop)."""
+    return await get_password_hashing_pool().run("hash", _hash_password, password)
+
+
+async def _verify_and_upgrade_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password on the hashing pool.
+
+    Returns (valid, new_hash); new_hash is an argon2 rehash when the stored
+    hash uses a deprecated scheme, computed in the same pool job.
+    """
+    return await get_password_hashing_pool().run(
+        "verify", _pwd_context.verify_and_update, plain_password, hashed_password
+    )
 
 
 def _validate_password_strength(password: str) -> Optional[str]:
@@ -216,7 +232,7 @@ async def register_user(payload: UserCreate) -> AuthResponse:
     user = User(
         username=normalized_username,
         email=normalized_email,
-        password_hash=_hash_password(payload.password),
+        password_hash=await hash_password(payload.password),
         preferences=preferences_document or UserPreferencesModel(),
     )
 
@@ -252,7 +268,7 @@ async def authenticate_user(identifier: str, password: str) -> AuthResponse:
     logger.info("Password hash scheme", scheme=current_scheme)
 
     try:
-        password_valid = _verify_password(password, user.password_hash)
+        password_valid, upgraded_hash = await _verify_and_upgrade_password(password, user.password_hash)
         logger.info("Password verification result", valid=password_valid)
     except (ValueError, TypeError) as exc:  # pragma: no cover - defensive guard
         logger.error(
@@ -280,8 +296,8 @@ async def authenticate_user(identifier: str, password: str) -> AuthResponse:
         )
 
     hash_upgraded = False
-    if _pwd_context.needs_update(user.password_hash):
-        user.password_hash = _hash_password(password)
+    if upgraded_hash:
+        user.password_hash = upgraded_hash
         hash_upgraded = True
         logger.info(
             "Password hash upgraded",
@@ -293,6 +309,7 @@ async def authenticate_user(identifier: str, password: str) -> AuthResponse:
     user.last_login = now
     user.updated_at = now
     await user.save()
+    await get_principal_cache().invalidate_user(user.id)
 
     if hash_upgraded:
         logger.debug("Password hash persisted with argon2", user_id=str(user.id))
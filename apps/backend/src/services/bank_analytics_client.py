@@ -15,15 +15,20 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-import re
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 import structlog
 
+from ..core.single_flight import SingleFlight
+from ..core.telemetry import telemetry
 from ..schemas.bank_chart import BankChartData, BankAnalyticsResponse, BankClarificationData, ClarificationOption
+from .text_matcher import KeywordMatcher, PatternMatcher
 
 logger = structlog.get_logger(__name__)
 
@@ -32,6 +37,15 @@ BANK_ADVISOR_URL = os.getenv("BANK_ADVISOR_URL", "http://bank-advisor:8002")
 BANK_ADVISOR_TIMEOUT = int(os.getenv("BANK_ADVISOR_TIMEOUT", "30"))
 USE_BANK_ADVISOR = os.getenv("USE_BANK_ADVISOR", "false").lower() == "true"
 
+# In-process L1 cache in front of Redis `bank_query_classification:*`
+# (message hash -> (result, monotonic expiry)), LRU-bounded
+CLASSIFICATION_L1_MAX_ENTRIES = 2048
+CLASSIFICATION_L1_TTL_SECONDS = 3600  # Redis hits whose remaining TTL is unknown
+_classification_l1: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+
+# Single-flight: classifications currently running, keyed by message hash
+_classification_in_flight = SingleFlight()
+
 
 class BankAdvisorUnavailableError(Exception):
     """Raised when the bank-advisor MCP service is unavailable."""
@@ -354,9 +368,11 @@ async def _classify_with_llm(message: str) -> bool:
     Uses a small, fast model with a focused prompt.
     """
     try:
-        from .saptiva_client import SaptivaClient, SaptivaRequest, SaptivaMessage
+        from .llm_concurrency import LLMPurpose
+        from .saptiva_client import get_saptiva_client
 
-        client = SaptivaClient()
+        # Shared singleton: reuses its HTTP/2 pool instead of a new TLS handshake per call
+        client = await get_saptiva_client()
 
         # Focused prompt for classification with edge case handling
         classification_prompt = """Eres un clasificador especializado de consultas bancarias y financieras mexicanas.
@@ -393,17 +409,20 @@ Responde SÍ solo si es claramente sobre banca/finanzas. En duda, responde NO.
 
 Tu respuesta (SÍ o NO):"""
 
-        request = SaptivaRequest(
-            model="gpt-4o-mini",  # Fast, cheap model for classification
+        started = time.monotonic()
+        response = await client.chat_completion(
             messages=[
-                SaptivaMessage(role="user", content=classification_prompt.format(message=message))
+                {"role": "user", "content": classification_prompt.format(message=message)}
             ],
+            model="SAPTIVA_TURBO",  # Fast, cheap model for classification
             temperature=0.0,  # Deterministic
             max_tokens=10,  # We only need "SÍ" or "NO"
-            stream=False
+            purpose=LLMPurpose.CLASSIFICATION,
+            hedge=True
+        )
+        telemetry.track_external_api_call(
+            "saptiva", "bank_query_classification", "success", time.monotonic() - started
         )
-
-        response = await client.chat_completion(request)
 
         if response and response.choices:
             answer = response.choices[0].get("message", {}).get("content", "").strip().upper()
@@ -423,6 +442,7 @@ Tu respuesta (SÍ o NO):"""
         return False
 
     except Exception as e:
+        telemetry.track_external_api_call("saptiva", "bank_query_classification", "error", 0.0)
         logger.warning(
             "LLM classification failed, falling back to False",
             error=str(e),
@@ -431,16 +451,49 @@ Tu respuesta (SÍ o NO):"""
         return False
 
 
+def _l1_get(message_hash: str) -> Optional[bool]:
+    entry = _classification_l1.get(message_hash)
+    if entry is None:
+        return None
+    result, expires_at = entry
+    if expires_at < time.monotonic():
+        _classification_l1.pop(message_hash, None)
+        return None
+    _classification_l1.move_to_end(message_hash)
+    return result
+
+
+def _l1_set(message_hash: str, result: bool, expire: int) -> None:
+    _classification_l1[message_hash] = (result, time.monotonic() + expire)
+    _classification_l1.move_to_end(message_hash)
+    while len(_classification_l1) > CLASSIFICATION_L1_MAX_ENTRIES:
+        _classification_l1.popitem(last=False)
+
+
+async def _remember(cache, message_hash: str, result: bool, expire: int) -> bool:
+    """Store a classification in L1 and Redis (best-effort) and return it."""
+    _l1_set(message_hash, result, expire)
+    if cache:
+        try:
+            await cache.set(f"bank_query_classification:{message_hash}", result, expire=expire)
+        except Exception:
+            pass
+    return result
+
+
 async def is_bank_query(message: str) -> bool:
     """
     Hybrid banking query detection with LLM fallback.
 
     Strategy:
-    1. Check Redis cache for previous classification
+    1. Check in-process L1 cache, then Redis, for a previous classification
     2. Fast-path: High-confidence keywords → return True immediately
     3. Negative keywords → return False immediately
     4. Ambiguous cases → Use LLM classifier
-    5. Cache result in Redis
+    5. Cache result in L1 + Redis
+
+    Concurrent calls for the same message share a single classification
+    (single-flight), so a burst of identical messages runs the LLM once.
 
     Args:
         message: User message text
@@ -448,15 +501,233 @@ async def is_bank_query(message: str) -> bool:
     Returns:
         True if message appears to be a banking query
     """
-    # 1. Check cache first
+    message_hash = hashlib.md5(message.encode()).hexdigest()
+
+    cached_result = _l1_get(message_hash)
+    if cached_result is not None:
+        telemetry.track_cache_operation("bank_query_classification", "memory", hit=True)
+        return cached_result
+    telemetry.track_cache_operation("bank_query_classification", "memory", hit=False)
+
+    return await _classification_in_flight.run(
+        message_hash, lambda: _classify_message(message, message_hash)
+    )
+
+
+# --- Keyword tables for the is_bank_query fast paths ---
+# Each table is compiled once into a single alternation regex (see
+# text_matcher), so a message is scanned once per table instead of once
+# per keyword.
+
+# 1. Financial metrics and indicators (high priority)
+BANK_QUERY_FINANCIAL_METRICS = [
+    # Core risk metrics
+    "imor", "icor", "icap", "roi", "roe", "roa",
+    "morosidad", "mora", "vencida", "vencido",
+
+    # Portfolio and credit metrics
+    "cartera", "portafolio", "portfolio",
+    "cartera comercial", "cartera consumo", "cartera vivienda",
+    "sin gob", "sin gobierno", "cc",
+
+    # Reserves and provisions
+    "reservas", "provisiones", "reservas totales",
+
+    # Capital and solvency
+    "capitalización", "capitalizacion", "capital",
+    "solvencia", "liquidez",
+
+    # Margins and rates
+    "margen", "spread", "diferencial",
+    "tasa", "tasas", "interés", "interes",
+    "tasa efectiva", "tasa de interés efectiva",
+    "tasa corporativo", "tasa corporativa",
+    "mn", "me", "moneda nacional", "moneda extranjera",
+
+    # Growth and performance
+    "crecimiento", "variación", "variacion",
+    "rendimiento", "rentabilidad",
+
+    # Balance sheet items
+    "activos", "pasivos", "patrimonio",
+    "utilidad", "utilidades", "ganancia",
+
+    # Credit quality and loss metrics
+    "quebranto", "quebrantos", "castigo", "castigos",
+    "quebrantos comerciales",
+    "pérdida esperada", "perdida esperada", "pérdida esperada total",
+    "deterioro", "etapa", "etapas", "etapas de deterioro",
+    "tasa de deterioro", "deterioro ajustada"
+]
+
+# 2. Bank names (Mexican financial institutions)
+BANK_QUERY_BANK_NAMES = [
+    "invex", "banorte", "bancomer", "bbva", "banamex", "citibanamex",
+    "santander", "hsbc", "scotiabank", "inbursa", "azteca",
+    "banregio", "bajio", "banjercito", "afirme", "mifel",
+    "ve por mas", "multiva", "intercam", "actinver",
+    "banco", "bancos", "banca", "bancario", "bancaria", "bancarios"
+]
+
+# 3. Banking product types
+BANK_QUERY_BANKING_PRODUCTS = [
+    "comercial", "consumo", "vivienda", "hipotecario", "hipoteca",
+    "automotriz", "automotor", "autos", "vehículos", "vehiculos",
+    "pyme", "empresarial", "corporativo",
+    "tarjeta", "crédito", "credito", "préstamo", "prestamo",
+    "crédito de consumo", "credito de consumo",
+    "financiamiento", "leasing", "arrendamiento",
+    "ahorro", "inversión", "inversion", "cuenta", "depósito", "deposito",
+    "nómina", "nomina"
+]
+
+# 4. Regulatory and institutional terms
+BANK_QUERY_REGULATORY_TERMS = [
+    "cnbv", "banxico", "banco de méxico", "banco de mexico",
+    "comisión nacional", "comision nacional",
+    "regulación", "regulacion", "normativa",
+    "indicador", "indicadores", "métrica", "metrica",
+    "reporte", "informe", "estadística", "estadistica"
+]
+
+# 5. Query patterns that suggest comparison or analysis
+BANK_QUERY_ANALYSIS_TERMS = [
+    "comparar", "comparación", "comparacion", "versus", "vs",
+    "frente a", "frente al", "contra", "respecto a", "respecto al",
+    "evolución", "evolucion", "tendencia", "histórico", "historico",
+    "ha evolucionado", "cómo ha", "como ha",
+    "análisis", "analisis", "desempeño", "desempeno", "performance",
+    "ranking", "top", "mejor", "peor", "líder", "lider",
+    "trimestre", "semestre", "anual", "mensual",
+    "últimos", "ultimos", "último", "ultimo", "reciente", "actual",
+    "porcentaje", "participación", "participacion", "%",
+    "cuánto", "cuanto", "qué", "que"
+]
+
+# 6. Financial/banking context words
+BANK_QUERY_FINANCIAL_CONTEXT = [
+    "financiero", "financiera", "financieros", "financieras",
+    "económico", "economico", "economía", "economia",
+    "sector bancario", "sistema financiero", "sistema bancario",
+    "mercado", "industria", "resto de bancos", "otros bancos",
+    "competencia", "competidores", "pares",
+    "tamaño", "ranking", "cada banco", "por banco"
+]
+
+# High-confidence banking keywords (immediate True)
+BANK_QUERY_HIGH_CONFIDENCE = [
+    "imor", "icor", "icap", "roi", "roe", "roa",
+    "invex", "banorte", "bbva", "santander", "citibanamex",
+    "cnbv", "banxico",
+    "morosidad", "cartera vencida",
+]
+
+# Negative keywords - very unlikely to be banking (immediate False)
+BANK_QUERY_NEGATIVE = [
+    # Food & Cooking
+    "receta", "cocina", "cocinar", "ingredientes", "menú",
+    "restaurante", "comida", "platillo", "bebida",
+
+    # Weather & Nature
+    "clima", "tiempo atmosférico", "lluvia", "temperatura", "pronóstico",
+
+    # Entertainment
+    "película", "serie", "música", "canción", "artista", "actor",
+    "videojuego", "juego", "película", "documental", "anime",
+
+    # Programming & Tech
+    "código python", "código javascript", "programación", "código",
+    "función python", "script", "algoritmo", "debugear",
+    "variable", "sintaxis", "compilar",
+
+    # Sports
+    "deporte", "fútbol", "basketball", "tenis", "partido",
+    "jugador", "equipo deportivo", "gol",
+
+    # History (general, non-banking)
+    "historia de la revolución", "guerra mundial", "época prehispánica",
+    "conquista española", "independencia de méxico",
+
+    # Geography
+    "capital de", "país de", "ciudad de", "ubicado en",
+    "geografía", "continente", "océano",
+
+    # Health & Fitness
+    "salud", "ejercicio", "dieta", "médico", "enfermedad",
+    "hospital", "síntoma", "tratamiento",
+
+    # Education (non-financial)
+    "escuela", "universidad", "curso de", "aprender",
+    "estudiar", "examen", "tarea",
+
+    # Physical Products
+    "de cuero", "de madera", "de metal", "de plástico",
+    "mueble", "decoración", "jardín",
+
+    # Street/Place Names
+    "nombre de una calle", "ubicación de", "dirección de",
+    "colonia", "avenida", "boulevard",
+
+    # General Non-Banking
+    "hora en", "traducir", "significado de", "sinónimo",
+    "horario de", "cómo llegar", "distancia entre"
+]
+
+# General history topics ("histórico" outside banking)
+BANK_QUERY_HISTORY_TOPICS = [
+    "revolución", "guerra", "conquista", "época", "siglo",
+    "prehispánico", "colonial", "independencia", "antigua",
+    "medieval", "romano", "griego"
+]
+
+# "hipotecario" used as a street/place name
+BANK_QUERY_PLACE_INDICATORS = [
+    "nombre de", "calle", "avenida", "boulevard", "colonia",
+    "ubicado en", "dirección", "zona", "fraccionamiento"
+]
+
+# Ambiguous terms: whole-word match plus banking context nearby
+BANK_QUERY_AMBIGUOUS = ["banco", "bancos", "capital", "cartera", "comercial", "consumo"]
+BANK_QUERY_AMBIGUOUS_CONTEXT = [
+    "imor", "icor", "icap", "invex", "banorte", "santander",
+    "financiero", "financiera", "bancario", "bancaria",
+    "morosidad", "crédito", "credito", "tasa", "cnbv",
+]
+
+# Metric-like query shapes
+BANK_QUERY_METRIC_PATTERNS = [
+    r'\b(cuál|cual|dame|muestra|obtener|consultar)\b.{0,30}\b(indicador|métrica|metrica|índice|indice|ratio)\b',
+    r'\b(cómo|como)\b.{0,30}\b(está|esta|van|anda)\b.{0,20}\b(banco|cartera|mora)\b',
+    r'\b(qué|que)\b.{0,30}\b(banco|bancos)\b.{0,30}\b(mejor|peor|líder|lider)\b'
+]
+
+_BANK_QUERY_ALL_KEYWORDS = (
+    BANK_QUERY_FINANCIAL_METRICS
+    + BANK_QUERY_BANK_NAMES
+    + BANK_QUERY_BANKING_PRODUCTS
+    + BANK_QUERY_REGULATORY_TERMS
+    + BANK_QUERY_ANALYSIS_TERMS
+    + BANK_QUERY_FINANCIAL_CONTEXT
+)
+_HIGH_CONFIDENCE_MATCHER = KeywordMatcher(BANK_QUERY_HIGH_CONFIDENCE)
+_NEGATIVE_MATCHER = KeywordMatcher(BANK_QUERY_NEGATIVE)
+_HISTORY_TOPICS_MATCHER = KeywordMatcher(BANK_QUERY_HISTORY_TOPICS)
+_PLACE_INDICATORS_MATCHER = KeywordMatcher(BANK_QUERY_PLACE_INDICATORS)
+_BANKING_KEYWORDS_MATCHER = KeywordMatcher(
+    keyword for keyword in _BANK_QUERY_ALL_KEYWORDS if keyword not in BANK_QUERY_AMBIGUOUS
+)
+_AMBIGUOUS_MATCHER = KeywordMatcher(BANK_QUERY_AMBIGUOUS, word_boundary=True)
+_AMBIGUOUS_CONTEXT_MATCHER = KeywordMatcher(BANK_QUERY_AMBIGUOUS_CONTEXT)
+_METRIC_QUERY_MATCHER = PatternMatcher(BANK_QUERY_METRIC_PATTERNS)
+
+
+async def _classify_message(message: str, message_hash: str) -> bool:
+    """Classify a message that missed the L1 cache (Redis → keywords → LLM)."""
+    # 1. Check Redis cache first
     from ..core.redis_cache import get_redis_cache
-    import hashlib
-    import re
 
     try:
         cache = await get_redis_cache()
-        # Create cache key from message hash
-        message_hash = hashlib.md5(message.encode()).hexdigest()
         cache_key = f"bank_query_classification:{message_hash}"
 
         if cache:
@@ -467,6 +738,9 @@ async def is_bank_query(message: str) -> bool:
                     message_preview=message[:50],
                     cached_result=cached_result
                 )
+                # Expire from L1 together with the Redis entry
+                remaining = await cache.ttl(cache_key)
+                _l1_set(message_hash, cached_result, remaining or CLASSIFICATION_L1_TTL_SECONDS)
                 return cached_result
     except Exception as e:
         logger.warning("Failed to access cache for bank query classification", error=str(e))
@@ -474,282 +748,66 @@ async def is_bank_query(message: str) -> bool:
 
     message_lower = message.lower()
 
-    # 1. Financial metrics and indicators (high priority)
-    financial_metrics = [
-        # Core risk metrics
-        "imor", "icor", "icap", "roi", "roe", "roa",
-        "morosidad", "mora", "vencida", "vencido",
-
-        # Portfolio and credit metrics
-        "cartera", "portafolio", "portfolio",
-        "cartera comercial", "cartera consumo", "cartera vivienda",
-        "sin gob", "sin gobierno", "cc",
-
-        # Reserves and provisions
-        "reservas", "provisiones", "reservas totales",
-
-        # Capital and solvency
-        "capitalización", "capitalizacion", "capital",
-        "solvencia", "liquidez",
-
-        # Margins and rates
-        "margen", "spread", "diferencial",
-        "tasa", "tasas", "interés", "interes",
-        "tasa efectiva", "tasa de interés efectiva",
-        "tasa corporativo", "tasa corporativa",
-        "mn", "me", "moneda nacional", "moneda extranjera",
-
-        # Growth and performance
-        "crecimiento", "variación", "variacion",
-        "rendimiento", "rentabilidad",
-
-        # Balance sheet items
-        "activos", "pasivos", "patrimonio",
-        "utilidad", "utilidades", "ganancia",
-
-        # Credit quality and loss metrics
-        "quebranto", "quebrantos", "castigo", "castigos",
-        "quebrantos comerciales",
-        "pérdida esperada", "perdida esperada", "pérdida esperada total",
-        "deterioro", "etapa", "etapas", "etapas de deterioro",
-        "tasa de deterioro", "deterioro ajustada"
-    ]
-
-    # 2. Bank names (Mexican financial institutions)
-    bank_names = [
-        "invex", "banorte", "bancomer", "bbva", "banamex", "citibanamex",
-        "santander", "hsbc", "scotiabank", "inbursa", "azteca",
-        "banregio", "bajio", "banjercito", "afirme", "mifel",
-        "ve por mas", "multiva", "intercam", "actinver",
-        "banco", "bancos", "banca", "bancario", "bancaria", "bancarios"
-    ]
-
-    # 3. Banking product types
-    banking_products = [
-        "comercial", "consumo", "vivienda", "hipotecario", "hipoteca",
-        "automotriz", "automotor", "autos", "vehículos", "vehiculos",
-        "pyme", "empresarial", "corporativo",
-        "tarjeta", "crédito", "credito", "préstamo", "prestamo",
-        "crédito de consumo", "credito de consumo",
-        "financiamiento", "leasing", "arrendamiento",
-        "ahorro", "inversión", "inversion", "cuenta", "depósito", "deposito",
-        "nómina", "nomina"
-    ]
-
-    # 4. Regulatory and institutional terms
-    regulatory_terms = [
-        "cnbv", "banxico", "banco de méxico", "banco de mexico",
-        "comisión nacional", "comision nacional",
-        "regulación", "regulacion", "normativa",
-        "indicador", "indicadores", "métrica", "metrica",
-        "reporte", "informe", "estadística", "estadistica"
-    ]
-
-    # 5. Query patterns that suggest comparison or analysis
-    query_patterns = [
-        "comparar", "comparación", "comparacion", "versus", "vs",
-        "frente a", "frente al", "contra", "respecto a", "respecto al",
-        "evolución", "evolucion", "tendencia", "histórico", "historico",
-        "ha evolucionado", "cómo ha", "como ha",
-        "análisis", "analisis", "desempeño", "desempeno", "performance",
-        "ranking", "top", "mejor", "peor", "líder", "lider",
-        "trimestre", "semestre", "anual", "mensual",
-        "últimos", "ultimos", "último", "ultimo", "reciente", "actual",
-        "porcentaje", "participación", "participacion", "%",
-        "cuánto", "cuanto", "qué", "que"
-    ]
-
-    # 6. Financial/banking context words
-    financial_context = [
-        "financiero", "financiera", "financieros", "financieras",
-        "económico", "economico", "economía", "economia",
-        "sector bancario", "sistema financiero", "sistema bancario",
-        "mercado", "industria", "resto de bancos", "otros bancos",
-        "competencia", "competidores", "pares",
-        "tamaño", "ranking", "cada banco", "por banco"
-    ]
-
-    # Check all categories
-    all_keywords = (
-        financial_metrics +
-        bank_names +
-        banking_products +
-        regulatory_terms +
-        query_patterns +
-        financial_context
-    )
-
     # 2. Fast-path: High-confidence banking keywords (immediate True)
-    high_confidence_keywords = [
-        "imor", "icor", "icap", "roi", "roe", "roa",
-        "invex", "banorte", "bbva", "santander", "citibanamex",
-        "cnbv", "banxico",
-        "morosidad", "cartera vencida",
-    ]
-
-    for keyword in high_confidence_keywords:
-        if keyword in message_lower:
-            result = True
-            logger.debug(
-                "Bank query detected (high-confidence keyword)",
-                keyword=keyword,
-                message_preview=message[:50]
-            )
-            # Cache result
-            if cache:
-                try:
-                    await cache.set(cache_key, result, expire=3600)  # 1 hour cache
-                except Exception:
-                    pass
-            return result
+    keyword = _HIGH_CONFIDENCE_MATCHER.search(message_lower)
+    if keyword:
+        result = True
+        logger.debug(
+            "Bank query detected (high-confidence keyword)",
+            keyword=keyword,
+            message_preview=message[:50]
+        )
+        # Cache result (1 hour)
+        return await _remember(cache, message_hash, result, expire=3600)
 
     # 3. Negative keywords - very unlikely to be banking (immediate False)
-    negative_keywords = [
-        # Food & Cooking
-        "receta", "cocina", "cocinar", "ingredientes", "menú",
-        "restaurante", "comida", "platillo", "bebida",
-
-        # Weather & Nature
-        "clima", "tiempo atmosférico", "lluvia", "temperatura", "pronóstico",
-
-        # Entertainment
-        "película", "serie", "música", "canción", "artista", "actor",
-        "videojuego", "juego", "película", "documental", "anime",
-
-        # Programming & Tech
-        "código python", "código javascript", "programación", "código",
-        "función python", "script", "algoritmo", "debugear",
-        "variable", "sintaxis", "compilar",
-
-        # Sports
-        "deporte", "fútbol", "basketball", "tenis", "partido",
-        "jugador", "equipo deportivo", "gol",
-
-        # History (general, non-banking)
-        "historia de la revolución", "guerra mundial", "época prehispánica",
-        "conquista española", "independencia de méxico",
-
-        # Geography
-        "capital de", "país de", "ciudad de", "ubicado en",
-        "geografía", "continente", "océano",
-
-        # Health & Fitness
-        "salud", "ejercicio", "dieta", "médico", "enfermedad",
-        "hospital", "síntoma", "tratamiento",
-
-        # Education (non-financial)
-        "escuela", "universidad", "curso de", "aprender",
-        "estudiar", "examen", "tarea",
-
-        # Physical Products
-        "de cuero", "de madera", "de metal", "de plástico",
-        "mueble", "decoración", "jardín",
-
-        # Street/Place Names
-        "nombre de una calle", "ubicación de", "dirección de",
-        "colonia", "avenida", "boulevard",
-
-        # General Non-Banking
-        "hora en", "traducir", "significado de", "sinónimo",
-        "horario de", "cómo llegar", "distancia entre"
-    ]
-
-    for keyword in negative_keywords:
-        if keyword in message_lower:
-            result = False
-            logger.debug(
-                "Bank query rejected (negative keyword)",
-                keyword=keyword,
-                message_preview=message[:50]
-            )
-            # Cache result
-            if cache:
-                try:
-                    await cache.set(cache_key, result, expire=3600)
-                except Exception:
-                    pass
-            return result
+    keyword = _NEGATIVE_MATCHER.search(message_lower)
+    if keyword:
+        result = False
+        logger.debug(
+            "Bank query rejected (negative keyword)",
+            keyword=keyword,
+            message_preview=message[:50]
+        )
+        # Cache result
+        return await _remember(cache, message_hash, result, expire=3600)
 
     # 3.5. Special filtering for ambiguous banking terms in non-banking contexts
     # Filter "histórico" when used for general history (not banking history)
     if "histórico" in message_lower or "historia" in message_lower:
         # If it's about general history topics, reject
-        history_topics = [
-            "revolución", "guerra", "conquista", "época", "siglo",
-            "prehispánico", "colonial", "independencia", "antigua",
-            "medieval", "romano", "griego"
-        ]
-        if any(topic in message_lower for topic in history_topics):
+        if _HISTORY_TOPICS_MATCHER.matches(message_lower):
             result = False
             logger.debug(
                 "Bank query rejected (general history context)",
                 message_preview=message[:50]
             )
-            if cache:
-                try:
-                    await cache.set(cache_key, result, expire=3600)
-                except Exception:
-                    pass
-            return result
+            return await _remember(cache, message_hash, result, expire=3600)
 
     # Filter "hipotecario" when used as street/place name
     if "hipotecario" in message_lower:
-        place_indicators = [
-            "nombre de", "calle", "avenida", "boulevard", "colonia",
-            "ubicado en", "dirección", "zona", "fraccionamiento"
-        ]
-        if any(indicator in message_lower for indicator in place_indicators):
+        if _PLACE_INDICATORS_MATCHER.matches(message_lower):
             result = False
             logger.debug(
                 "Bank query rejected (hipotecario as place name)",
                 message_preview=message[:50]
             )
-            if cache:
-                try:
-                    await cache.set(cache_key, result, expire=3600)
-                except Exception:
-                    pass
-            return result
+            return await _remember(cache, message_hash, result, expire=3600)
 
     # 4. Check all banking keywords with ambiguity handling
-    ambiguous_words = ["banco", "bancos", "capital", "cartera", "comercial", "consumo"]
-    found_banking_keywords = False
-
-    for keyword in all_keywords:
-        if keyword in ambiguous_words:
-            # Use word boundary for ambiguous words
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, message_lower):
-                # Additional context check
-                context_nearby = message_lower[max(0, message_lower.find(keyword) - 50):
-                                              min(len(message_lower), message_lower.find(keyword) + 50)]
-
-                banking_context_found = any(
-                    bk in context_nearby
-                    for bk in ["imor", "icor", "icap", "invex", "banorte", "santander",
-                              "financiero", "financiera", "bancario", "bancaria",
-                              "morosidad", "crédito", "credito", "tasa", "cnbv"]
-                )
+    found_banking_keywords = _BANKING_KEYWORDS_MATCHER.matches(message_lower)
 
-                if banking_context_found or keyword in ["bancos", "bancario", "bancaria"]:
-                    found_banking_keywords = True
-                    break
-        else:
-            if keyword in message_lower:
+    if not found_banking_keywords:
+        # Ambiguous words need a whole-word match plus banking context nearby
+        for keyword, position in _AMBIGUOUS_MATCHER.finditer(message_lower):
+            context_nearby = message_lower[max(0, position - 50):position + 50]
+            if keyword == "bancos" or _AMBIGUOUS_CONTEXT_MATCHER.matches(context_nearby):
                 found_banking_keywords = True
                 break
 
     # 5. Pattern matching for metric-like queries
-    metric_patterns = [
-        r'\b(cuál|cual|dame|muestra|obtener|consultar)\b.{0,30}\b(indicador|métrica|metrica|índice|indice|ratio)\b',
-        r'\b(cómo|como)\b.{0,30}\b(está|esta|van|anda)\b.{0,20}\b(banco|cartera|mora)\b',
-        r'\b(qué|que)\b.{0,30}\b(banco|bancos)\b.{0,30}\b(mejor|peor|líder|lider)\b'
-    ]
-
-    for pattern in metric_patterns:
-        if re.search(pattern, message_lower):
-            found_banking_keywords = True
-            break
+    if not found_banking_keywords:
+        found_banking_keywords = _METRIC_QUERY_MATCHER.matches(message_lower)
 
     # If we found banking keywords, return True immediately
     if found_banking_keywords:
@@ -759,12 +817,7 @@ async def is_bank_query(message: str) -> bool:
             message_preview=message[:50]
         )
         # Cache result
-        if cache:
-            try:
-                await cache.set(cache_key, result, expire=3600)
-            except Exception:
-                pass
-        return result
+        return await _remember(cache, message_hash, result, expire=3600)
 
     # 6. Ambiguous case - Use LLM classifier
     logger.info(
@@ -774,12 +827,8 @@ async def is_bank_query(message: str) -> bool:
 
     result = await _classify_with_llm(message)
 
-    # Cache LLM result (longer TTL for expensive operations)
-    if cache:
-        try:
-            await cache.set(cache_key, result, expire=7200)  # 2 hours cache for LLM results
-        except Exception:
-            pass
+    # Cache LLM result (longer TTL for expensive operations: 2 hours)
+    await _remember(cache, message_hash, result, expire=7200)
 
     logger.info(
         "Bank query LLM classification completed",
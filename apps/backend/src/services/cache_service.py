@@ -4,6 +4,8 @@ Cache service for Redis operations.
 
 from __future__ import annotations
 
+import hashlib
+
 import redis.asyncio as redis
 import structlog
 
@@ -13,6 +15,15 @@ logger = structlog.get_logger(__name__)
 
 _redis_client: redis.Redis | None = None
 
+BLACKLIST_PREFIX = "blacklist:"
+# Pub/sub channel that keeps in-process auth caches in sync across workers
+AUTH_INVALIDATION_CHANNEL = "auth:invalidations"
+
+
+def token_fingerprint(token: str) -> str:
+    """Stable hash of a token, used instead of the raw token in caches and messages."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
 
 async def get_redis_client() -> redis.Redis:
     """
@@ -32,7 +43,8 @@ async def add_token_to_blacklist(token: str, expires_at: int) -> None:
     """
     client = await get_redis_client()
     jti = token  # Use the token itself as the key
-    await client.set(f"blacklist:{jti}", "blacklisted", exat=expires_at)
+    await client.set(f"{BLACKLIST_PREFIX}{jti}", "blacklisted", exat=expires_at)
+    await client.publish(AUTH_INVALIDATION_CHANNEL, f"token:{token_fingerprint(token)}")
     logger.info("Token blacklisted", jti=jti)
 
 
@@ -42,5 +54,5 @@ async def is_token_blacklisted(token: str) -> bool:
     """
     client = await get_redis_client()
     jti = token
-    result = await client.get(f"blacklist:{jti}")
+    result = await client.get(f"{BLACKLIST_PREFIX}{jti}")
     return result is not None
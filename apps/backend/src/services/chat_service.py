@@ -5,6 +5,7 @@ Extracts business logic from chat router for better separation of concerns.
 Handles chat session management, message processing, and AI response generation.
 """
 
+import asyncio
 import json
 import time
 from datetime import datetime
@@ -14,7 +15,6 @@ import structlog
 from fastapi import HTTPException, status
 
 from ..core.config import Settings
-from ..core.redis_cache import get_redis_cache
 from ..core.telemetry import trace_span
 from ..models.artifact import Artifact, ArtifactType
 from ..models.chat import (
@@ -25,9 +25,15 @@ from ..models.chat import (
 from ..services.saptiva_client import SaptivaClient, build_payload
 from ..services.tools import normalize_tools_state
 from .memory.memory_service import get_memory_service
+from .memory.summary_service import get_conversation_summary_service
+from .message_persistence import MessagePersistence
+from .recent_messages import get_recent_messages
 
 logger = structlog.get_logger(__name__)
 
+# Strong references to fire-and-forget follow-ups (memory extraction)
+_background_tasks: set = set()
+
 
 class ChatService:
     """Service for chat operations"""
@@ -185,11 +191,24 @@ class ChatService:
                     "role": ctx_msg.get("role", "user"),
                     "content": ctx_msg.get("content", "")
                 })
+        elif self._get_active_summary(chat_session):
+            # Long chat: rolling summary + messages not yet folded into it
+            summary_service = get_conversation_summary_service()
+            summary = summary_service.get_active_summary(chat_session)
+            message_history.append(summary_service.format_for_llm(summary))
+
+            recent_messages = await summary_service.recent_messages_after(
+                str(chat_session.id), summary
+            )
+            for msg in recent_messages:
+                message_history.append({
+                    "role": msg.role.value,
+                    "content": msg.content
+                })
         else:
             # Get recent messages from session (increased to 20 to fix context amnesia)
-            recent_messages = await ChatMessageModel.find(
-                ChatMessageModel.chat_id == chat_session.id
-            ).sort(-ChatMessageModel.created_at).limit(20).to_list()
+            # Served from the Redis recent-message window, MongoDB on a miss
+            recent_messages = await get_recent_messages(chat_session.id, 20)
 
             # Reverse to chronological order
             for msg in reversed(recent_messages):
@@ -206,6 +225,47 @@ class ChatService:
 
         return message_history
 
+    def _get_active_summary(self, chat_session: ChatSessionModel):
+        """Return the rolling summary if summaries are enabled and one exists."""
+        if not self.settings.context_summary_enabled:
+            return None
+        return get_conversation_summary_service().get_active_summary(chat_session)
+
+    def _schedule_summary_update(self, chat_session: ChatSessionModel) -> None:
+        """Kick off a background summary update when enough messages piled up."""
+        if not self.settings.context_summary_enabled:
+            return
+        try:
+            get_conversation_summary_service().schedule_update(chat_session)
+        except Exception as e:
+            logger.warning(
+                "summary.schedule_failed",
+                error=str(e),
+                chat_id=chat_session.id
+            )
+
+    def _schedule_fact_extraction(self, chat_session: ChatSessionModel, content: str) -> None:
+        """Extract memory facts from an AI response in the background."""
+        task = asyncio.create_task(
+            self._extract_facts(str(chat_session.id), content)
+        )
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    @staticmethod
+    async def _extract_facts(session_id: str, content: str) -> None:
+        try:
+            await get_memory_service().process_message(
+                session_id=session_id,
+                message=content
+            )
+        except Exception as e:
+            logger.warning(
+                "memory.extraction_failed",
+                error=str(e),
+                chat_id=session_id
+            )
+
     async def build_message_context_with_memory(
         self,
         chat_session: ChatSessionModel,
@@ -619,16 +679,8 @@ class ChatService:
                 )
                 raise
 
-            # Persist to MongoDB
-            await user_message.insert()
-
-            # Update session stats (message_count, timestamps)
-            chat_session.message_count += 1
-            chat_session.updated_at = datetime.utcnow()
-            chat_session.last_message_at = datetime.utcnow()
-            if chat_session.message_count == 1:
-                chat_session.first_message_at = datetime.utcnow()
-            await chat_session.save()
+            # Persist message, session stats, history and cache in one batch
+            await MessagePersistence.persist(chat_session, user_message)
 
             logger.info(
                 "Added user message with validated files",
@@ -638,33 +690,6 @@ class ChatService:
                 schema_version=2
             )
 
-            # CRITICAL: Record in unified history (so message appears after refresh)
-            try:
-                from ..services.history_service import HistoryService
-                await HistoryService.record_chat_message(
-                    chat_id=chat_session.id,
-                    user_id=chat_session.user_id,
-                    message=user_message
-                )
-                logger.debug(
-                    "Recorded user message in history",
-                    message_id=user_message.id,
-                    chat_id=chat_session.id
-                )
-            except Exception as hist_err:
-                # Don't fail message creation if history fails, but log it
-                logger.error(
-                    "Failed to record user message in history",
-                    error=str(hist_err),
-                    message_id=user_message.id,
-                    chat_id=chat_session.id,
-                    exc_info=True
-                )
-
-            # Invalidate cache
-            cache = await get_redis_cache()
-            await cache.invalidate_chat_history(chat_session.id)
-
             return user_message
 
         except ValidationError as ve:
@@ -718,32 +743,18 @@ class ChatService:
             latency_ms=latency_ms
         )
 
-        # MEMORY: Extract FACTS from AI response
+        # MEMORY: Extract FACTS from AI response (background, off the critical path)
         # ⚠️ IMPORTANT: Facts come from AI responses, NOT user messages!
         # Users ASK questions ("Dame el IMOR de INVEX") - they don't have the data.
         # AI PROVIDES data ("El IMOR es 2.3%") - from DB queries, RAG, NL2SQL, etc.
         # This was a bug we caught during implementation - don't change this logic!
         if getattr(self.settings, 'memory_enabled', False):
-            try:
-                memory_service = get_memory_service()
-                await memory_service.process_message(
-                    session_id=str(chat_session.id),
-                    message=content
-                )
-            except Exception as e:
-                logger.warning(
-                    "memory.extraction_failed",
-                    error=str(e),
-                    chat_id=chat_session.id
-                )
+            self._schedule_fact_extraction(chat_session, content)
 
-        # NOTE: History recording is handled by chat_session.add_message() (chat.py:236)
-        # No need to call HistoryService.record_chat_message() here
+        # SUMMARY: Fold older messages into the rolling summary (background)
+        self._schedule_summary_update(chat_session)
 
-        # Invalidate cache
-        cache = await get_redis_cache()
-        await cache.invalidate_chat_history(chat_session.id)
-        if task_id:
-            await cache.invalidate_research_tasks(chat_session.id)
+        # NOTE: History recording and cache invalidation are handled by
+        # chat_session.add_message() via MessagePersistence
 
         return ai_message
@@ -29,6 +29,7 @@ from .file_events import file_event_bus
 from .idempotency import upload_idempotency_repository
 from .minio_service import minio_service
 from .storage import FileTooLargeError, storage
+from .tool_cache_warmup import get_tool_cache_warmer
 from .document_extraction import extract_text_from_file
 from .document_processing_service import create_document_processing_service
 
@@ -241,9 +242,7 @@ class FileIngestService:
             status=DocumentStatus.PROCESSING,
             user_id=user_id,
             conversation_id=conversation_id,
-            metadata={
-                "file_hash": digest  # Store hash for future deduplication
-            }
+            content_hash=digest,
         )
 
         await document.insert()
@@ -342,6 +341,7 @@ class FileIngestService:
                     status=FileStatus.READY,
                 ),
             )
+            get_tool_cache_warmer().enqueue(str(document.id), user_id, upload.content_type)
 
             # RAG Integration: Process document for vector storage (sync)
             try:
@@ -526,6 +526,7 @@ class FileIngestService:
                     pages=len(pages),
                 ),
             )
+            get_tool_cache_warmer().enqueue(str(document.id), str(document.user_id), content_type)
 
             logger.info(
                 "Large file processing completed successfully",
@@ -27,9 +27,15 @@ class HistoryService:
     async def record_chat_message(
         chat_id: str,
         user_id: str,
-        message: ChatMessage
+        message: ChatMessage,
+        invalidate_cache: bool = True
     ) -> HistoryEvent:
-        """Record a chat message in the unified history"""
+        """
+        Record a chat message in the unified history.
+
+        Pass invalidate_cache=False when the caller drops the timeline cache
+        itself (MessagePersistence does it in its single Redis call).
+        """
         try:
             event = await HistoryEventFactory.create_chat_message_event(
                 chat_id=chat_id,
@@ -51,7 +57,8 @@ class HistoryService:
             )
 
             # Invalidate cache
-            await HistoryService._invalidate_cache(chat_id)
+            if invalidate_cache:
+                await HistoryService._invalidate_cache(chat_id)
 
             logger.info(
                 "Recorded chat message in history",
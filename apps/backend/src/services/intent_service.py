@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List, Tuple
 
+from .text_matcher import PatternMatcher
+
 try:  # pragma: no cover - optional dependency during tests
     import structlog
 
@@ -58,6 +60,17 @@ REGION_PATTERN = re.compile(r"\b(latam|méxico|mx|europa|ee\.?uu\.?|usa|apac|eme
 URL_PATTERN = re.compile(r"https?://", re.IGNORECASE)
 RESEARCH_KEYWORDS = re.compile(r"\b(impacto|comparativa|tendencia|riesgo|mercado|benchmark|pronóstico|forecast|análisis)\b", re.IGNORECASE)
 
+# Context signals evaluated in a single scan (label -> pattern)
+CONSTRAINT_MATCHER = PatternMatcher(
+    {
+        "años": YEAR_PATTERN.pattern,
+        "regiones": REGION_PATTERN.pattern,
+        "URL": URL_PATTERN.pattern,
+        "palabras clave de investigación": RESEARCH_KEYWORDS.pattern,
+    },
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class HeuristicSignal:
@@ -168,20 +181,9 @@ class IntentClassifier:
         return signals
 
     def _constraint_score(self, text: str) -> Tuple[int, List[str]]:
-        score = 0
-        reasons: List[str] = []
-
-        for pattern, label in [
-            (YEAR_PATTERN, "años"),
-            (REGION_PATTERN, "regiones"),
-            (URL_PATTERN, "URL"),
-            (RESEARCH_KEYWORDS, "palabras clave de investigación"),
-        ]:
-            if pattern.search(text):
-                score += 1
-                reasons.append(label)
-
-        return score, reasons
+        hits = CONSTRAINT_MATCHER.find_all(text)
+        reasons = [label for label in CONSTRAINT_MATCHER.labels if label in hits]
+        return len(reasons), reasons
 
     def _looks_multi_topic(self, text: str) -> bool:
         separators = [" y ", " & ", " vs ", ","]
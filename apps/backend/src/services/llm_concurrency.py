@@ -0,0 +1,380 @@
+"""
+Adaptive concurrency control for outbound SAPTIVA calls.
+
+Every SAPTIVA request acquires a slot in the bulkhead of its purpose:
+
+- interactive:    chat streaming and chat completions the user is waiting on
+- background:     titles, executive/conversation summaries, review suggestions
+- classification: short routing calls (bank query classification)
+
+Each bulkhead has an AIMD limit: it grows by ~1 per limit's worth of healthy
+responses and shrinks multiplicatively on 429/5xx, timeouts or when latency
+drifts well above its baseline. Non-interactive bulkheads may not use the
+last ``interactive_reserve`` connections of the shared pool, so a burst of
+background jobs can never starve interactive streams.
+
+Retries and hedged requests draw from one process-wide RetryBudget, and
+LatencyTracker keeps the recent latencies used to pick the hedge delay.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Deque, Dict, Optional
+
+import httpx
+import structlog
+
+from ..core.config import get_settings
+from ..core.telemetry import (
+    record_llm_bulkhead_rejection,
+    record_llm_concurrency,
+    record_llm_queue_wait,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class LLMPurpose(str, Enum):
+    """Bulkhead a SAPTIVA request is accounted to."""
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+    CLASSIFICATION = "classification"
+
+
+class LLMCapacityError(Exception):
+    """Raised when a request cannot get a slot (queue full or wait timed out)."""
+
+    def __init__(self, purpose: str, reason: str):
+        self.purpose = purpose
+        self.reason = reason
+        super().__init__(f"SAPTIVA {purpose} capacity exhausted ({reason})")
+
+
+@dataclass(frozen=True)
+class BulkheadConfig:
+    """Static limits of a bulkhead."""
+    initial_limit: int
+    min_limit: int
+    max_limit: int
+    max_queue: int
+    queue_timeout: float
+
+
+DEFAULT_BULKHEADS: Dict[LLMPurpose, BulkheadConfig] = {
+    LLMPurpose.INTERACTIVE: BulkheadConfig(
+        initial_limit=20, min_limit=4, max_limit=50, max_queue=200, queue_timeout=30.0
+    ),
+    LLMPurpose.BACKGROUND: BulkheadConfig(
+        initial_limit=6, min_limit=1, max_limit=20, max_queue=500, queue_timeout=60.0
+    ),
+    LLMPurpose.CLASSIFICATION: BulkheadConfig(
+        initial_limit=8, min_limit=2, max_limit=16, max_queue=100, queue_timeout=5.0
+    ),
+}
+
+# AIMD tuning
+DECREASE_FACTOR = 0.7          # Multiplicative decrease on overload
+LATENCY_TOLERANCE = 2.0        # Overload when recent latency > 2x baseline
+SHORT_EWMA_ALPHA = 0.3         # Recent latency
+BASELINE_EWMA_ALPHA = 0.02     # Slow-moving baseline latency
+DECREASE_COOLDOWN_SECONDS = 1.0  # One decrease per congestion episode
+
+
+class Bulkhead:
+    """AIMD-limited slot pool for one purpose."""
+
+    def __init__(self, purpose: LLMPurpose, config: BulkheadConfig):
+        self.purpose = purpose
+        self.config = config
+        self._limit = float(config.initial_limit)
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self._recent_latency: Optional[float] = None
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def on_response(self, latency: float, overloaded: bool) -> None:
+        """Update the limit from one completed request."""
+        if not overloaded:
+            if self._recent_latency is None:
+                self._recent_latency = self._baseline_latency = latency
+            else:
+                self._recent_latency += SHORT_EWMA_ALPHA * (latency - self._recent_latency)
+                self._baseline_latency += BASELINE_EWMA_ALPHA * (latency - self._baseline_latency)
+            overloaded = self._recent_latency > self._baseline_latency * LATENCY_TOLERANCE
+
+        if overloaded:
+            now = time.monotonic()
+            if now - self._last_decrease >= DECREASE_COOLDOWN_SECONDS:
+                self._last_decrease = now
+                self._limit = max(float(self.config.min_limit), self._limit * DECREASE_FACTOR)
+                logger.info(
+                    "llm_concurrency.limit_decreased",
+                    purpose=self.purpose.value,
+                    limit=self.limit
+                )
+        else:
+            self._limit = min(float(self.config.max_limit), self._limit + 1.0 / self._limit)
+
+
+class Slot:
+    """A granted request slot; call record() once the response status is known."""
+
+    def __init__(self, bulkhead: Bulkhead):
+        self._bulkhead = bulkhead
+        self._started = time.monotonic()
+        self._recorded = False
+
+    def record(self, status_code: Optional[int] = None, overloaded: bool = False) -> None:
+        """
+        Feed the response outcome to the AIMD limit.
+
+        For streams call it when headers arrive so latency is time-to-first-byte.
+        """
+        if self._recorded:
+            return
+        self._recorded = True
+        if isinstance(status_code, int) and (status_code == 429 or status_code >= 500):
+            overloaded = True
+        self._bulkhead.on_response(time.monotonic() - self._started, overloaded)
+
+
+class ConcurrencyGovernor:
+    """Per-purpose bulkheads sharing one connection pool."""
+
+    def __init__(
+        self,
+        capacity: int,
+        interactive_reserve: int,
+        bulkheads: Optional[Dict[LLMPurpose, BulkheadConfig]] = None,
+    ):
+        self.capacity = capacity
+        self.interactive_reserve = min(interactive_reserve, capacity - 1)
+        self.bulkheads = {
+            purpose: Bulkhead(purpose, config)
+            for purpose, config in (bulkheads or DEFAULT_BULKHEADS).items()
+        }
+
+    @property
+    def total_in_flight(self) -> int:
+        return sum(b.in_flight for b in self.bulkheads.values())
+
+    def _can_admit(self, bulkhead: Bulkhead) -> bool:
+        if bulkhead.in_flight >= bulkhead.limit:
+            return False
+        shared = self.capacity
+        if bulkhead.purpose != LLMPurpose.INTERACTIVE:
+            shared -= self.interactive_reserve
+        return self.total_in_flight < shared
+
+    def _admit(self, bulkhead: Bulkhead) -> None:
+        bulkhead.in_flight += 1
+        record_llm_concurrency(bulkhead.purpose.value, bulkhead.limit, bulkhead.in_flight)
+
+    def _wake_waiters(self) -> None:
+        # Interactive first: freed capacity goes to the user-facing queue
+        for bulkhead in self.bulkheads.values():
+            while bulkhead.waiters and self._can_admit(bulkhead):
+                waiter = bulkhead.waiters.popleft()
+                if waiter.done():
+                    continue
+                self._admit(bulkhead)
+                waiter.set_result(None)
+
+    async def acquire(self, purpose: LLMPurpose) -> Bulkhead:
+        bulkhead = self.bulkheads[LLMPurpose(purpose)]
+        start = time.monotonic()
+
+        if not bulkhead.waiters and self._can_admit(bulkhead):
+            self._admit(bulkhead)
+            record_llm_queue_wait(bulkhead.purpose.value, 0.0)
+            return bulkhead
+
+        if len(bulkhead.waiters) >= bulkhead.config.max_queue:
+            record_llm_bulkhead_rejection(bulkhead.purpose.value, "queue_full")
+            raise LLMCapacityError(bulkhead.purpose.value, "queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        bulkhead.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), bulkhead.config.queue_timeout)
+        except asyncio.TimeoutError:
+            self._abandon(bulkhead, waiter)
+            record_llm_bulkhead_rejection(bulkhead.purpose.value, "queue_timeout")
+            raise LLMCapacityError(bulkhead.purpose.value, "queue_timeout")
+        except asyncio.CancelledError:
+            self._abandon(bulkhead, waiter)
+            raise
+
+        record_llm_queue_wait(bulkhead.purpose.value, time.monotonic() - start)
+        return bulkhead
+
+    def _abandon(self, bulkhead: Bulkhead, waiter: asyncio.Future) -> None:
+        if waiter.done() and not waiter.cancelled():
+            # Granted right as the wait ended: hand the slot back
+            self._release(bulkhead)
+        else:
+            waiter.cancel()
+            bulkhead.waiters.remove(waiter)
+
+    def _release(self, bulkhead: Bulkhead) -> None:
+        bulkhead.in_flight -= 1
+        record_llm_concurrency(bulkhead.purpose.value, bulkhead.limit, bulkhead.in_flight)
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self, purpose: LLMPurpose) -> AsyncIterator[Slot]:
+        """
+        Hold a slot of ``purpose`` for the duration of the block.
+
+        Timeouts and HTTP status errors raised inside the block count as
+        overload; a block that never called record() is recorded on exit.
+        """
+        bulkhead = await self.acquire(purpose)
+        slot = Slot(bulkhead)
+        try:
+            yield slot
+        except httpx.HTTPStatusError as e:
+            slot.record(e.response.status_code)
+            raise
+        except (httpx.TimeoutException, asyncio.TimeoutError):
+            slot.record(overloaded=True)
+            raise
+        finally:
+            slot.record()
+            self._release(bulkhead)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Current limit / in-flight / queued per purpose (health endpoints)."""
+        return {
+            purpose.value: {
+                "limit": b.limit,
+                "in_flight": b.in_flight,
+                "queued": len(b.waiters),
+            }
+            for purpose, b in self.bulkheads.items()
+        }
+
+
+class RetryBudget:
+    """
+    Process-wide budget for retries and hedges.
+
+    Within a sliding window, extra attempts are allowed up to
+    ``ratio`` x original requests plus ``min_per_second`` x window, so
+    retries scale with traffic but cannot multiply load during an outage.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, window_seconds: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window_seconds = window_seconds
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Count an original (first) attempt."""
+        now = time.monotonic()
+        self._trim(now)
+        self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Spend one retry/hedge if the budget allows it."""
+        now = time.monotonic()
+        self._trim(now)
+        allowed = self.min_per_second * self.window_seconds + self.ratio * len(self._requests)
+        if len(self._retries) >= allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+class LatencyTracker:
+    """Recent successful latencies per key, used to derive hedge delays."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, key: str, latency: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def percentile(self, key: str, quantile: float) -> Optional[float]:
+        """Return the quantile of recent samples, or None until enough are seen."""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(quantile * len(ordered)))
+        return ordered[index]
+
+
+# Singletons shared by every SaptivaClient (they share the upstream capacity)
+_governor_instance: Optional[ConcurrencyGovernor] = None
+_retry_budget_instance: Optional[RetryBudget] = None
+_latency_tracker_instance: Optional[LatencyTracker] = None
+
+
+def get_concurrency_governor() -> ConcurrencyGovernor:
+    """
+    Get singleton ConcurrencyGovernor instance.
+
+    Returns:
+        ConcurrencyGovernor singleton instance
+    """
+    global _governor_instance
+    if _governor_instance is None:
+        settings = get_settings()
+        _governor_instance = ConcurrencyGovernor(
+            capacity=settings.saptiva_max_connections,
+            interactive_reserve=settings.saptiva_interactive_reserve,
+        )
+    return _governor_instance
+
+
+def get_retry_budget() -> RetryBudget:
+    """
+    Get singleton RetryBudget instance.
+
+    Returns:
+        RetryBudget singleton instance
+    """
+    global _retry_budget_instance
+    if _retry_budget_instance is None:
+        settings = get_settings()
+        _retry_budget_instance = RetryBudget(
+            ratio=settings.saptiva_retry_budget_ratio,
+            min_per_second=settings.saptiva_retry_budget_min_per_second,
+        )
+    return _retry_budget_instance
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """
+    Get singleton LatencyTracker instance.
+
+    Returns:
+        LatencyTracker singleton instance
+    """
+    global _latency_tracker_instance
+    if _latency_tracker_instance is None:
+        _latency_tracker_instance = LatencyTracker()
+    return _latency_tracker_instance
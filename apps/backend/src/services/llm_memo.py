@@ -0,0 +1,152 @@
+"""
+Memoization for deterministic LLM sub-tasks.
+
+Titles, executive summaries and similar helpers call the LLM at low
+temperature with inputs that are often byte-identical (the same first
+message, the same audit findings on re-audit). ``memoize_completion`` keys a
+call on the model, the normalized messages and the sampling params, stores
+the response in Redis with a TTL, and coalesces concurrent identical calls
+into a single request (single-flight).
+
+Calls above the temperature ceiling, streaming calls and mock responses are
+never memoized.
+
+Usage:
+    response = await cached_chat_completion(
+        client, messages=[...], model="SAPTIVA_TURBO", temperature=0.3, max_tokens=20
+    )
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.redis_cache import get_redis_cache
+from ..core.single_flight import SingleFlight
+from ..core.telemetry import telemetry
+from .saptiva_client import SaptivaClient, SaptivaResponse
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "llm_memo"
+
+# Arguments that affect how a call is made, not what it returns
+_IGNORED_ARGS = frozenset({"self", "client", "purpose", "hedge"})
+
+_in_flight = SingleFlight()
+
+
+def _normalize_messages(messages: Any) -> Any:
+    """Collapse whitespace so cosmetic differences share a cache entry."""
+    if not isinstance(messages, list):
+        return messages
+    return [
+        {**message, "content": " ".join(str(message.get("content", "")).split())}
+        if isinstance(message, dict) else message
+        for message in messages
+    ]
+
+
+def _memo_key(namespace: str, arguments: Dict[str, Any]) -> str:
+    material = {
+        name: _normalize_messages(value) if name == "messages" else value
+        for name, value in sorted(arguments.items())
+        if name not in _IGNORED_ARGS
+    }
+    digest = hashlib.sha256(
+        json.dumps(material, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    return f"{KEY_PREFIX}:{namespace}:{digest}"
+
+
+def _bind(signature: inspect.Signature, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Bind a call to its signature, flattening ``**kwargs`` into named arguments."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments: Dict[str, Any] = {}
+    for name, value in bound.arguments.items():
+        if signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+            arguments.update(value)
+        else:
+            arguments[name] = value
+    return arguments
+
+
+def memoize_completion(
+    namespace: Optional[str] = None,
+    ttl: Optional[int] = None,
+    max_temperature: Optional[float] = None,
+) -> Callable[[Callable[..., Awaitable[SaptivaResponse]]], Callable[..., Awaitable[SaptivaResponse]]]:
+    """
+    Memoize an async function returning a ``SaptivaResponse``.
+
+    The wrapped function must take ``messages``, ``model`` and ``temperature``
+    (positionally or by keyword); every other argument except the client and
+    the concurrency hints (``purpose``, ``hedge``) is part of the key.
+
+    Args:
+        namespace: Key namespace (defaults to the function's qualified name)
+        ttl: Seconds to keep a response (defaults to LLM_MEMO_TTL_SECONDS)
+        max_temperature: Only memoize calls at or below this temperature
+            (defaults to LLM_MEMO_MAX_TEMPERATURE)
+    """
+
+    def decorator(func: Callable[..., Awaitable[SaptivaResponse]]):
+        signature = inspect.signature(func)
+        key_namespace = namespace or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> SaptivaResponse:
+            settings = get_settings()
+            arguments = _bind(signature, args, kwargs)
+            temperature = arguments.get("temperature")
+            ceiling = settings.llm_memo_max_temperature if max_temperature is None else max_temperature
+
+            if (
+                not settings.llm_memo_enabled
+                or arguments.get("stream")
+                or temperature is None
+                or temperature > ceiling
+            ):
+                return await func(*args, **kwargs)
+
+            key = _memo_key(key_namespace, arguments)
+            try:
+                cache = await get_redis_cache()
+            except Exception as e:
+                logger.warning("LLM memo cache unavailable", namespace=key_namespace, error=str(e))
+                return await func(*args, **kwargs)
+
+            cached = await cache.get(key)
+            if cached is not None:
+                telemetry.track_cache_operation(f"llm_memo:{key_namespace}", "redis", hit=True)
+                return SaptivaResponse(**cached)
+            telemetry.track_cache_operation(f"llm_memo:{key_namespace}", "redis", hit=False)
+
+            async def compute() -> SaptivaResponse:
+                response = await func(*args, **kwargs)
+                # Mock responses stand in for a missing API; never persist them
+                if isinstance(response, SaptivaResponse) and not response.id.startswith("mock-"):
+                    await cache.set(
+                        key,
+                        response.model_dump(mode="json"),
+                        expire=ttl or settings.llm_memo_ttl_seconds,
+                    )
+                return response
+
+            return await _in_flight.run(key, compute)
+
+        return wrapper
+
+    return decorator
+
+
+@memoize_completion(namespace="chat_completion")
+async def cached_chat_completion(client: SaptivaClient, **kwargs) -> SaptivaResponse:
+    """``client.chat_completion`` memoized for deterministic (low-temperature) calls."""
+    return await client.chat_completion(**kwargs)
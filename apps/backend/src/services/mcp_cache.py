@@ -5,29 +5,57 @@ Provides utilities for caching and invalidating MCP tool results in Redis.
 
 Features:
 - Cache key generation
+- Compressed, tag-versioned result cache with stale-while-revalidate
 - Cache invalidation by document, tool, or pattern
 - Bulk cache operations
 - TTL configuration per tool
 
 Usage:
-    from src.services.mcp_cache import invalidate_tool_cache, invalidate_document_tool_cache
+    from src.services.mcp_cache import get_tool_result_cache, invalidate_document_tool_cache
 
-    # Invalidate all tool results for a document
+    # Serve from cache, or run the tool (once, even for concurrent callers)
+    result = await get_tool_result_cache().get_or_compute(
+        "audit_file", "doc_123", {"policy_id": "auto"}, run_audit
+    )
+
+    # Invalidate all tool results for a document (O(1), bumps its tag)
     await invalidate_document_tool_cache("doc_123")
 
     # Invalidate specific tool results for a document
     await invalidate_tool_cache("audit_file", "doc_123")
+
+Redis layout:
+    mcp:tool:{tool}:{doc_id}[:{params_hash}]   hash: tag, fresh_until, codec, data
+    mcp:tool_tag:{doc_id}                      document tag (incremented to invalidate)
+    mcp:tool_refresh:{entry key}               lock held by the single background refresher
+
+An entry is valid only while its tag equals the document's current tag.
+Past ``fresh_until`` it is still served for ``stale_seconds`` while one
+refresher recomputes it in the background.
 """
 
+import asyncio
+import base64
+import time
+import zlib
 import structlog
-from typing import Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Set, Tuple
 import hashlib
 import json
 
+from ..core.config import get_settings
 from ..core.redis_cache import get_redis_cache
+from ..core.telemetry import telemetry
+from ..mcp.metrics import metrics_collector
 
 logger = structlog.get_logger(__name__)
 
+TAG_PREFIX = "mcp:tool_tag:"
+REFRESH_LOCK_PREFIX = "mcp:tool_refresh:"
+# Outlives any entry, so an expired tag never revives entries written under an old one
+TAG_TTL_SECONDS = 7 * 86400
+REFRESH_LOCK_SECONDS = 300
+
 # TTL configuration for each tool (in seconds)
 TOOL_CACHE_TTL = {
     "audit_file": 3600,       # 1 hour (findings don't change frequently)
@@ -64,6 +92,202 @@ def generate_cache_key(tool_name: str, doc_id: str, params: Optional[dict] = Non
     return f"mcp:tool:{tool_name}:{doc_id}"
 
 
+class ToolResultCache:
+    """Tag-versioned MCP tool result cache with stale-while-revalidate."""
+
+    def __init__(
+        self,
+        client: Any = None,
+        stale_seconds: Optional[int] = None,
+        compress_min_bytes: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self._client = client
+        self.stale_seconds = (
+            settings.mcp_tool_cache_stale_seconds if stale_seconds is None else stale_seconds
+        )
+        self.compress_min_bytes = (
+            settings.mcp_tool_cache_compress_min_bytes if compress_min_bytes is None else compress_min_bytes
+        )
+        # Computations in progress in this process, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+
+    async def _get_client(self):
+        if self._client is None:
+            cache = await get_redis_cache()
+            # None while Redis is unreachable; retried on the next call
+            self._client = cache.client
+        return self._client
+
+    def _encode(self, result: Any) -> Tuple[str, str]:
+        raw = json.dumps(result, default=str, separators=(",", ":"))
+        if len(raw) < self.compress_min_bytes:
+            return "json", raw
+        compressed = zlib.compress(raw.encode("utf-8"), 6)
+        return "zlib", base64.b64encode(compressed).decode("ascii")
+
+    @staticmethod
+    def _decode(entry: Dict[str, str]) -> Any:
+        data = entry["data"]
+        if entry.get("codec") == "zlib":
+            data = zlib.decompress(base64.b64decode(data)).decode("utf-8")
+        return json.loads(data)
+
+    async def _read(self, client, key: str, doc_id: str) -> Tuple[int, Optional[Dict[str, str]]]:
+        """Current document tag and the entry, if it was written under that tag."""
+        pipe = client.pipeline(transaction=False)
+        pipe.get(f"{TAG_PREFIX}{doc_id}")
+        pipe.hgetall(key)
+        tag, entry = await pipe.execute()
+        tag = int(tag or 0)
+        if not entry or entry.get("tag") != str(tag):
+            return tag, None
+        return tag, entry
+
+    async def _store(self, client, key: str, tag: int, ttl: int, result: Any) -> None:
+        codec, data = self._encode(result)
+        pipe = client.pipeline(transaction=True)
+        pipe.hset(key, mapping={
+            "tag": tag,
+            "fresh_until": time.time() + ttl,
+            "codec": codec,
+            "data": data,
+        })
+        pipe.expire(key, ttl + self.stale_seconds)
+        await pipe.execute()
+
+    async def _compute_and_store(self, client, key: str, tag: int, ttl: int, compute) -> Any:
+        result = await compute()
+        if result is not None:
+            try:
+                await self._store(client, key, tag, ttl, result)
+            except Exception as e:
+                logger.warning("Failed to cache tool result", cache_key=key, error=str(e))
+        return result
+
+    async def _coalesced(self, flight_key: str, producer: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``producer`` once per key; concurrent callers await the same result."""
+        future = self._inflight.get(flight_key)
+        if future is None:
+            future = asyncio.ensure_future(producer())
+            self._inflight[flight_key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(flight_key, None))
+        # A cancelled caller must not cancel the computation others are waiting on
+        return await asyncio.shield(future)
+
+    async def _refresh(self, client, key: str, tag: int, ttl: int, compute) -> None:
+        lock_key = f"{REFRESH_LOCK_PREFIX}{key}"
+        try:
+            # One refresher across all replicas
+            if not await client.set(lock_key, "1", nx=True, ex=REFRESH_LOCK_SECONDS):
+                return
+        except Exception as e:
+            logger.warning("Failed to acquire tool cache refresh lock", cache_key=key, error=str(e))
+            return
+
+        try:
+            await self._coalesced(
+                f"{key}@{tag}", lambda: self._compute_and_store(client, key, tag, ttl, compute)
+            )
+            logger.debug("Refreshed stale tool result", cache_key=key)
+        except Exception as e:
+            logger.warning("Background tool result refresh failed", cache_key=key, error=str(e))
+        finally:
+            try:
+                await client.delete(lock_key)
+            except Exception:
+                pass
+
+    async def get_or_compute(
+        self,
+        tool_name: str,
+        doc_id: str,
+        params: Optional[dict],
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Return the cached result for (tool, document, params), or compute it.
+
+        Fresh entries are returned directly. Stale entries are returned too,
+        and a single background task recomputes them. On a miss, concurrent
+        callers share one ``compute()`` call. Redis errors fall back to
+        computing without the cache.
+        """
+        ttl = ttl or TOOL_CACHE_TTL.get(tool_name, 3600)
+        key = generate_cache_key(tool_name, doc_id, params)
+
+        try:
+            client = await self._get_client()
+            if client is None:
+                return await compute()
+            lookup_start = time.perf_counter()
+            tag, entry = await self._read(client, key, doc_id)
+            result = self._decode(entry) if entry is not None else None
+            metrics_collector.record_tool_phase(
+                tool_name, "latest", "cache_lookup", time.perf_counter() - lookup_start
+            )
+        except Exception as e:
+            logger.warning("Failed to read tool cache", cache_key=key, error=str(e))
+            return await compute()
+
+        if entry is not None:
+            if float(entry["fresh_until"]) > time.time():
+                telemetry.track_cache_operation("mcp_tool", "redis", hit=True)
+                logger.info("Tool result loaded from cache", tool=tool_name, doc_id=doc_id, cache_hit=True)
+                return result
+
+            telemetry.track_cache_operation("mcp_tool_stale", "redis", hit=True)
+            logger.info("Serving stale tool result while refreshing", tool=tool_name, doc_id=doc_id)
+            task = asyncio.create_task(self._refresh(client, key, tag, ttl, compute))
+            self._refreshing.add(task)
+            task.add_done_callback(self._refreshing.discard)
+            return result
+
+        telemetry.track_cache_operation("mcp_tool", "redis", hit=False)
+        return await self._coalesced(
+            f"{key}@{tag}", lambda: self._compute_and_store(client, key, tag, ttl, compute)
+        )
+
+    async def is_fresh(self, tool_name: str, doc_id: str, params: Optional[dict] = None) -> bool:
+        """True if a result exists under the document's current tag and is within its TTL."""
+        client = await self._get_client()
+        if client is None:
+            return False
+        _, entry = await self._read(client, generate_cache_key(tool_name, doc_id, params), doc_id)
+        return entry is not None and float(entry["fresh_until"]) > time.time()
+
+    async def invalidate(self, tool_name: str, doc_id: str, params: Optional[dict] = None) -> bool:
+        """Drop one cached result."""
+        client = await self._get_client()
+        if client is None:
+            return False
+        return bool(await client.delete(generate_cache_key(tool_name, doc_id, params)))
+
+    async def invalidate_document(self, doc_id: str) -> int:
+        """Invalidate every cached result of a document by bumping its tag; returns the new tag."""
+        client = await self._get_client()
+        if client is None:
+            return 0
+        pipe = client.pipeline(transaction=True)
+        pipe.incr(f"{TAG_PREFIX}{doc_id}")
+        pipe.expire(f"{TAG_PREFIX}{doc_id}", TAG_TTL_SECONDS)
+        tag, _ = await pipe.execute()
+        return int(tag)
+
+
+_tool_result_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Get or create the global tool result cache."""
+    global _tool_result_cache
+    if _tool_result_cache is None:
+        _tool_result_cache = ToolResultCache()
+    return _tool_result_cache
+
+
 async def invalidate_tool_cache(
     tool_name: str,
     doc_id: str,
@@ -85,10 +309,9 @@ async def invalidate_tool_cache(
         True
     """
     try:
-        cache = await get_redis_cache()
         cache_key = generate_cache_key(tool_name, doc_id, params)
 
-        deleted = await cache.delete(cache_key)
+        deleted = await get_tool_result_cache().invalidate(tool_name, doc_id, params)
 
         if deleted:
             logger.info(
@@ -123,40 +346,47 @@ async def invalidate_document_tool_cache(doc_id: str, tool_name: Optional[str] =
     """
     Invalidate all tool caches for a document (or specific tool).
 
+    Without ``tool_name`` this bumps the document's tag: O(1), every entry
+    written under the previous tag stops matching and expires on its own.
+
     Args:
         doc_id: Document ID
         tool_name: Optional tool name (if None, invalidates all tools for document)
 
     Returns:
-        Number of cache keys deleted
+        Number of cache keys deleted (1 when the document tag was bumped)
 
     Example:
         >>> # Invalidate all tool results for a document
         >>> await invalidate_document_tool_cache("doc_123")
-        3  # deleted audit_file, excel_analyzer, and extract_document_text caches
+        1  # audit_file, excel_analyzer, and extract_document_text results are now stale
 
         >>> # Invalidate only audit_file results
         >>> await invalidate_document_tool_cache("doc_123", "audit_file")
         1
     """
     try:
-        cache = await get_redis_cache()
+        if not tool_name:
+            tag = await get_tool_result_cache().invalidate_document(doc_id)
+            logger.info("Invalidated document tool caches", doc_id=doc_id, tool_name="all", tag=tag)
+            return 1 if tag else 0
+
+        client = (await get_redis_cache()).client
+        if client is None:
+            return 0
 
         # Build pattern for scan
-        if tool_name:
-            pattern = f"mcp:tool:{tool_name}:{doc_id}*"
-        else:
-            pattern = f"mcp:tool:*:{doc_id}*"
+        pattern = f"mcp:tool:{tool_name}:{doc_id}*"
 
         # Scan for matching keys
         deleted_count = 0
         cursor = 0
 
         while True:
-            cursor, keys = await cache.scan(cursor, match=pattern, count=100)
+            cursor, keys = await client.scan(cursor, match=pattern, count=100)
 
             if keys:
-                deleted = await cache.delete(*keys)
+                deleted = await client.delete(*keys)
                 deleted_count += deleted
 
             if cursor == 0:
@@ -212,7 +442,9 @@ async def invalidate_all_tool_caches(tool_name: Optional[str] = None) -> int:
         150
     """
     try:
-        cache = await get_redis_cache()
+        client = (await get_redis_cache()).client
+        if client is None:
+            return 0
 
         # Build pattern for scan
         if tool_name:
@@ -225,10 +457,10 @@ async def invalidate_all_tool_caches(tool_name: Optional[str] = None) -> int:
         cursor = 0
 
         while True:
-            cursor, keys = await cache.scan(cursor, match=pattern, count=100)
+            cursor, keys = await client.scan(cursor, match=pattern, count=100)
 
             if keys:
-                deleted = await cache.delete(*keys)
+                deleted = await client.delete(*keys)
                 deleted_count += deleted
 
             if cursor == 0:
@@ -269,7 +501,9 @@ async def get_cache_stats(doc_id: Optional[str] = None) -> dict:
         }
     """
     try:
-        cache = await get_redis_cache()
+        client = (await get_redis_cache()).client
+        if client is None:
+            raise ConnectionError("Redis unavailable")
 
         # Build pattern
         if doc_id:
@@ -282,7 +516,7 @@ async def get_cache_stats(doc_id: Optional[str] = None) -> dict:
         cursor = 0
 
         while True:
-            cursor, batch_keys = await cache.scan(cursor, match=pattern, count=100)
+            cursor, batch_keys = await client.scan(cursor, match=pattern, count=100)
             keys.extend(batch_keys)
 
             if cursor == 0:
@@ -347,9 +581,11 @@ async def warmup_tool_cache(
         params: Optional parameters for tool
 
     Returns:
-        Dict with results:
+        Dict with results ("skipped" documents already had a fresh result;
+        "unavailable" is set when the tool is not registered):
         {
             "cached": 5,
+            "skipped": 2,
             "failed": 1,
             "errors": ["doc_789: Tool execution failed"]
         }
@@ -358,54 +594,51 @@ async def warmup_tool_cache(
 
     results = {
         "cached": 0,
+        "skipped": 0,
         "failed": 0,
         "errors": []
     }
 
     try:
-        cache = await get_redis_cache()
+        cache = get_tool_result_cache()
         mcp_adapter = get_mcp_adapter()
         tool_map = await mcp_adapter._get_tool_map()
 
         if tool_name not in tool_map:
-            raise ValueError(f"Tool '{tool_name}' not found in registry")
+            logger.info("Tool not available, skipping cache warmup", tool_name=tool_name)
+            results["unavailable"] = True
+            results["errors"].append(f"Tool '{tool_name}' not found in registry")
+            return results
 
         tool_impl = tool_map[tool_name]
 
         for doc_id in doc_ids:
             try:
-                # Generate cache key
-                cache_key = generate_cache_key(tool_name, doc_id, params)
-
-                # Check if already cached
-                existing = await cache.get(cache_key)
-                if existing:
+                if await cache.is_fresh(tool_name, doc_id, params):
                     logger.debug(
                         "Tool result already cached, skipping",
                         tool_name=tool_name,
                         doc_id=doc_id
                     )
-                    results["cached"] += 1
+                    results["skipped"] += 1
                     continue
 
-                # Execute tool
                 payload = {"doc_id": doc_id, "user_id": user_id, **(params or {})}
-                tool_result = await mcp_adapter._execute_tool_impl(
-                    tool_name=tool_name,
-                    tool_impl=tool_impl,
-                    payload=payload
-                )
 
-                # Store in cache
-                ttl = TOOL_CACHE_TTL.get(tool_name, 3600)
-                await cache.set(cache_key, tool_result, expire=ttl)
+                async def run_tool(payload=payload):
+                    return await mcp_adapter._execute_tool_impl(
+                        tool_name=tool_name,
+                        tool_impl=tool_impl,
+                        payload=payload
+                    )
+
+                await cache.get_or_compute(tool_name, doc_id, params, run_tool)
 
                 results["cached"] += 1
                 logger.info(
                     "Warmed up tool cache",
                     tool_name=tool_name,
-                    doc_id=doc_id,
-                    cache_key=cache_key
+                    doc_id=doc_id
                 )
 
             except Exception as e:
@@ -2,15 +2,19 @@
 Simple Memory Service - JSON-based fact recall.
 
 Extracts banking metrics from conversation via regex and stores
-them as JSON for context injection into LLM prompts.
+them as JSON for context injection into LLM prompts. Long chats also
+keep a rolling summary so only the last K messages are sent verbatim.
 """
 
 from .memory_service import MemoryService, get_memory_service
+from .summary_service import ConversationSummaryService, get_conversation_summary_service
 from .fact_extractor import extract_all, extract_bank, extract_period, extract_metrics
 
 __all__ = [
     "MemoryService",
     "get_memory_service",
+    "ConversationSummaryService",
+    "get_conversation_summary_service",
     "extract_all",
     "extract_bank",
     "extract_period",
@@ -8,6 +8,8 @@ Extracts bank names, periods (quarters/years), and financial metrics.
 import re
 from typing import Dict, Optional, Tuple
 
+from ..text_matcher import KeywordMatcher
+
 # Known Mexican banks (aligned with BankAdvisor DB)
 BANKS = {
     # Primary banks (available in BankAdvisor)
@@ -94,6 +96,41 @@ METRIC_PATTERNS = {
     "provision": r"provisi[oó]n\s*(?:es|de|fue|=|:)?\s*\$?\s*(\d+(?:[,.\s]\d{3})*(?:[.,]\d+)?)",
 }
 
+# Literal every METRIC_PATTERNS entry starts with. One scan finds which
+# metrics a message mentions; only their patterns are then evaluated.
+METRIC_TRIGGERS = {
+    "imor": "imor",
+    "icor": "icor",
+    "icap": "icap",
+    "roe": "roe",
+    "roa": "roa",
+    "roi": "roi",
+    "morosidad": "morosidad",
+    "solvencia": "solvencia",
+    "liquidez": "liquidez",
+    "margen": "margen",
+    "utilidad": "utilidad",
+    "rentabilidad": "rentabilidad",
+    "dscr": "dscr",
+    "ltv": "ltv",
+    "plazo": "plazo",
+    "tasa_interes": "tasa",
+    "tasa": "tasa",
+    "cartera_vencida": "cartera",
+    "cartera_total": "cartera",
+    "monto": "monto",
+    "reservas": "reserva",
+    "provision": "provisi",
+}
+
+# Compiled once at import
+_BANK_MATCHER = KeywordMatcher(BANKS, word_boundary=True)
+_METRIC_TRIGGER_MATCHER = KeywordMatcher(METRIC_TRIGGERS.values())
+_METRIC_REGEXES = {
+    metric: re.compile(pattern, re.IGNORECASE)
+    for metric, pattern in METRIC_PATTERNS.items()
+}
+
 
 def extract_bank(text: str) -> Optional[str]:
     """
@@ -103,14 +140,11 @@ def extract_bank(text: str) -> Optional[str]:
         text: Input text to search
 
     Returns:
-        Bank name (lowercase) if found, None otherwise
+        Bank name (lowercase) if found, None otherwise.
+        When several banks are mentioned, the first one in the text wins.
     """
-    text_lower = text.lower()
-    for bank in BANKS:
-        # Word boundary match to avoid partial matches
-        if re.search(rf"\b{bank}\b", text_lower):
-            return bank
-    return None
+    # Word boundary match to avoid partial matches
+    return _BANK_MATCHER.search(text)
 
 
 def extract_period(text: str) -> Optional[str]:
@@ -144,8 +178,14 @@ def extract_metrics(text: str) -> Dict[str, str]:
     facts = {}
     text_lower = text.lower()
 
-    for metric, pattern in METRIC_PATTERNS.items():
-        match = re.search(pattern, text_lower, re.IGNORECASE)
+    mentioned = _METRIC_TRIGGER_MATCHER.find_all(text_lower)
+    if not mentioned:
+        return facts
+
+    for metric, regex in _METRIC_REGEXES.items():
+        if METRIC_TRIGGERS[metric] not in mentioned:
+            continue
+        match = regex.search(text_lower)
         if match:
             # Clean the value: normalize decimal format
             value = match.group(1)
@@ -2,19 +2,21 @@
 Simple Memory Service
 
 Extracts facts via regex, stores as JSON in ChatSession,
-and builds context for LLM with memory + recent messages.
+and builds context for LLM with memory + rolling summary + recent messages.
+
+Facts are merged server-side with a single atomic update (no read-modify-save
+of the whole session), and reads go through a small projection.
 """
 
 import structlog
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 # Match existing import pattern from chat_service.py
-from ...models.chat import (
-    ChatMessage as ChatMessageModel,
-    ChatSession as ChatSessionModel,
-)
+from ...models.chat import ChatMemoryView, ChatSession as ChatSessionModel
 from ...core.config import get_settings
+from ..recent_messages import get_recent_messages
 from .fact_extractor import extract_all
+from .summary_service import get_conversation_summary_service
 
 logger = structlog.get_logger(__name__)
 
@@ -55,8 +57,8 @@ class MemoryService:
         if not self.settings.memory_enabled:
             return
 
-        session = await ChatSessionModel.get(session_id)
-        if not session:
+        current_context = await self._load_context(session_id)
+        if current_context is None:
             logger.warning(
                 "memory.session_not_found",
                 session_id=session_id
@@ -66,42 +68,99 @@ class MemoryService:
         # Extract facts using current context
         new_facts, new_context = extract_all(
             text=message,
-            current_context=session.memory_context
+            current_context=current_context
         )
 
-        # Update session if we found anything
-        should_save = False
-
-        if new_facts:
-            # Merge new facts into existing
-            session.memory_facts.update(new_facts)
+        update = self.build_memory_update(
+            new_facts=new_facts,
+            context_changes={
+                key: value
+                for key, value in new_context.items()
+                if current_context.get(key) != value
+            },
+            max_facts=self.settings.memory_max_facts,
+        )
+        if not update:
+            return
 
-            # Limit total facts to prevent unbounded growth
-            if len(session.memory_facts) > self.settings.memory_max_facts:
-                # Keep most recent facts (dict preserves insertion order in Python 3.7+)
-                items = list(session.memory_facts.items())
-                session.memory_facts = dict(items[-self.settings.memory_max_facts:])
+        # Only touch memory fields: extraction runs in the background and
+        # must not overwrite counters updated by concurrent messages
+        await ChatSessionModel.find_one({"_id": session_id}).update(update)
 
+        if new_facts:
             logger.info(
                 "memory.facts_saved",
                 session_id=session_id,
-                new_facts=new_facts,
-                total_facts=len(session.memory_facts)
+                new_facts=new_facts
             )
-            should_save = True
-
-        # Update context if changed
-        if new_context != session.memory_context:
-            session.memory_context = new_context
+        if new_context != current_context:
             logger.info(
                 "memory.context_updated",
                 session_id=session_id,
                 context=new_context
             )
-            should_save = True
 
-        if should_save:
-            await session.save()
+    @staticmethod
+    def build_memory_update(
+        new_facts: Dict[str, str],
+        context_changes: Dict[str, str],
+        max_facts: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build an update pipeline that merges facts and context atomically.
+
+        Fact keys contain dots (``bank.period.metric``), so they cannot be
+        addressed with ``$set``/``$unset`` field paths. Instead the existing
+        facts are merged server-side: re-mentioned keys move to the end, and
+        only the ``max_facts`` most recent facts are kept, all in one write.
+        ``$arrayToObject`` only accepts dotted field names from MongoDB 5.0
+        on, so this needs MongoDB 5.0+ (deployments run 7.0). Context keys
+        are plain, so only the changed ones are set.
+
+        Args:
+            new_facts: Facts extracted from the message
+            context_changes: Context keys whose value changed
+            max_facts: Maximum number of facts to keep
+
+        Returns:
+            Update pipeline, or an empty list if there is nothing to write
+        """
+        stage: Dict[str, Any] = {}
+
+        if new_facts:
+            existing = {"$objectToArray": {"$ifNull": ["$memory_facts", {}]}}
+            kept = {
+                "$filter": {
+                    "input": existing,
+                    "as": "fact",
+                    "cond": {"$not": [{"$in": ["$$fact.k", {"$literal": list(new_facts)}]}]},
+                }
+            }
+            added = [
+                {"k": {"$literal": key}, "v": {"$literal": value}}
+                for key, value in new_facts.items()
+            ]
+            stage["memory_facts"] = {
+                "$arrayToObject": {
+                    "$slice": [{"$concatArrays": [kept, added]}, -max_facts]
+                }
+            }
+
+        for key, value in context_changes.items():
+            stage[f"memory_context.{key}"] = {"$literal": value}
+
+        return [{"$set": stage}] if stage else []
+
+    async def _load_view(self, session_id: str) -> Optional[ChatMemoryView]:
+        """Load only the memory fields of a session (projection)."""
+        return await ChatSessionModel.find_one(
+            {"_id": session_id},
+            projection_model=ChatMemoryView
+        )
+
+    async def _load_context(self, session_id: str) -> Optional[Dict[str, str]]:
+        view = await self._load_view(session_id)
+        return dict(view.memory_context) if view else None
 
     async def get_context_for_llm(
         self,
@@ -123,8 +182,8 @@ class MemoryService:
         Returns:
             List of message dicts with 'role' and 'content' keys
         """
-        session = await ChatSessionModel.get(session_id)
-        if not session:
+        memory = await self._load_view(session_id)
+        if not memory:
             # Fallback: just return system prompt
             if system_prompt:
                 return [{"role": "system", "content": system_prompt}]
@@ -137,30 +196,43 @@ class MemoryService:
             messages.append({"role": "system", "content": system_prompt})
 
         # 2. Memory context (if we have facts)
-        if session.memory_facts:
+        if memory.memory_facts:
             memory_text = self._format_facts_for_llm(
-                facts=session.memory_facts,
-                context=session.memory_context
+                facts=memory.memory_facts,
+                context=memory.memory_context
             )
             messages.append({"role": "system", "content": memory_text})
 
-        # 3. Recent messages from conversation history
+        # 3. Rolling summary of older messages (long chats only)
+        summary_service = get_conversation_summary_service()
+        summary = (
+            summary_service.get_active_summary(memory)
+            if self.settings.context_summary_enabled
+            else None
+        )
+
+        # 4. Recent messages from conversation history
         # CRITICAL FIX: Skip the most recent message (current user message)
         # because it was already saved to DB before get_context_for_llm() is called,
         # and build_message_context_with_memory() adds it manually at line 260.
         # We fetch memory_recent_messages + 1, skip the first one (most recent),
         # and use the next memory_recent_messages as history.
-        all_recent = await ChatMessageModel.find(
-            ChatMessageModel.chat_id == session_id
-        ).sort(-ChatMessageModel.created_at).limit(
-            self.settings.memory_recent_messages + 1
-        ).to_list()
+        if summary:
+            messages.append(summary_service.format_for_llm(summary))
+            recent = await summary_service.recent_messages_after(
+                session_id, summary, skip_latest=True
+            )
+            all_recent = recent
+        else:
+            all_recent = await get_recent_messages(
+                session_id, self.settings.memory_recent_messages + 1
+            )
 
-        # Skip the first message (most recent = current user message just saved)
-        recent = all_recent[1:] if len(all_recent) > 0 else []
+            # Skip the first message (most recent = current user message just saved)
+            # and reverse to chronological order (oldest first)
+            recent = list(reversed(all_recent[1:])) if len(all_recent) > 0 else []
 
-        # Reverse to chronological order (oldest first)
-        for msg in reversed(recent):
+        for msg in recent:
             messages.append({
                 "role": msg.role.value,
                 "content": msg.content
@@ -172,9 +244,10 @@ class MemoryService:
             history_count=len(recent),
             total_fetched=len(all_recent),
             skipped_current=len(all_recent) > 0,
+            has_summary=summary is not None,
             recent_messages_preview=[
                 f"{msg.role.value}: {msg.content[:50]}..."
-                for msg in reversed(recent)
+                for msg in recent
             ][:3]
         )
 
@@ -256,10 +329,10 @@ class MemoryService:
         Returns:
             Dict of fact keys to values
         """
-        session = await ChatSessionModel.get(session_id)
-        if not session:
+        view = await self._load_view(session_id)
+        if not view:
             return {}
-        return session.memory_facts
+        return view.memory_facts
 
     async def get_context(self, session_id: str) -> Dict[str, str]:
         """
@@ -271,10 +344,8 @@ class MemoryService:
         Returns:
             Context dict with bank, period, metric keys
         """
-        session = await ChatSessionModel.get(session_id)
-        if not session:
-            return {}
-        return session.memory_context
+        context = await self._load_context(session_id)
+        return context or {}
 
     async def clear_memory(self, session_id: str) -> bool:
         """
@@ -286,14 +357,12 @@ class MemoryService:
         Returns:
             True if cleared, False if session not found
         """
-        session = await ChatSessionModel.get(session_id)
-        if not session:
+        result = await ChatSessionModel.find_one({"_id": session_id}).update(
+            {"$set": {"memory_facts": {}, "memory_context": {}}}
+        )
+        if not getattr(result, "matched_count", 0):
             return False
 
-        session.memory_facts = {}
-        session.memory_context = {}
-        await session.save()
-
         logger.info(
             "memory.cleared",
             session_id=session_id
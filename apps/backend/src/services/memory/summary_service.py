@@ -0,0 +1,273 @@
+"""
+Rolling Conversation Summary Service
+
+Keeps a compact, versioned summary on ChatSession so long chats send
+summary + last K messages to the LLM instead of the full raw history.
+Summaries are updated in the background and only fold in the new delta.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+import structlog
+
+from ...models.chat import (
+    ChatMessage as ChatMessageModel,
+    ChatSession as ChatSessionModel,
+    ConversationSummary,
+)
+from ...core.config import get_settings
+from ..recent_messages import RecentMessage, get_recent_messages
+
+logger = structlog.get_logger(__name__)
+
+# Per-message cap when feeding the delta to the summarizer (bank tables are long)
+MAX_DELTA_MESSAGE_CHARS = 1500
+
+SUMMARY_SYSTEM_PROMPT = (
+    "Eres un asistente que mantiene un resumen acumulado de una conversación. "
+    "Recibes el resumen previo (si existe) y los mensajes nuevos. "
+    "Devuelve un único resumen actualizado, en español, de máximo 12 viñetas. "
+    "Conserva bancos, periodos, métricas y cifras exactas mencionadas, decisiones "
+    "y preguntas abiertas. Omite saludos y tablas completas. Sin preámbulos."
+)
+
+
+class ConversationSummaryService:
+    """
+    Service for maintaining rolling conversation summaries.
+
+    Flow:
+    - add_assistant_message() calls schedule_update() after every AI response
+    - When enough messages fall outside the recent window, a background task
+      summarizes ONLY the new delta on top of the previous summary
+    - Context builders call get_active_summary() + recent_messages_after()
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._in_flight: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def recent_window(self) -> int:
+        return max(1, self.settings.context_summary_recent_messages)
+
+    @staticmethod
+    def get_active_summary(session: ChatSessionModel) -> Optional[ConversationSummary]:
+        """Return the session summary if it has content, None otherwise."""
+        summary = getattr(session, "conversation_summary", None)
+        if isinstance(summary, ConversationSummary) and summary.text:
+            return summary
+        return None
+
+    def pending_messages(self, session: ChatSessionModel) -> int:
+        """Count messages outside the recent window not yet folded into the summary."""
+        summary = getattr(session, "conversation_summary", None)
+        covered = summary.covered_message_count if isinstance(summary, ConversationSummary) else 0
+        message_count = getattr(session, "message_count", 0)
+        if not isinstance(message_count, int):
+            return 0
+        return message_count - self.recent_window - covered
+
+    def needs_update(self, session: ChatSessionModel) -> bool:
+        """Check whether the summary should be recomputed for this session."""
+        if not self.settings.context_summary_enabled:
+            return False
+        return self.pending_messages(session) >= self.settings.context_summary_trigger_messages
+
+    def schedule_update(self, session: ChatSessionModel) -> bool:
+        """
+        Schedule a background summary update if the session needs one.
+
+        At most one update per chat runs at a time in this process.
+
+        Returns:
+            True if a background task was scheduled
+        """
+        if not self.needs_update(session):
+            return False
+
+        session_id = str(session.id)
+        if session_id in self._in_flight:
+            return False
+
+        self._in_flight.add(session_id)
+        task = asyncio.create_task(self._run_update(session_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run_update(self, session_id: str) -> None:
+        try:
+            await self.update_summary(session_id)
+        except Exception as e:
+            logger.warning(
+                "summary.update_failed",
+                session_id=session_id,
+                error=str(e)
+            )
+        finally:
+            self._in_flight.discard(session_id)
+
+    async def update_summary(self, session_id: str) -> Optional[ConversationSummary]:
+        """
+        Fold messages older than the recent window into the summary.
+
+        Only messages newer than ``covered_until`` are sent to the LLM, together
+        with the previous summary text. The write is conditional on the previous
+        version so concurrent updaters cannot overwrite each other.
+
+        Args:
+            session_id: Chat session ID
+
+        Returns:
+            The new summary, or None if nothing was updated
+        """
+        session = await ChatSessionModel.get(session_id)
+        if not session:
+            logger.warning("summary.session_not_found", session_id=session_id)
+            return None
+
+        current = session.conversation_summary or ConversationSummary()
+
+        query = ChatMessageModel.find(ChatMessageModel.chat_id == session_id)
+        if current.covered_until:
+            query = query.find(ChatMessageModel.created_at > current.covered_until)
+        unsummarized = await query.sort(+ChatMessageModel.created_at).to_list()
+
+        delta = unsummarized[:-self.recent_window]
+        if len(delta) < self.settings.context_summary_trigger_messages:
+            return None
+
+        text = await self._summarize(current.text, delta)
+        if not text:
+            return None
+
+        new_summary = ConversationSummary(
+            text=text,
+            version=current.version + 1,
+            covered_message_count=current.covered_message_count + len(delta),
+            covered_until=delta[-1].created_at,
+            model=self.settings.context_summary_model,
+            updated_at=datetime.utcnow(),
+        )
+
+        version_filter = (
+            {"conversation_summary.version": current.version}
+            if session.conversation_summary
+            else {"conversation_summary": None}
+        )
+        result = await ChatSessionModel.find_one(
+            {"_id": session_id, **version_filter}
+        ).update({"$set": {"conversation_summary": new_summary.model_dump()}})
+
+        if not getattr(result, "modified_count", 0):
+            logger.info(
+                "summary.version_conflict",
+                session_id=session_id,
+                expected_version=current.version
+            )
+            return None
+
+        logger.info(
+            "summary.updated",
+            session_id=session_id,
+            version=new_summary.version,
+            delta_messages=len(delta),
+            covered_messages=new_summary.covered_message_count,
+            summary_chars=len(text)
+        )
+        return new_summary
+
+    async def _summarize(self, previous: str, delta: List[ChatMessageModel]) -> str:
+        """Ask the LLM for an updated summary given the previous one and the delta."""
+        from ..llm_concurrency import LLMPurpose
+        from ..saptiva_client import get_saptiva_client
+
+        lines = []
+        for msg in delta:
+            content = msg.content or ""
+            if len(content) > MAX_DELTA_MESSAGE_CHARS:
+                content = content[:MAX_DELTA_MESSAGE_CHARS] + "…"
+            lines.append(f"{msg.role.value}: {content}")
+
+        user_content = (
+            f"Resumen previo:\n{previous or '(sin resumen previo)'}\n\n"
+            f"Mensajes nuevos:\n" + "\n".join(lines)
+        )
+
+        client = await get_saptiva_client()
+        response = await client.chat_completion(
+            model=self.settings.context_summary_model,
+            messages=[
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": user_content},
+            ],
+            temperature=0.2,
+            max_tokens=self.settings.context_summary_max_tokens,
+            purpose=LLMPurpose.BACKGROUND,
+            hedge=True,
+        )
+
+        if not response or not response.choices:
+            return ""
+        message = response.choices[0].get("message", {}) or {}
+        return (message.get("content") or "").strip()
+
+    @staticmethod
+    def format_for_llm(summary: ConversationSummary) -> Dict[str, str]:
+        """Format the summary as a system message."""
+        return {
+            "role": "system",
+            "content": (
+                "## Resumen de la conversación previa\n\n"
+                f"{summary.text}\n\n"
+                "Los mensajes siguientes son los más recientes de la conversación."
+            ),
+        }
+
+    async def recent_messages_after(
+        self,
+        session_id: str,
+        summary: ConversationSummary,
+        skip_latest: bool = False,
+    ) -> List[RecentMessage]:
+        """
+        Get messages not covered by the summary, oldest first.
+
+        Bounded by recent window + trigger (the maximum unsummarized backlog
+        before a background update folds it in).
+
+        Args:
+            session_id: Chat session ID
+            summary: Active summary
+            skip_latest: Drop the most recent message (already-saved current turn)
+        """
+        limit = self.recent_window + self.settings.context_summary_trigger_messages
+        messages = await get_recent_messages(
+            session_id,
+            limit + (1 if skip_latest else 0),
+            after=summary.covered_until,
+        )
+        if skip_latest:
+            messages = messages[1:]
+        return list(reversed(messages))
+
+
+# Singleton (matches pattern from memory_service.py)
+_summary_service_instance: Optional[ConversationSummaryService] = None
+
+
+def get_conversation_summary_service() -> ConversationSummaryService:
+    """
+    Get singleton ConversationSummaryService instance.
+
+    Returns:
+        ConversationSummaryService singleton instance
+    """
+    global _summary_service_instance
+    if _summary_service_instance is None:
+        _summary_service_instance = ConversationSummaryService()
+    return _summary_service_instance
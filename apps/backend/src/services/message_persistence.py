@@ -0,0 +1,189 @@
+"""
+Message Persistence - single write path for new chat messages.
+
+Persisting a message used to cost several sequential round-trips on the
+critical path (message insert, session save, history event, two cache
+invalidations). MessagePersistence issues the MongoDB writes concurrently
+(the message insert, ONE atomic session update and the history event) and
+then a single Redis script that writes the message through to the
+recent-message window and drops the stale history caches.
+
+Message ids are generated client-side, so nothing has to wait for the insert.
+MongoDB transactions would serialize the writes and need a replica set, so
+the writes are independent and a failed insert rolls back the counter.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+import structlog
+
+from ..core.redis_cache import get_redis_cache
+from ..models.chat import (
+    ChatMessage as ChatMessageModel,
+    ChatSession as ChatSessionModel,
+    ConversationState,
+)
+from .recent_messages import RecentMessage
+
+logger = structlog.get_logger(__name__)
+
+
+class MessagePersistence:
+    """Persist a chat message and update its session with minimal round-trips."""
+
+    @staticmethod
+    def build_session_update(chat_session: ChatSessionModel, now: datetime) -> Dict[str, Any]:
+        """
+        Build the atomic session update for one new message.
+
+        Replaces the read-modify-save of ChatSession.add_message: the counter
+        is incremented server-side so concurrent writers cannot lose updates.
+        """
+        update: Dict[str, Any] = {
+            "$inc": {"message_count": 1},
+            "$set": {"updated_at": now, "last_message_at": now},
+        }
+
+        # P0-BE-UNIQ-EMPTY: Transition from DRAFT to ACTIVE on first message
+        if chat_session.state == ConversationState.DRAFT:
+            update["$set"]["state"] = ConversationState.ACTIVE.value
+            logger.info(
+                "State transition",
+                chat_id=chat_session.id,
+                user_id=chat_session.user_id,
+                from_state=ConversationState.DRAFT.value,
+                to_state=ConversationState.ACTIVE.value,
+                reason="first_message_received",
+                message_count=chat_session.message_count
+            )
+
+        return update
+
+    @staticmethod
+    def build_first_message_update(chat_id: Any, now: datetime) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Filter and update that set first_message_at only while it is unset.
+
+        Progressive Commitment: the first message sets it. It defaults to
+        null, which $min would keep (null sorts before any date), so the
+        update is guarded by the filter instead.
+        """
+        return {"_id": chat_id, "first_message_at": None}, {"$set": {"first_message_at": now}}
+
+    @staticmethod
+    async def persist(
+        chat_session: ChatSessionModel,
+        message: ChatMessageModel,
+        invalidate_research: bool = False
+    ) -> ChatMessageModel:
+        """
+        Persist a new message of ``chat_session``.
+
+        MongoDB: message insert, session update and history event run
+        concurrently. Redis: one script call, issued after the writes so no
+        reader can re-cache a timeline that misses the message.
+
+        Args:
+            chat_session: Session the message belongs to (refreshed in place)
+            message: Message to insert
+            invalidate_research: Also drop the research tasks cache
+
+        Returns:
+            The inserted message
+
+        Raises:
+            Exception: If the message insert fails
+        """
+        now = datetime.utcnow()
+        writes = [
+            message.insert(),
+            chat_session.update(MessagePersistence.build_session_update(chat_session, now)),
+            MessagePersistence._record_history(chat_session, message),
+        ]
+        if chat_session.first_message_at is None:
+            writes.append(MessagePersistence._set_first_message_at(chat_session, now))
+        insert_result, session_result, *_ = await asyncio.gather(*writes, return_exceptions=True)
+
+        if isinstance(insert_result, BaseException):
+            if not isinstance(session_result, BaseException):
+                await MessagePersistence._rollback_session_update(chat_session)
+            raise insert_result
+
+        if isinstance(session_result, BaseException):
+            # The message is stored; counters are repaired by the next update
+            logger.error(
+                "Failed to update session stats",
+                error=str(session_result),
+                chat_id=chat_session.id,
+                message_id=message.id
+            )
+
+        await MessagePersistence._commit_cache(chat_session, message, invalidate_research)
+        return message
+
+    @staticmethod
+    async def _set_first_message_at(chat_session: ChatSessionModel, now: datetime) -> None:
+        """Set first_message_at unless a concurrent first message already did."""
+        query, update = MessagePersistence.build_first_message_update(chat_session.id, now)
+        try:
+            result = await ChatSessionModel.find_one(query).update(update)
+            if getattr(result, "modified_count", 0):
+                chat_session.first_message_at = now
+        except Exception as e:
+            logger.error(
+                "Failed to set first message timestamp",
+                error=str(e),
+                chat_id=chat_session.id
+            )
+
+    @staticmethod
+    async def _record_history(chat_session: ChatSessionModel, message: ChatMessageModel) -> None:
+        """Record the message in unified history (so it appears after refresh)."""
+        try:
+            from .history_service import HistoryService
+            await HistoryService.record_chat_message(
+                chat_id=chat_session.id,
+                user_id=chat_session.user_id,
+                message=message,
+                invalidate_cache=False
+            )
+        except Exception as e:
+            # Don't fail message creation if history fails
+            logger.error(
+                "Failed to record message in unified history",
+                error=str(e),
+                chat_id=chat_session.id,
+                message_id=message.id
+            )
+
+    @staticmethod
+    async def _rollback_session_update(chat_session: ChatSessionModel) -> None:
+        """Undo the counter increment of a message that was never inserted."""
+        try:
+            await chat_session.update({"$inc": {"message_count": -1}})
+        except Exception as e:
+            logger.error(
+                "Failed to roll back session stats",
+                error=str(e),
+                chat_id=chat_session.id
+            )
+
+    @staticmethod
+    async def _commit_cache(
+        chat_session: ChatSessionModel,
+        message: ChatMessageModel,
+        invalidate_research: bool
+    ) -> None:
+        """Write-through + invalidation in a single Redis call. Never raises."""
+        try:
+            cache = await get_redis_cache()
+            await cache.commit_chat_message(
+                str(chat_session.id),
+                RecentMessage.from_model(message).to_dict(),
+                invalidate_research=invalidate_research
+            )
+        except Exception as e:
+            # Don't fail if cache invalidation fails
+            logger.warning("Failed to invalidate cache", error=str(e), chat_id=chat_session.id)
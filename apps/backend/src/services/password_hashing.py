@@ -0,0 +1,107 @@
+"""
+Bounded thread pool for password hashing.
+
+argon2 (and bcrypt/pbkdf2 for legacy hashes) takes tens to hundreds of
+milliseconds of CPU per call. Run inline in ``authenticate_user`` it blocks
+the event loop, so a login burst stalls every chat stream on the worker.
+
+Jobs run on a small dedicated executor (the hashing libraries release the
+GIL). Jobs queued or running are capped at ``workers + max_queue``; beyond
+that the call fails fast with a 503 instead of piling up behind the burst.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.exceptions import ServiceUnavailableError
+from ..core.telemetry import record_password_hash, record_password_hash_rejection
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusyError(ServiceUnavailableError):
+    """Raised when the hashing pool queue is full."""
+
+    def __init__(self):
+        super().__init__(
+            detail="Demasiadas solicitudes de inicio de sesión. Intenta de nuevo en unos segundos",
+            code="AUTH_BUSY",
+        )
+
+
+class PasswordHashingPool:
+    """Dedicated executor for password hashing with a queue-length limit."""
+
+    def __init__(self, workers: int = 2, max_queue: int = 32):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        # Jobs submitted and not finished (queued + running); only touched on the loop thread
+        self.pending = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    async def run(self, operation: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the pool; raises PasswordHashingBusyError when saturated."""
+        if self.pending >= self.capacity:
+            record_password_hash_rejection(operation)
+            logger.warning("Password hashing pool saturated", operation=operation, pending=self.pending)
+            raise PasswordHashingBusyError()
+
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            result = fn(*args)
+            record_password_hash(operation, started - submitted, time.perf_counter() - started)
+            return result
+
+        self.pending += 1
+        future = self._executor.submit(job)
+        # Release the slot when the job really finishes, even if the caller was cancelled
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        self.pending -= 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool_instance: Optional[PasswordHashingPool] = None
+
+
+def get_password_hashing_pool() -> PasswordHashingPool:
+    """
+    Get singleton PasswordHashingPool instance.
+
+    Returns:
+        PasswordHashingPool singleton instance
+    """
+    global _pool_instance
+    if _pool_instance is None:
+        settings = get_settings()
+        _pool_instance = PasswordHashingPool(
+            workers=settings.password_hash_workers,
+            max_queue=settings.password_hash_max_queue,
+        )
+    return _pool_instance
+
+
+def shutdown_password_hashing_pool() -> None:
+    """Shut down the pool's threads (application shutdown)."""
+    global _pool_instance
+    if _pool_instance is not None:
+        _pool_instance.shutdown()
+        _pool_instance = None
@@ -0,0 +1,268 @@
+"""
+Principal Cache - in-process cache of authenticated principals.
+
+Avoids repeating the full auth path (JWT decode, revocation GET in Redis and
+``User.get`` in MongoDB) on every request, which SSE reconnects and polling
+endpoints trigger constantly.
+
+Three pieces, all per process:
+    claims      token fingerprint -> decoded JWT claims, short TTL and never
+                past the token's own ``exp``
+    users       user id -> ``User`` snapshot, short TTL, evicted on updates
+    revocations Bloom filter mirroring the ``blacklist:*`` keys in Redis
+
+The Bloom filter has no false negatives, so a token it does not contain is
+known not to be revoked and the Redis GET is skipped; a positive (revoked or
+false positive) still goes to Redis. The mirror is only trusted while the
+pub/sub listener is subscribed to ``AUTH_INVALIDATION_CHANNEL``; until then,
+and after a dropped connection, every check falls back to Redis.
+"""
+
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.telemetry import telemetry
+from ..models.user import User
+from .cache_service import (
+    AUTH_INVALIDATION_CHANNEL,
+    BLACKLIST_PREFIX,
+    get_redis_client,
+    token_fingerprint,
+)
+
+logger = structlog.get_logger(__name__)
+
+RECONNECT_DELAY_SECONDS = 5.0
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over hex fingerprints (double hashing)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, fingerprint: str):
+        digest = hashlib.blake2b(fingerprint.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, fingerprint: str) -> None:
+        for pos in self._positions(fingerprint):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint))
+
+
+class PrincipalCache:
+    """Short-TTL cache of JWT claims and users, plus a revocation mirror."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        claims_ttl_seconds: float = 30,
+        user_ttl_seconds: float = 60,
+        max_entries: int = 10000,
+        bloom_capacity: int = 100000,
+        resync_interval_seconds: float = 3600,
+    ):
+        self.enabled = enabled
+        self.claims_ttl_seconds = claims_ttl_seconds
+        self.user_ttl_seconds = user_ttl_seconds
+        self.max_entries = max_entries
+        self.bloom_capacity = bloom_capacity
+        self.resync_interval_seconds = resync_interval_seconds
+
+        self._claims: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._users: "OrderedDict[str, Tuple[User, float]]" = OrderedDict()
+        self._revoked = BloomFilter(bloom_capacity)
+        self._synced = False
+        self._listener: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Claims
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def token_key(token: str) -> str:
+        return token_fingerprint(token)
+
+    def get_claims(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached claims for a token fingerprint, if still fresh."""
+        if not self.enabled:
+            return None
+        entry = self._claims.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._claims.move_to_end(key)
+            telemetry.track_cache_operation("get", "principal", True)
+            return dict(entry[0])
+        if entry is not None:
+            self._claims.pop(key, None)
+        telemetry.track_cache_operation("get", "principal", False)
+        return None
+
+    def put_claims(self, key: str, claims: Dict[str, Any]) -> None:
+        """Cache validated claims until the TTL or the token's ``exp``, whichever is first."""
+        if not self.enabled:
+            return
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        ttl = min(self.claims_ttl_seconds, exp - time.time())
+        if ttl <= 0:
+            return
+        self._claims[key] = (dict(claims), time.monotonic() + ttl)
+        self._claims.move_to_end(key)
+        while len(self._claims) > self.max_entries:
+            self._claims.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Users
+    # ------------------------------------------------------------------
+
+    def get_user(self, user_id: str) -> Optional[User]:
+        """Return a copy of the cached user snapshot, if still fresh."""
+        if not self.enabled:
+            return None
+        entry = self._users.get(user_id)
+        if entry is not None and entry[1] > time.monotonic():
+            self._users.move_to_end(user_id)
+            telemetry.track_cache_operation("get", "principal_user", True)
+            # Callers may mutate and save the user; never hand out the shared snapshot
+            return entry[0].model_copy(deep=True)
+        if entry is not None:
+            self._users.pop(user_id, None)
+        telemetry.track_cache_operation("get", "principal_user", False)
+        return None
+
+    def put_user(self, user: User) -> None:
+        if not self.enabled:
+            return
+        self._users[str(user.id)] = (user.model_copy(deep=True), time.monotonic() + self.user_ttl_seconds)
+        self._users.move_to_end(str(user.id))
+        while len(self._users) > self.max_entries:
+            self._users.popitem(last=False)
+
+    async def invalidate_user(self, user_id: str) -> None:
+        """Evict a user snapshot here and in every other worker."""
+        self._users.pop(str(user_id), None)
+        try:
+            client = await get_redis_client()
+            await client.publish(AUTH_INVALIDATION_CHANNEL, f"user:{user_id}")
+        except Exception as exc:
+            # Other workers fall back to their snapshot TTL
+            logger.warning("Failed to publish user invalidation", user_id=str(user_id), error=str(exc))
+
+    # ------------------------------------------------------------------
+    # Revocations
+    # ------------------------------------------------------------------
+
+    def might_be_revoked(self, key: str) -> bool:
+        """
+        False only when the token is known not to be revoked.
+
+        True means the caller must confirm with ``is_token_blacklisted``.
+        """
+        if not (self.enabled and self._synced):
+            return True
+        return key in self._revoked
+
+    def _handle_message(self, data: str) -> None:
+        kind, _, value = data.partition(":")
+        if kind == "token":
+            self._revoked.add(value)
+            self._claims.pop(value, None)
+        elif kind == "user":
+            self._users.pop(value, None)
+
+    async def _resync(self, client) -> None:
+        """Rebuild the revocation mirror from Redis (also sheds expired entries)."""
+        revoked = BloomFilter(self.bloom_capacity)
+        count = 0
+        async for redis_key in client.scan_iter(match=f"{BLACKLIST_PREFIX}*", count=1000):
+            revoked.add(token_fingerprint(redis_key[len(BLACKLIST_PREFIX):]))
+            count += 1
+        self._revoked = revoked
+        if count > self.bloom_capacity:
+            logger.warning(
+                "Revocation list exceeds Bloom capacity; more Redis lookups expected",
+                revoked=count,
+                capacity=self.bloom_capacity,
+            )
+        logger.info("Revocation mirror synced", revoked=count)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = None
+            try:
+                client = await get_redis_client()
+                pubsub = client.pubsub()
+                # Subscribe before scanning so no revocation falls between the two
+                await pubsub.subscribe(AUTH_INVALIDATION_CHANNEL)
+                await self._resync(client)
+                self._synced = True
+                next_resync = time.monotonic() + self.resync_interval_seconds
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message["type"] == "message":
+                        self._handle_message(message["data"])
+                    if time.monotonic() >= next_resync:
+                        await self._resync(client)
+                        next_resync = time.monotonic() + self.resync_interval_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Auth invalidation listener disconnected", error=str(exc))
+            finally:
+                # Messages may be missed while disconnected; stop trusting the mirror
+                self._synced = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def start(self) -> None:
+        """Start the pub/sub listener; returns immediately, sync happens in the background."""
+        if self.enabled and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._synced = False
+
+
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the process-wide principal cache."""
+    global _principal_cache
+    if _principal_cache is None:
+        settings = get_settings()
+        _principal_cache = PrincipalCache(
+            enabled=settings.auth_principal_cache_enabled,
+            claims_ttl_seconds=settings.auth_principal_cache_ttl_seconds,
+            user_ttl_seconds=settings.auth_user_cache_ttl_seconds,
+            max_entries=settings.auth_principal_cache_max_entries,
+            bloom_capacity=settings.auth_revocation_bloom_capacity,
+        )
+    return _principal_cache
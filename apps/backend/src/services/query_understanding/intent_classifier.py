@@ -13,9 +13,10 @@ Design Principles:
 """
 
 import re
-from typing import Tuple, Optional, List, Dict
+from typing import Tuple, Optional, Dict
 import structlog
 
+from ..text_matcher import PatternMatcher
 from .types import QueryIntent, QueryContext
 
 logger = structlog.get_logger(__name__)
@@ -89,6 +90,15 @@ class IntentClassifier:
             r'(mejor|peor|mayor|menor)\s+que',
         ]
 
+        # Each pattern list compiled once into a single alternation regex
+        self.overview_matcher = PatternMatcher(self.overview_patterns, re.IGNORECASE)
+        self.specific_fact_matcher = PatternMatcher(self.specific_fact_patterns, re.IGNORECASE)
+        self.procedural_matcher = PatternMatcher(self.procedural_patterns, re.IGNORECASE)
+        self.analytical_matcher = PatternMatcher(self.analytical_patterns, re.IGNORECASE)
+        self.definitional_matcher = PatternMatcher(self.definitional_patterns, re.IGNORECASE)
+        self.quantitative_matcher = PatternMatcher(self.quantitative_patterns, re.IGNORECASE)
+        self.comparison_matcher = PatternMatcher(self.comparison_patterns, re.IGNORECASE)
+
     def classify(self, query: str, context: QueryContext) -> Tuple[QueryIntent, float, str]:
         """
         Classify query intent.
@@ -142,10 +152,13 @@ class IntentClassifier:
             (intent, confidence, reasoning) or None if no match
         """
 
+        # Clean query once: remove question marks and exclamation marks
+        query = re.sub(r'[¿?¡!]', '', query)
+
         # Priority order: Most specific patterns first
 
         # 1. Overview (very distinctive patterns)
-        if self._matches_any(query, self.overview_patterns):
+        if self.overview_matcher.matches(query):
             return (
                 QueryIntent.OVERVIEW,
                 0.95,
@@ -153,7 +166,7 @@ class IntentClassifier:
             )
 
         # 2. Quantitative (numbers/amounts)
-        if self._matches_any(query, self.quantitative_patterns):
+        if self.quantitative_matcher.matches(query):
             return (
                 QueryIntent.QUANTITATIVE,
                 0.90,
@@ -161,7 +174,7 @@ class IntentClassifier:
             )
 
         # 3. Comparison
-        if self._matches_any(query, self.comparison_patterns):
+        if self.comparison_matcher.matches(query):
             return (
                 QueryIntent.COMPARISON,
                 0.90,
@@ -169,7 +182,7 @@ class IntentClassifier:
             )
 
         # 4. Definitional
-        if self._matches_any(query, self.definitional_patterns):
+        if self.definitional_matcher.matches(query):
             return (
                 QueryIntent.DEFINITIONAL,
                 0.85,
@@ -177,7 +190,7 @@ class IntentClassifier:
             )
 
         # 5. Procedural (how-to questions)
-        if self._matches_any(query, self.procedural_patterns):
+        if self.procedural_matcher.matches(query):
             return (
                 QueryIntent.PROCEDURAL,
                 0.85,
@@ -185,7 +198,7 @@ class IntentClassifier:
             )
 
         # 6. Analytical (why questions)
-        if self._matches_any(query, self.analytical_patterns):
+        if self.analytical_matcher.matches(query):
             return (
                 QueryIntent.ANALYTICAL,
                 0.85,
@@ -193,7 +206,7 @@ class IntentClassifier:
             )
 
         # 7. Specific fact (broadest category)
-        if self._matches_any(query, self.specific_fact_patterns):
+        if self.specific_fact_matcher.matches(query):
             return (
                 QueryIntent.SPECIFIC_FACT,
                 0.80,
@@ -203,8 +216,3 @@ class IntentClassifier:
         # No match
         return None
 
-    def _matches_any(self, query: str, patterns: List[str]) -> bool:
-        """Check if query matches any pattern in the list."""
-        # Clean query: remove question marks and exclamation marks
-        query_clean = re.sub(r'[¿?¡!]', '', query)
-        return any(re.search(pattern, query_clean, re.IGNORECASE) for pattern in patterns)
@@ -0,0 +1,147 @@
+"""
+Recent Message Window - shared read path for chat context builders.
+
+MessagePersistence writes every new message through to a per-chat capped
+Redis list. Context builders (memory context, rolling summary, clarification
+detection, payload builder) read the window from Redis and only fall back to
+MongoDB on a miss, repopulating the cache.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.redis_cache import get_redis_cache
+from ..core.telemetry import telemetry
+from ..models.chat import ChatMessage as ChatMessageModel, MessageRole
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RecentMessage:
+    """Lightweight message snapshot used to build LLM context."""
+
+    id: str
+    role: MessageRole
+    content: str
+    created_at: datetime
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, message: ChatMessageModel) -> "RecentMessage":
+        return cls(
+            id=str(message.id),
+            role=MessageRole(message.role),
+            content=message.content or "",
+            created_at=message.created_at,
+            metadata=message.metadata or {},
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecentMessage":
+        return cls(
+            id=data["id"],
+            role=MessageRole(data["role"]),
+            content=data.get("content", ""),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            metadata=data.get("metadata") or {},
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "role": self.role.value,
+            "content": self.content,
+            "created_at": self.created_at.isoformat(),
+            "metadata": self.metadata,
+        }
+
+
+async def get_recent_messages(
+    chat_id: str,
+    limit: int,
+    after: Optional[datetime] = None,
+) -> List[RecentMessage]:
+    """
+    Get the most recent messages of a chat, newest first.
+
+    Mirrors ``ChatMessage.find(chat_id).sort(-created_at).limit(limit)``,
+    optionally restricted to messages created after ``after``.
+
+    Args:
+        chat_id: Chat session ID
+        limit: Max messages to return
+        after: Only return messages with created_at > after
+
+    Returns:
+        List of RecentMessage, newest first
+    """
+    chat_id = str(chat_id)
+    settings = get_settings()
+    capacity = settings.recent_messages_cache_size
+    generation = None
+
+    if limit <= capacity:
+        cache = await get_redis_cache()
+        cached, generation = await cache.get_recent_messages(chat_id, capacity)
+
+        if cached is not None:
+            try:
+                window = [RecentMessage.from_dict(item) for item in cached]
+                selected = _select(window, limit, after, complete=len(window) < capacity)
+                if selected is not None:
+                    telemetry.track_cache_operation("recent_messages", "redis", hit=True)
+                    return selected
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("recent_messages.decode_failed", chat_id=chat_id, error=str(e))
+
+    telemetry.track_cache_operation("recent_messages", "redis", hit=False)
+
+    # MongoDB fallback: load the full window so the cache can serve every reader
+    fetch_limit = max(limit, capacity)
+    docs = await ChatMessageModel.find(
+        ChatMessageModel.chat_id == chat_id
+    ).sort(-ChatMessageModel.created_at).limit(fetch_limit).to_list()
+    window = [RecentMessage.from_model(doc) for doc in docs]
+
+    if generation is not None:
+        cache = await get_redis_cache()
+        await cache.populate_recent_messages(
+            chat_id,
+            [msg.to_dict() for msg in window[:capacity]],
+            generation
+        )
+
+    return _select(window, limit, after, complete=True) or []
+
+
+def _select(
+    window: List[RecentMessage],
+    limit: int,
+    after: Optional[datetime],
+    complete: bool,
+) -> Optional[List[RecentMessage]]:
+    """
+    Pick up to ``limit`` messages (newest first) from a window.
+
+    Returns None when the window cannot prove it holds every requested
+    message (it is at capacity and never reached ``after``).
+    """
+    if after is None:
+        if len(window) >= limit or complete:
+            return window[:limit]
+        return None
+
+    selected = []
+    for msg in window:
+        if msg.created_at <= after:
+            return selected
+        selected.append(msg)
+        if len(selected) >= limit:
+            return selected
+
+    return selected if complete else None
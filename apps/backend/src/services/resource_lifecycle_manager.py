@@ -146,9 +146,15 @@ class ResourceLifecycleManager:
 
         # Buscar documento con mismo hash del mismo usuario
         existing_doc = await Document.find_one({
-            "metadata.file_hash": file_hash,
-            "user_id": user_id
+            "user_id": user_id,
+            "content_hash": file_hash
         })
+        if existing_doc is None:
+            # Documentos subidos antes de guardar content_hash
+            existing_doc = await Document.find_one({
+                "metadata.file_hash": file_hash,
+                "user_id": user_id
+            })
 
         if existing_doc:
             logger.info(
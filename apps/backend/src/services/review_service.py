@@ -27,6 +27,7 @@ from ..schemas.review import ReviewStartRequest
 from .languagetool_client import languagetool_client
 # NOTE: color_auditor moved to plugins/capital414-private (Plugin-First Architecture)
 # from .color_auditor import color_auditor
+from .llm_concurrency import LLMPurpose
 from .saptiva_client import saptiva_client
 
 logger = structlog.get_logger(__name__)
@@ -385,6 +386,7 @@ Esquema JSON por bloque:
                     ],
                     temperature=0.3,
                     max_tokens=800,
+                    purpose=LLMPurpose.BACKGROUND,
                 )
 
                 content = llm_response.choices[0]["message"]["content"]
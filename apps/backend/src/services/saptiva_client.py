@@ -14,10 +14,20 @@ from fastapi import HTTPException  # FIX ISSUE-017: For timeout exception handli
 from pydantic import BaseModel
 
 from ..core.config import get_settings
+from ..core.telemetry import record_llm_hedge, record_llm_retry_budget_exhausted
+from .llm_concurrency import (
+    LLMPurpose,
+    get_concurrency_governor,
+    get_latency_tracker,
+    get_retry_budget,
+)
 from .settings_service import load_saptiva_api_key
 import structlog
 logger = structlog.get_logger(__name__)
 
+# Hedge a request once it has been outstanding longer than this latency quantile
+HEDGE_QUANTILE = 0.95
+
 _global_mock_mode: bool = False
 _global_mock_reason: Optional[str] = None
 
@@ -100,6 +110,12 @@ class SaptivaClient:
         connect_timeout = float(os.getenv("SAPTIVA_CONNECT_TIMEOUT", "10.0"))
         read_timeout = float(os.getenv("SAPTIVA_READ_TIMEOUT", "120.0"))
 
+        # Per-purpose bulkheads with adaptive limits share this pool
+        self.governor = get_concurrency_governor()
+        self.retry_budget = get_retry_budget()
+        self.latency_tracker = get_latency_tracker()
+        self.hedging_enabled = getattr(self.settings, 'saptiva_hedging_enabled', True)
+
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(
                 timeout=self.timeout,           # Total timeout (default 30s)
@@ -107,7 +123,7 @@ class SaptivaClient:
                 read=read_timeout,              # Read timeout (120s para streaming)
                 write=10.0                      # Write timeout
             ),
-            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),  # Más conexiones concurrentes
+            limits=httpx.Limits(max_connections=self.governor.capacity, max_keepalive_connections=20),
             follow_redirects=True,  # Enable redirects: Saptiva redirects /completions to /completions/
             http2=True,  # Habilitar HTTP/2 para mejor performance
             headers={
@@ -164,9 +180,17 @@ class SaptivaClient:
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        stream: bool = False
+        stream: bool = False,
+        purpose: LLMPurpose = LLMPurpose.INTERACTIVE,
+        hedge: bool = False
     ) -> httpx.Response:
-        """Realizar request HTTP con retry logic"""
+        """
+        Realizar request HTTP con retry logic (cada intento ocupa un slot del bulkhead).
+
+        Los reintentos (y hedges) consumen el retry budget global. Con hedge=True
+        (solo llamadas idempotentes sin streaming) se envía un segundo request si el
+        primero supera el p95 observado y se usa el que responda primero.
+        """
         # Construct URL manually to avoid urljoin issues with redirects
         url = f"{self.base_url.rstrip('/')}{endpoint}"
 
@@ -174,37 +198,17 @@ class SaptivaClient:
         if self.allow_mock_fallback and not self.force_mock:
             retries = 0
 
+        hedge = hedge and not stream and self.hedging_enabled
+        self.retry_budget.record_request()
+
         for attempt in range(retries + 1):
             try:
-                if stream:
-                    # Para streaming, no usar context manager
-                    response = await self.client.request(
-                        method=method,
-                        url=url,
-                        json=data if data else None
-                    )
-                else:
-                    response = await self.client.request(
-                        method=method,
-                        url=url,
-                        json=data if data else None
-                    )
-
-                # Handle redirects explicitly (Saptiva redirects but the target URL may not work)
-                if response.status_code in (301, 302, 307, 308):
-                    redirect_url = response.headers.get("Location", "")
-                    logger.warning(
-                        "SAPTIVA API returned redirect, may indicate incorrect endpoint",
-                        status_code=response.status_code,
-                        redirect_to=redirect_url,
-                        original_url=url
-                    )
-
-                response.raise_for_status()
-                return response
+                if hedge:
+                    return await self._send_hedged(method, url, data, purpose)
+                return await self._send(method, url, data, purpose)
 
             except httpx.HTTPError as e:
-                if attempt < retries:
+                if attempt < retries and self.retry_budget.try_acquire():
                     wait_time = min(2 ** attempt, 10)
                     logger.warning(
                         "SAPTIVA request failed, retrying",
@@ -213,6 +217,15 @@ class SaptivaClient:
                         wait_time=wait_time
                     )
                     await asyncio.sleep(wait_time)
+                elif attempt < retries:
+                    record_llm_retry_budget_exhausted(purpose.value, "retry")
+                    logger.error(
+                        "SAPTIVA request failed, retry budget exhausted",
+                        error=str(e),
+                        endpoint=endpoint,
+                        attempt=attempt + 1
+                    )
+                    raise
                 else:
                     logger.error(
                         "SAPTIVA request failed after all retries",
@@ -221,6 +234,90 @@ class SaptivaClient:
                     )
                     raise
 
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        purpose: LLMPurpose
+    ) -> httpx.Response:
+        """Un único intento HTTP dentro de un slot del bulkhead."""
+        async with self.governor.slot(purpose) as slot:
+            response = await self.client.request(
+                method=method,
+                url=url,
+                json=data if data else None
+            )
+            slot.record(response.status_code)
+
+            # Handle redirects explicitly (Saptiva redirects but the target URL may not work)
+            if response.status_code in (301, 302, 307, 308):
+                redirect_url = response.headers.get("Location", "")
+                logger.warning(
+                    "SAPTIVA API returned redirect, may indicate incorrect endpoint",
+                    status_code=response.status_code,
+                    redirect_to=redirect_url,
+                    original_url=url
+                )
+
+            response.raise_for_status()
+            return response
+
+    async def _timed_send(self, key: str, *args) -> httpx.Response:
+        """_send que registra la latencia de los intentos exitosos."""
+        started = time.monotonic()
+        response = await self._send(*args)
+        self.latency_tracker.record(key, time.monotonic() - started)
+        return response
+
+    async def _send_hedged(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]],
+        purpose: LLMPurpose
+    ) -> httpx.Response:
+        """Enviar un request y, si tarda más que el p95, un segundo en paralelo."""
+        key = f"{purpose.value}:{(data or {}).get('model', url)}"
+        args = (method, url, data, purpose)
+        primary = asyncio.create_task(self._timed_send(key, *args))
+        tasks = [primary]
+
+        delay = self.latency_tracker.percentile(key, HEDGE_QUANTILE)
+        try:
+            if delay is None:
+                return await primary
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            if not self.retry_budget.try_acquire():
+                record_llm_retry_budget_exhausted(purpose.value, "hedge")
+                return await primary
+
+            record_llm_hedge(purpose.value, "sent")
+            logger.info("SAPTIVA hedged request sent", purpose=purpose.value, hedge_delay=round(delay, 3))
+            hedged = asyncio.create_task(self._timed_send(key, *args))
+            tasks.append(hedged)
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedged:
+                            record_llm_hedge(purpose.value, "won")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # Loser (or both, if the caller was cancelled) releases its slot
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -228,7 +325,9 @@ class SaptivaClient:
         temperature: float = 0.7,
         max_tokens: int = 1024,
         stream: bool = False,
-        tools: Optional[List[str]] = None
+        tools: Optional[List[str]] = None,
+        purpose: LLMPurpose = LLMPurpose.INTERACTIVE,
+        hedge: bool = False
     ) -> SaptivaResponse:
         """
         Generar respuesta de chat usando SAPTIVA API
@@ -240,6 +339,8 @@ class SaptivaClient:
             max_tokens: Máximo número de tokens
             stream: Si usar streaming
             tools: Herramientas habilitadas
+            purpose: Bulkhead de concurrencia (interactive, background, classification)
+            hedge: Enviar un request de respaldo tras el p95 (solo llamadas idempotentes)
 
         Returns:
             Respuesta del modelo SAPTIVA
@@ -290,7 +391,9 @@ class SaptivaClient:
                 method="POST",
                 endpoint="/v1/chat/completions/",
                 data=request_data,
-                stream=stream
+                stream=stream,
+                purpose=purpose,
+                hedge=hedge
             )
 
             result = response.json()
@@ -323,13 +426,15 @@ class SaptivaClient:
         temperature: float = 0.7,
         max_tokens: int = 1024,
         tools: Optional[List[str]] = None,
-        timeout: int = 120  # FIX ISSUE-017: Default 2 minutes timeout
+        timeout: int = 120,  # FIX ISSUE-017: Default 2 minutes timeout
+        purpose: LLMPurpose = LLMPurpose.INTERACTIVE
     ) -> AsyncGenerator[SaptivaStreamChunk, None]:
         """
         Generar respuesta de chat con streaming usando SAPTIVA API
 
         Args:
             timeout: Timeout in seconds for the entire streaming operation (default: 120s)
+            purpose: Bulkhead de concurrencia; el slot se ocupa hasta que termina el stream
         """
 
         # Validar API key
@@ -375,11 +480,14 @@ class SaptivaClient:
                 async with asyncio.timeout(timeout):
                     # Hacer streaming request (Saptiva requires trailing slash)
                     url = f"{self.base_url.rstrip('/')}/v1/chat/completions/"
-                    async with self.client.stream(
+                    async with self.governor.slot(purpose) as slot, self.client.stream(
                         "POST",
                         url,
                         json=request_data
                     ) as response:
+                        # Time-to-first-byte drives the adaptive limit
+                        slot.record(response.status_code)
+
                         # Log error details before raising
                         if response.status_code >= 400:
                             error_body = await response.aread()
@@ -460,7 +568,8 @@ class SaptivaClient:
         temperature: float = 0.7,
         max_tokens: int = 1024,
         stream: bool = False,
-        tools: Optional[List[str]] = None
+        tools: Optional[List[str]] = None,
+        purpose: LLMPurpose = LLMPurpose.INTERACTIVE
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         BE-3 MVP: Unified wrapper for streaming and non-streaming completions.
@@ -496,7 +605,8 @@ class SaptivaClient:
                 model=model,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                tools=tools
+                tools=tools,
+                purpose=purpose
             ):
                 yield {"type": "chunk", "data": chunk}
         else:
@@ -507,7 +617,8 @@ class SaptivaClient:
                 temperature=temperature,
                 max_tokens=max_tokens,
                 stream=False,
-                tools=tools
+                tools=tools,
+                purpose=purpose
             )
 
             # Extract content from response
@@ -648,7 +759,9 @@ class SaptivaClient:
             return list(self.model_mapping.keys())
 
         try:
-            response = await self._make_request("GET", "/v1/models")
+            response = await self._make_request(
+                "GET", "/v1/models", purpose=LLMPurpose.BACKGROUND
+            )
             models_data = response.json()
             return [model["id"] for model in models_data.get("data", [])]
         except Exception as e:
@@ -728,8 +841,8 @@ async def build_messages(
             {"role": "user", "content": "Contexto:\\n{...}\\n\\nSolicitud:\\nHola"}
         ]
     """
-    from ..models.chat import ChatMessage as ChatMessageModel
     from ..core.config import get_settings
+    from .recent_messages import get_recent_messages
 
     messages = []
 
@@ -756,9 +869,7 @@ async def build_messages(
             # because it was already saved to DB before build_messages() is called.
             # We fetch recent_limit + 1 messages, skip the first one (most recent),
             # and use the next recent_limit messages as history.
-            all_recent = await ChatMessageModel.find(
-                ChatMessageModel.chat_id == chat_id
-            ).sort(-ChatMessageModel.created_at).limit(recent_limit + 1).to_list()
+            all_recent = await get_recent_messages(chat_id, recent_limit + 1)
 
             # Skip the first message (most recent = current user message just saved)
             recent_messages = all_recent[1:] if len(all_recent) > 0 else []
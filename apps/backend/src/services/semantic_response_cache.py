@@ -0,0 +1,261 @@
+"""
+Semantic Response Cache - reuse answers to repeated document questions.
+
+Opt-in via SEMANTIC_CACHE_ENABLED. Answers are scoped by the owner, the
+content hashes of the attached documents, the model and the system-prompt
+hash, so a changed document, model or prompt never serves a stale answer.
+Within a scope a new question is compared against cached questions by
+embedding similarity, and an answer is only reused above a strict threshold.
+
+Redis layout:
+    semantic_cache:{scope}        capped list of JSON entries, newest first
+    semantic_cache:doc:{hash}     set of scopes built on a document's content
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Union
+
+import structlog
+from beanie import PydanticObjectId
+from beanie.operators import In
+from pydantic import BaseModel
+
+from ..core.config import get_settings
+from ..core.redis_cache import get_redis_cache
+from ..core.telemetry import telemetry
+from ..models.document import Document, DocumentStatus
+from .embedding_service import get_embedding_service
+
+logger = structlog.get_logger(__name__)
+
+KEY_PREFIX = "semantic_cache"
+# Embeddings are stored rounded to keep entries small; well below the threshold resolution
+EMBEDDING_PRECISION = 5
+
+
+class _DocumentHashView(BaseModel):
+    """Projection used to read content hashes without loading pages."""
+
+    user_id: Union[str, PydanticObjectId]
+    content_hash: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """Answer served from the cache."""
+
+    answer: str
+    question: str
+    similarity: float
+    cached_at: str
+
+
+@dataclass
+class CacheLookup:
+    """Result of a lookup; carries what ``store`` needs on a miss."""
+
+    scope: str
+    content_hashes: List[str]
+    embedding: List[float]
+    hit: Optional[CachedAnswer] = None
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Summary persisted in the assistant message metadata."""
+        metadata: Dict[str, Any] = {"hit": self.hit is not None}
+        if self.hit is not None:
+            metadata["similarity"] = round(self.hit.similarity, 4)
+            metadata["cached_at"] = self.hit.cached_at
+        return metadata
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if not norm:
+        return []
+    return [round(value / norm, EMBEDDING_PRECISION) for value in vector]
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    # Both vectors are unit length, so the dot product is the cosine
+    if len(a) != len(b):
+        return 0.0
+    return sum(x * y for x, y in zip(a, b))
+
+
+def build_scope(user_id: str, content_hashes: List[str], model: str, system_hash: str) -> str:
+    """Hash everything an answer depends on besides the question itself."""
+    material = "|".join([user_id, model, system_hash, *sorted(content_hashes)])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()[:32]
+
+
+class SemanticResponseCache:
+    """Embedding-matched answer cache for document Q&A."""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self._pending: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.settings.semantic_cache_enabled
+
+    @staticmethod
+    def _scope_key(scope: str) -> str:
+        return f"{KEY_PREFIX}:{scope}"
+
+    @staticmethod
+    def _document_key(content_hash: str) -> str:
+        return f"{KEY_PREFIX}:doc:{content_hash}"
+
+    async def _content_hashes(self, document_ids: List[str], user_id: str) -> Optional[List[str]]:
+        """Content hashes of the user's ready documents, or None if any is unknown."""
+        try:
+            object_ids = [PydanticObjectId(doc_id) for doc_id in document_ids]
+        except Exception:
+            return None
+
+        documents = await Document.find(
+            In(Document.id, object_ids),
+            Document.status == DocumentStatus.READY,
+            projection_model=_DocumentHashView,
+        ).to_list()
+
+        # user_id may be stored as a string or an ObjectId
+        hashes = [doc.content_hash for doc in documents if str(doc.user_id) == str(user_id)]
+        if len(hashes) != len(object_ids) or not all(hashes):
+            return None
+        return hashes
+
+    async def _embed(self, question: str) -> List[float]:
+        # encode_single is CPU-bound; keep it off the event loop
+        embedding = await asyncio.to_thread(get_embedding_service().encode_single, question)
+        return _normalize(embedding)
+
+    async def lookup(
+        self,
+        question: str,
+        document_ids: List[str],
+        user_id: str,
+        model: str,
+        system_hash: str,
+    ) -> Optional[CacheLookup]:
+        """
+        Find a cached answer for a question over the given documents.
+
+        Returns:
+            CacheLookup (with ``hit`` set on a match), or None when the request
+            cannot be cached (disabled, unhashed documents, embedding failure)
+        """
+        if not self.enabled or not document_ids:
+            return None
+
+        try:
+            content_hashes = await self._content_hashes(document_ids, user_id)
+            if content_hashes is None:
+                return None
+
+            embedding = await self._embed(question)
+            if not embedding:
+                return None
+
+            scope = build_scope(user_id, content_hashes, model, system_hash)
+            cache = await get_redis_cache()
+            raw_entries = await cache.client.lrange(self._scope_key(scope), 0, -1)
+        except Exception as exc:
+            logger.warning("Semantic cache lookup failed", error=str(exc))
+            return None
+
+        lookup = CacheLookup(scope=scope, content_hashes=content_hashes, embedding=embedding)
+        best_similarity = 0.0
+        for raw in raw_entries:
+            entry = json.loads(raw)
+            similarity = _cosine(embedding, entry["embedding"])
+            if similarity >= self.settings.semantic_cache_threshold and similarity > best_similarity:
+                best_similarity = similarity
+                lookup.hit = CachedAnswer(
+                    answer=entry["answer"],
+                    question=entry["question"],
+                    similarity=similarity,
+                    cached_at=entry["created_at"],
+                )
+
+        telemetry.track_cache_operation("semantic_response", "redis", lookup.hit is not None)
+        logger.info(
+            "Semantic cache lookup",
+            hit=lookup.hit is not None,
+            similarity=round(best_similarity, 4) if lookup.hit else None,
+            candidates=len(raw_entries),
+        )
+        return lookup
+
+    async def store(self, lookup: CacheLookup, question: str, answer: str) -> None:
+        """Add an answer to the scope of a missed lookup."""
+        entry = json.dumps({
+            "question": question,
+            "answer": answer,
+            "embedding": lookup.embedding,
+            "created_at": datetime.utcnow().isoformat(),
+        })
+        ttl = self.settings.semantic_cache_ttl_seconds
+        scope_key = self._scope_key(lookup.scope)
+
+        try:
+            cache = await get_redis_cache()
+            pipe = cache.client.pipeline()
+            pipe.lpush(scope_key, entry)
+            pipe.ltrim(scope_key, 0, self.settings.semantic_cache_max_entries - 1)
+            pipe.expire(scope_key, ttl)
+            for content_hash in lookup.content_hashes:
+                document_key = self._document_key(content_hash)
+                pipe.sadd(document_key, lookup.scope)
+                pipe.expire(document_key, ttl)
+            await pipe.execute()
+        except Exception as exc:
+            logger.warning("Semantic cache store failed", error=str(exc))
+
+    def store_in_background(self, lookup: CacheLookup, question: str, answer: str) -> None:
+        """Schedule ``store`` without delaying the response."""
+        task = asyncio.create_task(self.store(lookup, question, answer))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def invalidate_document(self, content_hash: Optional[str]) -> int:
+        """
+        Drop every cached answer built on a document's content.
+
+        Returns:
+            Number of scopes removed
+        """
+        if not content_hash:
+            return 0
+
+        document_key = self._document_key(content_hash)
+        try:
+            cache = await get_redis_cache()
+            scopes = await cache.client.smembers(document_key)
+            keys = [self._scope_key(scope) for scope in scopes]
+            await cache.client.delete(*keys, document_key)
+        except Exception as exc:
+            logger.warning("Semantic cache invalidation failed", error=str(exc))
+            return 0
+
+        logger.info("Semantic cache invalidated", content_hash=content_hash[:16], scopes=len(keys))
+        return len(keys)
+
+
+_semantic_response_cache: Optional[SemanticResponseCache] = None
+
+
+def get_semantic_response_cache() -> SemanticResponseCache:
+    """Get or create the semantic response cache singleton."""
+    global _semantic_response_cache
+
+    if _semantic_response_cache is None:
+        _semantic_response_cache = SemanticResponseCache()
+
+    return _semantic_response_cache
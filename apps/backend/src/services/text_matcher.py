@@ -0,0 +1,150 @@
+"""
+Compiled multi-pattern matchers.
+
+Keyword sets and regex lists are compiled once into a single alternation
+regex, so a message is scanned in one pass instead of one ``re.search`` per
+pattern. Used by the memory fact extractor, the query-understanding and
+intent classifiers, and the bank-query keyword fast paths.
+
+Usage:
+    BANKS = KeywordMatcher(["invex", "bbva", "banorte"], word_boundary=True)
+    BANKS.search("El IMOR de INVEX")        # -> "invex"
+    BANKS.find_all("BBVA vs Banorte")        # -> {"bbva", "banorte"}
+"""
+
+import re
+from typing import Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
+
+# Matches nothing; used when a matcher is built from an empty set
+_NEVER = r"(?!)"
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a prefix-factored alternation from literal keywords.
+
+    ``re`` tries alternatives one by one, so a flat ``a|b|c`` over hundreds of
+    keywords is slower than substring tests. Factoring shared prefixes
+    ("ban(?:co(?:s)?|orte)") leaves one branch to try per character, which
+    behaves like an automaton. Optional suffixes are greedy, so the longest
+    keyword wins at a given offset.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = None  # terminal marker
+
+    def render(node: dict) -> str:
+        branches = [
+            re.escape(char) + render(child)
+            for char, child in sorted(node.items(), key=lambda item: item[0])
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return render(trie)
+
+
+class KeywordMatcher:
+    """
+    Literal keyword set compiled into one case-insensitive alternation.
+
+    Keywords are factored into a prefix trie, so at a given offset the longest
+    keyword wins ("cartera vencida" over "cartera"). Scans report a hit at
+    every offset where a keyword starts, including overlapping ones.
+
+    Args:
+        keywords: Literal keywords (stored lowercased)
+        word_boundary: Only match whole words (``\\b`` on both sides)
+    """
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = False):
+        self.keywords = frozenset(keyword.lower() for keyword in keywords if keyword)
+        self.word_boundary = word_boundary
+
+        alternation = _trie_pattern(self.keywords)
+        if not alternation:
+            alternation = _NEVER
+        elif word_boundary:
+            alternation = rf"\b(?:{alternation})\b"
+
+        self._regex = re.compile(alternation, re.IGNORECASE)
+        # Zero-width lookahead so finditer can report overlapping hits
+        self._scanner = re.compile(rf"(?=({alternation}))", re.IGNORECASE)
+
+    def matches(self, text: str) -> bool:
+        """Return True if any keyword occurs in the text."""
+        return self._regex.search(text) is not None
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the leftmost keyword found in the text, or None."""
+        match = self._regex.search(text)
+        return match.group(0).lower() if match else None
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Yield ``(keyword, start)`` for every hit, in text order."""
+        for match in self._scanner.finditer(text):
+            yield match.group(1).lower(), match.start()
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return every distinct keyword found in the text."""
+        return {keyword for keyword, _ in self.finditer(text)}
+
+
+class PatternMatcher:
+    """
+    Regex list compiled into one alternation with a named group per pattern.
+
+    At a given offset patterns are tried in the order given and the first one
+    that matches is reported. ``find_all`` scans for non-overlapping hits, so
+    it suits patterns that match distinct tokens (years, regions, keywords).
+    Patterns must not use numbered backreferences, since group numbers shift
+    once they are combined.
+
+    Args:
+        patterns: Regexes, as a list or a ``label -> regex`` mapping
+            (list entries are labelled by their own source)
+        flags: ``re`` flags applied to the combined expression
+    """
+
+    def __init__(
+        self,
+        patterns: Union[Iterable[str], Mapping[str, str]],
+        flags: int = 0,
+    ):
+        if isinstance(patterns, Mapping):
+            items = list(patterns.items())
+        else:
+            items = [(pattern, pattern) for pattern in patterns]
+
+        self.labels: List[str] = [label for label, _ in items]
+        self._group_labels = {f"p{index}": label for index, label in enumerate(self.labels)}
+
+        alternation = "|".join(
+            f"(?P<p{index}>{pattern})" for index, (_, pattern) in enumerate(items)
+        ) or _NEVER
+
+        self._regex = re.compile(alternation, flags)
+
+    def matches(self, text: str) -> bool:
+        """Return True if any pattern matches the text."""
+        return self._regex.search(text) is not None
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the label of the leftmost matching pattern, or None."""
+        match = self._regex.search(text)
+        return self._group_labels[match.lastgroup] if match else None
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the labels of every pattern that matches somewhere in the text."""
+        return {
+            self._group_labels[match.lastgroup]
+            for match in self._regex.finditer(text)
+        }
@@ -0,0 +1,166 @@
+"""
+Tool Cache Warmup - run document tools as soon as ingestion completes.
+
+When a document reaches READY, the configured MCP tools are run for it in
+the background so the first audit or analysis in chat is a cache hit. The
+warmup is low priority: a small worker pool drains a bounded queue (new
+documents are dropped, not queued, when it is full) and tools whose result
+is already fresh are skipped.
+
+Cache params must match the ones readers use (ToolExecutionService), or the
+warmed entry is never hit, so only tools with a cache reader have a spec.
+Tools that are not registered in this environment are skipped, not counted
+as failures.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.constants import TOOL_NAME_EXCEL
+from ..core.telemetry import record_tool_cache_warmup, record_tool_cache_warmup_queue
+from .mcp_cache import warmup_tool_cache
+
+logger = structlog.get_logger(__name__)
+
+EXCEL_CONTENT_TYPES = frozenset({
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.ms-excel",
+})
+
+
+@dataclass(frozen=True)
+class WarmupSpec:
+    """How a tool is warmed: its cache params and the documents it applies to."""
+
+    params: Optional[dict]
+    content_types: frozenset
+
+
+WARMUP_SPECS: Dict[str, WarmupSpec] = {
+    # Read by ToolExecutionService.invoke_relevant_tools
+    TOOL_NAME_EXCEL: WarmupSpec(params={"operations": ["stats", "preview"]}, content_types=EXCEL_CONTENT_TYPES),
+}
+
+
+@dataclass(frozen=True)
+class WarmupJob:
+    doc_id: str
+    user_id: str
+    content_type: str
+
+
+class ToolCacheWarmer:
+    """Bounded background queue that warms tool results for ingested documents."""
+
+    def __init__(
+        self,
+        tools: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
+        settings = get_settings()
+        if tools is None:
+            tools = [t.strip() for t in settings.mcp_warmup_tools.split(",") if t.strip()]
+        self.tools = [t for t in tools if t in WARMUP_SPECS]
+        self.concurrency = concurrency or settings.mcp_warmup_concurrency
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size or settings.mcp_warmup_queue_size)
+        self._workers: List[asyncio.Task] = []
+        self._outcomes: Dict[str, Dict[str, int]] = {
+            tool: {"warmed": 0, "skipped": 0, "failed": 0, "dropped": 0} for tool in self.tools
+        }
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def tools_for(self, content_type: str) -> List[str]:
+        return [t for t in self.tools if content_type in WARMUP_SPECS[t].content_types]
+
+    def _record(self, tool: str, outcome: str) -> None:
+        self._outcomes[tool][outcome] += 1
+        record_tool_cache_warmup(tool, outcome)
+
+    def enqueue(self, doc_id: str, user_id: str, content_type: str) -> bool:
+        """Schedule warmup for a freshly ingested document; never blocks the ingest path."""
+        tools = self.tools_for(content_type)
+        if not self.running or not tools:
+            return False
+
+        try:
+            self._queue.put_nowait(WarmupJob(doc_id=doc_id, user_id=user_id, content_type=content_type))
+        except asyncio.QueueFull:
+            for tool in tools:
+                self._record(tool, "dropped")
+            logger.warning("Tool cache warmup queue full, dropping document", doc_id=doc_id)
+            return False
+
+        record_tool_cache_warmup_queue(self._queue.qsize())
+        return True
+
+    async def warm(self, job: WarmupJob) -> None:
+        for tool in self.tools_for(job.content_type):
+            results = await warmup_tool_cache(
+                tool_name=tool,
+                doc_ids=[job.doc_id],
+                user_id=job.user_id,
+                params=WARMUP_SPECS[tool].params,
+            )
+            if results.get("unavailable"):
+                continue
+            if results["skipped"]:
+                self._record(tool, "skipped")
+            elif results["cached"]:
+                self._record(tool, "warmed")
+            else:
+                self._record(tool, "failed")
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            record_tool_cache_warmup_queue(self._queue.qsize())
+            try:
+                await self.warm(job)
+            except Exception as e:
+                logger.warning("Tool cache warmup failed", doc_id=job.doc_id, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def start(self) -> None:
+        if self.running or not self.tools:
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        logger.info("Tool cache warmup started", tools=self.tools, concurrency=self.concurrency)
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def get_stats(self) -> dict:
+        """Warm coverage: share of warmed documents that ended with a fresh result, per tool."""
+        tools = {}
+        for tool, outcomes in self._outcomes.items():
+            total = sum(outcomes.values())
+            covered = outcomes["warmed"] + outcomes["skipped"]
+            tools[tool] = {**outcomes, "coverage": round(covered / total, 3) if total else None}
+        return {
+            "running": self.running,
+            "queue_depth": self._queue.qsize(),
+            "tools": tools,
+        }
+
+
+_tool_cache_warmer: Optional[ToolCacheWarmer] = None
+
+
+def get_tool_cache_warmer() -> ToolCacheWarmer:
+    """Get or create the global tool cache warmer."""
+    global _tool_cache_warmer
+    if _tool_cache_warmer is None:
+        _tool_cache_warmer = ToolCacheWarmer()
+    return _tool_cache_warmer
@@ -2,7 +2,8 @@
 Tool Execution Service.
 
 This service handles the orchestration and execution of MCP tools
-with built-in Redis caching and error handling.
+with built-in Redis caching and error handling. Document tool results go
+through the tag-versioned ToolResultCache (services/mcp_cache.py).
 
 It abstracts the complexity of:
 - Tool discovery
@@ -17,6 +18,7 @@ from typing import Dict, Any, Optional, List
 import structlog
 
 from ..core.redis_cache import get_redis_cache
+from .mcp_cache import ToolResultCache, get_tool_result_cache
 from ..domain.chat_context import ChatContext
 from ..mcp import get_mcp_adapter
 from ..core.constants import (
@@ -62,10 +64,13 @@ class ToolExecutionService:
         cache_params: Dict[str, Any],
         tool_map: Dict[str, Any],
         mcp_adapter: Any,
-        cache: Any
+        cache: Optional[ToolResultCache]
     ) -> Optional[Dict[str, Any]]:
         """
         Generic method to execute a tool with Redis caching.
+
+        Stale results are served while one background task refreshes them,
+        and concurrent misses for the same document share one execution.
         
         Args:
             tool_name: Name of the tool to execute
@@ -75,72 +80,35 @@ class ToolExecutionService:
             cache_params: Parameters used to generate the cache key
             tool_map: Map of available tools
             mcp_adapter: Adapter to execute the tool
-            cache: Redis cache instance
+            cache: Tool result cache (None to skip caching)
             
         Returns:
             The tool result dict or None if execution failed
         """
-        try:
-            # Generate cache key
-            cache_key = cls._generate_cache_key(tool_name, doc_id, cache_params)
-
-            # Try to get from cache first
-            cached_result = None
-            if cache:
-                try:
-                    cached_result = await cache.get(cache_key)
-                    if cached_result:
-                        logger.info(
-                            f"{tool_name} result loaded from cache",
-                            doc_id=doc_id,
-                            cache_hit=True
-                        )
-                        return cached_result
-                except Exception as e:
-                    logger.warning(
-                        "Failed to read from cache",
-                        cache_key=cache_key,
-                        error=str(e)
-                    )
-
-            # Execute tool
+        async def run_tool():
             logger.info(
                 f"Invoking {tool_name} tool",
                 doc_id=doc_id,
                 user_id=user_id,
                 cache_hit=False
             )
-
-            tool_impl = tool_map[tool_name]
-            result = await mcp_adapter._execute_tool_impl(
+            return await mcp_adapter._execute_tool_impl(
                 tool_name=tool_name,
-                tool_impl=tool_impl,
-                payload={
-                    "doc_id": str(doc_id),
-                    "user_id": str(user_id),
-                    "policy_id": "auto"
-                },
+                tool_impl=tool_map[tool_name],
+                payload=payload,
                 context=None
             )
 
-            # Store in cache
-            if cache:
-                try:
-                    ttl = TOOL_CACHE_TTL.get(tool_name, 3600)
-                    await cache.set(cache_key, result, expire=ttl)
-                    logger.debug(
-                        f"Cached {tool_name} result",
-                        cache_key=cache_key,
-                        ttl=ttl
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to cache {tool_name} result",
-                        cache_key=cache_key,
-                        error=str(e)
-                    )
-            
-            return result
+        try:
+            if cache is None:
+                return await run_tool()
+            return await cache.get_or_compute(
+                tool_name,
+                str(doc_id),
+                cache_params,
+                run_tool,
+                ttl=TOOL_CACHE_TTL.get(tool_name, 3600),
+            )
 
         except Exception as e:
             logger.warning(
@@ -161,17 +129,7 @@ class ToolExecutionService:
         Invoke relevant MCP tools based on context and return results.
         """
         results = {}
-
-        # Get Redis cache
-        try:
-            cache = await get_redis_cache()
-        except Exception as e:
-            logger.warning(
-                "Failed to get Redis cache for tool results",
-                error=str(e),
-                exc_type=type(e).__name__
-            )
-            cache = None
+        cache = get_tool_result_cache()
 
         # Skip if no tools enabled
         if not context.tools_enabled or not any(context.tools_enabled.values()):
@@ -0,0 +1,55 @@
+"""
+Standalone worker for MCP long-running tasks.
+
+Consumes the Redis priority queues filled by POST /api/mcp/tasks on the API
+replicas, so expensive tools run outside the API processes:
+
+    MCP_TASK_BACKEND=redis python -m src.workers.mcp_task_worker
+
+API replicas may then set MCP_TASK_WORKERS=0 to only queue tasks.
+"""
+
+import asyncio
+import signal
+
+import structlog
+
+from ..core.config import get_settings
+from ..core.database import Database
+from ..core.auth import get_current_user
+from ..mcp.fastapi_adapter import MCPFastAPIAdapter
+from ..mcp.server import mcp as mcp_server
+from ..mcp.tasks import task_manager
+
+logger = structlog.get_logger(__name__)
+
+
+async def run_standalone():
+    """Run the task worker pool until SIGINT/SIGTERM."""
+    settings = get_settings()
+    if not task_manager.backend.distributed:
+        logger.warning(
+            "MCP task worker with in-memory backend only sees its own tasks",
+            backend=settings.mcp_task_backend,
+        )
+
+    await Database.connect_to_mongo()
+
+    adapter = MCPFastAPIAdapter(mcp_server=mcp_server, auth_dependency=get_current_user)
+    await task_manager.start(runner=adapter.run_task)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    logger.info("MCP task worker running", workers=task_manager.workers)
+    await stop.wait()
+
+    logger.info("MCP task worker shutting down")
+    await task_manager.stop()
+    await Database.close_mongo_connection()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone())
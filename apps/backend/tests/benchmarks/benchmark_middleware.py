@@ -0,0 +1,301 @@
+"""
+Benchmark: BaseHTTPMiddleware vs pure-ASGI middleware stack.
+
+Drives the app at the ASGI level (no network) with the same middleware
+chain main.create_app installs (instrumentation, cache headers, rate limit,
+auth, telemetry), once with the previous BaseHTTPMiddleware
+implementations and once with the pure-ASGI ones, plus a bare app baseline.
+
+Metrics Tracked:
+    - Per-request latency for an authenticated JSON endpoint (microseconds)
+    - SSE chunk latency: time from the endpoint yielding a chunk to the
+      server receiving it (microseconds)
+    - Overhead vs the bare app
+
+Usage:
+    python benchmark_middleware.py
+    python benchmark_middleware.py --requests 5000 --chunks 200 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, List, Tuple
+from unittest.mock import AsyncMock, patch
+
+import structlog
+
+# Add backend root to path so `src` package imports (relative imports) resolve
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Thousands of requests from one client would trip the global limit; the
+# legacy rate limit middleware was a pass-through, so compare like for like
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from jose import jwt  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from src.core.config import get_settings  # noqa: E402
+from src.core.telemetry import RequestInstrumentationMiddleware, metrics_collector, telemetry  # noqa: E402
+from src.middleware.auth import AuthMiddleware  # noqa: E402
+from src.middleware.cache_control import CacheControlMiddleware  # noqa: E402
+from src.middleware.rate_limit import RateLimitMiddleware  # noqa: E402
+from src.middleware.telemetry import TelemetryMiddleware  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Legacy BaseHTTPMiddleware implementations, kept for comparison
+# ---------------------------------------------------------------------------
+
+class LegacyTelemetryMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        metrics_collector.record_request(
+            method=request.method,
+            endpoint=request.url.path,
+            status_code=response.status_code,
+            duration=time.time() - start_time,
+        )
+        return response
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        self.auth = AuthMiddleware(app)
+
+    async def dispatch(self, request, call_next):
+        if request.method == "OPTIONS" or request.url.path in AuthMiddleware.PUBLIC_PATHS:
+            return await call_next(request)
+        token = self.auth._extract_token(request)
+        payload = self.auth._validate_token(token) if token else None
+        if not payload:
+            return self.auth._unauthorized_response()
+        request.state.user_id = payload.get("sub")
+        request.state.authenticated = True
+        request.state.user_claims = payload
+        return await call_next(request)
+
+
+class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+class LegacyCacheControlMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        if request.url.path.startswith("/api/"):
+            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+            response.headers["Pragma"] = "no-cache"
+            response.headers["Expires"] = "0"
+        return response
+
+
+class LegacyInstrumentationMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        telemetry.increment_active_connections()
+        try:
+            response = await call_next(request)
+            telemetry.track_request(
+                method=request.method,
+                endpoint=request.url.path,
+                status_code=response.status_code,
+                duration=time.time() - start_time,
+            )
+            return response
+        finally:
+            telemetry.decrement_active_connections()
+
+
+LEGACY_STACK = [
+    LegacyTelemetryMiddleware,
+    LegacyAuthMiddleware,
+    LegacyRateLimitMiddleware,
+    LegacyCacheControlMiddleware,
+    LegacyInstrumentationMiddleware,
+]
+ASGI_STACK = [
+    TelemetryMiddleware,
+    AuthMiddleware,
+    RateLimitMiddleware,
+    CacheControlMiddleware,
+    RequestInstrumentationMiddleware,
+]
+
+
+# ---------------------------------------------------------------------------
+# App and ASGI driver
+# ---------------------------------------------------------------------------
+
+def build_app(stack: List[type], chunk_times: List[float], chunks: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping(request: Request):
+        return {"ok": True}
+
+    @app.get("/api/stream")
+    async def stream(request: Request):
+        async def events():
+            for i in range(chunks):
+                chunk_times.append(time.perf_counter())
+                yield f"data: {i}\n\n"
+                await asyncio.sleep(0)
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    for middleware in stack:
+        app.add_middleware(middleware)
+    return app
+
+
+async def drive(app, path: str, token: str, on_body: Callable[[], None] = None) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    request_sent = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if on_body and message["type"] == "http.response.body" and message.get("body"):
+            on_body()
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        done.set()
+
+
+@dataclass
+class BenchmarkResult:
+    """Results for one middleware stack."""
+
+    stack: str
+    request_mean_us: float
+    request_p95_us: float
+    chunk_mean_us: float
+    chunk_p95_us: float
+
+
+def _stats(samples: List[float]) -> Tuple[float, float]:
+    samples = sorted(samples)
+    return statistics.mean(samples) * 1e6, samples[max(int(len(samples) * 0.95) - 1, 0)] * 1e6
+
+
+class MiddlewareBenchmark:
+    """Compares request overhead and SSE chunk latency across stacks."""
+
+    def __init__(self, requests: int = 2000, chunks: int = 100, warmup: int = 200):
+        self.requests = requests
+        self.chunks = chunks
+        self.warmup = warmup
+        settings = get_settings()
+        self.token = jwt.encode(
+            {"sub": "bench-user", "exp": int(time.time()) + 3600},
+            settings.jwt_secret_key,
+            algorithm=settings.jwt_algorithm,
+        )
+        self.results: List[BenchmarkResult] = []
+
+    async def _run_stack(self, name: str, stack: List[type]) -> BenchmarkResult:
+        chunk_times: List[float] = []
+        app = build_app(stack, chunk_times, self.chunks)
+
+        for _ in range(self.warmup):
+            await drive(app, "/api/ping", self.token)
+
+        request_samples = []
+        for _ in range(self.requests):
+            start = time.perf_counter()
+            await drive(app, "/api/ping", self.token)
+            request_samples.append(time.perf_counter() - start)
+
+        received: List[float] = []
+        chunk_times.clear()
+        await drive(app, "/api/stream", self.token, on_body=lambda: received.append(time.perf_counter()))
+        chunk_samples = [got - sent for sent, got in zip(chunk_times, received)]
+
+        request_mean, request_p95 = _stats(request_samples)
+        chunk_mean, chunk_p95 = _stats(chunk_samples)
+        result = BenchmarkResult(name, request_mean, request_p95, chunk_mean, chunk_p95)
+        self.results.append(result)
+        return result
+
+    async def run(self) -> None:
+        print(f"\n{'='*72}")
+        print(f"Middleware benchmark: {self.requests} requests, {self.chunks} SSE chunks per stack")
+        print(f"{'='*72}")
+        print(f"{'Stack':<14} {'req mean us':>12} {'req p95 us':>12} {'chunk mean us':>14} {'chunk p95 us':>13}")
+        print(f"{'-'*72}")
+
+        with patch("src.middleware.auth.is_token_blacklisted", AsyncMock(return_value=False)):
+            for name, stack in (("bare", []), ("base_http", LEGACY_STACK), ("pure_asgi", ASGI_STACK)):
+                result = await self._run_stack(name, stack)
+                print(
+                    f"{result.stack:<14} {result.request_mean_us:>12.1f} {result.request_p95_us:>12.1f} "
+                    f"{result.chunk_mean_us:>14.1f} {result.chunk_p95_us:>13.1f}"
+                )
+
+        bare, legacy, asgi = self.results
+        print(f"{'-'*72}")
+        print(
+            f"Per-request overhead vs bare: base_http {legacy.request_mean_us - bare.request_mean_us:.1f}us, "
+            f"pure_asgi {asgi.request_mean_us - bare.request_mean_us:.1f}us\n"
+        )
+
+    def export_results(self, output_path: str) -> None:
+        with open(output_path, "w") as f:
+            json.dump([asdict(result) for result in self.results], f, indent=2)
+        print(f"✓ Results exported to {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BaseHTTPMiddleware vs pure-ASGI stack")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per stack")
+    parser.add_argument("--chunks", type=int, default=100, help="SSE chunks per stream")
+    parser.add_argument("--output", type=str, help="Export results as JSON")
+    args = parser.parse_args()
+
+    # Request logs would dominate the timings
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    benchmark = MiddlewareBenchmark(requests=args.requests, chunks=args.chunks)
+    asyncio.run(benchmark.run())
+
+    if args.output:
+        benchmark.export_results(args.output)
+
+
+if __name__ == "__main__":
+    main()
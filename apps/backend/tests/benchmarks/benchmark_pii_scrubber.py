@@ -0,0 +1,188 @@
+"""
+Benchmark: single-pass PII scrubber vs one regex per pattern.
+
+Builds multi-megabyte payloads shaped like document_extraction (one big
+text field plus per-page text) and get_segments (thousands of small
+segment dicts) results, and scrubs them with:
+
+    - legacy:    the previous scrub_dict (six sequential regex passes per string)
+    - combined:  PIIScrubber.scrub_dict, first call (single pass)
+    - repeat:    PIIScrubber.scrub_dict on an equal payload (content-hash memo)
+    - stream:    PIIScrubber.scrub_stream over the big text field
+
+Metrics Tracked:
+    - Time per payload (ms) and throughput (MB/s)
+
+Usage:
+    python benchmark_pii_scrubber.py
+    python benchmark_pii_scrubber.py --size-mb 16 --output results.json
+"""
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add backend root to path so `src` package imports (relative imports) resolve
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.mcp.security import PIIScrubber  # noqa: E402
+
+WORDS = (
+    "el reporte trimestral muestra ventas de 1,234,567 MXN en la región norte "
+    "conforme a la política interna folio 2024-0001 página anexo tabla resultados "
+    "contacto ana.lopez@example.com teléfono 555-123-4567 servidor 10.20.30.40"
+).split()
+
+
+def _text(rng: random.Random, chars: int) -> str:
+    parts, size = [], 0
+    while size < chars:
+        word = rng.choice(WORDS)
+        parts.append(word)
+        size += len(word) + 1
+    return " ".join(parts)
+
+
+def build_extraction_result(size_mb: float, seed: int = 7) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    pages = [{"page": i + 1, "text": _text(rng, 4000)} for i in range(int(size_mb * 1024 * 1024 / 2 / 4000))]
+    return {
+        "doc_id": "doc_123",
+        "method_used": "pypdf",
+        "text": _text(rng, int(size_mb * 1024 * 1024 / 2)),
+        "pages": pages,
+        "metadata": {"filename": "reporte.pdf", "total_pages": len(pages)},
+    }
+
+
+def build_segments_result(size_mb: float, seed: int = 11) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    segments = [
+        {"segment_id": f"seg_{i}", "page": i // 20 + 1, "text": _text(rng, 500), "score": rng.random()}
+        for i in range(int(size_mb * 1024 * 1024 / 500))
+    ]
+    return {"doc_id": "doc_123", "segments": segments}
+
+
+def legacy_scrub(text: str) -> str:
+    text = PIIScrubber.EMAIL_PATTERN.sub("[EMAIL_REDACTED]", text)
+    text = PIIScrubber.PHONE_PATTERN.sub("[PHONE_REDACTED]", text)
+    text = PIIScrubber.SSN_PATTERN.sub("[SSN_REDACTED]", text)
+    text = PIIScrubber.CREDIT_CARD_PATTERN.sub("[CC_REDACTED]", text)
+    text = PIIScrubber.IP_PATTERN.sub("[IP_REDACTED]", text)
+    if "key" in text.lower() or "token" in text.lower():
+        text = PIIScrubber.API_KEY_PATTERN.sub("[KEY_REDACTED]", text)
+    return text
+
+
+def legacy_scrub_dict(data: dict) -> dict:
+    scrubbed = {}
+    for key, value in data.items():
+        if isinstance(value, str):
+            scrubbed[key] = legacy_scrub(value)
+        elif isinstance(value, dict):
+            scrubbed[key] = legacy_scrub_dict(value)
+        elif isinstance(value, list):
+            scrubbed[key] = [
+                legacy_scrub(item) if isinstance(item, str)
+                else legacy_scrub_dict(item) if isinstance(item, dict)
+                else item
+                for item in value
+            ]
+        else:
+            scrubbed[key] = value
+    return scrubbed
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing for one payload/strategy pair."""
+
+    payload: str
+    strategy: str
+    size_mb: float
+    duration_ms: float
+    throughput_mb_s: float
+
+
+class PIIScrubberBenchmark:
+    """Times each scrubbing strategy on each payload."""
+
+    def __init__(self, size_mb: float = 4.0, rounds: int = 3):
+        self.size_mb = size_mb
+        self.rounds = rounds
+        self.results: List[BenchmarkResult] = []
+
+    def _time(self, fn: Callable[[], Any]) -> float:
+        best = float("inf")
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def _record(self, payload: str, strategy: str, size_mb: float, seconds: float) -> None:
+        result = BenchmarkResult(payload, strategy, round(size_mb, 2), seconds * 1000, size_mb / seconds)
+        self.results.append(result)
+        print(f"{payload:<12} {strategy:<10} {result.duration_ms:>12.1f} {result.throughput_mb_s:>12.1f}")
+
+    def run(self) -> None:
+        print(f"\n{'='*52}")
+        print(f"PII scrubber benchmark: ~{self.size_mb} MB payloads, best of {self.rounds}")
+        print(f"{'='*52}")
+        print(f"{'Payload':<12} {'Strategy':<10} {'ms':>12} {'MB/s':>12}")
+        print(f"{'-'*52}")
+
+        payloads = {
+            "extraction": build_extraction_result(self.size_mb),
+            "segments": build_segments_result(self.size_mb),
+        }
+        for name, payload in payloads.items():
+            size_mb = len(json.dumps(payload)) / (1024 * 1024)
+
+            self._record(name, "legacy", size_mb, self._time(lambda: legacy_scrub_dict(payload)))
+
+            def combined_cold():
+                PIIScrubber._memo.clear()
+                PIIScrubber._memo_chars = 0
+                PIIScrubber.scrub_dict(payload)
+
+            self._record(name, "combined", size_mb, self._time(combined_cold))
+
+            equal_payload = copy.deepcopy(payload)
+            PIIScrubber.scrub_dict(payload)
+            self._record(name, "repeat", size_mb, self._time(lambda: PIIScrubber.scrub_dict(equal_payload)))
+
+        text = payloads["extraction"]["text"]
+        text_mb = len(text) / (1024 * 1024)
+        self._record("text field", "stream", text_mb, self._time(lambda: sum(1 for _ in PIIScrubber.scrub_stream(text))))
+        print()
+
+    def export_results(self, output_path: str) -> None:
+        with open(output_path, "w") as f:
+            json.dump([asdict(result) for result in self.results], f, indent=2)
+        print(f"✓ Results exported to {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass vs per-pattern PII scrubbing")
+    parser.add_argument("--size-mb", type=float, default=4.0, help="Approximate payload size")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per strategy (best is kept)")
+    parser.add_argument("--output", type=str, help="Export results as JSON")
+    args = parser.parse_args()
+
+    benchmark = PIIScrubberBenchmark(size_mb=args.size_mb, rounds=args.rounds)
+    benchmark.run()
+
+    if args.output:
+        benchmark.export_results(args.output)
+
+
+if __name__ == "__main__":
+    main()
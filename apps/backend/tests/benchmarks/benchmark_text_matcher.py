@@ -0,0 +1,282 @@
+"""
+Micro-benchmarks for compiled multi-pattern matchers.
+
+Compares the per-pattern loops the classifiers used to run (one ``re.search``
+or substring test per keyword) against the compiled matchers in
+``services.text_matcher`` over a realistic corpus of Spanish chat queries.
+Every benchmark first checks that both implementations agree on the corpus.
+
+Metrics Tracked:
+    - Mean / p95 latency per query (microseconds)
+    - Throughput (queries/second)
+    - Speedup of compiled vs legacy
+
+Usage:
+    python benchmark_text_matcher.py
+    python benchmark_text_matcher.py --iterations 500 --output results.json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Add backend root to path so `src` package imports (relative imports) resolve
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.services import bank_analytics_client as bank  # noqa: E402
+from src.services import intent_service  # noqa: E402
+from src.services.memory import fact_extractor  # noqa: E402
+from src.services.query_understanding.intent_classifier import IntentClassifier  # noqa: E402
+
+# Realistic chat traffic: banking analytics, document Q&A and small talk
+CORPUS: List[str] = [
+    "¿Cuál es el IMOR de INVEX en el Q2 2025?",
+    "Dame el ICOR de Banorte comparado con BBVA para los últimos 3 trimestres",
+    "¿Cómo ha evolucionado la cartera vencida del sistema en 2024?",
+    "El IMOR de INVEX es de 2.3% y el ICOR es 145%",
+    "Muestra la tasa de interés efectiva de la cartera comercial de Santander",
+    "¿Qué banco tiene mejor ICAP entre Citibanamex, HSBC y Scotiabank?",
+    "La utilidad neta de Banregio fue de 1,250 MDP en el 3T 2024",
+    "Compara la morosidad de Inbursa frente al resto de bancos",
+    "¿Cuánto creció el crédito al consumo en México el último año?",
+    "Reservas totales de Afirme es 3,400,000 y provisión de 120,000",
+    "Hola, buenos días",
+    "¿Qué es esto?",
+    "Resume el documento por favor",
+    "¿De qué trata el contrato que subí?",
+    "¿Por qué subió la tasa de referencia de Banxico?",
+    "¿Cuál es la diferencia entre cartera etapa 2 y etapa 3?",
+    "Explícame cómo se calcula el índice de capitalización",
+    "Dame una receta de pozole para 10 personas",
+    "¿Qué clima hará mañana en Monterrey?",
+    "Escribe un script en código Python que lea un CSV",
+    "¿Quién ganó el partido de fútbol anoche?",
+    "Traducir 'estado de cuenta' al inglés",
+    "Impacto del mercado hipotecario en LATAM y Europa 2025, análisis de riesgo",
+    "Configura el modelo para responder en inglés",
+    "El banco abrió tarde hoy",
+    "¿Cuál es el capital de Francia?",
+    "Historia de la revolución mexicana",
+    "Nombre de la avenida hipotecario en la colonia centro",
+    "¿Cómo está la cartera de Mifel?",
+    "ROE de BBVA es 22% y ROA es 2.1% al cierre de 2024",
+]
+
+
+# ---------------------------------------------------------------------------
+# Legacy implementations (per-pattern loops), kept for comparison
+# ---------------------------------------------------------------------------
+
+def legacy_extract_bank(text: str):
+    # Iterates a set: with several banks in the text the pick was arbitrary
+    text_lower = text.lower()
+    for bank_name in fact_extractor.BANKS:
+        if re.search(rf"\b{bank_name}\b", text_lower):
+            return bank_name
+    return None
+
+
+def legacy_extract_metric_names(text: str) -> List[str]:
+    text_lower = text.lower()
+    return [
+        metric
+        for metric, pattern in fact_extractor.METRIC_PATTERNS.items()
+        if re.search(pattern, text_lower, re.IGNORECASE)
+    ]
+
+
+def legacy_intent_rules(classifier: IntentClassifier, query: str) -> List[bool]:
+    def matches_any(patterns):
+        query_clean = re.sub(r'[¿?¡!]', '', query)
+        return any(re.search(pattern, query_clean, re.IGNORECASE) for pattern in patterns)
+
+    return [
+        matches_any(classifier.overview_patterns),
+        matches_any(classifier.quantitative_patterns),
+        matches_any(classifier.comparison_patterns),
+        matches_any(classifier.definitional_patterns),
+        matches_any(classifier.procedural_patterns),
+        matches_any(classifier.analytical_patterns),
+        matches_any(classifier.specific_fact_patterns),
+    ]
+
+
+def legacy_constraint_labels(text: str) -> List[str]:
+    return [
+        label
+        for pattern, label in [
+            (intent_service.YEAR_PATTERN, "años"),
+            (intent_service.REGION_PATTERN, "regiones"),
+            (intent_service.URL_PATTERN, "URL"),
+            (intent_service.RESEARCH_KEYWORDS, "palabras clave de investigación"),
+        ]
+        if pattern.search(text)
+    ]
+
+
+def legacy_bank_keywords(message: str) -> Dict[str, bool]:
+    message_lower = message.lower()
+    return {
+        "high_confidence": any(k in message_lower for k in bank.BANK_QUERY_HIGH_CONFIDENCE),
+        "negative": any(k in message_lower for k in bank.BANK_QUERY_NEGATIVE),
+        "banking": any(
+            k in message_lower
+            for k in bank._BANK_QUERY_ALL_KEYWORDS
+            if k not in bank.BANK_QUERY_AMBIGUOUS
+        ),
+        "metric_query": any(re.search(p, message_lower) for p in bank.BANK_QUERY_METRIC_PATTERNS),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Compiled implementations (what production code runs)
+# ---------------------------------------------------------------------------
+
+def compiled_extract_metric_names(text: str) -> List[str]:
+    return list(fact_extractor.extract_metrics(text))
+
+
+def compiled_intent_rules(classifier: IntentClassifier, query: str) -> List[bool]:
+    query = re.sub(r'[¿?¡!]', '', query)
+    return [
+        classifier.overview_matcher.matches(query),
+        classifier.quantitative_matcher.matches(query),
+        classifier.comparison_matcher.matches(query),
+        classifier.definitional_matcher.matches(query),
+        classifier.procedural_matcher.matches(query),
+        classifier.analytical_matcher.matches(query),
+        classifier.specific_fact_matcher.matches(query),
+    ]
+
+
+def compiled_constraint_labels(text: str) -> List[str]:
+    return intent_service.IntentClassifier._constraint_score(None, text)[1]
+
+
+def compiled_bank_keywords(message: str) -> Dict[str, bool]:
+    message_lower = message.lower()
+    return {
+        "high_confidence": bank._HIGH_CONFIDENCE_MATCHER.matches(message_lower),
+        "negative": bank._NEGATIVE_MATCHER.matches(message_lower),
+        "banking": bank._BANKING_KEYWORDS_MATCHER.matches(message_lower),
+        "metric_query": bank._METRIC_QUERY_MATCHER.matches(message_lower),
+    }
+
+
+@dataclass
+class BenchmarkResult:
+    """Results for one implementation of one matcher."""
+
+    name: str
+    implementation: str
+    queries: int
+    mean_us: float
+    p95_us: float
+    throughput_qps: float
+
+
+class MatcherBenchmark:
+    """Times legacy vs compiled matchers over the corpus."""
+
+    def __init__(self, iterations: int = 200, warmup_runs: int = 20):
+        self.iterations = iterations
+        self.warmup_runs = warmup_runs
+        self.results: List[BenchmarkResult] = []
+
+    def _time(self, name: str, implementation: str, func: Callable[[str], object]) -> BenchmarkResult:
+        for _ in range(self.warmup_runs):
+            for query in CORPUS:
+                func(query)
+
+        samples = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            for query in CORPUS:
+                func(query)
+            samples.append((time.perf_counter() - start) / len(CORPUS))
+
+        samples.sort()
+        mean = statistics.mean(samples)
+        result = BenchmarkResult(
+            name=name,
+            implementation=implementation,
+            queries=len(CORPUS) * self.iterations,
+            mean_us=mean * 1e6,
+            p95_us=samples[int(len(samples) * 0.95) - 1] * 1e6,
+            throughput_qps=1 / mean if mean else 0.0,
+        )
+        self.results.append(result)
+        return result
+
+    def compare(
+        self,
+        name: str,
+        legacy: Callable[[str], object],
+        compiled: Callable[[str], object],
+        equivalent: Callable[[object, object], bool] = lambda a, b: a == b,
+    ) -> None:
+        mismatches = [query for query in CORPUS if not equivalent(legacy(query), compiled(query))]
+        if mismatches:
+            raise AssertionError(f"{name}: legacy and compiled disagree on {mismatches}")
+
+        old = self._time(name, "legacy", legacy)
+        new = self._time(name, "compiled", compiled)
+        speedup = old.mean_us / new.mean_us if new.mean_us else float("inf")
+        print(
+            f"{name:<22} {old.mean_us:>10.1f} {new.mean_us:>10.1f} "
+            f"{new.p95_us:>10.1f} {speedup:>8.1f}x"
+        )
+
+    def run(self) -> None:
+        classifier = IntentClassifier()
+
+        print(f"\n{'='*66}")
+        print(f"Matcher benchmark: {len(CORPUS)} queries x {self.iterations} iterations")
+        print(f"{'='*66}")
+        print(f"{'Matcher':<22} {'legacy us':>10} {'compiled':>10} {'p95 us':>10} {'speedup':>9}")
+        print(f"{'-'*66}")
+
+        self.compare(
+            "extract_bank",
+            legacy_extract_bank,
+            fact_extractor.extract_bank,
+            equivalent=lambda a, b: (a is None) == (b is None),
+        )
+        self.compare("extract_metrics", legacy_extract_metric_names, compiled_extract_metric_names)
+        self.compare(
+            "query_intent_rules",
+            lambda q: legacy_intent_rules(classifier, q.lower().strip()),
+            lambda q: compiled_intent_rules(classifier, q.lower().strip()),
+        )
+        self.compare("intent_constraints", legacy_constraint_labels, compiled_constraint_labels)
+        self.compare("bank_query_keywords", legacy_bank_keywords, compiled_bank_keywords)
+
+        print(f"{'-'*66}\n")
+
+    def export_results(self, output_path: str) -> None:
+        with open(output_path, "w") as f:
+            json.dump([asdict(result) for result in self.results], f, indent=2)
+        print(f"✓ Results exported to {output_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled multi-pattern matchers")
+    parser.add_argument("--iterations", type=int, default=200, help="Passes over the corpus")
+    parser.add_argument("--output", type=str, help="Export results as JSON")
+    args = parser.parse_args()
+
+    benchmark = MatcherBenchmark(iterations=args.iterations)
+    benchmark.run()
+
+    if args.output:
+        benchmark.export_results(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -77,6 +77,19 @@ def reset_versioned_registry():
     versioned_registry._deprecated.clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_principal_cache():
+    """Ensure cached auth principals do not leak between tests."""
+    try:
+        from src.services import principal_cache
+    except Exception:  # pragma: no cover - optional for lightweight unit runs
+        yield
+        return
+    principal_cache._principal_cache = None
+    yield
+    principal_cache._principal_cache = None
+
+
 # ============================================================================
 # Resource Lifecycle Management Test Fixtures
 # ============================================================================
@@ -300,7 +300,7 @@ class TestRateLimiting:
             success_count = sum(1 for r in responses if r.status_code == 201)
             assert success_count >= 4, f"Expected at least 4 successful creations, got {success_count}"
 
-            # Verify rate limit headers exist (slowapi adds these)
+            # Verify rate limit headers exist (RateLimitMiddleware adds X-RateLimit-*)
             last_response = responses[-1]
             # Check for common rate limit header patterns
             has_rate_limit_headers = any(
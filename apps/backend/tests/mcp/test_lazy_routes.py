@@ -444,7 +444,7 @@ class TestInvokeEndpoint:
         mock_registry.invoke = AsyncMock()
 
         with patch(
-            "src.mcp.lazy_routes.PayloadValidator.validate_size",
+            "src.mcp.lazy_routes.PayloadValidator.validate",
             side_effect=ValueError("payload too large"),
         ):
             async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
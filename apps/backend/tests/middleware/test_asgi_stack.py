@@ -0,0 +1,172 @@
+"""
+Tests for the pure-ASGI middleware stack (telemetry, auth, cache headers).
+
+Verifies the middleware keep their behavior and forward streamed (SSE)
+bodies chunk by chunk instead of re-buffering them.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.core.telemetry import RequestInstrumentationMiddleware
+from src.middleware.auth import AuthMiddleware
+from src.middleware.body_limit import BodySizeLimitMiddleware
+from src.middleware.cache_control import CacheControlMiddleware
+from src.middleware.rate_limit import RateLimitMiddleware
+from src.middleware.telemetry import TelemetryMiddleware
+from src.services.principal_cache import get_principal_cache
+
+CHUNKS = [f"data: chunk-{i}\n\n" for i in range(5)]
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/me")
+    async def me(request: Request):
+        return {"user_id": request.state.user_id}
+
+    @app.get("/api/health")
+    async def stream():
+        async def events():
+            for chunk in CHUNKS:
+                yield chunk
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/api/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    # Same order as main.create_app
+    app.add_middleware(TelemetryMiddleware)
+    app.add_middleware(AuthMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(CacheControlMiddleware)
+    app.add_middleware(BodySizeLimitMiddleware)
+    app.add_middleware(RequestInstrumentationMiddleware)
+    return app
+
+
+async def _call(app, path: str, token: str = None):
+    """Drive the app at the ASGI level and collect the sent messages."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver")] + (
+            [(b"authorization", f"Bearer {token}".encode())] if token else []
+        ),
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    messages = []
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Client stays connected until the response is complete
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    try:
+        await app(scope, receive, send)
+    finally:
+        disconnected.set()
+    return messages
+
+
+@pytest.mark.unit
+class TestAsgiStack:
+    @pytest.mark.asyncio
+    async def test_sse_chunks_are_forwarded_individually(self):
+        messages = await _call(_build_app(), "/api/health")
+
+        start = messages[0]
+        bodies = [m["body"].decode() for m in messages[1:] if m.get("body")]
+        headers = dict(start["headers"])
+        assert start["status"] == 200
+        assert headers[b"cache-control"] == b"no-store, no-cache, must-revalidate, max-age=0"
+        assert bodies == CHUNKS
+
+    def test_auth_state_reaches_route(self):
+        with patch.object(AuthMiddleware, "_validate_token", return_value={"sub": "user-123"}), \
+                patch("src.middleware.auth.is_token_blacklisted", AsyncMock(return_value=False)):
+            response = TestClient(_build_app()).get(
+                "/api/me", headers={"Authorization": "Bearer token"}
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {"user_id": "user-123"}
+        assert response.headers["Pragma"] == "no-cache"
+
+    def test_revoked_token_is_rejected(self):
+        with patch.object(AuthMiddleware, "_validate_token", return_value={"sub": "user-123"}), \
+                patch("src.middleware.auth.is_token_blacklisted", AsyncMock(return_value=True)):
+            response = TestClient(_build_app()).get(
+                "/api/me", headers={"Authorization": "Bearer token"}
+            )
+
+        assert response.status_code == 401
+        assert response.json()["code"] == "token_revoked"
+
+    @pytest.mark.asyncio
+    async def test_telemetry_records_status_once(self):
+        with patch("src.middleware.telemetry.metrics_collector") as collector:
+            await _call(_build_app(), "/api/health")
+
+        collector.record_request.assert_called_once()
+        assert collector.record_request.call_args.kwargs["status_code"] == 200
+
+    @pytest.mark.asyncio
+    async def test_unhandled_error_is_recorded_as_500(self):
+        app = _build_app()
+        with patch.object(AuthMiddleware, "_validate_token", return_value={"sub": "u"}), \
+                patch("src.middleware.auth.is_token_blacklisted", AsyncMock(return_value=False)), \
+                patch("src.middleware.telemetry.metrics_collector") as collector:
+            with pytest.raises(RuntimeError):
+                await _call(app, "/api/boom", token="token")
+
+        assert collector.record_request.call_args.kwargs["status_code"] == 500
+
+    @pytest.mark.asyncio
+    async def test_active_connection_held_until_stream_ends(self):
+        with patch("src.core.telemetry.telemetry") as telemetry:
+            await _call(_build_app(), "/api/health")
+
+        telemetry.increment_active_connections.assert_called_once()
+        telemetry.decrement_active_connections.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_principal_skips_decode_and_revocation_lookup(self):
+        app = _build_app()
+        principal_cache = get_principal_cache()
+        principal_cache._synced = True
+        blacklist = AsyncMock(return_value=False)
+        claims = {"sub": "user-123", "exp": 4102444800}
+        with patch.object(AuthMiddleware, "_validate_token", return_value=claims) as validate, \
+                patch("src.middleware.auth.is_token_blacklisted", blacklist):
+            await _call(app, "/api/me", token="token")
+            messages = await _call(app, "/api/me", token="token")
+
+        validate.assert_called_once()
+        blacklist.assert_not_awaited()
+        assert messages[0]["status"] == 200
@@ -0,0 +1,58 @@
+"""
+Tests for the request body size limit middleware.
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.middleware.body_limit import BodySizeLimitMiddleware
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    seen = {"calls": 0}
+
+    @app.post("/api/mcp/invoke")
+    async def invoke(request: Request):
+        seen["calls"] += 1
+        return {"bytes": len(await request.body())}
+
+    @app.post("/api/files/upload")
+    async def upload(request: Request):
+        return {"bytes": len(await request.body())}
+
+    app.add_middleware(BodySizeLimitMiddleware, limits={"/api/mcp": 100})
+    test_client = TestClient(app)
+    test_client.seen = seen
+    return test_client
+
+
+def test_small_body_passes(client):
+    response = client.post("/api/mcp/invoke", content=b"x" * 100)
+    assert response.status_code == 200
+    assert response.json() == {"bytes": 100}
+
+
+def test_declared_length_over_limit_is_rejected_before_the_route(client):
+    response = client.post("/api/mcp/invoke", content=b"x" * 101)
+
+    assert response.status_code == 413
+    assert response.json()["limit_bytes"] == 100
+    assert client.seen["calls"] == 0
+
+
+def test_chunked_body_is_cut_off_at_the_limit(client):
+    def chunks():
+        for _ in range(5):
+            yield b"x" * 40
+
+    response = client.post("/api/mcp/invoke", content=chunks())
+
+    assert response.status_code == 413
+
+
+def test_other_prefixes_are_not_limited(client):
+    response = client.post("/api/files/upload", content=b"x" * 1000)
+    assert response.status_code == 200
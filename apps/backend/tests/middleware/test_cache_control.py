@@ -176,3 +176,43 @@ def test_cache_control_all_http_methods(app_with_cache_middleware):
     # Test PATCH
     response = client.patch("/api/patch", json={})
     assert response.headers["Cache-Control"] == "no-store, no-cache, must-revalidate, max-age=0"
+
+
+def test_etag_responses_are_revalidated_not_forbidden(app_with_cache_middleware):
+    """
+    Test that responses with an ETag stay storable so clients can send If-None-Match.
+    """
+    from fastapi import Response
+    app = app_with_cache_middleware
+
+    @app.get("/api/mcp/tools")
+    async def catalog_endpoint():
+        return Response(content="[]", media_type="application/json", headers={"ETag": '"abc"'})
+
+    client = TestClient(app)
+
+    response = client.get("/api/mcp/tools")
+
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.headers["ETag"] == '"abc"'
+
+
+def test_file_downloads_with_etag_are_not_stored(app_with_cache_middleware, tmp_path):
+    """
+    Test that FileResponse downloads (which always carry an ETag) keep no-store.
+    """
+    from fastapi.responses import FileResponse
+    app = app_with_cache_middleware
+    report = tmp_path / "report.pdf"
+    report.write_bytes(b"%PDF-1.4")
+
+    @app.get("/api/reports/download")
+    async def download_endpoint():
+        return FileResponse(report, media_type="application/pdf")
+
+    client = TestClient(app)
+
+    response = client.get("/api/reports/download")
+
+    assert "ETag" in response.headers
+    assert response.headers["Cache-Control"] == "no-store, no-cache, must-revalidate, max-age=0"
@@ -138,11 +138,11 @@ class TestFileDeduplicationRegression:
         # Act
         result = await manager.check_duplicate_file(sample_file_hash, "user123")
 
-        # Assert
-        mock_document.find_one.assert_called_once_with({
-            "metadata.file_hash": sample_file_hash,
-            "user_id": "user123"
-        })
+        # Assert - stored hash first, legacy metadata.file_hash as fallback
+        assert mock_document.find_one.call_args_list[0].args[0] == {
+            "user_id": "user123",
+            "content_hash": sample_file_hash
+        }
 
     @pytest.mark.asyncio
     @patch("src.services.resource_lifecycle_manager.Document")
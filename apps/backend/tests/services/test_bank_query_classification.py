@@ -0,0 +1,92 @@
+"""
+Tests for bank query classification caching and single-flight coalescing.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services import bank_analytics_client
+from src.services.bank_analytics_client import is_bank_query
+
+AMBIGUOUS_MESSAGE = "Hola, buenos días"
+
+
+@pytest.fixture(autouse=True)
+def clear_classification_state():
+    bank_analytics_client._classification_l1.clear()
+    bank_analytics_client._classification_in_flight.clear()
+    yield
+    bank_analytics_client._classification_l1.clear()
+    bank_analytics_client._classification_in_flight.clear()
+
+
+@pytest.fixture
+def redis_cache():
+    cache = AsyncMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock()
+    cache.ttl = AsyncMock(return_value=None)
+    with patch("src.core.redis_cache.get_redis_cache", AsyncMock(return_value=cache)):
+        yield cache
+
+
+@pytest.mark.unit
+class TestClassificationCache:
+    @pytest.mark.asyncio
+    async def test_l1_cache_skips_redis_and_llm(self, redis_cache):
+        with patch.object(bank_analytics_client, "_classify_with_llm", AsyncMock(return_value=True)) as llm:
+            assert await is_bank_query(AMBIGUOUS_MESSAGE) is True
+            assert await is_bank_query(AMBIGUOUS_MESSAGE) is True
+
+        llm.assert_awaited_once()
+        redis_cache.get.assert_awaited_once()
+        assert redis_cache.set.call_args.kwargs["expire"] == 7200
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_populates_l1(self, redis_cache):
+        redis_cache.get = AsyncMock(return_value=False)
+
+        with patch.object(bank_analytics_client, "_classify_with_llm", AsyncMock()) as llm:
+            assert await is_bank_query(AMBIGUOUS_MESSAGE) is False
+            assert await is_bank_query(AMBIGUOUS_MESSAGE) is False
+
+        llm.assert_not_called()
+        redis_cache.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_l1_entry_expires_with_redis_entry(self, redis_cache):
+        redis_cache.get = AsyncMock(return_value=True)
+        redis_cache.ttl = AsyncMock(return_value=120)
+
+        with patch.object(bank_analytics_client.time, "monotonic", return_value=1000.0):
+            assert await is_bank_query(AMBIGUOUS_MESSAGE) is True
+
+        assert list(bank_analytics_client._classification_l1.values()) == [(True, 1120.0)]
+
+    @pytest.mark.asyncio
+    async def test_keyword_fast_path_is_cached(self, redis_cache):
+        assert await is_bank_query("Dame el IMOR de INVEX") is True
+        assert redis_cache.set.call_args.kwargs["expire"] == 3600
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_messages_run_llm_once(self, redis_cache):
+        release = asyncio.Event()
+
+        async def slow_llm(message):
+            await release.wait()
+            return True
+
+        with patch.object(bank_analytics_client, "_classify_with_llm", AsyncMock(side_effect=slow_llm)) as llm:
+            tasks = [asyncio.create_task(is_bank_query(AMBIGUOUS_MESSAGE)) for _ in range(5)]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert results == [True] * 5
+        llm.assert_awaited_once()
+        assert not bank_analytics_client._classification_in_flight
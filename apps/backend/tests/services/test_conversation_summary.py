@@ -0,0 +1,203 @@
+"""
+Tests for the rolling conversation summary service.
+
+Covers trigger logic, delta-only summarization and versioned writes.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.models.chat import ConversationSummary, MessageRole
+from src.services.memory.summary_service import ConversationSummaryService
+
+
+def _settings(**overrides):
+    settings = Mock()
+    settings.context_summary_enabled = True
+    settings.context_summary_recent_messages = 4
+    settings.context_summary_trigger_messages = 3
+    settings.context_summary_model = "Saptiva Turbo"
+    settings.context_summary_max_tokens = 200
+    for key, value in overrides.items():
+        setattr(settings, key, value)
+    return settings
+
+
+def _service(**overrides):
+    with patch("src.services.memory.summary_service.get_settings", return_value=_settings(**overrides)):
+        return ConversationSummaryService()
+
+
+def _session(message_count, summary=None):
+    session = Mock()
+    session.id = "chat-1"
+    session.message_count = message_count
+    session.conversation_summary = summary
+    return session
+
+
+def _messages(count, start=None):
+    start = start or datetime(2025, 1, 1)
+    return [
+        Mock(
+            role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+            content=f"mensaje {i}",
+            created_at=start + timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _query_returning(messages):
+    query = MagicMock()
+    query.find = Mock(return_value=query)
+    query.sort = Mock(return_value=query)
+    query.limit = Mock(return_value=query)
+    query.to_list = AsyncMock(return_value=messages)
+    return query
+
+
+class TestTrigger:
+    """Test when a background update is required."""
+
+    def test_short_chat_does_not_trigger(self):
+        service = _service()
+        assert service.needs_update(_session(message_count=6)) is False
+
+    def test_triggers_once_backlog_reaches_threshold(self):
+        service = _service()
+        # 4 recent + 3 pending
+        assert service.needs_update(_session(message_count=7)) is True
+
+    def test_covered_messages_are_not_counted_again(self):
+        service = _service()
+        summary = ConversationSummary(text="resumen", version=1, covered_message_count=6)
+        assert service.needs_update(_session(message_count=12, summary=summary)) is False
+        assert service.needs_update(_session(message_count=13, summary=summary)) is True
+
+    def test_disabled_never_triggers(self):
+        service = _service(context_summary_enabled=False)
+        assert service.needs_update(_session(message_count=100)) is False
+
+    def test_active_summary_requires_text(self):
+        assert ConversationSummaryService.get_active_summary(_session(10)) is None
+        empty = ConversationSummary(text="", version=1)
+        assert ConversationSummaryService.get_active_summary(_session(10, empty)) is None
+        summary = ConversationSummary(text="resumen", version=1)
+        assert ConversationSummaryService.get_active_summary(_session(10, summary)) is summary
+
+
+class TestScheduleUpdate:
+    """Test background scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_single_update_in_flight_per_chat(self):
+        service = _service()
+        service.update_summary = AsyncMock(return_value=None)
+        session = _session(message_count=20)
+
+        assert service.schedule_update(session) is True
+        assert service.schedule_update(session) is False
+
+        for task in list(service._tasks):
+            await task
+
+        service.update_summary.assert_awaited_once_with("chat-1")
+        assert "chat-1" not in service._in_flight
+
+
+class TestUpdateSummary:
+    """Test delta-only summarization and versioning."""
+
+    @pytest.mark.asyncio
+    async def test_first_summary_covers_messages_outside_window(self):
+        service = _service()
+        session = _session(message_count=9)
+        messages = _messages(9)
+
+        with patch("src.services.memory.summary_service.ChatSessionModel") as MockSession, \
+             patch("src.services.memory.summary_service.ChatMessageModel") as MockMessage:
+            MockSession.get = AsyncMock(return_value=session)
+            update_query = Mock()
+            update_query.update = AsyncMock(return_value=Mock(modified_count=1))
+            MockSession.find_one = Mock(return_value=update_query)
+            MockMessage.find = Mock(return_value=_query_returning(messages))
+            service._summarize = AsyncMock(return_value="- INVEX IMOR 2.3%")
+
+            result = await service.update_summary("chat-1")
+
+        # 9 messages - 4 recent = 5 summarized
+        delta = service._summarize.call_args.args[1]
+        assert [m.content for m in delta] == [f"mensaje {i}" for i in range(5)]
+        assert service._summarize.call_args.args[0] == ""
+
+        assert result.version == 1
+        assert result.covered_message_count == 5
+        assert result.covered_until == messages[4].created_at
+
+        filter_doc = MockSession.find_one.call_args.args[0]
+        assert filter_doc == {"_id": "chat-1", "conversation_summary": None}
+
+    @pytest.mark.asyncio
+    async def test_incremental_update_only_sends_new_delta(self):
+        service = _service()
+        previous = ConversationSummary(
+            text="resumen previo",
+            version=2,
+            covered_message_count=10,
+            covered_until=datetime(2025, 1, 1),
+        )
+        session = _session(message_count=17, summary=previous)
+        new_messages = _messages(7, start=datetime(2025, 1, 2))
+
+        with patch("src.services.memory.summary_service.ChatSessionModel") as MockSession, \
+             patch("src.services.memory.summary_service.ChatMessageModel") as MockMessage:
+            MockSession.get = AsyncMock(return_value=session)
+            update_query = Mock()
+            update_query.update = AsyncMock(return_value=Mock(modified_count=1))
+            MockSession.find_one = Mock(return_value=update_query)
+            MockMessage.find = Mock(return_value=_query_returning(new_messages))
+            MockMessage.created_at.__gt__ = Mock(return_value={"created_at": {"$gt": previous.covered_until}})
+            service._summarize = AsyncMock(return_value="resumen nuevo")
+
+            result = await service.update_summary("chat-1")
+
+        assert service._summarize.call_args.args[0] == "resumen previo"
+        assert len(service._summarize.call_args.args[1]) == 3
+        assert result.version == 3
+        assert result.covered_message_count == 13
+
+        filter_doc = MockSession.find_one.call_args.args[0]
+        assert filter_doc == {"_id": "chat-1", "conversation_summary.version": 2}
+
+    @pytest.mark.asyncio
+    async def test_version_conflict_returns_none(self):
+        service = _service()
+        session = _session(message_count=9)
+
+        with patch("src.services.memory.summary_service.ChatSessionModel") as MockSession, \
+             patch("src.services.memory.summary_service.ChatMessageModel") as MockMessage:
+            MockSession.get = AsyncMock(return_value=session)
+            update_query = Mock()
+            update_query.update = AsyncMock(return_value=Mock(modified_count=0))
+            MockSession.find_one = Mock(return_value=update_query)
+            MockMessage.find = Mock(return_value=_query_returning(_messages(9)))
+            service._summarize = AsyncMock(return_value="resumen")
+
+            assert await service.update_summary("chat-1") is None
+
+    @pytest.mark.asyncio
+    async def test_small_delta_skips_llm(self):
+        service = _service()
+        session = _session(message_count=6)
+
+        with patch("src.services.memory.summary_service.ChatSessionModel") as MockSession, \
+             patch("src.services.memory.summary_service.ChatMessageModel") as MockMessage:
+            MockSession.get = AsyncMock(return_value=session)
+            MockMessage.find = Mock(return_value=_query_returning(_messages(6)))
+            service._summarize = AsyncMock()
+
+            assert await service.update_summary("chat-1") is None
+            service._summarize.assert_not_called()
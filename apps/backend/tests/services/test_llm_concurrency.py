@@ -0,0 +1,174 @@
+"""
+Tests for SAPTIVA bulkheads with adaptive (AIMD) concurrency limits.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.llm_concurrency import (
+    Bulkhead,
+    BulkheadConfig,
+    ConcurrencyGovernor,
+    LLMCapacityError,
+    LLMPurpose,
+    LatencyTracker,
+    RetryBudget,
+)
+
+
+def _config(limit=4, max_queue=10, queue_timeout=1.0):
+    return BulkheadConfig(
+        initial_limit=limit, min_limit=1, max_limit=limit * 4,
+        max_queue=max_queue, queue_timeout=queue_timeout,
+    )
+
+
+def _governor(capacity=10, reserve=4, **overrides):
+    bulkheads = {
+        LLMPurpose.INTERACTIVE: _config(limit=10),
+        LLMPurpose.BACKGROUND: _config(limit=10),
+        LLMPurpose.CLASSIFICATION: _config(limit=2),
+    }
+    bulkheads.update(overrides)
+    return ConcurrencyGovernor(capacity=capacity, interactive_reserve=reserve, bulkheads=bulkheads)
+
+
+@pytest.mark.unit
+class TestAIMD:
+    def test_healthy_responses_grow_limit_additively(self):
+        bulkhead = Bulkhead(LLMPurpose.BACKGROUND, _config(limit=4))
+        for _ in range(4):
+            bulkhead.on_response(0.5, overloaded=False)
+        assert bulkhead.limit == 4  # +1/limit per success: not yet a full window
+        for _ in range(4):
+            bulkhead.on_response(0.5, overloaded=False)
+        assert bulkhead.limit == 5
+
+    def test_overload_shrinks_limit_once_per_episode(self):
+        bulkhead = Bulkhead(LLMPurpose.BACKGROUND, _config(limit=10))
+        bulkhead.on_response(0.5, overloaded=True)
+        bulkhead.on_response(0.5, overloaded=True)
+        assert bulkhead.limit == 7
+
+    def test_latency_spike_counts_as_overload(self):
+        bulkhead = Bulkhead(LLMPurpose.BACKGROUND, _config(limit=10))
+        for _ in range(20):
+            bulkhead.on_response(0.2, overloaded=False)
+        before = bulkhead.limit
+        for _ in range(5):
+            bulkhead.on_response(5.0, overloaded=False)
+        assert bulkhead.limit < before
+
+    def test_limit_never_below_minimum(self):
+        bulkhead = Bulkhead(LLMPurpose.BACKGROUND, _config(limit=1))
+        bulkhead._last_decrease = -100
+        bulkhead.on_response(0.5, overloaded=True)
+        assert bulkhead.limit == 1
+
+
+@pytest.mark.unit
+class TestGovernor:
+    @pytest.mark.asyncio
+    async def test_background_cannot_use_interactive_reserve(self):
+        governor = _governor(capacity=10, reserve=4)
+        for _ in range(6):
+            await governor.acquire(LLMPurpose.BACKGROUND)
+
+        # Pool has 4 free connections, all reserved for interactive
+        assert not governor._can_admit(governor.bulkheads[LLMPurpose.BACKGROUND])
+        for _ in range(4):
+            await governor.acquire(LLMPurpose.INTERACTIVE)
+        assert governor.total_in_flight == 10
+
+    @pytest.mark.asyncio
+    async def test_freed_slot_goes_to_interactive_first(self):
+        governor = _governor(capacity=2, reserve=0)
+        first = await governor.acquire(LLMPurpose.BACKGROUND)
+        await governor.acquire(LLMPurpose.BACKGROUND)
+
+        background = asyncio.create_task(governor.acquire(LLMPurpose.BACKGROUND))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(governor.acquire(LLMPurpose.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        governor._release(first)
+        await asyncio.wait_for(interactive, timeout=1)
+
+        assert not background.done()
+        background.cancel()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_fast(self):
+        governor = _governor(**{LLMPurpose.CLASSIFICATION: _config(limit=1, max_queue=1)})
+        await governor.acquire(LLMPurpose.CLASSIFICATION)
+        waiting = asyncio.create_task(governor.acquire(LLMPurpose.CLASSIFICATION))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMCapacityError) as exc:
+            await governor.acquire(LLMPurpose.CLASSIFICATION)
+        assert exc.value.reason == "queue_full"
+        waiting.cancel()
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_leaves_no_waiter_behind(self):
+        governor = _governor(**{LLMPurpose.CLASSIFICATION: _config(limit=1, queue_timeout=0.01)})
+        await governor.acquire(LLMPurpose.CLASSIFICATION)
+
+        with pytest.raises(LLMCapacityError) as exc:
+            await governor.acquire(LLMPurpose.CLASSIFICATION)
+        assert exc.value.reason == "queue_timeout"
+        assert not governor.bulkheads[LLMPurpose.CLASSIFICATION].waiters
+
+    @pytest.mark.asyncio
+    async def test_slot_feeds_status_errors_and_releases(self):
+        governor = _governor()
+        bulkhead = governor.bulkheads[LLMPurpose.INTERACTIVE]
+        response = httpx.Response(429, request=httpx.Request("POST", "https://api.test"))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            async with governor.slot(LLMPurpose.INTERACTIVE):
+                response.raise_for_status()
+
+        assert bulkhead.in_flight == 0
+        assert bulkhead.limit == 7
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    def test_floor_allows_retries_without_traffic(self):
+        budget = RetryBudget(ratio=0.2, min_per_second=0.2, window_seconds=10)
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+    def test_budget_scales_with_requests(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0, window_seconds=10)
+        assert budget.try_acquire() is False
+        for _ in range(4):
+            budget.record_request()
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is True
+        assert budget.try_acquire() is False
+
+
+@pytest.mark.unit
+class TestLatencyTracker:
+    def test_no_percentile_until_enough_samples(self):
+        tracker = LatencyTracker(window=100, min_samples=5)
+        for value in range(4):
+            tracker.record("k", value)
+        assert tracker.percentile("k", 0.95) is None
+
+    def test_p95_of_recent_samples(self):
+        tracker = LatencyTracker(window=100, min_samples=5)
+        for value in range(1, 101):
+            tracker.record("k", value / 100)
+        assert tracker.percentile("k", 0.95) == pytest.approx(0.96)
+
+    def test_clients_share_one_tracker(self):
+        from src.services.saptiva_client import SaptivaClient, saptiva_client
+
+        # Latencies seen by any client (e.g. per-service instances) inform every hedge
+        assert SaptivaClient().latency_tracker is saptiva_client.latency_tracker
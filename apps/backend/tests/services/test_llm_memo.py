@@ -0,0 +1,114 @@
+"""
+Tests for memoized deterministic LLM sub-tasks.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services import llm_memo
+from src.services.llm_memo import cached_chat_completion
+from src.services.saptiva_client import SaptivaResponse
+
+MESSAGES = [{"role": "user", "content": "Mensaje:  Dame el IMOR de INVEX"}]
+
+
+def _response(content="IMOR de INVEX", response_id="resp-1"):
+    return SaptivaResponse(
+        id=response_id,
+        model="Saptiva Turbo",
+        choices=[{"index": 0, "message": {"role": "assistant", "content": content}}],
+    )
+
+
+@pytest.fixture(autouse=True)
+def settings():
+    values = SimpleNamespace(llm_memo_enabled=True, llm_memo_ttl_seconds=600, llm_memo_max_temperature=0.3)
+    with patch.object(llm_memo, "get_settings", return_value=values):
+        yield values
+
+
+@pytest.fixture
+def redis_cache():
+    store = {}
+    cache = MagicMock()
+    cache.get = AsyncMock(side_effect=lambda key: store.get(key))
+    cache.set = AsyncMock(side_effect=lambda key, value, expire: store.__setitem__(key, value))
+    with patch.object(llm_memo, "get_redis_cache", AsyncMock(return_value=cache)):
+        yield cache
+
+
+def _client(response=None, side_effect=None):
+    client = MagicMock()
+    client.chat_completion = AsyncMock(return_value=response or _response(), side_effect=side_effect)
+    return client
+
+
+@pytest.mark.unit
+class TestMemoizeCompletion:
+    @pytest.mark.asyncio
+    async def test_repeated_call_is_served_from_cache(self, redis_cache):
+        client = _client()
+
+        first = await cached_chat_completion(client, messages=MESSAGES, model="SAPTIVA_TURBO", temperature=0.3)
+        second = await cached_chat_completion(
+            client,
+            messages=[{"role": "user", "content": "Mensaje: Dame el IMOR de INVEX "}],
+            model="SAPTIVA_TURBO",
+            temperature=0.3,
+            hedge=True,
+        )
+
+        client.chat_completion.assert_awaited_once()
+        assert second == first
+        assert redis_cache.set.call_args.kwargs["expire"] == 600
+
+    @pytest.mark.asyncio
+    async def test_params_are_part_of_the_key(self, redis_cache):
+        client = _client()
+
+        await cached_chat_completion(client, messages=MESSAGES, model="SAPTIVA_TURBO", temperature=0.3)
+        await cached_chat_completion(client, messages=MESSAGES, model="SAPTIVA_TURBO", temperature=0.1)
+
+        assert client.chat_completion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_bypasses_cache(self, redis_cache):
+        client = _client()
+
+        await cached_chat_completion(client, messages=MESSAGES, model="SAPTIVA_TURBO", temperature=0.7)
+
+        redis_cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mock_responses_are_not_stored(self, redis_cache):
+        client = _client(response=_response(response_id="mock-123"))
+
+        await cached_chat_completion(client, messages=MESSAGES, model="SAPTIVA_TURBO", temperature=0.3)
+
+        redis_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(self, redis_cache):
+        release = asyncio.Event()
+
+        async def slow_completion(**kwargs):
+            await release.wait()
+            return _response()
+
+        client = _client(side_effect=slow_completion)
+        tasks = [
+            asyncio.create_task(
+                cached_chat_completion(client, messages=MESSAGES, model="SAPTIVA_TURBO", temperature=0.3)
+            )
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        client.chat_completion.assert_awaited_once()
+        assert all(result.id == "resp-1" for result in results)
+        assert not llm_memo._in_flight
@@ -4,13 +4,17 @@ Tests for Simple Memory Service
 Tests the regex-based fact extraction and memory service functionality.
 """
 
+from unittest.mock import AsyncMock, Mock, patch
+
 import pytest
+from src.models.chat import ChatMemoryView
 from src.services.memory.fact_extractor import (
     extract_all,
     extract_bank,
     extract_period,
     extract_metrics,
 )
+from src.services.memory.memory_service import MemoryService
 
 
 class TestExtractBank:
@@ -211,15 +215,62 @@ class TestFormattingForLLM:
         assert any("q3_2026" in k and "imor" in k for k in all_facts)
 
 
-# Async tests for MemoryService would go here
-# Requires pytest-asyncio and database mocking
+class TestMemoryUpdate:
+    """Test the atomic fact/context update pipeline."""
+
+    def test_nothing_to_write(self):
+        assert MemoryService.build_memory_update({}, {}, max_facts=50) == []
+
+    def test_facts_are_merged_and_capped_server_side(self):
+        update = MemoryService.build_memory_update(
+            {"invex.q2_2025.imor": "2.3%"}, {}, max_facts=50
+        )
+
+        merge = update[0]["$set"]["memory_facts"]["$arrayToObject"]["$slice"]
+        concat, cap = merge
+        kept, added = concat["$concatArrays"]
+        assert cap == -50
+        assert added == [{"k": {"$literal": "invex.q2_2025.imor"}, "v": {"$literal": "2.3%"}}]
+        assert kept["$filter"]["input"] == {"$objectToArray": {"$ifNull": ["$memory_facts", {}]}}
+
+    def test_only_changed_context_keys_are_set(self):
+        update = MemoryService.build_memory_update({}, {"bank": "bbva"}, max_facts=50)
+        assert update == [{"$set": {"memory_context.bank": {"$literal": "bbva"}}}]
+
+
+class TestProcessMessage:
+    """Test MemoryService.process_message without loading the full session."""
+
+    @pytest.mark.asyncio
+    async def test_reads_projection_and_writes_once(self):
+        view = ChatMemoryView(memory_context={"bank": "invex", "period": "q2_2025"})
+        query = Mock()
+        query.update = AsyncMock()
+        model = Mock()
+        model.find_one = Mock(side_effect=[AsyncMock(return_value=view)(), query])
+
+        service = MemoryService()
+        service.settings = Mock(memory_enabled=True, memory_max_facts=50)
+
+        with patch("src.services.memory.memory_service.ChatSessionModel", model):
+            await service.process_message("chat-1", "El IMOR es 2.3%")
+
+        assert model.find_one.call_args_list[0].kwargs["projection_model"] is ChatMemoryView
+        stage = query.update.call_args.args[0][0]["$set"]
+        assert "memory_facts" in stage
+        assert "memory_context.metric" in stage
+        assert "memory_context.bank" not in stage
+
+    @pytest.mark.asyncio
+    async def test_no_write_when_nothing_extracted(self):
+        view = ChatMemoryView(memory_context={"bank": "invex"})
+        model = Mock()
+        model.find_one = Mock(return_value=AsyncMock(return_value=view)())
+
+        service = MemoryService()
+        service.settings = Mock(memory_enabled=True, memory_max_facts=50)
 
-# @pytest.mark.asyncio
-# async def test_process_message():
-#     """Test processing a message through memory service."""
-#     pass
+        with patch("src.services.memory.memory_service.ChatSessionModel", model):
+            await service.process_message("chat-1", "Gracias")
 
-# @pytest.mark.asyncio
-# async def test_get_context_for_llm():
-#     """Test building LLM context with memory."""
-#     pass
+        model.find_one.assert_called_once()
@@ -0,0 +1,131 @@
+"""
+Unit tests for MessagePersistence (batched message writes).
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.models.chat import ConversationState, MessageRole
+from src.services.message_persistence import MessagePersistence
+
+
+def _session(state=ConversationState.ACTIVE, message_count=3):
+    session = Mock()
+    session.id = "chat-1"
+    session.user_id = "user-1"
+    session.state = state
+    session.message_count = message_count
+    session.first_message_at = datetime(2024, 12, 31)
+    session.update = AsyncMock()
+    return session
+
+
+def _message():
+    message = Mock()
+    message.id = "msg-1"
+    message.chat_id = "chat-1"
+    message.role = MessageRole.USER
+    message.content = "Dame el IMOR de INVEX"
+    message.created_at = datetime(2025, 1, 1)
+    message.metadata = {"source": "api"}
+    message.insert = AsyncMock()
+    return message
+
+
+@pytest.mark.unit
+class TestSessionUpdate:
+    def test_counters_are_updated_atomically(self):
+        now = datetime(2025, 1, 1)
+        update = MessagePersistence.build_session_update(_session(), now)
+
+        assert update["$inc"] == {"message_count": 1}
+        assert update["$set"] == {"updated_at": now, "last_message_at": now}
+
+    def test_only_first_message_sets_first_message_at(self):
+        mongomock = pytest.importorskip("mongomock")
+        sessions = mongomock.MongoClient().db.chat_sessions
+        sessions.insert_one({"_id": "chat-1", "message_count": 0, "first_message_at": None})
+        first = datetime(2025, 1, 1)
+
+        for now in (first, first + timedelta(minutes=1)):
+            sessions.update_one({"_id": "chat-1"}, MessagePersistence.build_session_update(_session(), now))
+            sessions.update_one(*MessagePersistence.build_first_message_update("chat-1", now))
+
+        stored = sessions.find_one({"_id": "chat-1"})
+        assert stored["message_count"] == 2
+        assert stored["first_message_at"] == first
+        assert stored["last_message_at"] == first + timedelta(minutes=1)
+
+    def test_draft_session_becomes_active(self):
+        update = MessagePersistence.build_session_update(
+            _session(state=ConversationState.DRAFT, message_count=0),
+            datetime(2025, 1, 1),
+        )
+        assert update["$set"]["state"] == ConversationState.ACTIVE.value
+
+
+@pytest.mark.unit
+class TestPersist:
+    @pytest.mark.asyncio
+    async def test_single_redis_call_after_mongo_writes(self):
+        session = _session()
+        message = _message()
+        cache = AsyncMock()
+
+        with patch("src.services.message_persistence.get_redis_cache", AsyncMock(return_value=cache)), \
+             patch("src.services.history_service.HistoryService.record_chat_message", AsyncMock()) as record:
+            result = await MessagePersistence.persist(session, message, invalidate_research=True)
+
+        assert result is message
+        message.insert.assert_awaited_once()
+        session.update.assert_awaited_once()
+        assert record.call_args.kwargs["invalidate_cache"] is False
+
+        cache.commit_chat_message.assert_awaited_once()
+        chat_id, payload = cache.commit_chat_message.call_args.args
+        assert chat_id == "chat-1"
+        assert payload["id"] == "msg-1"
+        assert cache.commit_chat_message.call_args.kwargs["invalidate_research"] is True
+
+    @pytest.mark.asyncio
+    async def test_first_message_runs_guarded_timestamp_update(self):
+        session = _session(state=ConversationState.DRAFT, message_count=0)
+        session.first_message_at = None
+        guarded = Mock()
+        guarded.update = AsyncMock(return_value=Mock(modified_count=1))
+
+        with patch("src.services.message_persistence.get_redis_cache", AsyncMock(return_value=AsyncMock())), \
+             patch("src.services.history_service.HistoryService.record_chat_message", AsyncMock()), \
+             patch("src.services.message_persistence.ChatSessionModel.find_one", return_value=guarded) as find_one:
+            await MessagePersistence.persist(session, _message())
+
+        assert find_one.call_args.args[0] == {"_id": "chat-1", "first_message_at": None}
+        assert session.first_message_at is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_insert_rolls_back_counter(self):
+        session = _session()
+        message = _message()
+        message.insert = AsyncMock(side_effect=RuntimeError("mongo down"))
+        cache = AsyncMock()
+
+        with patch("src.services.message_persistence.get_redis_cache", AsyncMock(return_value=cache)), \
+             patch("src.services.history_service.HistoryService.record_chat_message", AsyncMock()):
+            with pytest.raises(RuntimeError):
+                await MessagePersistence.persist(session, message)
+
+        assert session.update.await_count == 2
+        assert session.update.call_args.args[0] == {"$inc": {"message_count": -1}}
+        cache.commit_chat_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_history_failure_does_not_fail_message(self):
+        session = _session()
+        message = _message()
+
+        with patch("src.services.message_persistence.get_redis_cache", AsyncMock(return_value=AsyncMock())), \
+             patch("src.services.history_service.HistoryService.record_chat_message",
+                   AsyncMock(side_effect=RuntimeError("history down"))):
+            assert await MessagePersistence.persist(session, message) is message
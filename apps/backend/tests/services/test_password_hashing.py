@@ -0,0 +1,88 @@
+"""
+Tests for the bounded password hashing pool.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.services import auth_service
+from src.services import password_hashing
+from src.services.password_hashing import PasswordHashingBusyError, PasswordHashingPool
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashingPool(workers=1, max_queue=1)
+    with patch.object(auth_service, "get_password_hashing_pool", return_value=pool):
+        yield pool
+    pool.shutdown()
+
+
+@pytest.mark.unit
+class TestPasswordHashingPool:
+    @pytest.mark.asyncio
+    async def test_jobs_run_off_the_event_loop(self, pool):
+        thread_name = await pool.run("hash", lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("password-hash")
+        await asyncio.sleep(0.01)
+        assert pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_fails_fast_with_503(self, pool):
+        release = threading.Event()
+        running = [asyncio.create_task(pool.run("verify", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        with patch("src.services.password_hashing.record_password_hash_rejection") as rejection:
+            with pytest.raises(PasswordHashingBusyError) as exc_info:
+                await pool.run("verify", release.wait)
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        rejection.assert_called_once_with("verify")
+
+        release.set()
+        await asyncio.gather(*running)
+        await asyncio.sleep(0.01)
+        assert pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_slot_until_job_finishes(self, pool):
+        release = threading.Event()
+        task = asyncio.create_task(pool.run("hash", release.wait))
+        await asyncio.sleep(0.01)
+
+        task.cancel()
+        await asyncio.sleep(0.01)
+        assert pool.pending == 1
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert pool.pending == 0
+
+    def test_shutdown_stops_the_singleton_pool(self):
+        with patch.object(password_hashing, "get_settings", return_value=Mock(password_hash_workers=1, password_hash_max_queue=1)):
+            shared = password_hashing.get_password_hashing_pool()
+        password_hashing.shutdown_password_hashing_pool()
+
+        assert shared._executor._shutdown
+        assert password_hashing._pool_instance is None
+
+    @pytest.mark.asyncio
+    async def test_login_upgrades_legacy_hash_in_the_pool(self, pool):
+        legacy_hash = auth_service._pwd_context.hash("correct-password", scheme="pbkdf2_sha256")
+        user = Mock(id="user-123", password_hash=legacy_hash, is_active=True, save=AsyncMock())
+
+        with patch.object(auth_service, "_get_user_by_identifier", AsyncMock(return_value=user)), \
+                patch.object(auth_service, "_create_token_pair", AsyncMock(return_value=("a", "r", 60))), \
+                patch.object(auth_service, "_serialize_user"), \
+                patch.object(auth_service, "AuthResponse"), \
+                patch.object(auth_service, "get_principal_cache", return_value=Mock(invalidate_user=AsyncMock())):
+            await auth_service.authenticate_user("ana", "correct-password")
+
+        assert user.password_hash.startswith("$argon2")
+        assert await auth_service._verify_and_upgrade_password("correct-password", user.password_hash) == (True, None)
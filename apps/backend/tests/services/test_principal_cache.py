@@ -0,0 +1,154 @@
+"""
+Tests for the in-process authenticated-principal cache.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.user import User
+from src.services import principal_cache as principal_cache_module
+from src.services.cache_service import token_fingerprint
+from src.services.principal_cache import BloomFilter, PrincipalCache
+
+
+def _user(**overrides):
+    values = {"id": "user-123", "username": "ana", "email": "ana@example.com", "password_hash": "x"}
+    values.update(overrides)
+    return User.model_construct(**values)
+
+
+def _claims(ttl=3600):
+    return {"sub": "user-123", "exp": int(time.time()) + ttl}
+
+
+class FakePubSub:
+    """Minimal redis.asyncio PubSub replacement fed from a queue."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self.channel = channel
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            data = await asyncio.wait_for(self.queue.get(), timeout=0.01)
+        except asyncio.TimeoutError:
+            return None
+        return {"type": "message", "data": data}
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def redis_client():
+    pubsub = FakePubSub()
+    client = MagicMock()
+    client.pubsub = MagicMock(return_value=pubsub)
+    client.publish = AsyncMock()
+
+    async def scan_iter(match, count):
+        for key in ("blacklist:revoked-token",):
+            yield key
+
+    client.scan_iter = scan_iter
+    with patch.object(principal_cache_module, "get_redis_client", AsyncMock(return_value=client)):
+        yield client
+
+
+async def _synced_cache() -> PrincipalCache:
+    cache = PrincipalCache()
+    await cache.start()
+    for _ in range(50):
+        if cache._synced:
+            break
+        await asyncio.sleep(0.01)
+    assert cache._synced
+    return cache
+
+
+@pytest.mark.unit
+class TestPrincipalCache:
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000)
+        fingerprints = [token_fingerprint(f"token-{i}") for i in range(1000)]
+        for fingerprint in fingerprints:
+            bloom.add(fingerprint)
+
+        assert all(fingerprint in bloom for fingerprint in fingerprints)
+        false_positives = sum(token_fingerprint(f"other-{i}") in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_claims_are_cached_until_token_expiry(self):
+        cache = PrincipalCache(claims_ttl_seconds=30)
+        key = cache.token_key("token")
+
+        cache.put_claims(key, _claims())
+        cached = cache.get_claims(key)
+        cached["sub"] = "tampered"
+
+        assert cache.get_claims(key)["sub"] == "user-123"
+
+        cache.put_claims(cache.token_key("expired"), _claims(ttl=-1))
+        cache.put_claims(cache.token_key("no-exp"), {"sub": "user-123"})
+        assert cache.get_claims(cache.token_key("expired")) is None
+        assert cache.get_claims(cache.token_key("no-exp")) is None
+
+    def test_user_snapshot_is_copied(self):
+        cache = PrincipalCache()
+        cache.put_user(_user())
+
+        user = cache.get_user("user-123")
+        user.is_active = False
+
+        assert cache.get_user("user-123").is_active is True
+
+    def test_disabled_cache_always_falls_through(self):
+        cache = PrincipalCache(enabled=False)
+        key = cache.token_key("token")
+        cache.put_claims(key, _claims())
+
+        assert cache.get_claims(key) is None
+        assert cache.might_be_revoked(key) is True
+
+    @pytest.mark.asyncio
+    async def test_revocations_are_mirrored_once_synced(self, redis_client):
+        unsynced = PrincipalCache()
+        assert unsynced.might_be_revoked(unsynced.token_key("fresh-token")) is True
+
+        cache = await _synced_cache()
+        try:
+            assert cache.might_be_revoked(cache.token_key("revoked-token")) is True
+            assert cache.might_be_revoked(cache.token_key("fresh-token")) is False
+
+            key = cache.token_key("fresh-token")
+            cache.put_claims(key, _claims())
+            await redis_client.pubsub().queue.put(f"token:{key}")
+            await asyncio.sleep(0.05)
+
+            assert cache.might_be_revoked(key) is True
+            assert cache.get_claims(key) is None
+        finally:
+            await cache.stop()
+        assert cache.might_be_revoked(cache.token_key("fresh-token")) is True
+
+    @pytest.mark.asyncio
+    async def test_user_invalidation_is_broadcast(self, redis_client):
+        cache = await _synced_cache()
+        try:
+            cache.put_user(_user())
+            await cache.invalidate_user("user-123")
+            redis_client.publish.assert_awaited_once_with("auth:invalidations", "user:user-123")
+            assert cache.get_user("user-123") is None
+
+            # Update published by another worker
+            cache.put_user(_user())
+            await redis_client.pubsub().queue.put("user:user-123")
+            await asyncio.sleep(0.05)
+            assert cache.get_user("user-123") is None
+        finally:
+            await cache.stop()
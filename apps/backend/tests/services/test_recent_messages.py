@@ -0,0 +1,115 @@
+"""
+Unit tests for the recent-message window (Redis write-through, MongoDB fallback).
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.models.chat import MessageRole
+from src.services.recent_messages import (
+    RecentMessage,
+    _select,
+    get_recent_messages,
+)
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _window(count):
+    """Newest-first window of alternating user/assistant messages."""
+    return [
+        RecentMessage(
+            id=f"msg-{i}",
+            role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+            content=f"mensaje {i}",
+            created_at=BASE_TIME + timedelta(minutes=i),
+        )
+        for i in reversed(range(count))
+    ]
+
+
+def _mock_cache(cached=None, generation="3"):
+    cache = AsyncMock()
+    cache.get_recent_messages = AsyncMock(return_value=(cached, generation))
+    cache.populate_recent_messages = AsyncMock(return_value=True)
+    return cache
+
+
+def _mongo_query(docs):
+    query = MagicMock()
+    query.sort = Mock(return_value=query)
+    query.limit = Mock(return_value=query)
+    query.to_list = AsyncMock(return_value=docs)
+    return query
+
+
+@pytest.mark.unit
+class TestRecentMessageSerialization:
+    def test_round_trip(self):
+        msg = RecentMessage(
+            id="m1",
+            role=MessageRole.ASSISTANT,
+            content="El IMOR es 2.3%",
+            created_at=BASE_TIME,
+            metadata={"bank_chart": True},
+        )
+        assert RecentMessage.from_dict(msg.to_dict()) == msg
+
+
+@pytest.mark.unit
+class TestSelect:
+    def test_full_window_serves_limit(self):
+        window = _window(10)
+        assert [m.id for m in _select(window, 3, None, complete=False)] == ["msg-9", "msg-8", "msg-7"]
+
+    def test_short_incomplete_window_is_a_miss(self):
+        assert _select(_window(2), 5, None, complete=False) is None
+
+    def test_short_complete_window_serves_everything(self):
+        assert len(_select(_window(2), 5, None, complete=True)) == 2
+
+    def test_after_boundary_inside_window(self):
+        window = _window(10)
+        selected = _select(window, 20, BASE_TIME + timedelta(minutes=6), complete=False)
+        assert [m.id for m in selected] == ["msg-9", "msg-8", "msg-7"]
+
+    def test_after_boundary_outside_incomplete_window_is_a_miss(self):
+        assert _select(_window(4), 10, BASE_TIME - timedelta(days=1), complete=False) is None
+
+
+@pytest.mark.unit
+class TestGetRecentMessages:
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_mongo(self):
+        cached = [m.to_dict() for m in _window(4)]
+        cache = _mock_cache(cached=cached)
+
+        with patch("src.services.recent_messages.get_redis_cache", AsyncMock(return_value=cache)), \
+             patch("src.services.recent_messages.ChatMessageModel") as MockMessage:
+            result = await get_recent_messages("chat-1", 2)
+
+        MockMessage.find.assert_not_called()
+        assert [m.id for m in result] == ["msg-3", "msg-2"]
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_loads_mongo_and_populates(self):
+        cache = _mock_cache(cached=None, generation="7")
+        docs = [
+            Mock(id=f"msg-{i}", chat_id="chat-1", role=MessageRole.USER, content=f"m{i}",
+                 created_at=BASE_TIME + timedelta(minutes=i), metadata=None)
+            for i in reversed(range(3))
+        ]
+
+        with patch("src.services.recent_messages.get_redis_cache", AsyncMock(return_value=cache)), \
+             patch("src.services.recent_messages.ChatMessageModel") as MockMessage:
+            MockMessage.find = Mock(return_value=_mongo_query(docs))
+            result = await get_recent_messages("chat-1", 2)
+
+        assert [m.id for m in result] == ["msg-2", "msg-1"]
+        cache.populate_recent_messages.assert_awaited_once()
+        args = cache.populate_recent_messages.call_args.args
+        assert args[0] == "chat-1"
+        assert len(args[1]) == 3
+        assert args[2] == "7"
@@ -234,3 +234,62 @@ async def test_streaming_does_not_retry():
 
         # Only 1 attempt for streaming (no retries)
         assert client.client.stream.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_stops_retries():
+    """
+    Test that an exhausted global retry budget fails fast instead of retrying.
+    """
+    client = SaptivaClient()
+    client.allow_mock_fallback = False
+    client.retry_budget = MagicMock()
+    client.retry_budget.try_acquire.return_value = False
+
+    with patch.object(client.client, 'request') as mock_request:
+        mock_request.side_effect = httpx.ConnectError("Upstream down")
+
+        with pytest.raises(httpx.ConnectError):
+            await client._make_request("POST", "/chat/completions", data={"model": "test"})
+
+        assert mock_request.call_count == 1  # No retries without budget
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_takes_first_response():
+    """
+    Test that a slow idempotent call is hedged after the observed p95 delay.
+
+    Scenario: first attempt hangs, hedge answers immediately.
+    """
+    import asyncio
+
+    client = SaptivaClient()
+    client.allow_mock_fallback = False
+    client.hedging_enabled = True
+    for _ in range(client.latency_tracker.min_samples):
+        client.latency_tracker.record("background:test", 0.01)
+
+    fast_response = MagicMock(status_code=200, raise_for_status=lambda: None)
+    calls = 0
+
+    async def request(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(10)
+        return fast_response
+
+    with patch.object(client.client, 'request', side_effect=request):
+        from src.services.llm_concurrency import LLMPurpose
+
+        response = await asyncio.wait_for(
+            client._make_request(
+                "POST", "/chat/completions", data={"model": "test"},
+                purpose=LLMPurpose.BACKGROUND, hedge=True
+            ),
+            timeout=2
+        )
+
+    assert response is fast_response
+    assert calls == 2
@@ -0,0 +1,162 @@
+"""
+Tests for the semantic response cache (document Q&A answer reuse).
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+from src.services import semantic_response_cache as module
+from src.services.semantic_response_cache import (
+    CacheLookup,
+    SemanticResponseCache,
+    build_scope,
+)
+
+
+def _settings(**overrides):
+    values = {
+        "semantic_cache_enabled": True,
+        "semantic_cache_threshold": 0.95,
+        "semantic_cache_ttl_seconds": 86400,
+        "semantic_cache_max_entries": 100,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _entry(embedding, answer="El IMOR es 2.3%"):
+    return json.dumps({
+        "question": "¿Cuál es el IMOR?",
+        "answer": answer,
+        "embedding": embedding,
+        "created_at": "2025-01-01T12:00:00",
+    })
+
+
+@pytest.fixture
+def redis_cache():
+    cache = MagicMock()
+    cache.client = MagicMock()
+    cache.client.lrange = AsyncMock(return_value=[])
+    cache.client.smembers = AsyncMock(return_value=set())
+    cache.client.delete = AsyncMock()
+    with patch.object(module, "get_redis_cache", AsyncMock(return_value=cache)):
+        yield cache
+
+
+@pytest.fixture
+def semantic_cache():
+    with patch.object(module, "get_settings", return_value=_settings()):
+        service = SemanticResponseCache()
+    service._content_hashes = AsyncMock(return_value=["hash-a"])
+    service._embed = AsyncMock(return_value=[1.0, 0.0])
+    return service
+
+
+async def _lookup(service):
+    return await service.lookup(
+        question="¿Cuál es el IMOR?",
+        document_ids=["doc-1"],
+        user_id="user-1",
+        model="Saptiva Turbo",
+        system_hash="abc123",
+    )
+
+
+@pytest.mark.unit
+class TestScope:
+    def test_scope_ignores_document_order(self):
+        assert build_scope("u", ["a", "b"], "m", "s") == build_scope("u", ["b", "a"], "m", "s")
+
+    def test_scope_changes_with_content_model_and_prompt(self):
+        base = build_scope("u", ["a"], "m", "s")
+        assert build_scope("u", ["a2"], "m", "s") != base
+        assert build_scope("u", ["a"], "m2", "s") != base
+        assert build_scope("u", ["a"], "m", "s2") != base
+        assert build_scope("u2", ["a"], "m", "s") != base
+
+
+@pytest.mark.unit
+class TestLookup:
+    @pytest.mark.asyncio
+    async def test_hit_above_threshold(self, semantic_cache, redis_cache):
+        redis_cache.client.lrange = AsyncMock(return_value=[
+            _entry([0.0, 1.0], answer="otra"),
+            _entry([0.99, 0.14]),
+        ])
+
+        lookup = await _lookup(semantic_cache)
+
+        assert lookup.hit.answer == "El IMOR es 2.3%"
+        assert lookup.to_metadata()["hit"] is True
+
+    @pytest.mark.asyncio
+    async def test_miss_below_threshold(self, semantic_cache, redis_cache):
+        redis_cache.client.lrange = AsyncMock(return_value=[_entry([0.9, 0.43])])
+
+        lookup = await _lookup(semantic_cache)
+
+        assert lookup.hit is None
+        assert lookup.to_metadata() == {"hit": False}
+
+    @pytest.mark.asyncio
+    async def test_unhashed_documents_are_not_cached(self, semantic_cache, redis_cache):
+        semantic_cache._content_hashes = AsyncMock(return_value=None)
+
+        assert await _lookup(semantic_cache) is None
+        redis_cache.client.lrange.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disabled_skips_lookup(self, semantic_cache, redis_cache):
+        semantic_cache.settings = _settings(semantic_cache_enabled=False)
+
+        assert await _lookup(semantic_cache) is None
+        semantic_cache._embed.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_owner_check_accepts_object_id_user_ids(self):
+        owner = ObjectId()
+        doc_ids = [str(ObjectId()), str(ObjectId())]
+        documents = [
+            SimpleNamespace(user_id=owner, content_hash="hash-a"),
+            SimpleNamespace(user_id=str(owner), content_hash="hash-b"),
+        ]
+        query = MagicMock()
+        query.to_list = AsyncMock(return_value=documents)
+        with patch.object(module, "get_settings", return_value=_settings()):
+            service = SemanticResponseCache()
+
+        with patch.object(module, "Document", MagicMock(find=MagicMock(return_value=query))):
+            assert await service._content_hashes(doc_ids, str(owner)) == ["hash-a", "hash-b"]
+            assert await service._content_hashes(doc_ids, str(ObjectId())) is None
+
+
+@pytest.mark.unit
+class TestStoreAndInvalidate:
+    @pytest.mark.asyncio
+    async def test_store_caps_scope_and_indexes_documents(self, semantic_cache, redis_cache):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis_cache.client.pipeline = MagicMock(return_value=pipe)
+        lookup = CacheLookup(scope="scope-1", content_hashes=["hash-a"], embedding=[1.0, 0.0])
+
+        await semantic_cache.store(lookup, "¿Cuál es el IMOR?", "El IMOR es 2.3%")
+
+        pipe.ltrim.assert_called_once_with("semantic_cache:scope-1", 0, 99)
+        pipe.sadd.assert_called_once_with("semantic_cache:doc:hash-a", "scope-1")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_every_scope_of_a_document(self, semantic_cache, redis_cache):
+        redis_cache.client.smembers = AsyncMock(return_value={"scope-1"})
+
+        removed = await semantic_cache.invalidate_document("hash-a")
+
+        assert removed == 1
+        redis_cache.client.delete.assert_awaited_once_with(
+            "semantic_cache:scope-1", "semantic_cache:doc:hash-a"
+        )
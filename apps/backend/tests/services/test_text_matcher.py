@@ -0,0 +1,74 @@
+"""
+Tests for compiled multi-pattern matchers and their consumers.
+"""
+
+import re
+
+import pytest
+
+from src.services.memory.fact_extractor import extract_bank, extract_metrics
+from src.services.query_understanding.intent_classifier import IntentClassifier
+from src.services.query_understanding.types import QueryIntent
+from src.services.text_matcher import KeywordMatcher, PatternMatcher
+
+
+@pytest.mark.unit
+class TestKeywordMatcher:
+    def test_longest_keyword_wins_at_same_offset(self):
+        matcher = KeywordMatcher(["cartera", "cartera vencida"])
+        assert matcher.search("La Cartera Vencida subió") == "cartera vencida"
+
+    def test_word_boundary_rejects_partial_words(self):
+        matcher = KeywordMatcher(["banco", "bancos"], word_boundary=True)
+        assert matcher.search("bancomer") is None
+        assert matcher.search("los bancos") == "bancos"
+
+    def test_finditer_reports_overlapping_hits_in_order(self):
+        matcher = KeywordMatcher(["cartera vencida", "vencida", "imor"])
+        assert list(matcher.finditer("imor y cartera vencida")) == [
+            ("imor", 0),
+            ("cartera vencida", 7),
+            ("vencida", 15),
+        ]
+
+    def test_keywords_are_escaped(self):
+        matcher = KeywordMatcher(["%", "ee.uu."])
+        assert matcher.find_all("crecimiento 5% en eexuu") == {"%"}
+
+    def test_empty_matcher_never_matches(self):
+        assert KeywordMatcher([]).matches("cualquier texto") is False
+
+
+@pytest.mark.unit
+class TestPatternMatcher:
+    def test_search_returns_first_pattern_at_leftmost_offset(self):
+        matcher = PatternMatcher({"year": r"\b20\d{2}\b", "quarter": r"\bq[1-4]\b"})
+        assert matcher.search("q3 2025") == "quarter"
+
+    def test_find_all_returns_every_label(self):
+        matcher = PatternMatcher(
+            {"year": r"\b20\d{2}\b", "bank": r"\b(invex|bbva)\b", "url": r"https?://"},
+            re.IGNORECASE,
+        )
+        assert matcher.find_all("INVEX 2024") == {"year", "bank"}
+
+    def test_inner_groups_do_not_leak_labels(self):
+        matcher = PatternMatcher([r"^(qu[eé])\s+(es)", r"(cu[aá]nto)"])
+        assert matcher.search("cuánto cuesta") == r"(cu[aá]nto)"
+
+
+@pytest.mark.unit
+class TestConsumers:
+    def test_extract_bank_returns_first_mentioned(self):
+        assert extract_bank("Compara Banorte contra BBVA") == "banorte"
+
+    def test_extract_metrics_skips_unmentioned_patterns(self):
+        assert extract_metrics("El clima es 25 grados") == {}
+
+    def test_extract_metrics_keeps_pattern_order(self):
+        metrics = extract_metrics("tasa 11%, IMOR es 3.8% e ICOR es 145%")
+        assert list(metrics) == ["imor", "icor", "tasa"]
+
+    def test_intent_classifier_strips_punctuation_once(self):
+        intent, _, _ = IntentClassifier()._apply_rules("¿cuánto cuesta?")
+        assert intent == QueryIntent.QUANTITATIVE
@@ -6,6 +6,7 @@ Valida carga de YAML, sustitución de placeholders y parámetros por modelo.
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -240,6 +241,66 @@ class TestPromptRegistry:
         system_text2, params2 = registry.resolve("default", channel="chat")
         assert params2["_metadata"]["system_hash"] == hash_value
 
+    def test_resolve_reuses_precompiled_bundle(self, sample_yaml):
+        """Test que resolve reutiliza el bundle precompilado al cargar"""
+        registry = PromptRegistry()
+        registry.load(sample_yaml)
+
+        assert ("default", None, "chat") in registry._bundles
+
+        with patch.object(registry, "_compile", wraps=registry._compile) as compile_spy:
+            registry.resolve("default", channel="chat")
+            registry.resolve("Test Model", tools_markdown="* **calc**", channel="chat")
+            registry.resolve("Test Model", tools_markdown="* **calc**", channel="chat")
+
+        # Solo la variante con tools se compila, y una sola vez
+        assert compile_spy.call_count == 1
+
+    def test_bundle_cache_evicts_least_recently_used(self, sample_yaml):
+        """Test que al llenarse la cache solo se descarta el bundle menos usado"""
+        registry = PromptRegistry()
+        registry.load(sample_yaml)
+        registry.MAX_BUNDLES = len(registry._bundles) + 1
+
+        registry.resolve("default", tools_markdown="* **a**", channel="chat")
+        registry.resolve("default", channel="chat")
+        registry.resolve("default", tools_markdown="* **b**", channel="chat")
+
+        assert len(registry._bundles) == registry.MAX_BUNDLES
+        assert ("default", None, "chat") in registry._bundles
+        assert ("default", "* **a**", "chat") in registry._bundles
+        assert ("default", "* **b**", "chat") in registry._bundles
+
+    def test_resolve_returns_independent_params(self, sample_yaml):
+        """Test que modificar los params retornados no altera la cache"""
+        registry = PromptRegistry()
+        registry.load(sample_yaml)
+
+        _, params = registry.resolve("default", channel="chat")
+        params["temperature"] = 1.5
+        del params["_metadata"]
+
+        _, params2 = registry.resolve("default", channel="chat")
+        assert params2["temperature"] == 0.3
+        assert "system_hash" in params2["_metadata"]
+
+    def test_reload_invalidates_bundles(self, sample_yaml):
+        """Test que recargar el registro descarta los bundles anteriores"""
+        registry = PromptRegistry()
+        registry.load(sample_yaml)
+        system_before, _ = registry.resolve("default", channel="chat")
+
+        with open(sample_yaml) as f:
+            data = yaml.safe_load(f)
+        data["copilot_name"] = "RenamedCopilot"
+        with open(sample_yaml, "w") as f:
+            yaml.dump(data, f)
+        registry.load(sample_yaml)
+
+        system_after, _ = registry.resolve("default", channel="chat")
+        assert "TestCopilot" in system_before
+        assert "RenamedCopilot" in system_after
+
     def test_get_available_models(self, sample_yaml):
         """Test obtener modelos disponibles"""
         registry = PromptRegistry()
@@ -88,10 +88,41 @@ class TestResourceLifecycleManager:
         # Assert
         assert result == "doc123"
         mock_document.find_one.assert_called_once_with({
-            "metadata.file_hash": file_hash,
-            "user_id": user_id
+            "user_id": user_id,
+            "content_hash": file_hash
         })
 
+    @pytest.mark.asyncio
+    async def test_same_bytes_uploaded_twice_reuse_document(self, manager):
+        """Test that a re-upload finds the document stored by the first upload."""
+        from src.models.document import Document
+
+        mongomock = pytest.importorskip("mongomock")
+        documents = mongomock.MongoClient().db.documents
+
+        async def find_one(query):
+            raw = documents.find_one(query)
+            return MagicMock(id=raw["_id"]) if raw else None
+
+        content = b"%PDF-1.4\nsame bytes"
+        digest = await manager.compute_file_hash(content)
+        legacy_hash = await manager.compute_file_hash(b"legacy bytes")
+
+        with patch.object(Document, "find_one", new=find_one, create=True):
+            # First upload: no duplicate, document stored as file_ingest does
+            assert await manager.check_duplicate_file(digest, "user123") is None
+            first = documents.insert_one({"user_id": "user123", "content_hash": digest}).inserted_id
+
+            # Second upload of the same bytes
+            assert await manager.check_duplicate_file(digest, "user123") == first
+            assert await manager.check_duplicate_file(digest, "user456") is None
+
+            # Documents uploaded before content_hash was stored
+            legacy = documents.insert_one(
+                {"user_id": "user123", "metadata": {"file_hash": legacy_hash}}
+            ).inserted_id
+            assert await manager.check_duplicate_file(legacy_hash, "user123") == legacy
+
     @pytest.mark.asyncio
     @patch("src.services.resource_lifecycle_manager.Document")
     async def test_check_duplicate_file_not_found(self, mock_document, manager):
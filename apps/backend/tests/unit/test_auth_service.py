@@ -19,7 +19,7 @@ from jose import jwt
 
 from src.services.auth_service import (
     _hash_password,
-    _verify_password,
+    _verify_and_upgrade_password,
     _validate_password_strength,
     _get_user_by_username,
     _get_user_by_email,
@@ -125,19 +125,21 @@ class TestPasswordUtilities:
         # Due to salt, hashes should differ
         assert hash1 != hash2
 
-    def test_verify_password_correct(self):
+    @pytest.mark.asyncio
+    async def test_verify_password_correct(self):
         """Correct password should verify successfully."""
         password = "MyPassword123"
         hashed = _hash_password(password)
 
-        assert _verify_password(password, hashed) is True
+        assert await _verify_and_upgrade_password(password, hashed) == (True, None)
 
-    def test_verify_password_incorrect(self):
+    @pytest.mark.asyncio
+    async def test_verify_password_incorrect(self):
         """Incorrect password should fail verification."""
         password = "correct-password"
         hashed = _hash_password(password)
 
-        assert _verify_password("wrong-password", hashed) is False
+        assert await _verify_and_upgrade_password("wrong-password", hashed) == (False, None)
 
     # NOTE: Bcrypt legacy support is tested implicitly in authenticate_user tests
     # which handle password hash upgrades from bcrypt to argon2
@@ -24,6 +24,7 @@ def mock_settings():
     settings = Mock(spec=Settings)
     settings.saptiva_base_url = "https://api.test.com"
     settings.saptiva_api_key = "test-key"
+    settings.context_summary_enabled = False
     return settings
 
 
@@ -224,12 +225,8 @@ class TestBuildMessageContext:
             )
         ]
 
-        with patch('src.services.chat_service.ChatMessageModel') as MockChatMessage:
-            mock_find = AsyncMock()
-            mock_find.sort = Mock(return_value=mock_find)
-            mock_find.limit = Mock(return_value=mock_find)
-            mock_find.to_list = AsyncMock(return_value=mock_messages)
-            MockChatMessage.find = Mock(return_value=mock_find)
+        with patch('src.services.chat_service.get_recent_messages', new_callable=AsyncMock) as mock_recent:
+            mock_recent.return_value = mock_messages
 
             result = await chat_service.build_message_context(
                 chat_session=mock_chat_session,
@@ -237,19 +234,15 @@ class TestBuildMessageContext:
                 provided_context=None
             )
 
-            # Should retrieve from DB
-            MockChatMessage.find.assert_called_once()
-            assert len(result) == 3  # 2 from DB + 1 current
+            # Should retrieve from the recent-message window (Redis, MongoDB fallback)
+            mock_recent.assert_awaited_once()
+            assert len(result) == 3  # 2 from history + 1 current
 
     @pytest.mark.asyncio
-    async def test_limits_to_10_messages(self, chat_service, mock_chat_session):
-        """Should limit retrieval to 10 recent messages"""
-        with patch('src.services.chat_service.ChatMessageModel') as MockChatMessage:
-            mock_find = AsyncMock()
-            mock_find.sort = Mock(return_value=mock_find)
-            mock_find.limit = Mock(return_value=mock_find)
-            mock_find.to_list = AsyncMock(return_value=[])
-            MockChatMessage.find = Mock(return_value=mock_find)
+    async def test_limits_to_20_messages(self, chat_service, mock_chat_session):
+        """Should limit retrieval to 20 recent messages"""
+        with patch('src.services.chat_service.get_recent_messages', new_callable=AsyncMock) as mock_recent:
+            mock_recent.return_value = []
 
             await chat_service.build_message_context(
                 chat_session=mock_chat_session,
@@ -257,8 +250,8 @@ class TestBuildMessageContext:
                 provided_context=None
             )
 
-            # Should limit to 10
-            mock_find.limit.assert_called_once_with(10)
+            # Should limit to 20
+            mock_recent.assert_awaited_once_with(mock_chat_session.id, 20)
 
 
 @pytest.mark.unit
@@ -310,21 +303,17 @@ class TestAddMessages:
 
     @pytest.mark.asyncio
     async def test_add_user_message(self, chat_service, mock_chat_session):
-        """Should add user message with file validation and cache invalidation"""
+        """Should add user message with file validation through the persistence unit"""
         # Mock the ChatMessageModel to avoid Beanie initialization
         mock_message = AsyncMock(spec=ChatMessage)
         mock_message.id = "msg-123"
-        mock_message.insert = AsyncMock()
-        mock_chat_session.save = AsyncMock()
 
         with patch('src.services.chat_service.ChatMessageModel') as MockChatMessage, \
-             patch('src.services.chat_service.get_redis_cache') as mock_get_cache, \
+             patch('src.services.chat_service.MessagePersistence') as MockPersistence, \
              patch('fastapi.encoders.jsonable_encoder', return_value={}):
 
             MockChatMessage.return_value = mock_message
-            mock_cache = AsyncMock()
-            mock_cache.invalidate_chat_history = AsyncMock()
-            mock_get_cache.return_value = mock_cache
+            MockPersistence.persist = AsyncMock(return_value=mock_message)
 
             result = await chat_service.add_user_message(
                 chat_session=mock_chat_session,
@@ -338,15 +327,9 @@ class TestAddMessages:
             assert call_args.kwargs["content"] == "User message"
             assert call_args.kwargs["chat_id"] == mock_chat_session.id
 
-            # Should insert message
-            mock_message.insert.assert_called_once()
-
-            # Should update session stats
-            assert mock_chat_session.message_count == 1
-            mock_chat_session.save.assert_called_once()
-
-            # Should invalidate cache
-            mock_cache.invalidate_chat_history.assert_called_once_with(mock_chat_session.id)
+            # Message, session stats, history and cache go through one batch
+            MockPersistence.persist.assert_awaited_once_with(mock_chat_session, mock_message)
+            mock_chat_session.save.assert_not_called()
 
             assert result == mock_message
 
@@ -356,13 +339,9 @@ class TestAddMessages:
         mock_message = AsyncMock(spec=ChatMessage)
         mock_message.id = "msg-456"
         mock_chat_session.add_message = AsyncMock(return_value=mock_message)
+        chat_service.settings.memory_enabled = True
 
-        with patch('src.services.chat_service.get_redis_cache') as mock_get_cache:
-            mock_cache = AsyncMock()
-            mock_cache.invalidate_chat_history = AsyncMock()
-            mock_cache.invalidate_research_tasks = AsyncMock()
-            mock_get_cache.return_value = mock_cache
-
+        with patch.object(chat_service, '_schedule_fact_extraction') as mock_schedule:
             result = await chat_service.add_assistant_message(
                 chat_session=mock_chat_session,
                 content="AI response",
@@ -381,8 +360,7 @@ class TestAddMessages:
             assert call_args.kwargs["task_id"] == "task-789"
             assert call_args.kwargs["tokens"] == {"prompt": 100, "completion": 50}
 
-            # Should invalidate both caches when task_id present
-            mock_cache.invalidate_chat_history.assert_called_once()
-            mock_cache.invalidate_research_tasks.assert_called_once()
+            # Fact extraction runs in the background, off the critical path
+            mock_schedule.assert_called_once_with(mock_chat_session, "AI response")
 
             assert result == mock_message
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Tests for usage-driven preloading in LazyToolRegistry.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.mcp.lazy_registry import STATS_KEY, LazyToolRegistry, ToolMetadata
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+def _registry(tmp_path, redis_client) -> LazyToolRegistry:
+    registry = LazyToolRegistry(tools_directory=tmp_path)
+    # Any importable, no-arg class stands in for a tool
+    for name, module_path, class_name in (
+        ("decoder", "json", "JSONDecoder"),
+        ("ordered", "collections", "OrderedDict"),
+        ("counter", "collections", "Counter"),
+    ):
+        registry._metadata_cache[name] = ToolMetadata(name, module_path, class_name)
+    registry._redis = redis_client
+    return registry
+
+
+@pytest.mark.unit
+class TestLazyRegistryPreload:
+    @pytest.mark.asyncio
+    async def test_load_time_and_calls_are_recorded_and_persisted(self, tmp_path, redis_client):
+        registry = _registry(tmp_path, redis_client)
+
+        await registry.load_tool("decoder")
+        registry.record_call("decoder")
+        registry.record_call("decoder")
+        registry.record_call("unknown")
+        await registry.persist_stats()
+        registry.record_call("decoder")
+        await registry.persist_stats()
+
+        saved = await redis_client.hgetall(STATS_KEY)
+        assert saved["calls:decoder"] == "3"
+        assert float(saved["load_ms:decoder"]) >= 0
+        stats = registry.get_registry_stats()
+        assert stats["tools_loaded"] == 1
+        assert stats["usage"]["decoder"]["calls"] == 3
+        assert stats["usage"]["ordered"] == {"calls": 0, "load_ms": None, "loaded": False, "preloaded": False}
+
+    @pytest.mark.asyncio
+    async def test_preload_uses_persisted_ranking(self, tmp_path, redis_client):
+        await redis_client.hset(STATS_KEY, mapping={
+            "calls:counter": 10, "calls:ordered": 4, "calls:decoder": 4,
+            "load_ms:decoder": 250.0, "load_ms:ordered": 5.0, "calls:removed_tool": 99,
+        })
+        registry = _registry(tmp_path, redis_client)
+        await registry.load_persisted_stats()
+
+        assert registry.preload_candidates(2) == ["counter", "decoder"]  # ties go to the slower import
+        assert await registry.preload(2) == ["counter", "decoder"]
+        stats = registry.get_registry_stats()
+        assert stats["preload"]["tools"] == ["decoder", "counter"]
+        assert stats["tools_loaded_list"] == ["counter", "decoder"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_import_once(self, tmp_path, redis_client):
+        registry = _registry(tmp_path, redis_client)
+
+        with patch("src.mcp.lazy_registry.importlib.import_module", wraps=__import__("importlib").import_module) as imp:
+            tools = await asyncio.gather(*(registry.load_tool("ordered") for _ in range(5)))
+
+        assert imp.call_count == 1
+        assert all(tool is tools[0] for tool in tools)
+
+    @pytest.mark.asyncio
+    async def test_persist_failure_keeps_pending_stats(self, tmp_path, redis_client):
+        registry = _registry(tmp_path, redis_client)
+        registry.record_call("counter")
+
+        with patch.object(redis_client, "pipeline", side_effect=ConnectionError("down")):
+            await registry.persist_stats()
+        registry.record_call("counter")
+        await registry.persist_stats()
+
+        assert await redis_client.hget(STATS_KEY, "calls:counter") == "2"
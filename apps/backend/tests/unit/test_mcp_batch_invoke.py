@@ -0,0 +1,137 @@
+"""
+Tests for POST /mcp/invoke/batch.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.mcp.security import RateLimiter
+
+# The adapter needs the FastMCP server extras (and the real `mcp` SDK on sys.path)
+fastapi_adapter = pytest.importorskip("src.mcp.fastapi_adapter", exc_type=ImportError)
+
+
+def _events(response) -> list:
+    events, name = [], None
+    for line in response.text.splitlines():
+        if line.startswith("event:"):
+            name = line.split(":", 1)[1].strip()
+        elif line.startswith("data:"):
+            events.append((name, json.loads(line.split(":", 1)[1])))
+    return events
+
+
+@pytest.fixture
+def running():
+    return {"now": 0, "max": 0}
+
+
+@pytest.fixture
+def client(running):
+    async def _auth():
+        return SimpleNamespace(id="user_123", username="ana", email="ana@example.com")
+
+    async def slow_tool(payload):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(payload.get("sleep", 0.2))
+        running["now"] -= 1
+        return {"slept": payload.get("sleep", 0.2)}
+
+    async def fast_tool(payload):
+        return {"echo": payload.get("value")}
+
+    adapter = fastapi_adapter.MCPFastAPIAdapter(
+        mcp_server=fastapi_adapter.FastMCP("Test MCP"),
+        auth_dependency=_auth,
+    )
+    tool_map = {"slow_tool": slow_tool, "fast_tool": fast_tool}
+    limiter = RateLimiter(use_redis=False)
+
+    with patch.object(adapter, "_get_tool_map", AsyncMock(return_value=tool_map)), \
+            patch.object(fastapi_adapter, "rate_limiter", limiter):
+        app = FastAPI()
+        app.include_router(adapter.create_router())
+        client = TestClient(app)
+        client.limiter = limiter
+        yield client
+
+
+@pytest.mark.unit
+class TestBatchInvoke:
+    def test_results_stream_in_completion_order(self, client):
+        with patch.object(client.limiter, "check_rate_limit", wraps=client.limiter.check_rate_limit) as check:
+            response = client.post("/mcp/invoke/batch", json={"invocations": [
+                {"tool": "slow_tool", "payload": {"sleep": 0.2}},
+                {"tool": "fast_tool", "payload": {"value": 1}},
+                {"tool": "fast_tool", "payload": {"value": 2}},
+            ]})
+
+        events = _events(response)
+        results = [data for name, data in events if name == "result"]
+        assert response.status_code == 200
+        assert [r["index"] for r in results][-1] == 0  # the slow one finishes last
+        assert {r["index"]: r["result"] for r in results}[2] == {"echo": 2}
+        assert events[-1] == ("done", {**events[-1][1], "total": 3, "succeeded": 3, "failed": 0})
+        # One rate-limit check per tool, charged for all its invocations
+        assert sorted(c.kwargs["cost"] for c in check.call_args_list) == [1, 2]
+
+    def test_concurrency_cap_and_per_item_timeout(self, client, running):
+        response = client.post("/mcp/invoke/batch", json={
+            "max_concurrency": 2,
+            "invocations": [
+                {"tool": "slow_tool", "payload": {"sleep": 0.05}},
+                {"tool": "slow_tool", "payload": {"sleep": 0.05}},
+                {"tool": "slow_tool", "payload": {"sleep": 0.05}},
+                {"tool": "slow_tool", "payload": {"sleep": 1.0}, "timeout_ms": 100},
+            ],
+        })
+
+        results = {data["index"]: data for name, data in _events(response) if name == "result"}
+        assert running["max"] == 2
+        assert results[3]["error"]["code"] == "TIMEOUT"
+        assert all(results[i]["success"] for i in range(3))
+
+    def test_invalid_items_fail_alone_and_bad_batches_are_rejected(self, client):
+        deep = {"a": {"b": {"c": {"d": {"e": {"f": {"g": {"h": {"i": {"j": {"k": {"l": 1}}}}}}}}}}}}
+        response = client.post("/mcp/invoke/batch", json={"invocations": [
+            {"tool": "fast_tool", "payload": deep},
+            {"tool": "fast_tool", "payload": {"value": 1}},
+        ]})
+        results = {data["index"]: data for name, data in _events(response) if name == "result"}
+        assert results[0]["error"]["code"] == "VALIDATION_ERROR"
+        assert results[1]["success"]
+
+        assert client.post("/mcp/invoke/batch", json={"invocations": []}).status_code == 400
+        assert client.post("/mcp/invoke/batch", json={"invocations": [{"payload": {}}]}).status_code == 400
+        too_many = [{"tool": "fast_tool"}] * 21
+        assert client.post("/mcp/invoke/batch", json={"invocations": too_many}).status_code == 400
+
+    @pytest.mark.parametrize("body", [
+        {"max_concurrency": "many"},
+        {"timeout_ms": -1},
+        {"max_concurrency": 0},
+        {"item_timeout_ms": "soon"},
+    ])
+    def test_bad_options_are_rejected_before_streaming(self, client, body):
+        item = {"tool": "fast_tool", "payload": {"value": 1}}
+        if "item_timeout_ms" in body:
+            item["timeout_ms"] = body.pop("item_timeout_ms")
+
+        response = client.post("/mcp/invoke/batch", json={"invocations": [item], **body})
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Invalid batch request:")
+
+    def test_failing_checks_return_execution_error(self, client):
+        with patch.object(client.limiter, "check_rate_limit", AsyncMock(side_effect=RuntimeError("redis down"))):
+            response = client.post("/mcp/invoke", json={"tool": "fast_tool", "payload": {"value": 1}})
+
+        assert response.status_code == 200
+        assert response.json()["error"]["code"] == "EXECUTION_ERROR"
@@ -0,0 +1,100 @@
+"""
+Tests for per-phase MCP latency metrics, rolling percentiles and SLO checks.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.mcp import metrics
+from src.mcp.metrics import LatencyTracker, LatencyWindow, MCPMetricsCollector
+
+
+@pytest.fixture
+def tracker():
+    tracker = LatencyTracker(
+        window_seconds=60, max_samples=100, slo_p95_ms=500,
+        slo_overrides={"audit_file": 5000}, slo_min_samples=5,
+    )
+    with patch.object(metrics, "latency_tracker", tracker):
+        yield tracker
+
+
+@pytest.mark.unit
+class TestLatencyMetrics:
+    def test_window_percentiles_drop_expired_samples(self):
+        window = LatencyWindow(window_seconds=10, max_samples=1000)
+        window.add(9.0, now=50.0)  # outside the window at t=105
+        for i in range(100):
+            window.add((i + 1) / 1000, now=100.0)
+
+        stats = window.percentiles(now=105.0)
+
+        assert stats["count"] == 100
+        assert (stats["p50_ms"], stats["p95_ms"], stats["p99_ms"], stats["max_ms"]) == (51.0, 96.0, 100.0, 100.0)
+        assert window.percentiles(now=200.0) is None
+
+    def test_invocation_phases_feed_histograms_and_windows(self, tracker):
+        MCPMetricsCollector.record_tool_invocation(
+            tool="excel_analyzer", version="1.0.0", status="success", duration_seconds=0.3,
+            outcome="success", phases={"validation": 0.001, "execution": 0.29},
+        )
+        MCPMetricsCollector.record_tool_invocation(
+            tool="excel_analyzer", version="1.0.0", status="error", duration_seconds=0.001,
+            outcome="validation_error",
+        )
+
+        summary = metrics.get_metrics_summary()["latency"]["excel_analyzer"]
+        assert set(summary) == {"validation", "execution", "total"}
+        assert summary["total"]["count"] == 1  # rejected invocation kept out
+        assert summary["execution"]["p95_ms"] == 290.0
+
+    def test_slo_report_flags_tools_over_target(self, tracker):
+        for _ in range(10):
+            # Phases recorded without a resolved version still meet the total
+            MCPMetricsCollector.record_tool_invocation(
+                tool="get_relevant_segments", version="1.0.0", status="success",
+                duration_seconds=0.9, outcome="success", phases={"execution": 0.2},
+            )
+            MCPMetricsCollector.record_tool_phase("get_relevant_segments", "latest", "cache_lookup", 0.65)
+            tracker.observe("audit_file", "total", 2.0)  # within its override
+        for _ in range(3):
+            tracker.observe("viz_tool", "total", 3.0)  # too few samples
+
+        report = {entry["tool"]: entry for entry in tracker.slo_report()}
+
+        assert report["get_relevant_segments"]["breached"] is True
+        assert report["get_relevant_segments"]["slowest_phase"] == "cache_lookup"
+        assert report["audit_file"]["breached"] is False
+        assert report["audit_file"]["target_p95_ms"] == 5000
+        assert report["viz_tool"]["breached"] is False
+        assert [e["tool"] for e in metrics.get_metrics_summary()["slo_breaches"]] == ["get_relevant_segments"]
+
+    def test_async_tasks_are_checked_against_the_slo(self, tracker):
+        for _ in range(5):
+            MCPMetricsCollector.record_tool_phase("deep_research", "latest", "queue_wait", 0.4)
+            MCPMetricsCollector.record_task_latency("deep_research", 1.2)
+
+        (entry,) = tracker.slo_report()
+
+        assert entry["tool"] == "deep_research"
+        assert entry["samples"] == 5
+        assert entry["breached"] is True
+        assert entry["slowest_phase"] == "queue_wait"
+
+    def test_series_are_capped(self, tracker, monkeypatch):
+        monkeypatch.setattr(LatencyTracker, "MAX_SERIES", 2)
+        for tool in ("a", "b", "c"):
+            tracker.observe(tool, "total", 0.1)
+        assert set(tracker.summary()) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_tool_result_cache_records_lookup_phase(self, tracker):
+        fakeredis = pytest.importorskip("fakeredis")
+        from src.services.mcp_cache import ToolResultCache
+
+        cache = ToolResultCache(client=fakeredis.FakeAsyncRedis(decode_responses=True))
+        for _ in range(2):
+            await cache.get_or_compute("audit_file", "doc_1", None, AsyncMock(return_value={"ok": 1}))
+
+        assert tracker.summary()["audit_file"]["cache_lookup"]["count"] == 2
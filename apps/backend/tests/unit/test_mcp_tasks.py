@@ -0,0 +1,318 @@
+"""
+Tests for the MCP task manager backends, priority dispatch, cancellation
+and progress streaming.
+"""
+
+import asyncio
+
+import pytest
+
+from src.mcp.tasks import RedisTaskBackend, TaskManager, TaskPriority, TaskStatus
+from src.mcp.tasks import InMemoryTaskBackend, TaskBackend, get_task_context
+
+
+async def _wait_for(condition, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.mark.unit
+class TestTaskManager:
+    @pytest.mark.asyncio
+    async def test_workers_run_higher_priority_first(self):
+        manager = TaskManager(backend=InMemoryTaskBackend(), workers=1)
+        ran = []
+
+        async def runner(task):
+            ran.append(task.tool)
+            manager.mark_running(task.task_id)
+            manager.mark_completed(task.task_id, {})
+
+        for tool, priority in [("low", TaskPriority.LOW), ("normal", TaskPriority.NORMAL), ("high", TaskPriority.HIGH)]:
+            await manager.submit(manager.create_task(tool=tool, payload={}, user_id="u1", priority=priority))
+
+        await manager.start(runner=runner)
+        try:
+            await _wait_for(lambda: len(ran) == 3)
+        finally:
+            await manager.stop()
+
+        assert ran == ["high", "normal", "low"]
+        assert await manager.count(TaskStatus.COMPLETED) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_before_dispatch_never_runs(self):
+        manager = TaskManager(backend=InMemoryTaskBackend(), workers=1)
+        ran = []
+
+        async def runner(task):
+            ran.append(task.task_id)
+
+        task_id = manager.create_task(tool="slow", payload={}, user_id="u1")
+        await manager.submit(task_id)
+        assert await manager.cancel(task_id)
+
+        await manager.start(runner=runner)
+        try:
+            await _wait_for(lambda: manager.get_task(task_id).status == TaskStatus.CANCELLED)
+        finally:
+            await manager.stop()
+
+        assert ran == []
+
+    def test_list_tasks_uses_indexes(self):
+        manager = TaskManager(backend=InMemoryTaskBackend(), workers=0)
+        first = manager.create_task(tool="a", payload={}, user_id="u1")
+        second = manager.create_task(tool="b", payload={}, user_id="u1")
+        manager.create_task(tool="a", payload={}, user_id="u2")
+        manager.mark_running(first)
+
+        assert [t.task_id for t in manager.list_tasks(user_id="u1")] == [second, first]
+        assert [t.task_id for t in manager.list_tasks(user_id="u1", status=TaskStatus.RUNNING)] == [first]
+        assert len(manager.list_tasks(status=TaskStatus.PENDING)) == 2
+        assert manager._by_status[TaskStatus.PENDING].keys() >= {second}
+
+
+@pytest.mark.unit
+class TestTaskContext:
+    @pytest.mark.asyncio
+    async def test_running_tool_stops_at_next_progress_checkpoint(self):
+        manager = TaskManager(backend=InMemoryTaskBackend(), workers=0)
+        task_id = manager.create_task(tool="audit", payload={}, user_id="u1")
+        manager.mark_running(task_id)
+        steps = []
+
+        async def tool():
+            ctx = get_task_context()
+            for step in range(100):
+                steps.append(step)
+                await ctx.report_progress(step, 100, f"page {step}")
+                await asyncio.sleep(0.01)
+
+        with manager.task_context(task_id) as context:
+            running = asyncio.create_task(context.run(tool(), grace_seconds=10))
+            await _wait_for(lambda: len(steps) >= 3)
+            assert manager.request_cancellation(task_id)
+            with pytest.raises(asyncio.CancelledError):
+                await running
+
+        assert len(steps) < 10
+        assert manager.get_task(task_id).progress_message.startswith("page ")
+        assert get_task_context() is None
+
+    @pytest.mark.asyncio
+    async def test_tool_ignoring_cancellation_is_cancelled_after_grace(self):
+        manager = TaskManager(backend=InMemoryTaskBackend(), workers=0)
+        task_id = manager.create_task(tool="slow", payload={}, user_id="u1")
+
+        with manager.task_context(task_id) as context:
+            running = asyncio.create_task(context.run(asyncio.sleep(30), grace_seconds=0.05))
+            await asyncio.sleep(0.01)
+            manager.request_cancellation(task_id)
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(running, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_watch_streams_progress_until_terminal(self):
+        manager = TaskManager(backend=InMemoryTaskBackend(), workers=0)
+        task_id = manager.create_task(tool="excel_analyzer", payload={}, user_id="u1")
+        seen = []
+
+        async def watcher():
+            async for task in manager.watch(task_id):
+                seen.append((task.status, task.progress))
+
+        watching = asyncio.create_task(watcher())
+        await _wait_for(lambda: seen)
+        manager.mark_running(task_id)
+        manager.update_progress(task_id, 0.5, "Analyzing rows...")
+        manager.update_progress(task_id, 0.5, "Analyzing rows...")  # no change, not re-sent
+        manager.mark_completed(task_id, {"rows": 10})
+        await asyncio.wait_for(watching, timeout=1)
+
+        assert seen == [
+            (TaskStatus.PENDING, 0.0),
+            (TaskStatus.RUNNING, 0.0),
+            (TaskStatus.RUNNING, 0.5),
+            (TaskStatus.COMPLETED, 1.0),
+        ]
+        assert manager._watchers == {}
+        assert [t async for t in manager.watch("missing")] == []
+
+
+@pytest.mark.unit
+class TestRedisTaskBackend:
+    @pytest.mark.asyncio
+    async def test_task_created_on_one_replica_runs_on_another(self, redis_client):
+        api = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+        worker = TaskManager(backend=RedisTaskBackend(redis_client), workers=2)
+
+        async def runner(task):
+            worker.mark_running(task.task_id)
+            worker.mark_completed(task.task_id, {"echo": task.payload["value"]})
+
+        task_id = api.create_task(tool="echo", payload={"value": 1}, user_id="u1", priority=TaskPriority.HIGH)
+        await api.submit(task_id)
+        assert await redis_client.lrange("mcp:tasks:queue:high", 0, -1) == [task_id]
+
+        await worker.start(runner=runner)
+        try:
+            async def completed():
+                task = await api.fetch_task(task_id)
+                return task.status == TaskStatus.COMPLETED
+
+            for _ in range(200):
+                if await completed():
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.stop()
+
+        task = await api.fetch_task(task_id)
+        assert task.status == TaskStatus.COMPLETED
+        assert task.result == {"echo": 1}
+        assert [t.task_id for t in await api.fetch_tasks(user_id="u1", status=TaskStatus.COMPLETED)] == [task_id]
+        assert await api.count(TaskStatus.PENDING) == 0
+        assert await api.count(TaskStatus.COMPLETED) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_reaches_running_replica(self, redis_client):
+        api = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+        worker = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+
+        task_id = api.create_task(tool="slow", payload={}, user_id="u1")
+        await api.flush()
+        # The worker owns the running copy; the API replica only has Redis
+        assert await worker._claim(task_id) is not None
+        worker.mark_running(task_id)
+        await worker.flush()
+        del api.tasks[task_id]
+
+        await worker.start()
+        try:
+            await asyncio.sleep(0.05)  # Let the listener subscribe
+            assert await api.cancel(task_id)
+            await _wait_for(lambda: worker.is_cancellation_requested(task_id))
+        finally:
+            await worker.stop()
+
+        assert (await api.fetch_task(task_id)).cancellation_requested
+
+    @pytest.mark.asyncio
+    async def test_cancel_keeps_state_of_task_claimed_elsewhere(self, redis_client):
+        api = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+        worker = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+
+        task_id = api.create_task(tool="slow", payload={}, user_id="u1")
+        await api.submit(task_id)
+        # The API replica keeps its stale PENDING copy while the worker runs the task
+        assert await worker._claim(task_id) is not None
+        worker.mark_running(task_id)
+        worker.update_progress(task_id, 0.6)
+        await worker.flush()
+
+        assert await api.cancel(task_id)
+        await api.flush()
+
+        task = await api.fetch_task(task_id)
+        assert task.status == TaskStatus.RUNNING
+        assert task.progress == 0.6
+        assert task.started_at is not None
+        assert task.cancellation_requested
+        assert await redis_client.zrange("mcp:tasks:status:running", 0, -1) == [task_id]
+        assert await redis_client.zcard("mcp:tasks:status:pending") == 0
+
+        # Later saves by the running replica keep the flag
+        worker.update_progress(task_id, 0.8)
+        await worker.flush()
+        assert (await api.fetch_task(task_id)).cancellation_requested
+
+    @pytest.mark.asyncio
+    async def test_changes_made_during_a_slow_save_are_written(self, redis_client):
+        class SlowSaveBackend(RedisTaskBackend):
+            async def save(self, task):
+                saving.set()
+                await release.wait()
+                await super().save(task)
+
+        saving, release = asyncio.Event(), asyncio.Event()
+        manager = TaskManager(backend=SlowSaveBackend(redis_client), workers=0)
+        task_id = manager.create_task(tool="slow", payload={}, user_id="u1")
+        manager.mark_running(task_id)
+        manager.update_progress(task_id, 0.5)
+        await asyncio.wait_for(saving.wait(), timeout=1)
+
+        # The write-through of RUNNING is in flight when the task completes
+        manager.mark_completed(task_id, {"ok": True})
+        release.set()
+        await manager.flush()
+
+        assert (await manager.backend.get(task_id)).status == TaskStatus.COMPLETED
+        assert manager._dirty == {}
+
+    @pytest.mark.asyncio
+    async def test_expired_tasks_are_pruned_from_user_index(self, redis_client):
+        manager = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+        kept = manager.create_task(tool="a", payload={}, user_id="u1")
+        gone = manager.create_task(tool="a", payload={}, user_id="u1")
+        await manager.flush()
+        await redis_client.delete(f"mcp:tasks:task:{gone}")
+
+        tasks = await manager.backend.list(user_id="u1")
+
+        assert [t.task_id for t in tasks] == [kept]
+        assert await redis_client.zrange("mcp:tasks:user:u1", 0, -1) == [kept]
+
+    @pytest.mark.asyncio
+    async def test_listings_are_paged(self, redis_client):
+        manager = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+        # Ordered IDs: tasks created in the same microsecond tie on score
+        ids = [
+            manager.create_task(tool="a" if i % 2 else "b", payload={}, user_id="u1", task_id=f"t{i}")
+            for i in range(7)
+        ]
+        await manager.flush()
+        await redis_client.delete(f"mcp:tasks:task:{ids[5]}")
+        newest_a = [i for n, i in reversed(list(enumerate(ids))) if n % 2 and n != 5]
+
+        page = await manager.fetch_tasks(user_id="u1", tool="a", offset=1, limit=1)
+        everything = await manager.fetch_tasks(status=TaskStatus.PENDING, offset=2, limit=3)
+
+        assert [t.task_id for t in page] == newest_a[1:2]
+        assert [t.task_id for t in everything] == list(reversed(ids[:5]))[1:4]
+        with pytest.raises(TypeError):
+            TaskBackend()
+
+    @pytest.mark.asyncio
+    async def test_watch_sees_progress_made_on_another_replica(self, redis_client):
+        api = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+        worker = TaskManager(backend=RedisTaskBackend(redis_client), workers=0)
+
+        task_id = api.create_task(tool="deep_research", payload={}, user_id="u1")
+        await api.flush()
+        assert await worker._claim(task_id) is not None
+        seen = []
+
+        async def watcher():
+            async for task in api.watch(task_id, refresh_seconds=5):
+                seen.append(task.progress_message)
+
+        watching = asyncio.create_task(watcher())
+        await _wait_for(lambda: seen == [None])
+        worker.mark_running(task_id)
+        worker.update_progress(task_id, 0.3, "Searching sources")
+        await worker.flush()
+        worker.mark_completed(task_id, {"summary": "ok"})
+        await worker.flush()
+        await asyncio.wait_for(watching, timeout=2)
+
+        assert "Searching sources" in seen
+        assert (await api.fetch_task(task_id)).status == TaskStatus.COMPLETED
@@ -0,0 +1,92 @@
+"""
+Tests for the compiled, ETag-able MCP tool catalog.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.mcp.versioning import versioned_registry
+
+# The adapter needs the FastMCP server extras (and the real `mcp` SDK on sys.path)
+fastapi_adapter = pytest.importorskip("src.mcp.fastapi_adapter", exc_type=ImportError)
+
+
+def _tool(description: str):
+    return SimpleNamespace(
+        description=description,
+        parameters={"type": "object", "properties": {"doc_id": {"type": "string"}}, "required": ["doc_id"]},
+        output_schema={"type": "object"},
+    )
+
+
+@pytest.fixture
+def adapter():
+    async def _auth():
+        return SimpleNamespace(id="user_123", username="ana", email="ana@example.com")
+
+    adapter = fastapi_adapter.MCPFastAPIAdapter(
+        mcp_server=fastapi_adapter.FastMCP("Test MCP"),
+        auth_dependency=_auth,
+    )
+    tool_map = {"audit_file": _tool("Audit a file"), "excel_analyzer": _tool("Analyze Excel")}
+    with patch.object(adapter, "_get_tool_map", AsyncMock(return_value=tool_map)):
+        yield adapter
+
+
+@pytest.fixture
+def client(adapter):
+    app = FastAPI()
+    app.include_router(adapter.create_router())
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestToolCatalog:
+    def test_catalog_is_compiled_once_and_revalidated_with_304(self, adapter, client):
+        with patch.object(adapter, "_build_tool_spec", wraps=adapter._build_tool_spec) as build:
+            first = client.get("/mcp/tools")
+            second = client.get("/mcp/tools", headers={"If-None-Match": first.headers["ETag"]})
+            client.get("/mcp/discover?include_schema=true")
+
+        assert first.status_code == 200
+        assert [t["name"] for t in first.json()] == ["audit_file", "excel_analyzer"]
+        assert first.json()[0]["input_schema"]["required"] == ["doc_id"]
+        assert second.status_code == 304
+        assert second.content == b""
+        assert build.call_count == 2  # once per tool, not per request
+
+    def test_version_changes_invalidate_catalog(self, client):
+        etag = client.get("/mcp/tools").headers["ETag"]
+        try:
+            versioned_registry.register("audit_file", "2.0.0", _tool("Audit a file v2"))
+            response = client.get("/mcp/tools", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert response.json()[0]["version"] == "2.0.0"
+
+            deprecated_etag = response.headers["ETag"]
+            versioned_registry.register("audit_file", "1.0.0", _tool("Audit a file"))
+            versioned_registry.deprecate_version("audit_file", "1.0.0", "2.0.0")
+            assert client.get("/mcp/tools").headers["ETag"] != deprecated_etag
+        finally:
+            versioned_registry.unregister("audit_file")
+
+        assert client.get("/mcp/tools").headers["ETag"] == etag
+
+    def test_discover_and_schema_support_if_none_match(self, adapter, client):
+        discover = client.get("/mcp/discover?search=excel")
+        assert [t["name"] for t in discover.json()["tools"]] == ["excel_analyzer"]
+        assert client.get(
+            "/mcp/discover?search=excel", headers={"If-None-Match": discover.headers["ETag"]}
+        ).status_code == 304
+
+        with patch.object(adapter, "_get_tool_input_schema", wraps=adapter._get_tool_input_schema) as extract:
+            schema = client.get("/mcp/schema/audit_file")
+            cached = client.get("/mcp/schema/audit_file", headers={"If-None-Match": f'W/{schema.headers["ETag"]}'})
+
+        assert schema.json()["example_payload"] == {"doc_id": "example_doc_id"}
+        assert cached.status_code == 304
+        assert extract.call_count == 1
@@ -0,0 +1,96 @@
+"""
+Tests for the tag-versioned MCP tool result cache.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.mcp_cache import ToolResultCache, generate_cache_key
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def cache(redis_client):
+    return ToolResultCache(client=redis_client, stale_seconds=60, compress_min_bytes=100)
+
+
+class Tool:
+    """Counts executions; can be held open to simulate a slow audit."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.result
+
+
+@pytest.mark.unit
+class TestToolResultCache:
+    @pytest.mark.asyncio
+    async def test_large_results_are_compressed_and_served_fresh(self, cache, redis_client):
+        findings = {"findings": [{"rule": "font", "page": i} for i in range(50)]}
+        tool = Tool(findings)
+
+        assert await cache.get_or_compute("audit_file", "doc_1", {"policy_id": "auto"}, tool, ttl=60) == findings
+        assert await cache.get_or_compute("audit_file", "doc_1", {"policy_id": "auto"}, tool, ttl=60) == findings
+
+        entry = await redis_client.hgetall(generate_cache_key("audit_file", "doc_1", {"policy_id": "auto"}))
+        assert tool.calls == 1
+        assert entry["codec"] == "zlib"
+        assert len(entry["data"]) < len(str(findings))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_execution(self, cache):
+        tool = Tool({"text": "ok"})
+        tool.release.clear()
+
+        callers = [asyncio.create_task(cache.get_or_compute("extract_document_text", "doc_1", None, tool))
+                   for _ in range(5)]
+        await asyncio.sleep(0.01)
+        tool.release.set()
+
+        assert [await c for c in callers] == [{"text": "ok"}] * 5
+        assert tool.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_one_refresher_runs(self, cache, redis_client):
+        old, new = Tool({"v": 1}), Tool({"v": 2})
+        await cache.get_or_compute("audit_file", "doc_1", None, old, ttl=60)
+        key = generate_cache_key("audit_file", "doc_1")
+        await redis_client.hset(key, "fresh_until", 0)
+
+        new.release.clear()
+        first = await cache.get_or_compute("audit_file", "doc_1", None, new, ttl=60)
+        second = await cache.get_or_compute("audit_file", "doc_1", None, new, ttl=60)
+        assert first == second == {"v": 1}
+
+        new.release.set()
+        await asyncio.gather(*cache._refreshing)
+        assert new.calls == 1
+        assert await cache.get_or_compute("audit_file", "doc_1", None, new, ttl=60) == {"v": 2}
+        assert await redis_client.exists("mcp:tool_refresh:" + key) == 0
+
+    @pytest.mark.asyncio
+    async def test_bumping_document_tag_invalidates_all_its_entries(self, cache):
+        for tool_name in ("audit_file", "excel_analyzer"):
+            await cache.get_or_compute(tool_name, "doc_1", None, Tool({"tool": tool_name}))
+        await cache.get_or_compute("audit_file", "doc_2", None, Tool({"doc": 2}))
+
+        assert await cache.invalidate_document("doc_1") == 1
+
+        rerun = Tool({"rerun": True})
+        assert await cache.get_or_compute("audit_file", "doc_1", None, rerun) == {"rerun": True}
+        assert await cache.get_or_compute("excel_analyzer", "doc_1", None, rerun) == {"rerun": True}
+        assert await cache.get_or_compute("audit_file", "doc_2", None, rerun) == {"doc": 2}
+        assert rerun.calls == 2
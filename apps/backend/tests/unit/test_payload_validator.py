@@ -0,0 +1,60 @@
+"""
+Tests for single-pass MCP payload validation.
+"""
+
+import json
+
+import pytest
+
+from src.mcp.security import PayloadValidator
+
+
+def _nested_lists(levels: int):
+    payload = []
+    for _ in range(levels):
+        payload = [payload]
+    return {"data": payload}
+
+
+@pytest.mark.unit
+class TestPayloadValidator:
+    @pytest.mark.parametrize("payload", [
+        {"doc_id": "doc_123", "options": {"pages": [1, 2, 3], "strict": True, "ratio": 0.25, "note": None}},
+        {"rows": [{"name": "Ana", "total": 1234}, {"name": "Peña", "total": -5}], "empty": {}, "none": []},
+        {"text": "línea con acentos y emoji 📄", "tags": ["a", "b"]},
+    ])
+    def test_estimated_size_matches_json_encoding(self, payload):
+        stats = PayloadValidator.validate(payload)
+        assert stats.size_bytes == len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+    def test_reports_depth_and_element_count(self):
+        payload = {"a": {"b": [{"c": 1}]}, "d": "x"}
+        stats = PayloadValidator.validate(payload)
+
+        assert stats.depth == 2  # a list shares the depth of the dict holding it
+        assert stats.elements == 5  # values below the top-level object
+
+    def test_size_limit_stops_early(self):
+        payload = {"items": ["x" * 1000] * 50_000}
+        with pytest.raises(ValueError, match="Payload too large"):
+            PayloadValidator.validate(payload, max_size_kb=64, check_structure=False)
+
+    def test_strings_and_arrays_inside_lists_are_checked(self):
+        with pytest.raises(ValueError, match="String too long"):
+            PayloadValidator.validate({"texts": ["x" * (PayloadValidator.MAX_STRING_LENGTH + 1)]})
+        with pytest.raises(ValueError, match="nesting too deep"):
+            PayloadValidator.validate(_nested_lists(PayloadValidator.MAX_NESTING_DEPTH + 2))
+        assert PayloadValidator.validate(_nested_lists(PayloadValidator.MAX_NESTING_DEPTH)).depth == 10
+
+    def test_element_count_limit(self, monkeypatch):
+        monkeypatch.setattr(PayloadValidator, "MAX_ELEMENTS", 10)
+        with pytest.raises(ValueError, match="too many elements"):
+            PayloadValidator.validate({"a": list(range(5)), "b": list(range(5))})
+
+    def test_wrappers_keep_their_contracts(self):
+        huge = {"data": "x" * (2 * 1024 * 1024)}
+        with pytest.raises(ValueError, match="Payload too large"):
+            PayloadValidator.validate_size(huge, max_size_kb=1024)
+        assert PayloadValidator.validate_structure({"a": {"b": 1}}) is True
+        with pytest.raises(ValueError, match="Invalid key type"):
+            PayloadValidator.validate_structure({1: "x"})
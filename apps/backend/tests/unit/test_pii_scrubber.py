@@ -0,0 +1,98 @@
+"""
+Tests for the single-pass PII scrubber engine.
+"""
+
+import random
+from collections import namedtuple
+from unittest.mock import patch
+
+import pytest
+
+from src.mcp.security import PIIScrubber
+
+SAMPLES = [
+    "Contact john.doe@example.com or call 555-123-4567 today",
+    "SSN: 123-45-6789, card 4111-1111-1111-1111, from 192.168.1.100",
+    "Phones 555.987.6543 and (555) 123 4567; ip 10.0.0.1.",
+    "token=abcdefghijklmnopqrstuvwxyz0123456789 for key rotation",
+    "no key hint: abcdefghijklmnopqrstuvwxyz0123456789",
+    "Reporte Q3: ventas 1,234,567 MXN, folio 2024-0001, página 12 de 40",
+    "mixed a@b.co|x 4111 1111 1111 1111  555 1234\n\n123-45-6789",
+]
+
+
+def _legacy_scrub(text: str) -> str:
+    """The previous one-regex-per-pattern implementation."""
+    text = PIIScrubber.EMAIL_PATTERN.sub("[EMAIL_REDACTED]", text)
+    text = PIIScrubber.PHONE_PATTERN.sub("[PHONE_REDACTED]", text)
+    text = PIIScrubber.SSN_PATTERN.sub("[SSN_REDACTED]", text)
+    text = PIIScrubber.CREDIT_CARD_PATTERN.sub("[CC_REDACTED]", text)
+    text = PIIScrubber.IP_PATTERN.sub("[IP_REDACTED]", text)
+    if "key" in text.lower() or "token" in text.lower():
+        text = PIIScrubber.API_KEY_PATTERN.sub("[KEY_REDACTED]", text)
+    return text
+
+
+def _corpus(seed: int, size: int) -> str:
+    rng = random.Random(seed)
+    words = [s for sample in SAMPLES for s in sample.split(" ")]
+    separators = [" ", " ", " ", "\n", "  ", ", ", "\t"]
+    return "".join(rng.choice(words) + rng.choice(separators) for _ in range(size))
+
+
+@pytest.mark.unit
+class TestPIIScrubberEngine:
+    @pytest.mark.parametrize("text", SAMPLES)
+    def test_single_pass_matches_previous_implementation(self, text):
+        assert PIIScrubber.scrub(text) == _legacy_scrub(text)
+
+    def test_prefixed_api_keys_are_redacted(self):
+        assert PIIScrubber.scrub("API key: sk_test_EXAMPLE_KEY_FOR_TESTING") == "API key: [KEY_REDACTED]"
+
+    @pytest.mark.parametrize("chunk_chars", [1, 7, 64, 1000])
+    def test_stream_equals_whole_text_scrub(self, chunk_chars):
+        text = _corpus(seed=chunk_chars, size=400)
+        pieces = list(PIIScrubber.scrub_stream(text, chunk_chars=chunk_chars))
+
+        assert "".join(pieces) == PIIScrubber._scrub_once(text)
+        if chunk_chars < 100:
+            assert len(pieces) > 1
+
+    def test_large_strings_are_memoized_by_content(self):
+        text = _corpus(seed=1, size=2000)
+        assert len(text) >= PIIScrubber.MEMO_MIN_CHARS
+
+        first = PIIScrubber.scrub(text)
+        with patch.object(PIIScrubber, "_scrub_once", wraps=PIIScrubber._scrub_once) as scan:
+            assert PIIScrubber.scrub("".join(list(text))) == first  # equal content, new object
+        assert scan.call_count == 0
+        assert "[EMAIL_REDACTED]" in first
+
+    def test_scrub_value_shares_unchanged_subtrees(self):
+        clean = {"pages": [{"text": "Página sin datos personales", "n": 1}], "meta": ("a", "b")}
+        data = {"clean": clean, "segments": [["nested", "alice@test.com"]], "count": 3}
+
+        scrubbed = PIIScrubber.scrub_value(data)
+
+        assert scrubbed["clean"] is clean
+        assert scrubbed["segments"] == [["nested", "[EMAIL_REDACTED]"]]
+        assert data["segments"][0][1] == "alice@test.com"
+        assert PIIScrubber.scrub_value(clean) is clean
+
+    def test_scrub_dict_returns_a_copy(self):
+        clean = {"pages": [{"text": "Página sin datos personales"}]}
+
+        scrubbed = PIIScrubber.scrub_dict(clean)
+
+        assert scrubbed == clean
+        assert scrubbed is not clean
+        assert scrubbed["pages"] is not clean["pages"]
+        assert scrubbed["pages"][0] is not clean["pages"][0]
+
+    def test_namedtuples_keep_their_type(self):
+        Contact = namedtuple("Contact", ["name", "email"])
+
+        scrubbed = PIIScrubber.scrub_dict({"contact": Contact("Ana", "ana@example.com")})
+
+        assert scrubbed["contact"] == Contact("Ana", "[EMAIL_REDACTED]")
+        assert isinstance(scrubbed["contact"], Contact)
@@ -18,6 +18,7 @@ def app_with_rate_limit(monkeypatch):
     """Create a test FastAPI app with rate limiting enabled."""
     # Enable rate limiting for tests (may be disabled in .env)
     monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setenv("RATE_LIMIT_GLOBAL_ENABLED", "true")
     monkeypatch.setenv("RATE_LIMIT_CALLS", "100")
     monkeypatch.setenv("RATE_LIMIT_PERIOD", "60")
 
@@ -73,6 +74,7 @@ class TestRateLimitMiddleware:
 
         # Configure very low rate limit for testing via env vars
         monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+        monkeypatch.setenv("RATE_LIMIT_GLOBAL_ENABLED", "true")
         monkeypatch.setenv("RATE_LIMIT_CALLS", "2")  # Only allow 2 requests
         monkeypatch.setenv("RATE_LIMIT_PERIOD", "60")
 
@@ -105,6 +107,7 @@ class TestRateLimitMiddleware:
         get_settings.cache_clear()
 
         monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+        monkeypatch.setenv("RATE_LIMIT_GLOBAL_ENABLED", "true")
         monkeypatch.setenv("RATE_LIMIT_CALLS", "1")
         monkeypatch.setenv("RATE_LIMIT_PERIOD", "60")
 
@@ -172,6 +175,7 @@ class TestRateLimitMiddleware:
     def test_get_client_ip_from_forwarded_header(self):
         """Test extracting client IP from X-Forwarded-For header."""
         middleware = RateLimitMiddleware(app=Mock())
+        middleware.settings = Mock(rate_limit_trusted_proxy_hops=2)
 
         mock_request = Mock(spec=Request)
         mock_request.client = Mock()
@@ -182,9 +186,55 @@ class TestRateLimitMiddleware:
 
         ip = middleware._get_client_ip(mock_request)
 
-        # Should extract first IP from X-Forwarded-For
+        # Two trusted proxies: the client is the second entry from the right
         assert ip == "203.0.113.45"
 
+    def test_spoofed_forwarded_hops_are_ignored(self):
+        """Test that entries the client prepends to X-Forwarded-For are ignored."""
+        middleware = RateLimitMiddleware(app=Mock())
+        middleware.settings = Mock(rate_limit_trusted_proxy_hops=1)
+
+        mock_request = Mock(spec=Request)
+        mock_request.client = Mock()
+        mock_request.client.host = "10.0.0.1"  # Ingress
+        mock_request.headers = {"X-Forwarded-For": "1.2.3.4, 203.0.113.45"}
+
+        assert middleware._get_client_ip(mock_request) == "203.0.113.45"
+
+        middleware.settings = Mock(rate_limit_trusted_proxy_hops=0)
+        assert middleware._get_client_ip(mock_request) == "10.0.0.1"
+
+    def test_global_limit_is_opt_in_and_skips_streams(self, monkeypatch):
+        """Test that the global limit is off by default and never counts streams."""
+        from src.core.config import get_settings
+
+        monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+        monkeypatch.setenv("RATE_LIMIT_CALLS", "1")
+        monkeypatch.delenv("RATE_LIMIT_GLOBAL_ENABLED", raising=False)
+        get_settings.cache_clear()
+        try:
+            app = FastAPI()
+
+            @app.get("/api/test")
+            async def test_endpoint():
+                return {"message": "success"}
+
+            @app.get("/api/mcp/tasks/{task_id}/events")
+            async def events_endpoint(task_id: str):
+                return {"task_id": task_id}
+
+            app.add_middleware(RateLimitMiddleware)
+            client = TestClient(app)
+            assert [client.get("/api/test").status_code for _ in range(3)] == [200, 200, 200]
+            assert "X-RateLimit-Limit" not in client.get("/api/test").headers
+
+            monkeypatch.setenv("RATE_LIMIT_GLOBAL_ENABLED", "true")
+            get_settings.cache_clear()
+            client = TestClient(app)
+            assert [client.get("/api/mcp/tasks/t1/events").status_code for _ in range(3)] == [200, 200, 200]
+        finally:
+            get_settings.cache_clear()
+
     @patch('src.core.config.get_settings')
     def test_middleware_disabled_allows_all_requests(self, mock_settings):
         """Test that disabling rate limiting allows unlimited requests."""
@@ -246,6 +296,7 @@ class TestRateLimitHeaders:
         get_settings.cache_clear()
 
         monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+        monkeypatch.setenv("RATE_LIMIT_GLOBAL_ENABLED", "true")
         monkeypatch.setenv("RATE_LIMIT_CALLS", "1")
         monkeypatch.setenv("RATE_LIMIT_PERIOD", "60")
 
@@ -294,6 +345,7 @@ class TestRateLimitConfiguration:
         get_settings.cache_clear()
 
         monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+        monkeypatch.setenv("RATE_LIMIT_GLOBAL_ENABLED", "true")
         monkeypatch.setenv("RATE_LIMIT_CALLS", "100")
         monkeypatch.setenv("RATE_LIMIT_PERIOD", "3600")
 
@@ -0,0 +1,124 @@
+"""
+Tests for the distributed sliding-window rate limit engine.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.rate_limiter import RateLimitEngine, RateWindow
+
+MINUTE = (RateWindow(3, 60),)
+
+
+def _engine_with_script(script) -> RateLimitEngine:
+    redis_client = MagicMock()
+    redis_client.register_script = MagicMock(return_value=script)
+    return RateLimitEngine(redis_client)
+
+
+@pytest.mark.unit
+class TestRateLimitEngine:
+    @pytest.mark.asyncio
+    async def test_in_memory_fallback_enforces_all_windows(self):
+        engine = RateLimitEngine(use_redis=False)
+        windows = (RateWindow(100, 60), RateWindow(2, 3600))
+
+        results = [await engine.hit("user_1", windows) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, False]
+        assert results[0].limit == 2
+        assert results[0].remaining == 1
+        assert 0 < results[2].retry_after <= 3600
+
+    @pytest.mark.asyncio
+    async def test_one_script_call_per_check(self):
+        script = AsyncMock(return_value=[1, 0, 1])
+        engine = _engine_with_script(script)
+
+        result = await engine.hit("user_1", MINUTE)
+
+        script.assert_awaited_once()
+        assert script.call_args.kwargs["keys"] == ["ratelimit:{user_1}:60s"]
+        assert script.call_args.kwargs["args"][1:] == [3, 60000]
+        assert result.allowed and result.remaining == 1
+
+    @pytest.mark.asyncio
+    async def test_denied_by_redis_reports_retry_after(self):
+        engine = _engine_with_script(AsyncMock(return_value=[0, 1500, 3]))
+
+        result = await engine.hit("user_1", MINUTE)
+
+        assert not result.allowed
+        assert result.retry_after == 1.5
+        assert result.retry_after_seconds == 2
+
+    @pytest.mark.asyncio
+    async def test_local_bucket_rejects_without_redis(self):
+        script = AsyncMock(return_value=[1, 0, 0])
+        engine = _engine_with_script(script)
+
+        for _ in range(3):
+            assert (await engine.hit("user_1", MINUTE)).allowed
+        result = await engine.hit("user_1", MINUTE)
+
+        assert not result.allowed
+        assert script.await_count == 3
+        assert 0 < result.retry_after <= 20
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_memory(self):
+        engine = _engine_with_script(AsyncMock(side_effect=ConnectionError("down")))
+
+        result = await engine.hit("user_1", MINUTE)
+
+        assert result.allowed
+        assert len(engine.local_log["user_1"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_lua_script_counts_across_engines(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        windows = (RateWindow(2, 60), RateWindow(10, 3600))
+
+        # Two workers sharing Redis: the limit holds across both
+        first, second = RateLimitEngine(redis_client), RateLimitEngine(redis_client)
+        results = [
+            await first.hit("user_1", windows),
+            await second.hit("user_1", windows),
+            await first.hit("user_1", windows),
+        ]
+
+        assert [r.allowed for r in results] == [True, True, False]
+        assert 59 < results[2].retry_after <= 60
+        assert await redis_client.zcard("ratelimit:{user_1}:3600s") == 2
+        assert 0 < await redis_client.pttl("ratelimit:{user_1}:60s") <= 60000
+
+    @pytest.mark.asyncio
+    async def test_cost_is_all_or_nothing(self):
+        engine = RateLimitEngine(use_redis=False)
+        windows = (RateWindow(5, 60),)
+
+        first = await engine.hit("user_1", windows, cost=3)
+        second = await engine.hit("user_1", windows, cost=3)
+
+        assert first.allowed and first.remaining == 2
+        assert not second.allowed
+        assert len(engine.local_log["user_1"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_lua_script_charges_cost(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        redis_client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        windows = (RateWindow(5, 60),)
+        # Separate engines so the local bucket does not answer first
+        first, second = RateLimitEngine(redis_client), RateLimitEngine(redis_client)
+
+        assert (await first.hit("user_1", windows, cost=4)).remaining == 1
+        denied = await second.hit("user_1", windows, cost=2)
+
+        assert not denied.allowed
+        assert 59 < denied.retry_after <= 60
+        assert await redis_client.zcard("ratelimit:{user_1}:60s") == 4
@@ -0,0 +1,71 @@
+"""
+Tests for single-flight coalescing of concurrent identical calls.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await release.wait()
+            return "done"
+
+        tasks = [asyncio.create_task(flight.run("k", compute)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == ["done"] * 5
+        assert len(calls) == 1
+        assert not flight
+
+    @pytest.mark.asyncio
+    async def test_leader_failure_reaches_followers_and_clears(self):
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def compute():
+            await release.wait()
+            raise RuntimeError("boom")
+
+        tasks = [asyncio.create_task(flight.run("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not flight
+
+    @pytest.mark.asyncio
+    async def test_followers_run_their_own_call_if_leader_is_cancelled(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            started.set()
+            await asyncio.sleep(0 if len(calls) > 1 else 30)
+            return len(calls)
+
+        leader = asyncio.create_task(flight.run("k", compute))
+        await started.wait()
+        follower = asyncio.create_task(flight.run("k", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await asyncio.wait_for(follower, timeout=1) == 2
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert not flight
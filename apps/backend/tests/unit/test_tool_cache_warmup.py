@@ -0,0 +1,110 @@
+"""
+Tests for tool cache warmup at ingest completion.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.services.mcp_cache import ToolResultCache, warmup_tool_cache
+from src.services.tool_cache_warmup import ToolCacheWarmer, WarmupJob
+
+PDF = "application/pdf"
+XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def _results(cached=0, skipped=0):
+    return {"cached": cached, "skipped": skipped, "failed": 0, "errors": []}
+
+
+@pytest.mark.unit
+class TestToolCacheWarmer:
+    @pytest.mark.asyncio
+    async def test_warms_matching_tools_with_bounded_concurrency(self):
+        running = {"now": 0, "max": 0}
+        warmed = []
+
+        async def fake_warmup(tool_name, doc_ids, user_id, params):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            warmed.append((tool_name, doc_ids[0], params))
+            return _results(skipped=1) if doc_ids[0] == "doc_0" else _results(cached=1)
+
+        # audit_file has no cache reader, so it has no warmup spec
+        warmer = ToolCacheWarmer(tools=["audit_file", "excel_analyzer"], concurrency=2, queue_size=10)
+        assert warmer.tools == ["excel_analyzer"]
+        assert not warmer.enqueue("doc_x", "user_1", XLSX)  # not started
+
+        with patch("src.services.tool_cache_warmup.warmup_tool_cache", side_effect=fake_warmup):
+            await warmer.start()
+            for i in range(5):
+                assert warmer.enqueue(f"doc_{i}", "user_1", XLSX)
+            assert not warmer.enqueue("doc_pdf", "user_1", PDF)  # no configured tool applies
+            await asyncio.wait_for(warmer._queue.join(), timeout=2)
+            await warmer.stop()
+
+        assert running["max"] == 2
+        assert {tool for tool, _, _ in warmed} == {"excel_analyzer"}
+        assert warmed[0][2] == {"operations": ["stats", "preview"]}
+        stats = warmer.get_stats()
+        assert stats["tools"] == {
+            "excel_analyzer": {"warmed": 4, "skipped": 1, "failed": 0, "dropped": 0, "coverage": 1.0},
+        }
+
+    @pytest.mark.asyncio
+    async def test_unavailable_tools_are_not_counted_as_failures(self):
+        adapter = Mock()
+        adapter._get_tool_map = AsyncMock(return_value={})
+        warmer = ToolCacheWarmer(tools=["excel_analyzer"], concurrency=1, queue_size=1)
+
+        with patch("src.services.mcp_cache.get_tool_result_cache"), \
+                patch("src.mcp.get_mcp_adapter", return_value=adapter):
+            await warmer.warm(WarmupJob(doc_id="doc_1", user_id="user_1", content_type=XLSX))
+
+        assert warmer.get_stats()["tools"]["excel_analyzer"]["coverage"] is None
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_documents(self):
+        warmer = ToolCacheWarmer(tools=["excel_analyzer"], concurrency=1, queue_size=1)
+        release = asyncio.Event()
+
+        async def blocked_warmup(**kwargs):
+            await release.wait()
+            return _results()
+
+        with patch("src.services.tool_cache_warmup.warmup_tool_cache", side_effect=blocked_warmup):
+            await warmer.start()
+            assert warmer.enqueue("doc_1", "user_1", XLSX)
+            await asyncio.sleep(0)  # worker takes doc_1
+            assert warmer.enqueue("doc_2", "user_1", XLSX)
+            assert not warmer.enqueue("doc_3", "user_1", XLSX)
+            release.set()
+            await asyncio.wait_for(warmer._queue.join(), timeout=2)
+            await warmer.stop()
+
+        outcomes = warmer.get_stats()["tools"]["excel_analyzer"]
+        assert outcomes["dropped"] == 1
+        assert outcomes["failed"] == 2
+        assert outcomes["coverage"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_warmup_skips_documents_with_fresh_results(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        cache = ToolResultCache(client=fakeredis.FakeAsyncRedis(decode_responses=True))
+        await cache.get_or_compute("audit_file", "doc_1", {"policy_id": "auto"}, AsyncMock(return_value={"ok": 1}))
+
+        adapter = Mock()
+        adapter._get_tool_map = AsyncMock(return_value={"audit_file": object()})
+        adapter._execute_tool_impl = AsyncMock(return_value={"ok": 2})
+
+        with patch("src.services.mcp_cache.get_tool_result_cache", return_value=cache), \
+                patch("src.mcp.get_mcp_adapter", return_value=adapter):
+            results = await warmup_tool_cache("audit_file", ["doc_1", "doc_2"], "user_1", {"policy_id": "auto"})
+
+        assert results["skipped"] == 1
+        assert results["cached"] == 1
+        payload = adapter._execute_tool_impl.call_args.kwargs["payload"]
+        assert payload == {"doc_id": "doc_2", "user_id": "user_1", "policy_id": "auto"}
@@ -18,16 +18,19 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..', 'src'))
 
 from src.services.tool_execution_service import ToolExecutionService, TOOL_CACHE_TTL
+from src.services.mcp_cache import ToolResultCache
 from src.core.constants import TOOL_NAME_EXCEL
 from src.domain.chat_context import ChatContext
 
 
 @pytest.fixture
-def mock_redis():
-    """Mock Redis cache."""
-    cache = AsyncMock()
-    cache.get = AsyncMock(return_value=None)
-    cache.set = AsyncMock()
+def mock_cache():
+    """Mock tool result cache (always a miss: runs the tool)."""
+    async def get_or_compute(tool_name, doc_id, params, compute, ttl=None):
+        return await compute()
+
+    cache = Mock(spec=ToolResultCache)
+    cache.get_or_compute = AsyncMock(side_effect=get_or_compute)
     return cache
 
 
@@ -62,7 +65,7 @@ class TestToolExecutionService:
         """Should return empty dict if no tools are enabled."""
         mock_context.tools_enabled = {}
         
-        with patch('src.services.tool_execution_service.get_redis_cache', new_callable=AsyncMock), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache'), \
              patch('src.services.tool_execution_service.get_mcp_adapter', new_callable=AsyncMock) as mock_get_adapter:
             
             results = await ToolExecutionService.invoke_relevant_tools(mock_context, "user-123")
@@ -75,7 +78,7 @@ class TestToolExecutionService:
         """Should return empty dict if no documents are attached."""
         mock_context.document_ids = []
         
-        with patch('src.services.tool_execution_service.get_redis_cache', new_callable=AsyncMock), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache'), \
              patch('src.services.tool_execution_service.get_mcp_adapter', new_callable=AsyncMock) as mock_get_adapter:
             
             results = await ToolExecutionService.invoke_relevant_tools(mock_context, "user-123")
@@ -84,7 +87,7 @@ class TestToolExecutionService:
             mock_get_adapter.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_executes_excel_tool_cache_miss(self, mock_context, mock_redis, mock_mcp_adapter):
+    async def test_executes_excel_tool_cache_miss(self, mock_context, mock_cache, mock_mcp_adapter):
         """Should execute excel tool and cache result on cache miss."""
         # Setup Document mock
         mock_doc = AsyncMock()
@@ -94,7 +97,7 @@ class TestToolExecutionService:
         # Setup tool execution
         mock_mcp_adapter._execute_tool_impl.return_value = {"sheets": ["Sheet1"]}
 
-        with patch('src.services.tool_execution_service.get_redis_cache', return_value=mock_redis), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache', return_value=mock_cache), \
              patch('src.services.tool_execution_service.get_mcp_adapter', return_value=mock_mcp_adapter), \
              patch('src.models.document.Document.get', return_value=mock_doc):
 
@@ -111,13 +114,13 @@ class TestToolExecutionService:
             assert call_args.kwargs["payload"]["doc_id"] == "doc-123"
 
             # Verify caching
-            mock_redis.get.assert_called_once()
-            mock_redis.set.assert_called_once()
-            set_args = mock_redis.set.call_args
-            assert set_args.kwargs["expire"] == TOOL_CACHE_TTL[TOOL_NAME_EXCEL]
+            mock_cache.get_or_compute.assert_called_once()
+            cache_args = mock_cache.get_or_compute.call_args
+            assert cache_args.args[:3] == (TOOL_NAME_EXCEL, "doc-123", {"operations": ["stats", "preview"]})
+            assert cache_args.kwargs["ttl"] == TOOL_CACHE_TTL[TOOL_NAME_EXCEL]
 
     @pytest.mark.asyncio
-    async def test_returns_cached_excel_result(self, mock_context, mock_redis, mock_mcp_adapter):
+    async def test_returns_cached_excel_result(self, mock_context, mock_cache, mock_mcp_adapter):
         """Should return cached result and skip execution on cache hit."""
         # Setup Document mock
         mock_doc = AsyncMock()
@@ -126,9 +129,10 @@ class TestToolExecutionService:
 
         # Setup cache hit
         cached_data = {"sheets": ["CachedSheet"]}
-        mock_redis.get.return_value = cached_data
+        mock_cache.get_or_compute.side_effect = None
+        mock_cache.get_or_compute.return_value = cached_data
 
-        with patch('src.services.tool_execution_service.get_redis_cache', return_value=mock_redis), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache', return_value=mock_cache), \
              patch('src.services.tool_execution_service.get_mcp_adapter', return_value=mock_mcp_adapter), \
              patch('src.models.document.Document.get', return_value=mock_doc):
 
@@ -141,10 +145,10 @@ class TestToolExecutionService:
             mock_mcp_adapter._execute_tool_impl.assert_not_called()
 
             # Verify cache read
-            mock_redis.get.assert_called_once()
+            mock_cache.get_or_compute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_executes_excel_tool_for_spreadsheets(self, mock_context, mock_redis, mock_mcp_adapter):
+    async def test_executes_excel_tool_for_spreadsheets(self, mock_context, mock_cache, mock_mcp_adapter):
         """Should execute excel analyzer only for spreadsheet files."""
         # Setup Document mock
         mock_doc = AsyncMock()
@@ -153,7 +157,7 @@ class TestToolExecutionService:
         
         mock_mcp_adapter._execute_tool_impl.return_value = {"sheets": ["Sheet1"]}
         
-        with patch('src.services.tool_execution_service.get_redis_cache', return_value=mock_redis), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache', return_value=mock_cache), \
              patch('src.services.tool_execution_service.get_mcp_adapter', return_value=mock_mcp_adapter), \
              patch('src.models.document.Document.get', return_value=mock_doc):
             
@@ -170,14 +174,14 @@ class TestToolExecutionService:
             assert mock_mcp_adapter._execute_tool_impl.call_args.kwargs["tool_name"] == TOOL_NAME_EXCEL
 
     @pytest.mark.asyncio
-    async def test_skips_excel_tool_for_non_spreadsheets(self, mock_context, mock_redis, mock_mcp_adapter):
+    async def test_skips_excel_tool_for_non_spreadsheets(self, mock_context, mock_cache, mock_mcp_adapter):
         """Should skip excel analyzer for non-spreadsheet files (e.g. PDF)."""
         # Setup PDF Document mock
         mock_doc = AsyncMock()
         mock_doc.user_id = "user-123"
         mock_doc.content_type = "application/pdf"
         
-        with patch('src.services.tool_execution_service.get_redis_cache', return_value=mock_redis), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache', return_value=mock_cache), \
              patch('src.services.tool_execution_service.get_mcp_adapter', return_value=mock_mcp_adapter), \
              patch('src.models.document.Document.get', return_value=mock_doc):
             
@@ -190,12 +194,12 @@ class TestToolExecutionService:
             mock_mcp_adapter._execute_tool_impl.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_handles_execution_error_gracefully(self, mock_context, mock_redis, mock_mcp_adapter):
+    async def test_handles_execution_error_gracefully(self, mock_context, mock_cache, mock_mcp_adapter):
         """Should continue if one tool fails."""
         # Setup execution failure
         mock_mcp_adapter._execute_tool_impl.side_effect = Exception("MCP Error")
         
-        with patch('src.services.tool_execution_service.get_redis_cache', return_value=mock_redis), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache', return_value=mock_cache), \
              patch('src.services.tool_execution_service.get_mcp_adapter', return_value=mock_mcp_adapter):
             
             results = await ToolExecutionService.invoke_relevant_tools(mock_context, "user-123")
@@ -207,7 +211,7 @@ class TestToolExecutionService:
             mock_mcp_adapter._execute_tool_impl.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_cache_read_failure_fallback(self, mock_context, mock_redis, mock_mcp_adapter):
+    async def test_cache_read_failure_fallback(self, mock_context, mock_cache, mock_mcp_adapter):
         """Should execute tool even if cache read fails."""
         # Setup Document mock
         mock_doc = AsyncMock()
@@ -215,10 +219,12 @@ class TestToolExecutionService:
         mock_doc.content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
         # Setup cache failure
-        mock_redis.get.side_effect = Exception("Redis down")
+        redis_client = Mock()
+        redis_client.pipeline.side_effect = Exception("Redis down")
+        broken_cache = ToolResultCache(client=redis_client)
         mock_mcp_adapter._execute_tool_impl.return_value = {"result": "ok"}
 
-        with patch('src.services.tool_execution_service.get_redis_cache', return_value=mock_redis), \
+        with patch('src.services.tool_execution_service.get_tool_result_cache', return_value=broken_cache), \
              patch('src.services.tool_execution_service.get_mcp_adapter', return_value=mock_mcp_adapter), \
              patch('src.models.document.Document.get', return_value=mock_doc):
 